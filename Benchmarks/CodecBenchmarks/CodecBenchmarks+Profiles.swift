@@ -0,0 +1,81 @@
+import Benchmark
+import NIOCore
+
+@testable import AMQP
+
+/// Shapes of the values the generated benchmarks are run with, the strings and tables of a method are taken from
+/// the profile.
+enum PayloadProfile: String, Sendable {
+    /// short strings and empty tables
+    case minimal
+    /// 255 bytes short strings and 4 KiB long strings
+    case long
+    /// tables with 10 entries, a part of them are nested arrays and tables
+    case headers10
+    /// tables with 100 entries, a part of them are nested arrays and tables
+    case headers100
+
+    var shortString: String {
+        self == .long ? String(repeating: "s", count: 255) : "FooBar"
+    }
+
+    var longString: String {
+        self == .long ? String(repeating: "l", count: 4096) : "FooBar"
+    }
+
+    var table: Spec.Table {
+        switch self {
+        case .minimal, .long: [:]
+        case .headers10: Self.makeTable(entries: 10)
+        case .headers100: Self.makeTable(entries: 100)
+        }
+    }
+
+    private static func makeTable(entries: Int) -> Spec.Table {
+        (0..<entries)
+            .reduce(into: [:]) { table, index in
+                table["x-header-\(index)"] =
+                    switch index % 4 {
+                    case 0: .longstr("value-\(index)")
+                    case 1: .int64(Int64(index))
+                    case 2: .array([.int32(Int32(index)), .longstr("item"), .array([.bool(true), .f64(0.5)])])
+                    default: .table(["nested": .array([.uint8(1), .timestamp(.distantPast)])])
+                    }
+            }
+    }
+}
+
+private let codecMetrics: [BenchmarkMetric] = [.throughput, .wallClock, .mallocCountTotal]
+
+/// Registers encode (`FrameEncoder`), write (`FrameBufferWritable`) and decode (`FrameDecoder`) benchmarks of the
+/// value built for every profile, the names are prefixed with `name` so the results are grouped per method.
+func registerCodecBenchmarks<T: FrameCodable & FrameBufferWritable>(
+    _ name: String,
+    profiles: [PayloadProfile],
+    makeValue: (PayloadProfile) -> T
+) {
+    let configuration = Benchmark.Configuration(metrics: codecMetrics)
+    for profile in profiles {
+        let value = makeValue(profile)
+        var wire = ByteBuffer()
+        value.write(into: &wire)
+
+        Benchmark("\(name) encode [\(profile)]", configuration: configuration) { benchmark in
+            for _ in benchmark.scaledIterations {
+                blackHole(try FrameEncoder().encode(value))
+            }
+        }
+        Benchmark("\(name) write [\(profile)]", configuration: configuration) { benchmark in
+            for _ in benchmark.scaledIterations {
+                var buffer = ByteBuffer()
+                value.write(into: &buffer)
+                blackHole(buffer)
+            }
+        }
+        Benchmark("\(name) decode [\(profile)]", configuration: configuration) { [wire] benchmark in
+            for _ in benchmark.scaledIterations {
+                blackHole(try FrameDecoder().decode(T.self, from: wire))
+            }
+        }
+    }
+}
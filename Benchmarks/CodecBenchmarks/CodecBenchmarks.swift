@@ -0,0 +1,463 @@
+//   NOTE: This -*- swift -*- source code is autogenerated from the AMQP
+//         specification!
+//
+// This source file is part of the swift-amqp open source project
+//
+// Copyright (c) 2024-2025 swift-amqp project authors
+// Licensed under Apache License 2.0
+//
+// See LICENSE for license information
+//
+// SPDX-License-Identifier: Apache-2.0
+//
+
+import Benchmark
+
+@testable import AMQP
+
+let benchmarks: @Sendable () -> Void = {
+    registerBasicBenchmarks()
+    registerConnectionBenchmarks()
+    registerChannelBenchmarks()
+    registerAccessBenchmarks()
+    registerExchangeBenchmarks()
+    registerQueueBenchmarks()
+    registerTxBenchmarks()
+    registerConfirmBenchmarks()
+    registerCorpusBenchmarks()
+}
+
+func registerBasicBenchmarks() {
+    registerCodecBenchmarks("Basic.Qos", profiles: [.minimal]) { _ in
+        Spec.Basic.Qos(
+            prefetchSize: 1,
+            prefetchCount: 1,
+            global: true
+        )
+    }
+    registerCodecBenchmarks("Basic.QosOk", profiles: [.minimal]) { _ in
+        Spec.Basic.QosOk()
+    }
+    registerCodecBenchmarks("Basic.Consume", profiles: [.minimal, .long, .headers10, .headers100]) { profile in
+        Spec.Basic.Consume(
+            ticket: 1,
+            queue: profile.shortString,
+            consumerTag: profile.shortString,
+            noLocal: true,
+            noAck: true,
+            exclusive: true,
+            nowait: true,
+            arguments: profile.table
+        )
+    }
+    registerCodecBenchmarks("Basic.ConsumeOk", profiles: [.minimal, .long]) { profile in
+        Spec.Basic.ConsumeOk(
+            consumerTag: profile.shortString
+        )
+    }
+    registerCodecBenchmarks("Basic.Cancel", profiles: [.minimal, .long]) { profile in
+        Spec.Basic.Cancel(
+            consumerTag: profile.shortString,
+            nowait: true
+        )
+    }
+    registerCodecBenchmarks("Basic.CancelOk", profiles: [.minimal, .long]) { profile in
+        Spec.Basic.CancelOk(
+            consumerTag: profile.shortString
+        )
+    }
+    registerCodecBenchmarks("Basic.Publish", profiles: [.minimal, .long]) { profile in
+        Spec.Basic.Publish(
+            ticket: 1,
+            exchange: profile.shortString,
+            routingKey: profile.shortString,
+            mandatory: true,
+            immediate: true
+        )
+    }
+    registerCodecBenchmarks("Basic.Return", profiles: [.minimal, .long]) { profile in
+        Spec.Basic.Return(
+            replyCode: 1,
+            replyText: profile.shortString,
+            exchange: profile.shortString,
+            routingKey: profile.shortString
+        )
+    }
+    registerCodecBenchmarks("Basic.Deliver", profiles: [.minimal, .long]) { profile in
+        Spec.Basic.Deliver(
+            consumerTag: profile.shortString,
+            deliveryTag: 1,
+            redelivered: true,
+            exchange: profile.shortString,
+            routingKey: profile.shortString
+        )
+    }
+    registerCodecBenchmarks("Basic.Get", profiles: [.minimal, .long]) { profile in
+        Spec.Basic.Get(
+            ticket: 1,
+            queue: profile.shortString,
+            noAck: true
+        )
+    }
+    registerCodecBenchmarks("Basic.GetOk", profiles: [.minimal, .long]) { profile in
+        Spec.Basic.GetOk(
+            deliveryTag: 1,
+            redelivered: true,
+            exchange: profile.shortString,
+            routingKey: profile.shortString,
+            messageCount: 1
+        )
+    }
+    registerCodecBenchmarks("Basic.GetEmpty", profiles: [.minimal, .long]) { profile in
+        Spec.Basic.GetEmpty(
+            clusterId: profile.shortString
+        )
+    }
+    registerCodecBenchmarks("Basic.Ack", profiles: [.minimal]) { _ in
+        Spec.Basic.Ack(
+            deliveryTag: 1,
+            multiple: true
+        )
+    }
+    registerCodecBenchmarks("Basic.Reject", profiles: [.minimal]) { _ in
+        Spec.Basic.Reject(
+            deliveryTag: 1,
+            requeue: true
+        )
+    }
+    registerCodecBenchmarks("Basic.RecoverAsync", profiles: [.minimal]) { _ in
+        Spec.Basic.RecoverAsync(
+            requeue: true
+        )
+    }
+    registerCodecBenchmarks("Basic.Recover", profiles: [.minimal]) { _ in
+        Spec.Basic.Recover(
+            requeue: true
+        )
+    }
+    registerCodecBenchmarks("Basic.RecoverOk", profiles: [.minimal]) { _ in
+        Spec.Basic.RecoverOk()
+    }
+    registerCodecBenchmarks("Basic.Nack", profiles: [.minimal]) { _ in
+        Spec.Basic.Nack(
+            deliveryTag: 1,
+            multiple: true,
+            requeue: true
+        )
+    }
+    registerCodecBenchmarks("BasicProperties", profiles: [.minimal, .long, .headers10, .headers100]) { profile in
+        Spec.BasicProperties(
+            contentType: profile.shortString,
+            contentEncoding: profile.shortString,
+            headers: profile.table,
+            deliveryMode: 1,
+            priority: 1,
+            correlationId: profile.shortString,
+            replyTo: profile.shortString,
+            expiration: profile.shortString,
+            messageId: profile.shortString,
+            timestamp: Timestamp(millisecondsSince1970: 1),
+            type: profile.shortString,
+            userId: profile.shortString,
+            appId: profile.shortString,
+            clusterId: profile.shortString
+        )
+    }
+}
+
+func registerConnectionBenchmarks() {
+    registerCodecBenchmarks("Connection.Start", profiles: [.minimal, .long, .headers10, .headers100]) { profile in
+        Spec.Connection.Start(
+            versionMajor: 1,
+            versionMinor: 1,
+            serverProperties: profile.table,
+            mechanisms: profile.longString,
+            locales: profile.longString
+        )
+    }
+    registerCodecBenchmarks("Connection.StartOk", profiles: [.minimal, .long, .headers10, .headers100]) { profile in
+        Spec.Connection.StartOk(
+            clientProperties: profile.table,
+            mechanism: profile.shortString,
+            response: profile.longString,
+            locale: profile.shortString
+        )
+    }
+    registerCodecBenchmarks("Connection.Secure", profiles: [.minimal, .long]) { profile in
+        Spec.Connection.Secure(
+            challenge: profile.longString
+        )
+    }
+    registerCodecBenchmarks("Connection.SecureOk", profiles: [.minimal, .long]) { profile in
+        Spec.Connection.SecureOk(
+            response: profile.longString
+        )
+    }
+    registerCodecBenchmarks("Connection.Tune", profiles: [.minimal]) { _ in
+        Spec.Connection.Tune(
+            channelMax: 1,
+            frameMax: 1,
+            heartbeat: 1
+        )
+    }
+    registerCodecBenchmarks("Connection.TuneOk", profiles: [.minimal]) { _ in
+        Spec.Connection.TuneOk(
+            channelMax: 1,
+            frameMax: 1,
+            heartbeat: 1
+        )
+    }
+    registerCodecBenchmarks("Connection.Open", profiles: [.minimal, .long]) { profile in
+        Spec.Connection.Open(
+            virtualHost: profile.shortString,
+            capabilities: profile.shortString,
+            insist: true
+        )
+    }
+    registerCodecBenchmarks("Connection.OpenOk", profiles: [.minimal, .long]) { profile in
+        Spec.Connection.OpenOk(
+            knownHosts: profile.shortString
+        )
+    }
+    registerCodecBenchmarks("Connection.Close", profiles: [.minimal, .long]) { profile in
+        Spec.Connection.Close(
+            replyCode: 1,
+            replyText: profile.shortString,
+            classId: 1,
+            methodId: 1
+        )
+    }
+    registerCodecBenchmarks("Connection.CloseOk", profiles: [.minimal]) { _ in
+        Spec.Connection.CloseOk()
+    }
+    registerCodecBenchmarks("Connection.Blocked", profiles: [.minimal, .long]) { profile in
+        Spec.Connection.Blocked(
+            reason: profile.shortString
+        )
+    }
+    registerCodecBenchmarks("Connection.Unblocked", profiles: [.minimal]) { _ in
+        Spec.Connection.Unblocked()
+    }
+    registerCodecBenchmarks("Connection.UpdateSecret", profiles: [.minimal, .long]) { profile in
+        Spec.Connection.UpdateSecret(
+            newSecret: profile.longString,
+            reason: profile.shortString
+        )
+    }
+    registerCodecBenchmarks("Connection.UpdateSecretOk", profiles: [.minimal]) { _ in
+        Spec.Connection.UpdateSecretOk()
+    }
+}
+
+func registerChannelBenchmarks() {
+    registerCodecBenchmarks("Channel.Open", profiles: [.minimal, .long]) { profile in
+        Spec.Channel.Open(
+            outOfBand: profile.shortString
+        )
+    }
+    registerCodecBenchmarks("Channel.OpenOk", profiles: [.minimal, .long]) { profile in
+        Spec.Channel.OpenOk(
+            channelId: profile.longString
+        )
+    }
+    registerCodecBenchmarks("Channel.Flow", profiles: [.minimal]) { _ in
+        Spec.Channel.Flow(
+            active: true
+        )
+    }
+    registerCodecBenchmarks("Channel.FlowOk", profiles: [.minimal]) { _ in
+        Spec.Channel.FlowOk(
+            active: true
+        )
+    }
+    registerCodecBenchmarks("Channel.Close", profiles: [.minimal, .long]) { profile in
+        Spec.Channel.Close(
+            replyCode: 1,
+            replyText: profile.shortString,
+            classId: 1,
+            methodId: 1
+        )
+    }
+    registerCodecBenchmarks("Channel.CloseOk", profiles: [.minimal]) { _ in
+        Spec.Channel.CloseOk()
+    }
+}
+
+func registerAccessBenchmarks() {
+    registerCodecBenchmarks("Access.Request", profiles: [.minimal, .long]) { profile in
+        Spec.Access.Request(
+            realm: profile.shortString,
+            exclusive: true,
+            passive: true,
+            active: true,
+            write: true,
+            read: true
+        )
+    }
+    registerCodecBenchmarks("Access.RequestOk", profiles: [.minimal]) { _ in
+        Spec.Access.RequestOk(
+            ticket: 1
+        )
+    }
+}
+
+func registerExchangeBenchmarks() {
+    registerCodecBenchmarks("Exchange.Declare", profiles: [.minimal, .long, .headers10, .headers100]) { profile in
+        Spec.Exchange.Declare(
+            ticket: 1,
+            exchange: profile.shortString,
+            type: profile.shortString,
+            passive: true,
+            durable: true,
+            autoDelete: true,
+            `internal`: true,
+            nowait: true,
+            arguments: profile.table
+        )
+    }
+    registerCodecBenchmarks("Exchange.DeclareOk", profiles: [.minimal]) { _ in
+        Spec.Exchange.DeclareOk()
+    }
+    registerCodecBenchmarks("Exchange.Delete", profiles: [.minimal, .long]) { profile in
+        Spec.Exchange.Delete(
+            ticket: 1,
+            exchange: profile.shortString,
+            ifUnused: true,
+            nowait: true
+        )
+    }
+    registerCodecBenchmarks("Exchange.DeleteOk", profiles: [.minimal]) { _ in
+        Spec.Exchange.DeleteOk()
+    }
+    registerCodecBenchmarks("Exchange.Bind", profiles: [.minimal, .long, .headers10, .headers100]) { profile in
+        Spec.Exchange.Bind(
+            ticket: 1,
+            destination: profile.shortString,
+            source: profile.shortString,
+            routingKey: profile.shortString,
+            nowait: true,
+            arguments: profile.table
+        )
+    }
+    registerCodecBenchmarks("Exchange.BindOk", profiles: [.minimal]) { _ in
+        Spec.Exchange.BindOk()
+    }
+    registerCodecBenchmarks("Exchange.Unbind", profiles: [.minimal, .long, .headers10, .headers100]) { profile in
+        Spec.Exchange.Unbind(
+            ticket: 1,
+            destination: profile.shortString,
+            source: profile.shortString,
+            routingKey: profile.shortString,
+            nowait: true,
+            arguments: profile.table
+        )
+    }
+    registerCodecBenchmarks("Exchange.UnbindOk", profiles: [.minimal]) { _ in
+        Spec.Exchange.UnbindOk()
+    }
+}
+
+func registerQueueBenchmarks() {
+    registerCodecBenchmarks("Queue.Declare", profiles: [.minimal, .long, .headers10, .headers100]) { profile in
+        Spec.Queue.Declare(
+            ticket: 1,
+            queue: profile.shortString,
+            passive: true,
+            durable: true,
+            exclusive: true,
+            autoDelete: true,
+            nowait: true,
+            arguments: profile.table
+        )
+    }
+    registerCodecBenchmarks("Queue.DeclareOk", profiles: [.minimal, .long]) { profile in
+        Spec.Queue.DeclareOk(
+            queue: profile.shortString,
+            messageCount: 1,
+            consumerCount: 1
+        )
+    }
+    registerCodecBenchmarks("Queue.Bind", profiles: [.minimal, .long, .headers10, .headers100]) { profile in
+        Spec.Queue.Bind(
+            ticket: 1,
+            queue: profile.shortString,
+            exchange: profile.shortString,
+            routingKey: profile.shortString,
+            nowait: true,
+            arguments: profile.table
+        )
+    }
+    registerCodecBenchmarks("Queue.BindOk", profiles: [.minimal]) { _ in
+        Spec.Queue.BindOk()
+    }
+    registerCodecBenchmarks("Queue.Purge", profiles: [.minimal, .long]) { profile in
+        Spec.Queue.Purge(
+            ticket: 1,
+            queue: profile.shortString,
+            nowait: true
+        )
+    }
+    registerCodecBenchmarks("Queue.PurgeOk", profiles: [.minimal]) { _ in
+        Spec.Queue.PurgeOk(
+            messageCount: 1
+        )
+    }
+    registerCodecBenchmarks("Queue.Delete", profiles: [.minimal, .long]) { profile in
+        Spec.Queue.Delete(
+            ticket: 1,
+            queue: profile.shortString,
+            ifUnused: true,
+            ifEmpty: true,
+            nowait: true
+        )
+    }
+    registerCodecBenchmarks("Queue.DeleteOk", profiles: [.minimal]) { _ in
+        Spec.Queue.DeleteOk(
+            messageCount: 1
+        )
+    }
+    registerCodecBenchmarks("Queue.Unbind", profiles: [.minimal, .long, .headers10, .headers100]) { profile in
+        Spec.Queue.Unbind(
+            ticket: 1,
+            queue: profile.shortString,
+            exchange: profile.shortString,
+            routingKey: profile.shortString,
+            arguments: profile.table
+        )
+    }
+    registerCodecBenchmarks("Queue.UnbindOk", profiles: [.minimal]) { _ in
+        Spec.Queue.UnbindOk()
+    }
+}
+
+func registerTxBenchmarks() {
+    registerCodecBenchmarks("Tx.Select", profiles: [.minimal]) { _ in
+        Spec.Tx.Select()
+    }
+    registerCodecBenchmarks("Tx.SelectOk", profiles: [.minimal]) { _ in
+        Spec.Tx.SelectOk()
+    }
+    registerCodecBenchmarks("Tx.Commit", profiles: [.minimal]) { _ in
+        Spec.Tx.Commit()
+    }
+    registerCodecBenchmarks("Tx.CommitOk", profiles: [.minimal]) { _ in
+        Spec.Tx.CommitOk()
+    }
+    registerCodecBenchmarks("Tx.Rollback", profiles: [.minimal]) { _ in
+        Spec.Tx.Rollback()
+    }
+    registerCodecBenchmarks("Tx.RollbackOk", profiles: [.minimal]) { _ in
+        Spec.Tx.RollbackOk()
+    }
+}
+
+func registerConfirmBenchmarks() {
+    registerCodecBenchmarks("Confirm.Select", profiles: [.minimal]) { _ in
+        Spec.Confirm.Select(
+            nowait: true
+        )
+    }
+    registerCodecBenchmarks("Confirm.SelectOk", profiles: [.minimal]) { _ in
+        Spec.Confirm.SelectOk()
+    }
+}
@@ -0,0 +1,42 @@
+import Benchmark
+import Foundation
+import NIOCore
+import NIOEmbedded
+
+@testable import AMQP
+
+/// Registers the benchmarks decoding a traffic corpus written by `Generator/corpusgen.py`, the path is taken from
+/// the `AMQP_BENCHMARK_CORPUS` environment variable and the benchmarks are skipped when it isn't set.
+func registerCorpusBenchmarks() {
+    guard let path = ProcessInfo.processInfo.environment["AMQP_BENCHMARK_CORPUS"],
+        let contents = FileManager.default.contents(atPath: path)
+    else {
+        return
+    }
+    let corpus = ByteBuffer(bytes: contents)
+    let configuration = Benchmark.Configuration(
+        metrics: [.throughput, .wallClock, .mallocCountTotal, .peakMemoryResident]
+    )
+
+    // the decoding of ByteToFrameCoderHandler without the channel pipeline
+    Benchmark("Corpus InboundFrame.decode", configuration: configuration) { benchmark in
+        let decoder = FrameDecoder(decodesLazyViews: true)
+        for _ in benchmark.scaledIterations {
+            var buffer = corpus
+            while let frame = try InboundFrame.decode(from: &buffer, decoder: decoder) {
+                blackHole(frame)
+            }
+        }
+    }
+
+    Benchmark("Corpus ByteToFrameCoderHandler", configuration: configuration) { benchmark in
+        for _ in benchmark.scaledIterations {
+            let channel = EmbeddedChannel(handler: ByteToMessageHandler(ByteToFrameCoderHandler()))
+            try channel.writeInbound(corpus)
+            while let frame = try channel.readInbound(as: InboundFrame.self) {
+                blackHole(frame)
+            }
+            _ = try channel.finish()
+        }
+    }
+}
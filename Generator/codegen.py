@@ -2,11 +2,93 @@
 
 # this generator requires https://github.com/rabbitmq/rabbitmq-server/tree/main/deps/rabbitmq_codegen to work
 
+import sys
+from typing import TextIO
+
 from shared.utilities import *
 from rabbitmq_codegen.amqp_codegen import *
 
 
-def gen_swift_api(spec: AmqpSpec):
+# based on the first column from here: https://www.rabbitmq.com/amqp-0-9-1-errata#section_3
+# enum case, native Swift type, kind, size
+FIELD_VALUES = [
+    ("bool", "Bool", "t", "1"),  # stored as Int8
+    ("int8", "Int8", "b", "1"),
+    ("uint8", "UInt8", "B", "1"),
+    # conflicting in spec and implementation, fallback to implementation
+    ("int16", "Int16", "s", "2"),
+    ("uint16", "UInt16", "u", "2"),
+    ("int32", "Int32", "I", "4"),
+    ("uint32", "UInt32", "i", "4"),
+    # conflicting in spec and implementation, fallback to implementation
+    ("int64", "Int64", "l", "8"),
+    # ("uint64", "UInt64", "l", "8"),
+    ("f32", "Float", "f", "4"),
+    ("f64", "Double", "d", "8"),
+    ("decimal", "UInt8, Int32", "D", "5"),
+    # ("shortstr", "String", "s", "UInt32(value.shortBytesCount)"),
+    ("longstr", "String", "S", "value.longBytesCount"),
+    (
+        "array",
+        "[FieldValue]",
+        "A",
+        "value.reduce(into: 0) { $0 += $1.bytesCount }",
+    ),
+    ("timestamp", "Timestamp", "T", "8"),  # stored as uint64
+    ("table", "Table", "F", "value.bytesCount"),
+    ("bytes", "[UInt8]", "x", "UInt32(value.count)"),
+    ("void", "", "V", "1"),
+]
+
+
+def field_value_decode(case: str, type: str) -> list:
+    """statements decoding the value of the case which follow its type tag"""
+    if case == "decimal":
+        return [
+            "let scale = try decoder.decode(UInt8.self)",
+            "return .decimal(scale, try decoder.decode(Int32.self))",
+        ]
+    if case == "void":
+        # the client writes the tag once more in place of the (empty) value
+        return ["_ = try decoder.decode(UInt8.self)", "return .void"]
+    if case == "longstr":
+        return ["return .longstr(try decoder.decode(String.self, isLong: true))"]
+    if case == "table":
+        return ["return .table(try decoder.decode([String: FieldValue].self))"]
+    return [f"return .{case}(try decoder.decode({type}.self))"]
+
+
+def field_value_write(case: str) -> list:
+    """statements writing the value of the case (without its type tag) into `buffer`"""
+    if case == "bool":
+        return ["buffer.writeInteger(UInt8(value ? 1 : 0))"]
+    if case in ["f32", "f64"]:
+        return ["buffer.writeInteger(value.bitPattern)"]
+    if case == "decimal":
+        return ["buffer.writeInteger(scale)", "buffer.writeInteger(value)"]
+    if case == "longstr":
+        return ["buffer.writeLongString(value)"]
+    if case == "timestamp":
+        return ["buffer.writeInteger(value.millisecondsSince1970)"]
+    if case == "table":
+        return ["buffer.writeTable(value)"]
+    if case == "array":
+        # the length is patched in once the elements are written, so nested values are walked only once
+        return [
+            "buffer.writeWithLengthPrefix { buffer in",
+            "    for element in value {",
+            "        element.write(into: &buffer)",
+            "    }",
+            "}",
+        ]
+    if case == "bytes":
+        return ["buffer.writeInteger(UInt32(value.count))", "buffer.writeBytes(value)"]
+    if case == "void":
+        return ["buffer.writeInteger(type)"]
+    return ["buffer.writeInteger(value)"]
+
+
+def gen_swift_api(spec: AmqpSpec, out: TextIO):
     def protocols():
         print(
             """protocol AMQPObjectProtocol: Equatable, Sendable {
@@ -21,79 +103,52 @@ protocol AMQPPropertiesProtocol: AMQPObjectProtocol, Hashable {}
 
 protocol AMQPMethodProtocol: AMQPClassProtocol {
     var amqpMethodId: UInt16 { get }
-}"""
+}""",
+            file=out,
         )
 
     def FieldValueEnum():
-        # based on the first column from here: https://www.rabbitmq.com/amqp-0-9-1-errata#section_3
-        # enum case, native Swift type, kind, size
-        field_values_definitions = [
-            ("bool", "Bool", "t", "1"),  # stored as Int8
-            ("int8", "Int8", "b", "1"),
-            ("uint8", "UInt8", "B", "1"),
-            # conflicting in spec and implementation, fallback to implementation
-            ("int16", "Int16", "s", "2"),
-            ("uint16", "UInt16", "u", "2"),
-            ("int32", "Int32", "I", "4"),
-            ("uint32", "UInt32", "i", "4"),
-            # conflicting in spec and implementation, fallback to implementation
-            ("int64", "Int64", "l", "8"),
-            # ("uint64", "UInt64", "l", "8"),
-            ("f32", "Float", "f", "4"),
-            ("f64", "Double", "d", "8"),
-            ("decimal", "UInt8, Int32", "D", "5"),
-            # ("shortstr", "String", "s", "UInt32(value.shortBytesCount)"),
-            ("longstr", "String", "S", "value.longBytesCount"),
-            (
-                "array",
-                "[FieldValue]",
-                "A",
-                "value.reduce(into: 0) { $0 += $1.bytesCount }",
-            ),
-            ("timestamp", "Timestamp", "T", "8"),  # stored as uint64
-            ("table", "Table", "F", "value.bytesCount"),
-            ("bytes", "[UInt8]", "x", "UInt32(value.count)"),
-            ("void", "", "V", "1"),
-        ]
+        field_values_definitions = FIELD_VALUES
 
         def get_init_value(case: str, type: str) -> str:
             if case == "decimal":
-                return f"0,0"
+                return f"0, 0"
             elif case == "timestamp":
                 return "Timestamp.distantPast"
             elif case == "table":
                 return "[:]"
             return f"{type}.init()"
 
-        print("    public typealias Table = [String: FieldValue]")
-        print("")
+        print("    public typealias Table = [String: FieldValue]", file=out)
+        print("", file=out)
         print(
-            "    public enum FieldValue: Equatable, Hashable, CaseIterable, Sendable {"
+            "    public enum FieldValue: Equatable, Hashable, CaseIterable, Sendable {",
+            file=out,
         )
-        print("        public static let allCases: [Self] = [")
+        print("        public static let allCases: [Self] = [", file=out)
         for case, type, _, _ in field_values_definitions:
             if len(type):
-                print(f"            .{case}({get_init_value(case, type)}),")
+                print(f"            .{case}({get_init_value(case, type)}),", file=out)
             else:
-                print(f"            .{case},")
-        print("        ]")
-        print()
+                print(f"            .{case},", file=out)
+        print("        ]", file=out)
+        print(file=out)
         for case, type, _, _ in field_values_definitions:
             if len(type):
-                print(f"        case {case}({type})")
+                print(f"        case {case}({type})", file=out)
             else:
-                print(f"        case {case}")
-        print("")
-        print("        var type: UInt8 {")
-        print("            switch self {")
+                print(f"        case {case}", file=out)
+        print("", file=out)
+        print("        var type: UInt8 {", file=out)
+        print("            switch self {", file=out)
         for case, _, kind, _ in field_values_definitions:
-            print(f'            case .{case}: return Character("{kind}").asciiValue!')
-        print("            }")
-        print("        }")
-        print("")
-        print("        var bytesCount: UInt32 {")
-        print("            // 1 extra byte to store the type info")
-        print("            switch self {")
+            print(f'            case .{case}: return UInt8(ascii: "{kind}")', file=out)
+        print("            }", file=out)
+        print("        }", file=out)
+        print("", file=out)
+        print("        var bytesCount: UInt32 {", file=out)
+        print("            // 1 extra byte to store the type info", file=out)
+        print("            switch self {", file=out)
         for case, _, kind, size in field_values_definitions:
             if "value" in size:
                 # add 4 for length
@@ -101,26 +156,27 @@ protocol AMQPMethodProtocol: AMQPClassProtocol {
                     "" if case not in ["array", "bytes"] else " + 4"
                 )
                 print(
-                    f"            case .{case}(let value): return {size} + 1{addition}"
+                    f"            case .{case}(let value): return {size} + 1{addition}",
+                    file=out,
                 )
             else:
-                print(f"            case .{case}: return {size} + 1")
-        print("            }")
-        print("        }")
-        print("    }")
+                print(f"            case .{case}: return {size} + 1", file=out)
+        print("            }", file=out)
+        print("        }", file=out)
+        print("    }", file=out)
 
     def header():
-        print_file_header()
+        print_file_header(out)
 
     def amqp_constants():
-        print()
-        print("    public struct ProtocolLevel {")
-        print(f"        static let major: UInt8 = {spec.major}")
-        print(f"        static let minor: UInt8 = {spec.minor}")
-        print(f"        static let revision: UInt8 = {spec.revision}")
-        print(f"        static let port = {spec.port}")
-        print("    }")
-        print()
+        print(file=out)
+        print("    public struct ProtocolLevel {", file=out)
+        print(f"        static let major: UInt8 = {spec.major}", file=out)
+        print(f"        static let minor: UInt8 = {spec.minor}", file=out)
+        print(f"        static let revision: UInt8 = {spec.revision}", file=out)
+        print(f"        static let port = {spec.port}", file=out)
+        print("    }", file=out)
+        print(file=out)
         for c, v, constant_class in spec.constants:
             if "error" in constant_class:
                 continue
@@ -133,75 +189,92 @@ protocol AMQPMethodProtocol: AMQPClassProtocol {
                 "frameEnd",
             ]:
                 c += ": UInt8"
-            print(f"    static let {c} = {v}")
+            print(f"    static let {c} = {v}", file=out)
 
-        print("\n    enum SoftError: Int, Error {")
+        print("\n    enum SoftError: Int, Error {", file=out)
         for c, v, constant_class in spec.constants:
             if "soft-error" in constant_class:
                 c = as_camel_case(False, c)
-                print(f"    case {c} = {v}")
-        print("    }")
-        print("\n    enum HardError: Int, Error {")
+                print(f"        case {c} = {v}", file=out)
+        print("    }", file=out)
+        print("\n    enum HardError: Int, Error {", file=out)
         for c, v, constant_class in spec.constants:
             if "hard-error" in constant_class:
                 c = as_camel_case(False, c)
-                print(f"    case {c} = {v}")
-        print("    }")
+                print(f"        case {c} = {v}", file=out)
+        print("    }", file=out)
 
     def amqp_classes_and_methods():
         for c in spec.classes:
-            print()
-            print(f"    public struct {struct_name(c.name)}: AMQPClassProtocol {{")
-            print(f"        public var amqpClassId: UInt16 {{ {c.index} }}")
-            print(f'        public var amqpName: String {{ "{c.name}" }}')
+            print(file=out)
+            print(f"    public struct {struct_name(c.name)}: AMQPClassProtocol {{", file=out)
+            print(f"        public var amqpClassId: UInt16 {{ {c.index} }}", file=out)
+            print(f'        public var amqpName: String {{ "{c.name}" }}', file=out)
             for m in c.allMethods():
-                print()
+                print(file=out)
                 print(
-                    f"        public struct {struct_name(m.name)}: AMQPMethodProtocol {{"
+                    f"        public struct {struct_name(m.name)}: AMQPMethodProtocol {{",
+                    file=out,
                 )
                 for a in m.arguments:
                     if a.defaultvalue is None:
                         print(
-                            f"            public private(set) var {variable_name(a.name)}: {swift_type(spec, a.domain)}"
+                            f"            public private(set) var {variable_name(a.name)}: {swift_type(spec, a.domain)}",
+                            file=out,
                         )
                     else:
                         print(
-                            f"            public private(set) var {variable_name(a.name)}: {swift_type(spec, a.domain)} = {default_value(spec, a.domain, a.defaultvalue)}"
+                            f"            public private(set) var {variable_name(a.name)}: {swift_type(spec, a.domain)} = {default_value(spec, a.domain, a.defaultvalue)}",
+                            file=out,
                         )
-                print()
-                print(f"            public var amqpClassId: UInt16 {{ {c.index} }}")
-                print(f"            public var amqpMethodId: UInt16 {{ {m.index} }}")
+                print(file=out)
+                print(f"            public var amqpClassId: UInt16 {{ {c.index} }}", file=out)
+                print(f"            public var amqpMethodId: UInt16 {{ {m.index} }}", file=out)
                 print(
-                    f'            public var amqpName: String {{ "{c.name}.{m.name}" }}'
+                    f'            public var amqpName: String {{ "{c.name}.{m.name}" }}',
+                    file=out,
                 )
-                print("        }")
-            print("    }")
+                print("        }", file=out)
+            print("    }", file=out)
 
     def specific_properties(c):
         structName = struct_name(c.name)
 
-        print()
-        print(f"    public struct {structName}Properties: AMQPPropertiesProtocol {{")
+        print(file=out)
+        print(f"    public struct {structName}Properties: AMQPPropertiesProtocol {{", file=out)
         for f in c.fields:
             print(
-                f"        public private(set) var {variable_name(f.name)}: {swift_type(spec, f.domain)}?"
+                f"        public private(set) var {variable_name(f.name)}: {swift_type(spec, f.domain)}?",
+                file=out,
             )
+        tables = [f for f in c.fields if spec.resolveDomain(f.domain) == "table"]
+        if len(tables):
+            print(file=out)
+            print("        // computed once so the encoder doesn't walk the tables for every size query", file=out)
+        for f in tables:
+            print(f"        let {variable_name(f.name, False)}BytesCount: UInt32", file=out)
 
-        print()
-        print(f"        public var amqpClassId: UInt16 {{ {c.index} }}")
-        print(f'        public var amqpName: String {{ "{c.name}" }}')
-        print()
-        print("        public init(")
+        print(file=out)
+        print(f"        public var amqpClassId: UInt16 {{ {c.index} }}", file=out)
+        print(f'        public var amqpName: String {{ "{c.name}" }}', file=out)
+        print(file=out)
+        print("        public init(", file=out)
         for f in c.fields:
             print(
-                f"        {variable_name(f.name)}: {swift_type(spec, f.domain)}? = nil,"
+                f"            {variable_name(f.name)}: {swift_type(spec, f.domain)}? = nil,",
+                file=out,
             )
-        print("        ) {")
+        print("        ) {", file=out)
         for f in c.fields:
-            print(f"        self.{variable_name(f.name)} = {variable_name(f.name)}")
-        print("        }")
-        print()
-        print("    }")
+            print(f"            self.{variable_name(f.name)} = {variable_name(f.name)}", file=out)
+        for f in tables:
+            print(
+                f"            self.{variable_name(f.name, False)}BytesCount = {variable_name(f.name)}?.bytesCount ?? 0",
+                file=out,
+            )
+        print("        }", file=out)
+        print(file=out)
+        print("    }", file=out)
 
     def amqp_properties_classes():
         for c in spec.classes:
@@ -209,50 +282,171 @@ protocol AMQPMethodProtocol: AMQPClassProtocol {
                 specific_properties(c)
 
     def amqp_spec():
-        print("// swiftlint:disable nesting type_body_length")
-        print("public enum Spec {")
+        print("// swiftlint:disable nesting type_body_length", file=out)
+        print("public enum Spec {", file=out)
 
         FieldValueEnum()
         amqp_constants()
         amqp_classes_and_methods()
         amqp_properties_classes()
 
-        print("}")
-        print("// swiftlint:enable nesting type_body_length")
+        print("}", file=out)
+        print("// swiftlint:enable nesting type_body_length", file=out)
 
     header()
-    print()
     protocols()
-    print()
+    print(file=out)
     amqp_spec()
 
 
 # --------------------------------------------------------------------------------
 
 
-def as_bool_literal(val: bool):
-    return "true" if val else "false"
+# shortstr fields "class.method.field" decoded through the interning cache of the connection (ShortStringInterner),
+# they carry the handful of distinct values a channel sees over and over; generate.py --intern replaces the set.
+# The views of LAZY_VIEW_METHODS read these fields through the cache when they are made instead of on access
+INTERNED_FIELDS = {
+    "basic.deliver.consumer-tag",
+    "basic.deliver.exchange",
+    "basic.deliver.routing-key",
+    "basic.return.exchange",
+    "basic.return.routing-key",
+    "basic.get-ok.exchange",
+    "basic.get-ok.routing-key",
+}
+
+
+def field_path(m, a) -> str:
+    return f"{m.klass.name}.{m.name}.{a.name}"
+
+
+def shortstr_fields(spec) -> set:
+    return {
+        field_path(m, a)
+        for c in spec.allClasses()
+        for m in c.allMethods()
+        for a in m.arguments
+        if spec.resolveDomain(a.domain) == "shortstr"
+    }
+
+
+def check_interned_fields(spec, fields):
+    """raises if an interned field doesn't exist in the spec or isn't a shortstr"""
+    unknown = sorted(set(fields) - shortstr_fields(spec))
+    if unknown:
+        raise RuntimeError(f"only shortstr method arguments can be interned, got {', '.join(unknown)}")
 
 
-def gen_swift_impl(spec: AmqpSpec):
+def metrics_slots(spec) -> dict:
+    """(class, method) -> index of the method in the CodecMetrics counter table, in spec order"""
+    methods = [(c.name, m.name) for c in spec.allClasses() for m in c.allMethods()]
+    return {method: slot for slot, method in enumerate(methods)}
+
+
+def print_codec_metrics(out: TextIO, indent: str, statements: list):
+    """the instrumentation is only compiled with the CodecMetrics trait, without it the codecs are unchanged"""
+    print(f"{indent}#if CodecMetrics", file=out)
+    for statement in statements:
+        print(f"{indent}    {statement}", file=out)
+    print(f"{indent}#endif", file=out)
+
+
+# domains which occupy the same number of bytes on the wire regardless of the value
+FIXED_WIDTH_DOMAINS = ["octet", "short", "long", "longlong", "timestamp", "bit"]
+
+
+def wire_items(spec, arguments):
+    """splits arguments into (domain, [arguments]) as laid out on the wire, consecutive bits share one octet"""
+    items = []
+    for a in arguments:
+        t = spec.resolveDomain(a.domain)
+        if t == "bit" and len(items) and items[-1][0] == "bit":
+            items[-1][1].append(a)
+        else:
+            items.append((t, [a]))
+    return items
+
+
+def gen_swift_impl(spec: AmqpSpec, out: TextIO):
+    slots = metrics_slots(spec)
+
+    def timed(m, operation):
+        """starts the clock and records the operation when the enclosing function returns"""
+        slot = slots[(m.klass.name, m.name)]
+        print_codec_metrics(
+            out,
+            "        ",
+            [
+                "let metricsStart = CodecMetrics.now()",
+                f"defer {{ CodecMetrics.shared.record(.{operation}, slot: {slot}, bytes: bytesCount, since: metricsStart) }}",
+            ],
+        )
 
     def header():
-        print_file_header()
-        print()
-        print("private typealias FieldValue = Spec.FieldValue")
+        print_file_header(out)
+        print("import NIOCore", file=out)
+        print(file=out)
+        print("private typealias FieldValue = Spec.FieldValue", file=out)
 
     def pack_encode_bits(bits_to_pack):
         if len(bits_to_pack) == 0:
             return
         if len(bits_to_pack) == 1:
-            print(f"        try encoder.encode({variable_name(bits_to_pack[0].name)})")
+            print(f"        try encoder.encode({variable_name(bits_to_pack[0].name)})", file=out)
             return
-        print(f"        var bitPack: UInt8 = 0")
+        print(f"        var bitPack: UInt8 = 0", file=out)
         if len(bits_to_pack) > 8:
             raise RuntimeError("packing more than 8 bits is not implemented")
         for k, a in enumerate(bits_to_pack):
-            print(f"        if {variable_name(a.name)} {{ bitPack |= 1 << {k} }}")
-        print(f"        try encoder.encode(bitPack)")
+            print(f"        if {variable_name(a.name)} {{ bitPack |= 1 << {k} }}", file=out)
+        print(f"        try encoder.encode(bitPack)", file=out)
+
+    def pack_write_bits(bits_to_pack):
+        if len(bits_to_pack) == 0:
+            return
+        if len(bits_to_pack) == 1:
+            print(
+                f"        buffer.writeInteger(UInt8({variable_name(bits_to_pack[0].name)} ? 1 : 0))",
+                file=out,
+            )
+            return
+        print(f"        var bitPack: UInt8 = 0", file=out)
+        if len(bits_to_pack) > 8:
+            raise RuntimeError("packing more than 8 bits is not implemented")
+        for k, a in enumerate(bits_to_pack):
+            print(f"        if {variable_name(a.name)} {{ bitPack |= 1 << {k} }}", file=out)
+        print(f"        buffer.writeInteger(bitPack)", file=out)
+
+    def write_call(a):
+        t = spec.resolveDomain(a.domain)
+        name = variable_name(a.name)
+        if t == "shortstr":
+            return f"buffer.writeShortString({name})"
+        elif t == "longstr":
+            return f"buffer.writeLongString({name})"
+        elif t == "table":
+            return f"buffer.writeTable({name})"
+        elif t == "timestamp":
+            return f"buffer.writeInteger({name}.millisecondsSince1970)"
+        return f"buffer.writeInteger({name})"
+
+    def write_argument(a):
+        print(f"        {write_call(a)}", file=out)
+
+    def write_extension(m):
+        """emits direct-to-ByteBuffer serialization, the same wire layout as encode(to:)"""
+        print("    func write(into buffer: inout ByteBuffer) {", file=out)
+        timed(m, "encode")
+        bits_to_pack = []
+        for a in m.arguments:
+            if spec.resolveDomain(a.domain) == "bit":
+                bits_to_pack.append(a)
+                continue
+            pack_write_bits(bits_to_pack)
+            bits_to_pack = []
+            write_argument(a)
+        pack_write_bits(bits_to_pack)
+        print("    }", file=out)
 
     def pack_decode_bits(bits_to_unpack) -> int:
         """returns number of bytes it would need"""
@@ -261,26 +455,111 @@ def gen_swift_impl(spec: AmqpSpec):
         if len(bits_to_unpack) == 1:
             a = bits_to_unpack[0]
             print(
-                f"        let {variable_name(a.name, True)} = try decoder.decode({swift_type(spec, a.domain)}.self)"
+                f"        let {variable_name(a.name, True)} = try decoder.decode({swift_type(spec, a.domain)}.self)",
+                file=out,
             )
             return 1
-        print(f"        let bitPack: UInt8 = try decoder.decode(UInt8.self)")
+        print(f"        let bitPack: UInt8 = try decoder.decode(UInt8.self)", file=out)
         if len(bits_to_unpack) > 8:
             raise RuntimeError("packing more than 8 bits is not implemented")
         for k, a in enumerate(bits_to_unpack):
             print(
-                f"        let {variable_name(a.name, True)}: Bool = ((bitPack & (1 << {k})) != 0)"
+                f"        let {variable_name(a.name, True)}: Bool = ((bitPack & (1 << {k})) != 0)",
+                file=out,
             )
         return 1  # can't pack more than 8 bits for now
 
+    def item_bytes_count(item):
+        t, args = item
+        if t == "bit":
+            return "1"
+        return get_bytes_count(spec, args[0].name, args[0].domain)
+
+    def decode_item(m, item):
+        t, args = item
+        if t == "bit":
+            pack_decode_bits(args)
+            return
+        a = args[0]
+        if t == "shortstr" and field_path(m, a) in INTERNED_FIELDS:
+            print(f"        let {variable_name(a.name, False)} = try decoder.decodeInterned(String.self)", file=out)
+        elif t == "shortstr" or t == "longstr":
+            is_long = t == "longstr"
+            print(
+                f"        let {variable_name(a.name, False)} = try decoder.decode({swift_type(spec, a.domain)}.self, isLong: {as_bool_literal(is_long)})",
+                file=out,
+            )
+        else:
+            print(
+                f"        let {variable_name(a.name, False)} = try decoder.decode({swift_type(spec, a.domain)}.self)",
+                file=out,
+            )
+
+    def decode_fixed_width_run(run, name):
+        """reads a run of fixed width items with one bounds check, each item is read at a known offset"""
+        print(
+            f"        let {name} = try decoder.decodeBytes(count: {sum(int(item_bytes_count(i)) for i in run)})",
+            file=out,
+        )
+        offset = 0
+        for item in run:
+            t, args = item
+            if t == "bit" and len(args) == 1:
+                print(
+                    f"        let {variable_name(args[0].name, True)} = {name}.getInteger(at: {offset}, as: UInt8.self)! != 0",
+                    file=out,
+                )
+            elif t == "bit":
+                if len(args) > 8:
+                    raise RuntimeError("packing more than 8 bits is not implemented")
+                print(f"        let bitPack = {name}.getInteger(at: {offset}, as: UInt8.self)!", file=out)
+                for k, a in enumerate(args):
+                    print(
+                        f"        let {variable_name(a.name, True)}: Bool = ((bitPack & (1 << {k})) != 0)",
+                        file=out,
+                    )
+            elif t == "timestamp":
+                print(
+                    f"        let {variable_name(args[0].name, False)} = Timestamp(millisecondsSince1970: {name}.getInteger(at: {offset}, as: UInt64.self)!)",
+                    file=out,
+                )
+            else:
+                print(
+                    f"        let {variable_name(args[0].name, False)} = {name}.getInteger(at: {offset}, as: {swift_type(spec, args[0].domain)}.self)!",
+                    file=out,
+                )
+            offset += int(item_bytes_count(item))
+
+    def decode_arguments(m):
+        """emits decoding of all arguments of the method, returns the list of their sizes"""
+        runs = []
+        for item in wire_items(spec, m.arguments):
+            fixed_width = item[0] in FIXED_WIDTH_DOMAINS
+            if fixed_width and len(runs) and runs[-1][0]:
+                runs[-1][1].append(item)
+            else:
+                runs.append((fixed_width, [item]))
+        fixed_width_runs = 0
+        for fixed_width, run in runs:
+            if fixed_width and len(run) > 1:
+                name = "fixedWidth" + (str(fixed_width_runs) if fixed_width_runs else "")
+                fixed_width_runs += 1
+                decode_fixed_width_run(run, name)
+            else:
+                for item in run:
+                    decode_item(m, item)
+        return [item_bytes_count(item) for _, run in runs for item in run]
+
     def encode_extensions():
         for c in spec.allClasses():
             for m in c.allMethods():
-                print()
+                print(file=out)
                 print(
-                    f"extension Spec.{struct_name(c.name)}.{struct_name(m.name).strip()}: FrameCodable {{"
+                    f"extension Spec.{struct_name(c.name)}.{struct_name(m.name).strip()}: FrameCodable, FrameBufferWritable {{",
+                    file=out,
                 )
-                print("    func encode(to encoder: FrameEncoderProtocol) throws {")
+                print("    func encode(to encoder: FrameEncoderProtocol) throws {", file=out)
+                timed(m, "encode")
                 bits_to_pack = []
                 for a in m.arguments:
                     t = spec.resolveDomain(a.domain)
@@ -293,92 +572,597 @@ def gen_swift_impl(spec: AmqpSpec):
                     if t == "shortstr" or t == "longstr":
                         is_long = t == "longstr"
                         print(
-                            f"        try encoder.encode({variable_name(a.name)}, isLong: {as_bool_literal(is_long)})"
+                            f"        try encoder.encode({variable_name(a.name)}, isLong: {as_bool_literal(is_long)})",
+                            file=out,
                         )
                     else:
-                        print(f"        try encoder.encode({variable_name(a.name)})")
+                        print(f"        try encoder.encode({variable_name(a.name)})", file=out)
                 pack_encode_bits(bits_to_pack)
                 bits_to_pack = []
-                print("    }")
-                print()
-                print("    init(from decoder: FrameDecoderProtocol) throws {")
-                bytes_count = []
-                bits_to_unpack = []
-                for a in m.arguments:
-                    t = spec.resolveDomain(a.domain)
-                    if t == "bit":
-                        bits_to_unpack.append(a)
-                        continue
-                    else:
-                        # not encoding bits, check if there are any bits to encode and do that
-                        serialized_size = pack_decode_bits(bits_to_unpack)
-                        bits_to_unpack = []
-                        if serialized_size:
-                            bytes_count.append(str(serialized_size))
-                    bytes_count.append(get_bytes_count(spec, a.name, a.domain))
-                    if t == "shortstr" or t == "longstr":
-                        is_long = t == "longstr"
-                        print(
-                            f"        let {variable_name(a.name, False)} = try decoder.decode({swift_type(spec, a.domain)}.self, isLong: {as_bool_literal(is_long)})"
-                        )
-                    else:
-                        print(
-                            f"        let {variable_name(a.name, False)} = try decoder.decode({swift_type(spec, a.domain)}.self)"
-                        )
-                serialized_size = pack_decode_bits(bits_to_unpack)
-                bits_to_unpack = []
-                if serialized_size != None:
-                    bytes_count.append(str(serialized_size))
+                print("    }", file=out)
+                print(file=out)
+                write_extension(m)
+                print(file=out)
+                print("    init(from decoder: FrameDecoderProtocol) throws {", file=out)
+                print_codec_metrics(out, "        ", ["let metricsStart = CodecMetrics.now()"])
+                bytes_count = decode_arguments(m)
                 if not len(m.arguments):
-                    print("        self.init()")
+                    print("        self.init()", file=out)
                 else:
-                    print(f"        self.init(")
+                    print(f"        self.init(", file=out)
                     print(
                         ",\n".join(
                             [
                                 f"            {variable_name(a.name, False)}: {variable_name(a.name, True)}"
                                 for a in m.arguments
                             ]
-                        )
+                        ),
+                        file=out,
                     )
-                    print(f"        )")
-                print("    }")
-                print()
-                bc = " + ".join(sorted(bytes_count))  # optimization for compiler
-                print("    var bytesCount: UInt32 { " + (bc if len(bc) else "0") + " }")
-                print("}")
-
-        print()
-        print("extension Spec {")
+                    print(f"        )", file=out)
+                slot = slots[(c.name, m.name)]
+                print_codec_metrics(
+                    out,
+                    "        ",
+                    [f"CodecMetrics.shared.record(.decode, slot: {slot}, bytes: bytesCount, since: metricsStart)"],
+                )
+                print("    }", file=out)
+                print(file=out)
+                # sorted as an optimization for compiler
+                print_computed_property(out, "    ", "var bytesCount: UInt32", sorted(bytes_count) or ["0"])
+                print("}", file=out)
+
+        print(file=out)
+        print("extension Spec {", file=out)
         print(
-            "    typealias Factory = @Sendable (any FrameDecoderProtocol) throws -> any FrameCodable\n"
+            "    typealias Factory = @Sendable (any FrameDecoderProtocol) throws -> any FrameCodable\n",
+            file=out,
         )
-        print("    // swiftlint:disable:next all")
+        print("    // swiftlint:disable:next all", file=out)
         print(
-            "    static func makeFactory(with classId: UInt16, and methodId: UInt16) throws -> Factory {"
+            "    static func makeFactory(with classId: UInt16, and methodId: UInt16) throws -> Factory {",
+            file=out,
         )
-        print("        switch (classId, methodId) {")
+        print("        switch (classId, methodId) {", file=out)
         for c in spec.allClasses():
             for m in c.allMethods():
                 print(
-                    f"        case ({c.index}, {m.index}): return Spec.{struct_name(c.name)}.{struct_name(m.name)}.init"
+                    f"        case ({c.index}, {m.index}): return Spec.{struct_name(c.name)}.{struct_name(m.name)}.init",
+                    file=out,
                 )
+        print("        default:", file=out)
+        print_codec_metrics(out, "            ", ["CodecMetrics.shared.recordUnknownMethod()"])
+        print("            throw FramingError.unknownClassAndMethod(class: classId, method: methodId)", file=out)
+        print("        }", file=out)
+        print("    }", file=out)
+        print("}", file=out)
+
+    def metrics_extension():
+        """the slot table of the CodecMetrics counters"""
+        print(file=out)
+        print("#if CodecMetrics", file=out)
+        print("    extension Spec {", file=out)
+        print("        /// class id, method id and name of every method, indexed by the CodecMetrics slot", file=out)
+        print("        static let metricsSlots: [(classId: UInt16, methodId: UInt16, name: String)] = [", file=out)
+        for c in spec.allClasses():
+            for m in c.allMethods():
+                print(f'            ({c.index}, {m.index}, "{c.name}.{m.name}"),', file=out)
+        print("        ]", file=out)
+        print(file=out)
+        print("        static func metricsSlot(with classId: UInt16, and methodId: UInt16) -> Int? {", file=out)
+        print("            switch (classId, methodId) {", file=out)
+        for c in spec.allClasses():
+            for m in c.allMethods():
+                print(f"            case ({c.index}, {m.index}): return {slots[(c.name, m.name)]}", file=out)
+        print("            default: return nil", file=out)
+        print("            }", file=out)
+        print("        }", file=out)
+        print("    }", file=out)
+        print("#endif", file=out)
+
+    def properties_extension(c):
+        """emits the content header properties codec, 4.2.6.1 The Content Header"""
+        # every flag word carries 15 properties from the highest bit down, the lowest bit announces the next word
+        words = max(1, (len(c.fields) + 14) // 15)
+
+        def flag(i):
+            return f"1 << {15 - i % 15}"
+
+        def flags_name(w):
+            return "flags" if words == 1 else f"flags.{w}"
+
+        def following(w):
+            """expression which is non zero if any flag word after w has to be written"""
+            return " | ".join(flags_name(k) for k in range(w + 1, words))
+
+        def field_bytes_count(f):
+            if spec.resolveDomain(f.domain) == "table":
+                return f"{variable_name(f.name, False)}BytesCount"
+            return get_bytes_count(spec, f.name, f.domain)
+
+        print(file=out)
+        print(f"extension Spec.{struct_name(c.name)}Properties: FrameCodable, FrameBufferWritable {{", file=out)
+        print("    /// presence bits of the set properties, one value per flag word", file=out)
+        if words == 1:
+            print("    var propertyFlags: UInt16 {", file=out)
+        else:
+            print(f"    var propertyFlags: ({', '.join(['UInt16'] * words)}) {{", file=out)
+        for w in range(words):
+            print(f"        var flags{w}: UInt16 = 0", file=out)
+        for i, f in enumerate(c.fields):
+            print(f"        if {variable_name(f.name)} != nil {{ flags{i // 15} |= {flag(i)} }}", file=out)
+        if words == 1:
+            print("        return flags0", file=out)
+        else:
+            print(f"        return ({', '.join(f'flags{w}' for w in range(words))})", file=out)
+        print("    }", file=out)
+        print(file=out)
+
+        def write_flags(write):
+            if words == 1:
+                print(f"        {write('propertyFlags')}", file=out)
+                return
+            print("        let flags = propertyFlags", file=out)
+            for w in range(words):
+                value = flags_name(w)
+                if w + 1 < words:
+                    value = f"{value} | ({following(w)} != 0 ? 1 : 0)"
+                if w == 0:
+                    print(f"        {write(value)}", file=out)
+                else:
+                    print(f"        if {following(w - 1)} != 0 {{ {write(value)} }}", file=out)
+
+        print("    func encode(to encoder: FrameEncoderProtocol) throws {", file=out)
+        write_flags(lambda value: f"try encoder.encode({value})")
+        for f in c.fields:
+            name = variable_name(f.name)
+            t = spec.resolveDomain(f.domain)
+            if t == "shortstr" or t == "longstr":
+                call = f"try encoder.encode({name}, isLong: {as_bool_literal(t == 'longstr')})"
+            else:
+                call = f"try encoder.encode({name})"
+            print(f"        if let {name} {{ {call} }}", file=out)
+        print("    }", file=out)
+        print(file=out)
+        print("    func write(into buffer: inout ByteBuffer) {", file=out)
+        write_flags(lambda value: f"buffer.writeInteger({value})")
+        for f in c.fields:
+            print(f"        if let {variable_name(f.name)} {{ {write_call(f)} }}", file=out)
+        print("    }", file=out)
+        print(file=out)
+        print("    init(from decoder: FrameDecoderProtocol) throws {", file=out)
+        print("        let flags0 = try decoder.decode(UInt16.self)", file=out)
+        for w in range(1, words):
+            print(
+                f"        let flags{w}: UInt16 = try flags{w - 1} & 1 != 0 ? decoder.decode(UInt16.self) : 0",
+                file=out,
+            )
+        print(f"        guard flags{words - 1} & 1 == 0 else {{", file=out)
+        print(
+            '            throw FramingError.fatal("Content header announces more property flags than the spec defines")',
+            file=out,
+        )
+        print("        }", file=out)
+        for f in c.fields:
+            print(f"        var {variable_name(f.name, False)}: {swift_type(spec, f.domain)}?", file=out)
+        for i, f in enumerate(c.fields):
+            name = variable_name(f.name, False)
+            t = spec.resolveDomain(f.domain)
+            print(f"        if flags{i // 15} & ({flag(i)}) != 0 {{", file=out)
+            if t == "shortstr" or t == "longstr":
+                print(
+                    f"            {name} = try decoder.decode({swift_type(spec, f.domain)}.self, isLong: {as_bool_literal(t == 'longstr')})",
+                    file=out,
+                )
+            else:
+                print(f"            {name} = try decoder.decode({swift_type(spec, f.domain)}.self)", file=out)
+            print("        }", file=out)
+        print("        self.init(", file=out)
         print(
-            "        default: throw FramingError.unknownClassAndMethod(class: classId, method: methodId)"
+            ",\n".join(
+                f"            {variable_name(f.name, False)}: {variable_name(f.name, False)}" for f in c.fields
+            ),
+            file=out,
         )
-        print("        }")
-        print("    }")
-        print("}")
+        print("        )", file=out)
+        print("    }", file=out)
+        print(file=out)
+        print("    var bytesCount: UInt32 {", file=out)
+        if words == 1:
+            print("        var size: UInt32 = 2", file=out)
+        else:
+            print("        let flags = propertyFlags", file=out)
+            print("        var size: UInt32 = 2", file=out)
+            for w in range(1, words):
+                print(f"        if {following(w - 1)} != 0 {{ size += 2 }}", file=out)
+        for f in c.fields:
+            name = variable_name(f.name)
+            t = spec.resolveDomain(f.domain)
+            binding = f"let {name}" if t in ["shortstr", "longstr"] else f"{name} != nil"
+            print(f"        if {binding} {{ size += {field_bytes_count(f)} }}", file=out)
+        print("        return size", file=out)
+        print("    }", file=out)
+        print("}", file=out)
 
-    def decode_extensions():
-        pass
+    def properties_extensions():
+        for c in spec.allClasses():
+            if c.hasContentProperties:
+                properties_extension(c)
+
+    def field_value_codec():
+        print(file=out)
+        print("extension Spec.FieldValue: FrameBufferWritable {", file=out)
+        print("    /// Decodes the value which follows the type `tag` (see `type`).", file=out)
+        print("    static func decode(tag: UInt8, from decoder: FrameDecoderProtocol) throws -> Self {", file=out)
+        print("        switch tag {", file=out)
+        for case, type, kind, _ in FIELD_VALUES:
+            statements = field_value_decode(case, type)
+            if len(statements) == 1:
+                print(f'        case UInt8(ascii: "{kind}"): {statements[0]}', file=out)
+                continue
+            print(f'        case UInt8(ascii: "{kind}"):', file=out)
+            for statement in statements:
+                print(f"            {statement}", file=out)
+        print('        default: throw FramingError.fatal("Unknown field value type \\(tag)")', file=out)
+        print("        }", file=out)
+        print("    }", file=out)
+        print(file=out)
+        print("    /// Writes the type tag followed by the value.", file=out)
+        print("    func write(into buffer: inout ByteBuffer) {", file=out)
+        print("        buffer.writeInteger(type)", file=out)
+        print("        switch self {", file=out)
+        for case, type, _, _ in FIELD_VALUES:
+            statements = field_value_write(case)
+            if case == "decimal":
+                pattern = f".{case}(let scale, let value)"
+            elif case == "void":
+                pattern = f".{case}"
+            else:
+                pattern = f".{case}(let value)"
+            if len(statements) == 1:
+                print(f"        case {pattern}: {statements[0]}", file=out)
+                continue
+            print(f"        case {pattern}:", file=out)
+            for statement in statements:
+                print(f"            {statement}", file=out)
+        print("        }", file=out)
+        print("    }", file=out)
+        print("}", file=out)
 
     header()
+    field_value_codec()
     encode_extensions()
-    decode_extensions()
+    metrics_extension()
+    properties_extensions()
+
+
+def gen_swift_views(spec: AmqpSpec, out: TextIO):
+    """emits lazy views for LAZY_VIEW_METHODS, each keeps the wire bytes and the offsets past variable length arguments"""
+
+    def offset_expression(anchor, constant):
+        if anchor is None:
+            return str(constant)
+        if constant == 0:
+            return anchor
+        return f"{anchor} + {constant}"
+
+    def is_interned(m, item):
+        return item[0] == "shortstr" and field_path(m, item[1][0]) in INTERNED_FIELDS
+
+    def accessor(m, item, at):
+        t, args = item
+        if t == "bit":
+            if len(args) > 8:
+                raise RuntimeError("packing more than 8 bits is not implemented")
+            for k, a in enumerate(args):
+                if len(args) == 1:
+                    expression = f"buffer.getInteger(at: {at}, as: UInt8.self)! != 0"
+                else:
+                    expression = f"(buffer.getInteger(at: {at}, as: UInt8.self)! & (1 << {k})) != 0"
+                print(f"        var {variable_name(a.name)}: Bool {{ {expression} }}", file=out)
+            return
+        a = args[0]
+        name = variable_name(a.name)
+        if is_interned(m, item):
+            # stored, read through the cache by init(buffer:interner:)
+            print(f"        let {name}: String", file=out)
+        elif t == "shortstr":
+            print(f"        var {name}: String {{ buffer.getShortString(at: {at}) }}", file=out)
+        elif t == "longstr":
+            print(f"        var {name}: String {{ buffer.getLongString(at: {at}) }}", file=out)
+        elif t == "timestamp":
+            print(
+                f"        var {name}: Timestamp {{ Timestamp(millisecondsSince1970: buffer.getInteger(at: {at}, as: UInt64.self)!) }}",
+                file=out,
+            )
+        elif t in FIXED_WIDTH_DOMAINS:
+            t = swift_type(spec, a.domain)
+            print(f"        var {name}: {t} {{ buffer.getInteger(at: {at}, as: {t}.self)! }}", file=out)
+        else:
+            raise RuntimeError(f"lazy views don't support {t} arguments")
+
+    def item_size(item):
+        return 1 if item[0] == "bit" else int(get_bytes_count(spec, item[1][0].name, item[1][0].domain))
+
+    def layout(m):
+        """returns [(item, offset expression, stored offset name or None)], an offset is stored past every variable length item"""
+        result = []
+        anchor, constant = None, 0
+        follows_variable = False
+        for item in wire_items(spec, m.arguments):
+            stored = None
+            if follows_variable:
+                # named after the argument it points at
+                stored = anchor = variable_name(item[1][0].name, False) + "Offset"
+                constant = 0
+            result.append((item, offset_expression(anchor, constant), stored))
+            follows_variable = item[0] not in FIXED_WIDTH_DOMAINS
+            if not follows_variable:
+                constant += item_size(item)
+        return result
+
+    def init_from_buffer(m, positions):
+        print("        init(buffer: ByteBuffer, interner: ShortStringInterner? = nil) throws {", file=out)
+        print("            let buffer = buffer.slice()", file=out)
+        print("            var offset = 0", file=out)
+        fixed = 0
+        for item, _, stored in positions:
+            if stored is not None:
+                print(f"            self.{stored} = offset", file=out)
+            if item[0] in FIXED_WIDTH_DOMAINS:
+                fixed += item_size(item)
+                continue
+            if fixed:
+                print(f"            offset += {fixed}", file=out)
+                fixed = 0
+            if item[0] == "shortstr":
+                print("            offset += try buffer.shortStringSize(at: offset)", file=out)
+            elif item[0] == "longstr":
+                print("            offset += try buffer.longStringSize(at: offset)", file=out)
+            else:
+                raise RuntimeError(f"lazy views don't support {item[0]} arguments")
+        if fixed:
+            print(f"            offset += {fixed}", file=out)
+        print("            guard offset <= buffer.readableBytes else {", file=out)
+        print(
+            "                throw FramingError.insufficientData(needed: offset, available: buffer.readableBytes)",
+            file=out,
+        )
+        print("            }", file=out)
+        print("            self.buffer = buffer.getSlice(at: 0, length: offset)!", file=out)
+        for item, at, _ in positions:
+            if is_interned(m, item):
+                name = variable_name(item[1][0].name)
+                print(f"            self.{name} = buffer.getShortString(at: {at}, interner: interner)", file=out)
+        print("        }", file=out)
+
+    def view(c, m):
+        method_type = f"Spec.{struct_name(c.name)}.{struct_name(m.name)}"
+        positions = layout(m)
+        print(f"    /// Lazy representation of ``{method_type}`` which keeps the arguments as wire bytes.", file=out)
+        print("    ///", file=out)
+        print(
+            "    /// Only the offsets past variable length arguments are computed on construction, every accessor",
+            file=out,
+        )
+        print("    /// reads its argument when called. The full method is decoded with ``materialize()``.", file=out)
+        if any(is_interned(m, item) for item, _, _ in positions):
+            print(
+                "    /// The arguments which repeat a lot are read on construction instead, through the interning cache",
+                file=out,
+            )
+            print("    /// of the connection, so a repeated value shares the storage of the cached String.", file=out)
+        print(
+            f"    struct {view_name(m.name)}: FrameCodable, FrameBufferWritable, AMQPMethodProtocol {{",
+            file=out,
+        )
+        print("        private let buffer: ByteBuffer", file=out)
+        for _, _, stored in positions:
+            if stored is not None:
+                print(f"        private let {stored}: Int", file=out)
+        print(file=out)
+        print(f"        var amqpClassId: UInt16 {{ {c.index} }}", file=out)
+        print(f"        var amqpMethodId: UInt16 {{ {m.index} }}", file=out)
+        print(f'        var amqpName: String {{ "{c.name}.{m.name}" }}', file=out)
+        print(file=out)
+        for item, at, _ in positions:
+            accessor(m, item, at)
+        print(file=out)
+        init_from_buffer(m, positions)
+        print(file=out)
+        print(f"        init(_ method: {method_type}) {{", file=out)
+        print("            var buffer = ByteBuffer()", file=out)
+        print("            method.write(into: &buffer)", file=out)
+        print("            // the bytes were just written from a valid method", file=out)
+        print("            try! self.init(buffer: buffer)", file=out)
+        print("        }", file=out)
+        print(file=out)
+        print(f"        func materialize() -> {method_type} {{", file=out)
+        if len(m.arguments):
+            print("            .init(", file=out)
+            for i, a in enumerate(m.arguments):
+                separator = "," if i + 1 < len(m.arguments) else ""
+                print(f"                {variable_name(a.name, False)}: {variable_name(a.name)}{separator}", file=out)
+            print("            )", file=out)
+        else:
+            print("            .init()", file=out)
+        print("        }", file=out)
+        print(file=out)
+        print("        func encode(to encoder: FrameEncoderProtocol) throws {", file=out)
+        print("            try materialize().encode(to: encoder)", file=out)
+        print("        }", file=out)
+        print(file=out)
+        print("        func write(into buffer: inout ByteBuffer) {", file=out)
+        print("            buffer.writeImmutableBuffer(self.buffer)", file=out)
+        print("        }", file=out)
+        print(file=out)
+        print("        init(from decoder: FrameDecoderProtocol) throws {", file=out)
+        print(f"            self.init(try {method_type}(from: decoder))", file=out)
+        print("        }", file=out)
+        print(file=out)
+        print("        var bytesCount: UInt32 { UInt32(buffer.readableBytes) }", file=out)
+        print("    }", file=out)
+
+    print_file_header(out)
+    print("import NIOCore", file=out)
+    for c in spec.allClasses():
+        methods = [m for m in c.allMethods() if (c.name, m.name) in LAZY_VIEW_METHODS]
+        if not len(methods):
+            continue
+        print(file=out)
+        print(f"extension Spec.{struct_name(c.name)} {{", file=out)
+        for i, m in enumerate(methods):
+            if i:
+                print(file=out)
+            view(c, m)
+        print("}", file=out)
+    print(file=out)
+    print("extension Spec {", file=out)
+    print(
+        "    typealias ViewFactory = @Sendable (ByteBuffer, ShortStringInterner?) throws -> any FrameCodable",
+        file=out,
+    )
+    print(file=out)
+    print(
+        "    /// Returns the factory of the lazy view for the method or nil if the method is always decoded eagerly.",
+        file=out,
+    )
+    print(
+        "    static func makeViewFactory(with classId: UInt16, and methodId: UInt16) -> ViewFactory? {",
+        file=out,
+    )
+    print("        switch (classId, methodId) {", file=out)
+    for c in spec.allClasses():
+        for m in c.allMethods():
+            if (c.name, m.name) in LAZY_VIEW_METHODS:
+                print(
+                    f"        case ({c.index}, {m.index}): return Spec.{struct_name(c.name)}.{view_name(m.name)}.init(buffer:interner:)",
+                    file=out,
+                )
+    print("        default: return nil", file=out)
+    print("        }", file=out)
+    print("    }", file=out)
+    print("}", file=out)
+
+
+def template_methods(spec) -> list:
+    """methods which can be sent from a frame template: methods without arguments or with fixed width arguments only,
+    which are stored into their slots of the template when the frame is written. A method with a variable length
+    argument would rarely send the value it was encoded with, checking for it would cost every send"""
+    return [
+        m
+        for c in spec.allClasses()
+        for m in c.allMethods()
+        if all(spec.resolveDomain(a.domain) in FIXED_WIDTH_DOMAINS for a in m.arguments)
+    ]
+
+
+def swift_byte_array(out: TextIO, data: bytes, indent: str, prefix: str, suffix: str):
+    """prints the bytes as an array literal, on one line if it fits"""
+    values = [str(b) for b in data]
+    line = f"{indent}{prefix}[{', '.join(values)}]{suffix}"
+    if len(line) <= LINE_LENGTH:
+        print(line, file=out)
+        return
+    print(f"{indent}{prefix}[", file=out)
+    row = indent + INDENT
+    for value in values:
+        if len(row) + len(value) + 1 > LINE_LENGTH:
+            print(row.rstrip(), file=out)
+            row = indent + INDENT
+        row += f"{value}, "
+    print(row.rstrip(), file=out)
+    print(f"{indent}]{suffix}", file=out)
+
+
+def gen_swift_templates(spec: AmqpSpec, out: TextIO):
+    """emits the frames which are the same for every send but the channel id and the fixed width arguments, encoded
+    once by the reference serializer, sending one copies the template and stores a few integers into it"""
+    from shared.wire import WireCodec
+
+    codec = WireCodec(spec)
+    slots = metrics_slots(spec)
+    # type(1) + channelId(2) + size(4) + classId(2) + methodId(2)
+    arguments_offset = 11
+
+    def slot_store(item, offset):
+        t, args = item
+        if t == "bit" and len(args) == 1:
+            return [f"buffer.setInteger(UInt8({variable_name(args[0].name)} ? 1 : 0), at: start + {offset})"]
+        if t == "bit":
+            if len(args) > 8:
+                raise RuntimeError("packing more than 8 bits is not implemented")
+            lines = ["var bitPack: UInt8 = 0"]
+            for k, a in enumerate(args):
+                lines.append(f"if {variable_name(a.name)} {{ bitPack |= 1 << {k} }}")
+            lines.append(f"buffer.setInteger(bitPack, at: start + {offset})")
+            return lines
+        name = variable_name(args[0].name)
+        if t == "timestamp":
+            return [f"buffer.setInteger({name}.millisecondsSince1970, at: start + {offset})"]
+        return [f"buffer.setInteger({name}, at: start + {offset})"]
+
+    def template(c, m):
+        # the slots are written over, any value encodes to the same number of bytes
+        values = {
+            a.name.replace("-", "_"): (False if spec.resolveDomain(a.domain) == "bit" else 0)
+            for a in m.arguments
+            if spec.resolveDomain(a.domain) in FIXED_WIDTH_DOMAINS
+        }
+        data = codec.method_frame(0, c.name, m.name, **values)
+        stores = []
+        offset = arguments_offset
+        for item in wire_items(spec, m.arguments):
+            stores += slot_store(item, offset)
+            offset += item_wire_size(item)
+        print(file=out)
+        print(f"extension Spec.{struct_name(c.name)}.{struct_name(m.name)} {{", file=out)
+        swift_byte_array(out, data, INDENT, "private static let frameTemplate = ByteBuffer(bytes: ", ")")
+        print(file=out)
+        print("    func writeFrameFromTemplate(channelId: UInt16, into buffer: inout ByteBuffer) -> Bool {", file=out)
+        # counted like write(into:), which the template stands in for
+        print_codec_metrics(
+            out,
+            "        ",
+            [
+                "let metricsStart = CodecMetrics.now()",
+                f"defer {{ CodecMetrics.shared.record(.encode, slot: {slots[(c.name, m.name)]}, bytes: bytesCount, since: metricsStart) }}",
+            ],
+        )
+        print("        let start = buffer.writerIndex", file=out)
+        print("        buffer.writeImmutableBuffer(Self.frameTemplate)", file=out)
+        print("        buffer.setInteger(channelId, at: start + 1)", file=out)
+        for store in stores:
+            print(f"        {store}", file=out)
+        print("        return true", file=out)
+        print("    }", file=out)
+        print("}", file=out)
+
+    def item_wire_size(item):
+        t, _ = item
+        if t == "bit":
+            return 1
+        return len(codec._scalar(t, 0))
+
+    print_file_header(out)
+    print("import NIOCore", file=out)
+    print(file=out)
+    print("extension Spec {", file=out)
+    print("    /// The heartbeat frame, it never changes.", file=out)
+    swift_byte_array(out, codec.heartbeat_frame(), INDENT, "static let heartbeatFrame = ByteBuffer(bytes: ", ")")
+    print("}", file=out)
+    for m in template_methods(spec):
+        template(m.klass, m)
 
 
 # --------------------------------------------------------------------------------
 
 if __name__ == "__main__":
-    do_main(lambda x: gen_swift_api(AmqpSpec(x)), lambda x: gen_swift_impl(AmqpSpec(x)))
+    do_main_dict(
+        {
+            "header": lambda x: gen_swift_api(AmqpSpec(x), sys.stdout),
+            "body": lambda x: gen_swift_impl(AmqpSpec(x), sys.stdout),
+            "views": lambda x: gen_swift_views(AmqpSpec(x), sys.stdout),
+            "templates": lambda x: gen_swift_templates(AmqpSpec(x), sys.stdout),
+        }
+    )
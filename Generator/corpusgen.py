@@ -0,0 +1,154 @@
+#!/usr/bin/env python
+
+# this generator requires https://github.com/rabbitmq/rabbitmq-server/tree/main/deps/rabbitmq_codegen to work
+
+# Writes a seedable corpus of inbound traffic as a client would receive it from the broker: deliver/header/body
+# sequences across many channels, publisher confirms and heartbeats. The output is raw concatenated frames, the
+# same raw-byte format as Tests/AMQPTests/Resources/Fixtures, and feeds the decoder benchmarks:
+#   python corpusgen.py rabbitmq_codegen/amqp-rabbitmq-0.9.1.json traffic.bin --seed 1 --messages 100000
+
+import argparse
+import math
+import random
+import sys
+
+from shared.wire import WireCodec
+from rabbitmq_codegen.amqp_codegen import AmqpSpec
+
+EXCHANGES = ["", "amq.direct", "amq.topic", "orders", "telemetry"]
+ROUTING_KEYS = ["orders.eu.created", "orders.us.updated", "telemetry.cpu", "rpc.reply", "task_queue"]
+CONTENT_TYPES = ["application/json", "text/plain", "application/octet-stream"]
+
+
+def message_size(rng: random.Random, args) -> int:
+    if args.size_distribution == "fixed":
+        size = args.median_size
+    elif args.size_distribution == "pareto":
+        # heavy tail, the median of paretovariate(alpha) is 2 ** (1 / alpha)
+        size = args.median_size * rng.paretovariate(args.alpha) / 2 ** (1 / args.alpha)
+    else:
+        size = args.median_size * math.exp(rng.gauss(0, args.sigma))
+    return max(0, min(int(size), args.max_size))
+
+
+def channel_weights(channels: int, skew: float):
+    # zipf-like, a few channels carry most of the traffic
+    return [1 / (rank**skew) for rank in range(1, channels + 1)]
+
+
+def message_frames(codec: WireCodec, rng: random.Random, args, channel: int, delivery_tag: int, index: int):
+    frames = [
+        codec.method_frame(
+            channel,
+            "basic",
+            "deliver",
+            consumer_tag=f"ctag-{channel}",
+            delivery_tag=delivery_tag,
+            redelivered=rng.random() < args.redelivered_ratio,
+            exchange=rng.choice(EXCHANGES),
+            routing_key=rng.choice(ROUTING_KEYS),
+        )
+    ]
+    size = message_size(rng, args)
+    properties = {
+        "content_type": rng.choice(CONTENT_TYPES),
+        "delivery_mode": 2,
+        "message_id": f"msg-{index}",
+        "timestamp": 1_700_000_000_000 + index,
+    }
+    if rng.random() < args.headers_ratio:
+        properties["headers"] = {
+            f"x-header-{k}": rng.choice([k, f"value-{k}", True]) for k in range(rng.randint(1, 10))
+        }
+    frames.append(codec.content_header_frame(channel, "basic", size, **properties))
+    body = bytes(rng.getrandbits(8) for _ in range(min(size, 64))) * (size // 64 + 1)
+    frames += codec.body_frames(channel, body[:size], args.frame_max)
+    return frames
+
+
+def interleave(sequences):
+    """round robin over the frame sequences, each sequence stays in order (content of one channel is sequential)"""
+    result = []
+    while sequences:
+        for sequence in list(sequences):
+            result.append(sequence.pop(0))
+            if not sequence:
+                sequences.remove(sequence)
+    return result
+
+
+def generate(codec: WireCodec, args) -> list:
+    rng = random.Random(args.seed)
+    channels = list(range(1, args.channels + 1))
+    weights = channel_weights(args.channels, args.skew)
+    delivery_tags = {channel: 0 for channel in channels}
+    frames = []
+    in_flight = []
+    for index in range(args.messages):
+        channel = rng.choices(channels, weights)[0]
+        # a channel's content can't be interleaved with its own frames
+        while args.interleave and any(c == channel for c, _ in in_flight):
+            channel = rng.choices(channels, weights)[0]
+        delivery_tags[channel] += 1
+        sequence = message_frames(codec, rng, args, channel, delivery_tags[channel], index)
+        if args.interleave:
+            in_flight.append((channel, sequence))
+            if len(in_flight) == min(args.interleave, args.channels):
+                frames += interleave([s for _, s in in_flight])
+                in_flight = []
+        else:
+            frames += sequence
+        if rng.random() < args.ack_ratio:
+            acked = rng.choice(channels)
+            if delivery_tags[acked]:
+                frames.append(
+                    codec.method_frame(
+                        acked,
+                        "basic",
+                        "ack",
+                        delivery_tag=delivery_tags[acked],
+                        multiple=rng.random() < 0.5,
+                    )
+                )
+        if args.heartbeat_every and (index + 1) % args.heartbeat_every == 0:
+            frames.append(codec.heartbeat_frame())
+    frames += interleave([s for _, s in in_flight])
+    return frames
+
+
+def main():
+    parser = argparse.ArgumentParser(description="generates a corpus of inbound AMQP traffic")
+    parser.add_argument("spec", help="path to amqp-rabbitmq-0.9.1.json")
+    parser.add_argument("output", help="file to write the raw frames to")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--messages", type=int, default=10_000)
+    parser.add_argument("--channels", type=int, default=16)
+    parser.add_argument("--skew", type=float, default=1.1, help="zipf exponent of the channel popularity")
+    parser.add_argument("--frame-max", type=int, default=131_072, help="negotiated frame_max, 0 for no limit")
+    parser.add_argument("--size-distribution", choices=["lognormal", "pareto", "fixed"], default="lognormal")
+    parser.add_argument("--median-size", type=int, default=512)
+    parser.add_argument("--max-size", type=int, default=4 * 1024 * 1024)
+    parser.add_argument("--sigma", type=float, default=1.5, help="lognormal sigma")
+    parser.add_argument("--alpha", type=float, default=1.2, help="pareto alpha")
+    parser.add_argument("--headers-ratio", type=float, default=0.3)
+    parser.add_argument("--redelivered-ratio", type=float, default=0.02)
+    parser.add_argument("--ack-ratio", type=float, default=0.1, help="share of messages followed by a confirm")
+    parser.add_argument("--heartbeat-every", type=int, default=1_000, help="messages between heartbeats, 0 for none")
+    parser.add_argument(
+        "--interleave",
+        type=int,
+        default=0,
+        help="number of channels whose content frames are interleaved, 0 keeps every message contiguous",
+    )
+    args = parser.parse_args()
+
+    codec = WireCodec(AmqpSpec([args.spec]))
+    frames = generate(codec, args)
+    with open(args.output, "wb") as f:
+        for frame in frames:
+            f.write(frame)
+    print(f"{args.output}: {len(frames)} frames, {sum(len(f) for f in frames)} bytes", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+
+# this generator requires https://github.com/rabbitmq/rabbitmq-server/tree/main/deps/rabbitmq_codegen to work
+
+# Renders every generated Swift file in a single process: the spec is parsed once, each target is rendered into
+# memory and written only when its content hash differs from the file on disk. Unchanged files keep their
+# modification time, so regenerating doesn't force a rebuild of the Spec module. The generators write code that is
+# already formatted according to .swift-format, no formatting pass is needed afterwards:
+#   python generate.py rabbitmq_codegen/amqp-rabbitmq-0.9.1.json
+# A trimmed client (smaller binary, faster compile) is generated from an allow-list, see shared/subset.py:
+#   python generate.py rabbitmq_codegen/amqp-rabbitmq-0.9.1.json --profile client-minimal --only tx
+
+import argparse
+import hashlib
+import io
+import os
+import sys
+
+import codegen
+from codegen import gen_swift_api, gen_swift_impl, gen_swift_templates, gen_swift_views
+from testgen import gen_swift_tests, gen_swift_verify_tests, gen_swift_benchmarks
+from shared.subset import PROFILES, subset_spec
+from rabbitmq_codegen.amqp_codegen import AmqpSpec
+
+ROOT = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+# generator -> output path relative to the repository root
+TARGETS = [
+    (gen_swift_api, "Sources/Spec/Spec.swift"),
+    (gen_swift_impl, "Sources/Spec/Spec+FrameCodable.swift"),
+    (gen_swift_views, "Sources/Spec/Spec+Views.swift"),
+    (gen_swift_templates, "Sources/Spec/Spec+Templates.swift"),
+    (gen_swift_tests, "Tests/AMQPTests/Spec/CodableRoundtrip.swift"),
+    (gen_swift_verify_tests, "Tests/AMQPTests/Spec/CodableVerification.swift"),
+    (gen_swift_benchmarks, "Benchmarks/CodecBenchmarks/CodecBenchmarks.swift"),
+]
+
+
+def render(generator, spec) -> bytes:
+    # the generators write into the buffer, the file is written at once and only if it changed
+    buffer = io.StringIO()
+    generator(spec, buffer)
+    return buffer.getvalue().encode("utf-8")
+
+
+def content_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def write_if_changed(path: str, data: bytes) -> bool:
+    if os.path.exists(path):
+        with open(path, "rb") as f:
+            if content_hash(f.read()) == content_hash(data):
+                return False
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(data)
+    return True
+
+
+def main():
+    parser = argparse.ArgumentParser(description="generates the Swift sources, tests and benchmarks from the spec")
+    parser.add_argument("specs", nargs="+", help="path to amqp-rabbitmq-0.9.1.json and optional extensions")
+    parser.add_argument("--root", default=ROOT, help="repository root the outputs are relative to")
+    parser.add_argument(
+        "--intern",
+        action="append",
+        metavar="CLASS.METHOD.FIELD",
+        help="shortstr argument decoded through the interning cache, replaces the defaults (repeatable)",
+    )
+    parser.add_argument(
+        "--profile", choices=sorted(PROFILES), help="generate only the classes and methods of a profile"
+    )
+    parser.add_argument(
+        "--only",
+        action="append",
+        metavar="CLASS[.METHOD]",
+        help="generate only these classes and methods, added to the profile if there is one (repeatable)",
+    )
+    args = parser.parse_args()
+
+    spec = AmqpSpec(args.specs)
+    if args.profile or args.only:
+        subset_spec(spec, set(PROFILES.get(args.profile, [])) | set(args.only or []))
+    if args.intern is not None:
+        codegen.INTERNED_FIELDS = set(args.intern)
+    else:
+        # the defaults which were trimmed away aren't an error
+        codegen.INTERNED_FIELDS &= codegen.shortstr_fields(spec)
+    codegen.check_interned_fields(spec, codegen.INTERNED_FIELDS)
+    for generator, target in TARGETS:
+        path = os.path.join(args.root, target)
+        written = write_if_changed(path, render(generator, spec))
+        print(f"{target}: {'written' if written else 'unchanged'}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
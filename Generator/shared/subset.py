@@ -0,0 +1,53 @@
+# Trims the parsed spec to an allow-list of classes and methods before anything is generated, so the structs, codecs,
+# makeFactory cases, lazy views, tests and benchmarks are only emitted for those. Methods left out are rejected when
+# received like any unknown method, with FramingError.unknownClassAndMethod.
+
+# "class" keeps the whole class, "class.method" a single method
+PROFILES = {
+    # what Sources/ sends and handles plus the methods a broker may send unprompted (blocked, flow, cancel, return)
+    "client-minimal": [
+        "connection.start",
+        "connection.start-ok",
+        "connection.tune",
+        "connection.tune-ok",
+        "connection.open",
+        "connection.open-ok",
+        "connection.close",
+        "connection.close-ok",
+        "connection.blocked",
+        "connection.unblocked",
+        "channel",
+        "exchange.declare",
+        "exchange.declare-ok",
+        "queue.declare",
+        "queue.declare-ok",
+        "queue.bind",
+        "queue.bind-ok",
+        "basic.qos",
+        "basic.qos-ok",
+        "basic.consume",
+        "basic.consume-ok",
+        "basic.cancel",
+        "basic.cancel-ok",
+        "basic.publish",
+        "basic.return",
+        "basic.deliver",
+        "basic.ack",
+        "basic.nack",
+        "confirm.select",
+        "confirm.select-ok",
+    ],
+}
+
+
+def subset_spec(spec, allowed):
+    """removes the classes and methods which aren't allowed from the spec in place, raises on unknown names"""
+    known = {c.name for c in spec.allClasses()} | {f"{c.name}.{m.name}" for c in spec.allClasses() for m in c.methods}
+    unknown = sorted(set(allowed) - known)
+    if unknown:
+        raise RuntimeError(f"unknown classes or methods in the allow-list: {', '.join(unknown)}")
+    for c in spec.allClasses():
+        if c.name not in allowed:
+            c.methods = [m for m in c.methods if f"{c.name}.{m.name}" in allowed]
+    # a class without methods is only kept for its content properties (Spec.BasicProperties)
+    spec.classes = [c for c in spec.allClasses() if c.methods or c.fields]
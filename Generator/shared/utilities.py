@@ -1,4 +1,5 @@
 import re
+from typing import TextIO
 
 SPEC_TYPE_TO_SWIFT = {
     "octet": "Int8",
@@ -13,6 +14,40 @@ SPEC_TYPE_TO_SWIFT = {
 }
 
 
+# lineLength of .swift-format, the generated code is printed already formatted
+LINE_LENGTH = 120
+INDENT = "    "
+
+
+def print_computed_property(out: TextIO, indent: str, declaration: str, terms: list):
+    """prints `declaration { a + b }` on one line or, when it doesn't fit, the sum wrapped the way swift-format does"""
+    line = f"{indent}{declaration} {{ {' + '.join(terms)} }}"
+    if len(line) <= LINE_LENGTH:
+        print(line, file=out)
+        return
+    print(f"{indent}{declaration} {{", file=out)
+    current = indent + INDENT + terms[0]
+    for term in terms[1:]:
+        if len(current) + len(term) + 3 <= LINE_LENGTH:
+            current += " + " + term
+        else:
+            print(current, file=out)
+            current = indent + INDENT * 2 + "+ " + term
+    print(current, file=out)
+    print(f"{indent}}}", file=out)
+
+
+def print_call(out: TextIO, indent: str, callee: str, arguments: list):
+    """prints `callee(arguments)` on one line or one argument per line when it doesn't fit"""
+    line = f"{indent}{callee}({', '.join(arguments)})"
+    if len(line) <= LINE_LENGTH:
+        print(line, file=out)
+        return
+    print(f"{indent}{callee}(", file=out)
+    print(",\n".join(indent + INDENT + a for a in arguments), file=out)
+    print(f"{indent})", file=out)
+
+
 def constant_name(c):
     return "".join(
         [(p.capitalize() if i != 0 else p.lower()) for i, p in enumerate(re.split("[- ]", c))]
@@ -74,7 +109,7 @@ def get_bytes_count(spec, arg_name: str, domain: str):
     raise RuntimeError(f"Unknown domain - type: {domain} - {t}")
 
 
-def print_file_header():
+def print_file_header(out: TextIO):
     print(
         """//   NOTE: This -*- swift -*- source code is autogenerated from the AMQP
 //         specification!
@@ -88,9 +123,23 @@ def print_file_header():
 //
 // SPDX-License-Identifier: Apache-2.0
 //
-"""
+""",
+        file=out,
     )
 
 
 def as_bool_literal(val: bool):
     return "true" if val else "false"
+
+
+# (class, method) pairs which additionally get a lazy view reading the arguments from the wire bytes
+LAZY_VIEW_METHODS = [
+    ("basic", "deliver"),
+    ("basic", "ack"),
+    ("basic", "nack"),
+    ("basic", "return"),
+]
+
+
+def view_name(method_name: str):
+    return struct_name(method_name) + "View"
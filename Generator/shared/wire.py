@@ -0,0 +1,322 @@
+import struct
+
+# reference serializer of AMQP 0-9-1 frames driven by the spec model of rabbitmq_codegen,
+# it produces the same bytes as the Swift FrameEncoder and is used to generate test and benchmark inputs
+
+# Python type -> field value type tag, see `Spec.FieldValue` for the tags the client understands
+_FIELD_VALUE_TAGS = [
+    (bool, "t"),
+    (int, "l"),
+    (float, "d"),
+    (str, "S"),
+    (bytes, "x"),
+    (dict, "F"),
+    (list, "A"),
+]
+
+
+class FieldValue:
+    """a field value with an explicit type tag, e.g. FieldValue("I", 10) for an int32"""
+
+    def __init__(self, tag: str, value):
+        self.tag = tag
+        self.value = value
+
+
+def _short_string(value) -> bytes:
+    data = value.encode("utf-8") if isinstance(value, str) else value
+    if len(data) > 255:
+        raise ValueError(f"short string is longer than 255 bytes: {len(data)}")
+    return struct.pack(">B", len(data)) + data
+
+
+def _long_string(value) -> bytes:
+    data = value.encode("utf-8") if isinstance(value, str) else value
+    return struct.pack(">I", len(data)) + data
+
+
+def _tagged(value) -> FieldValue:
+    if isinstance(value, FieldValue):
+        return value
+    for python_type, tag in _FIELD_VALUE_TAGS:
+        if isinstance(value, python_type):
+            return FieldValue(tag, value)
+    raise ValueError(f"no field value type for {type(value)}")
+
+
+def _field_value(value) -> bytes:
+    value = _tagged(value)
+    tag, v = value.tag, value.value
+    payload = {
+        "t": lambda: struct.pack(">B", 1 if v else 0),
+        "b": lambda: struct.pack(">b", v),
+        "B": lambda: struct.pack(">B", v),
+        "s": lambda: struct.pack(">h", v),
+        "u": lambda: struct.pack(">H", v),
+        "I": lambda: struct.pack(">i", v),
+        "i": lambda: struct.pack(">I", v),
+        "l": lambda: struct.pack(">q", v),
+        "f": lambda: struct.pack(">f", v),
+        "d": lambda: struct.pack(">d", v),
+        "D": lambda: struct.pack(">Bi", *v),
+        "S": lambda: _long_string(v),
+        "T": lambda: struct.pack(">Q", v),
+        "F": lambda: table(v),
+        "A": lambda: array(v),
+        "x": lambda: _long_string(v),
+        # the client writes the tag once more in place of the (empty) value
+        "V": lambda: b"V",
+    }[tag]()
+    return tag.encode("ascii") + payload
+
+
+def table(values: dict) -> bytes:
+    data = b"".join(_short_string(k) + _field_value(v) for k, v in values.items())
+    return struct.pack(">I", len(data)) + data
+
+
+def array(values: list) -> bytes:
+    data = b"".join(_field_value(v) for v in values)
+    return struct.pack(">I", len(data)) + data
+
+
+class _Reader:
+    def __init__(self, data: bytes):
+        self.data = data
+        self.position = 0
+
+    def unpack(self, fmt: str):
+        values = struct.unpack_from(fmt, self.data, self.position)
+        self.position += struct.calcsize(fmt)
+        return values if len(values) > 1 else values[0]
+
+    def bytes(self, count: int) -> bytes:
+        if self.position + count > len(self.data):
+            raise ValueError(f"{count} bytes needed, {len(self.data) - self.position} available")
+        value = self.data[self.position : self.position + count]
+        self.position += count
+        return value
+
+    def short_string(self) -> str:
+        return self.bytes(self.unpack(">B")).decode("utf-8")
+
+    def long_string(self) -> bytes:
+        return self.bytes(self.unpack(">I"))
+
+    def field_value(self):
+        tag = chr(self.unpack(">B"))
+        if tag in "bBsuIilfd":
+            fmt = {"b": ">b", "B": ">B", "s": ">h", "u": ">H", "I": ">i", "i": ">I", "l": ">q", "f": ">f", "d": ">d"}
+            return self.unpack(fmt[tag])
+        if tag == "t":
+            return self.unpack(">B") != 0
+        if tag == "D":
+            return FieldValue("D", self.unpack(">Bi"))
+        if tag == "S":
+            return self.long_string().decode("utf-8")
+        if tag == "T":
+            return FieldValue("T", self.unpack(">Q"))
+        if tag == "F":
+            return self.table()
+        if tag == "A":
+            end = self.position + 4 + self.unpack(">I")
+            values = []
+            while self.position < end:
+                values.append(self.field_value())
+            return values
+        if tag == "x":
+            return self.long_string()
+        if tag == "V":
+            self.unpack(">B")
+            return None
+        raise ValueError(f"unknown field value type {tag!r}")
+
+    def table(self) -> dict:
+        end = self.position + 4 + self.unpack(">I")
+        values = {}
+        while self.position < end:
+            key = self.short_string()
+            values[key] = self.field_value()
+        return values
+
+
+def _python_name(name: str) -> str:
+    return name.replace("-", "_")
+
+
+class WireCodec:
+    """serializes method, content header, body and heartbeat frames of the spec"""
+
+    def __init__(self, spec):
+        self.spec = spec
+        constants = {name: value for name, value, _ in spec.constants}
+        self.frame_method = constants["FRAME-METHOD"]
+        self.frame_header = constants["FRAME-HEADER"]
+        self.frame_body = constants["FRAME-BODY"]
+        self.frame_heartbeat = constants["FRAME-HEARTBEAT"]
+        self.frame_end = constants["FRAME-END"]
+        self.frame_min_size = constants["FRAME-MIN-SIZE"]
+        self._classes = {c.name: c for c in spec.allClasses()}
+        self._methods = {(c.name, m.name): m for c in spec.allClasses() for m in c.allMethods()}
+
+    def method(self, class_name: str, method_name: str):
+        return self._methods[(class_name, method_name)]
+
+    def _value(self, field, values: dict):
+        name = _python_name(field.name)
+        if name in values:
+            return values[name]
+        if field.defaultvalue is None:
+            raise ValueError(f"argument {field.name} has no default value and must be given")
+        return field.defaultvalue
+
+    def _scalar(self, domain: str, value) -> bytes:
+        if domain == "octet":
+            return struct.pack(">B", value & 0xFF)
+        if domain == "short":
+            return struct.pack(">H", value & 0xFFFF)
+        if domain == "long":
+            return struct.pack(">I", value & 0xFFFFFFFF)
+        if domain in ["longlong", "timestamp"]:
+            return struct.pack(">Q", value & 0xFFFFFFFFFFFFFFFF)
+        if domain == "shortstr":
+            return _short_string(value)
+        if domain == "longstr":
+            return _long_string(value)
+        if domain == "table":
+            return table(value)
+        raise ValueError(f"unknown domain {domain}")
+
+    def encode_arguments(self, method, values: dict) -> bytes:
+        """arguments of the method in the wire layout, consecutive bits are packed into octets"""
+        data = b""
+        bits = []
+        for a in method.arguments:
+            domain = self.spec.resolveDomain(a.domain)
+            if domain == "bit":
+                bits.append(bool(self._value(a, values)))
+                continue
+            data += self._pack_bits(bits)
+            bits = []
+            data += self._scalar(domain, self._value(a, values))
+        return data + self._pack_bits(bits)
+
+    def _pack_bits(self, bits) -> bytes:
+        data = b""
+        for start in range(0, len(bits), 8):
+            octet = 0
+            for k, bit in enumerate(bits[start : start + 8]):
+                if bit:
+                    octet |= 1 << k
+            data += struct.pack(">B", octet)
+        return data
+
+    def encode_properties(self, class_name: str, values: dict) -> bytes:
+        """property flag words followed by the set properties, 4.2.6.1 The Content Header"""
+        fields = self._classes[class_name].fields
+        words = [0] * max(1, (len(fields) + 14) // 15)
+        data = b""
+        for i, f in enumerate(fields):
+            name = _python_name(f.name)
+            if values.get(name) is None:
+                continue
+            words[i // 15] |= 1 << (15 - i % 15)
+            domain = self.spec.resolveDomain(f.domain)
+            if domain != "bit":
+                data += self._scalar(domain, values[name])
+        while len(words) > 1 and words[-1] == 0:
+            words.pop()
+        flags = b"".join(
+            struct.pack(">H", word | (1 if i + 1 < len(words) else 0)) for i, word in enumerate(words)
+        )
+        return flags + data
+
+    def frame(self, frame_type: int, channel: int, payload: bytes) -> bytes:
+        return struct.pack(">BHI", frame_type, channel, len(payload)) + payload + struct.pack(">B", self.frame_end)
+
+    def method_frame(self, channel: int, class_name: str, method_name: str, **values) -> bytes:
+        m = self.method(class_name, method_name)
+        payload = struct.pack(">HH", m.klass.index, m.index) + self.encode_arguments(m, values)
+        return self.frame(self.frame_method, channel, payload)
+
+    def content_header_frame(self, channel: int, class_name: str, body_size: int, **properties) -> bytes:
+        c = self._classes[class_name]
+        # weight is always 0
+        payload = struct.pack(">HHQ", c.index, 0, body_size) + self.encode_properties(class_name, properties)
+        return self.frame(self.frame_header, channel, payload)
+
+    def body_frames(self, channel: int, body: bytes, frame_max: int = 0) -> list:
+        """splits the body so every frame fits into frame_max (0 means no limit), 8 bytes are the frame overhead"""
+        size = len(body) if frame_max == 0 else frame_max - 8
+        if size <= 0:
+            return []
+        return [self.frame(self.frame_body, channel, body[i : i + size]) for i in range(0, len(body), size)]
+
+    def heartbeat_frame(self) -> bytes:
+        return self.frame(self.frame_heartbeat, 0, b"")
+
+    # decoding, the inverse of the above, values are keyed by the python names of the arguments
+
+    def _decode_scalar(self, domain: str, reader: _Reader):
+        if domain == "octet":
+            return reader.unpack(">B")
+        if domain == "short":
+            return reader.unpack(">H")
+        if domain == "long":
+            return reader.unpack(">I")
+        if domain in ["longlong", "timestamp"]:
+            return reader.unpack(">Q")
+        if domain == "shortstr":
+            return reader.short_string()
+        if domain == "longstr":
+            return reader.long_string()
+        if domain == "table":
+            return reader.table()
+        raise ValueError(f"unknown domain {domain}")
+
+    def decode_method(self, payload: bytes):
+        """returns (class name, method name, argument values) of a method frame payload"""
+        reader = _Reader(payload)
+        class_index, method_index = reader.unpack(">HH")
+        m = next(m for m in self._methods.values() if m.klass.index == class_index and m.index == method_index)
+        values = {}
+        bits = 0
+        octet = 0
+        for a in m.arguments:
+            domain = self.spec.resolveDomain(a.domain)
+            if domain == "bit":
+                if bits % 8 == 0:
+                    octet = reader.unpack(">B")
+                values[_python_name(a.name)] = (octet & (1 << (bits % 8))) != 0
+                bits += 1
+                continue
+            bits = 0
+            values[_python_name(a.name)] = self._decode_scalar(domain, reader)
+        return m.klass.name, m.name, values
+
+    def decode_content_header(self, payload: bytes):
+        """returns (class name, body size, property values) of a content header frame payload"""
+        reader = _Reader(payload)
+        class_index, _, body_size = reader.unpack(">HHQ")
+        c = next(c for c in self._classes.values() if c.index == class_index)
+        words = []
+        while not words or words[-1] & 1:
+            words.append(reader.unpack(">H"))
+        values = {}
+        for i, f in enumerate(c.fields):
+            if i // 15 >= len(words) or not words[i // 15] & (1 << (15 - i % 15)):
+                continue
+            domain = self.spec.resolveDomain(f.domain)
+            values[_python_name(f.name)] = True if domain == "bit" else self._decode_scalar(domain, reader)
+        return c.name, body_size, values
+
+    def split_frame(self, data: bytes):
+        """returns (frame type, channel, payload, consumed bytes) of the first complete frame or None"""
+        if len(data) < 7:
+            return None
+        frame_type, channel, size = struct.unpack_from(">BHI", data)
+        if len(data) < size + 8:
+            return None
+        if data[size + 7] != self.frame_end:
+            raise ValueError("frame doesn't end with the frame-end octet")
+        return frame_type, channel, data[7 : 7 + size], size + 8
@@ -0,0 +1,623 @@
+#!/usr/bin/env python
+
+# this stand-in broker requires https://github.com/rabbitmq/rabbitmq-server/tree/main/deps/rabbitmq_codegen to work
+
+# A single process, in memory AMQP 0-9-1 broker for measuring the client end to end without a RabbitMQ install.
+# It speaks the handshake of Spec+AMQPNegotiatorProtocol.swift and the methods the client sends: channel open/close,
+# exchange and queue declare/bind/delete, basic.qos, publish, consume/cancel, ack/nack/reject, confirm.select and
+# heartbeats. Direct, fanout and topic exchanges are routed, nothing is persisted and there are no users or vhosts:
+#   python standin_broker.py rabbitmq_codegen/amqp-rabbitmq-0.9.1.json --port 5672
+# It is not a RabbitMQ replacement, numbers measured against it tell how fast the client is, not the broker.
+
+import argparse
+import asyncio
+import collections
+import itertools
+import sys
+
+from shared.wire import WireCodec
+from rabbitmq_codegen.amqp_codegen import AmqpSpec
+
+PROTOCOL_HEADER = b"AMQP\x00\x00\x09\x01"
+
+# reply codes, see the constants of the spec
+NOT_FOUND = 404
+RESOURCE_LOCKED = 405
+PRECONDITION_FAILED = 406
+FRAME_ERROR = 501
+COMMAND_INVALID = 503
+CHANNEL_ERROR = 504
+UNEXPECTED_FRAME = 505
+NOT_IMPLEMENTED = 540
+
+
+class AMQPError(Exception):
+    def __init__(self, reply_code: int, reply_text: str, connection: bool = False):
+        super().__init__(reply_text)
+        self.reply_code = reply_code
+        self.reply_text = reply_text
+        self.connection = connection
+
+
+class Message:
+    def __init__(self, exchange: str, routing_key: str, properties: dict, body: bytes):
+        self.exchange = exchange
+        self.routing_key = routing_key
+        self.properties = properties
+        self.body = body
+        self.redelivered = False
+
+
+def topic_matches(pattern: list, words: list) -> bool:
+    if not pattern:
+        return not words
+    if pattern[0] == "#":
+        return any(topic_matches(pattern[1:], words[i:]) for i in range(len(words) + 1))
+    if not words:
+        return False
+    return (pattern[0] == "*" or pattern[0] == words[0]) and topic_matches(pattern[1:], words[1:])
+
+
+class Exchange:
+    TYPES = ["direct", "fanout", "topic"]
+
+    def __init__(self, name: str, kind: str, auto_delete: bool = False):
+        self.name = name
+        self.kind = kind
+        self.auto_delete = auto_delete
+        self.bindings = set()  # (queue name, routing key)
+
+    def route(self, routing_key: str) -> set:
+        if self.kind == "fanout":
+            return {queue for queue, _ in self.bindings}
+        if self.kind == "topic":
+            words = routing_key.split(".")
+            return {queue for queue, key in self.bindings if topic_matches(key.split("."), words)}
+        return {queue for queue, key in self.bindings if key == routing_key}
+
+
+class Consumer:
+    def __init__(self, channel: "ChannelState", tag: str, no_ack: bool):
+        self.channel = channel
+        self.tag = tag
+        self.no_ack = no_ack
+
+
+class Queue:
+    def __init__(self, broker: "Broker", name: str, owner, auto_delete: bool):
+        self.broker = broker
+        self.name = name
+        self.owner = owner  # connection of an exclusive queue
+        self.auto_delete = auto_delete
+        self.messages = collections.deque()
+        self.consumers = collections.deque()
+
+    def dispatch(self):
+        """hands messages out round robin to the consumers which are below their prefetch"""
+        while self.messages and self.consumers:
+            for _ in range(len(self.consumers)):
+                consumer = self.consumers[0]
+                self.consumers.rotate(-1)
+                if consumer.no_ack or consumer.channel.has_capacity():
+                    consumer.channel.deliver(consumer, self, self.messages.popleft())
+                    break
+            else:
+                return  # every consumer is at its prefetch limit
+
+    def remove_consumer(self, consumer: Consumer):
+        self.consumers.remove(consumer)
+        if self.auto_delete and not self.consumers:
+            self.broker.delete_queue(self.name)
+
+
+class Broker:
+    def __init__(self, codec: WireCodec, args):
+        self.codec = codec
+        self.args = args
+        # the predeclared amq.* exchanges, the default exchange is handled by route
+        self.exchanges = {f"amq.{kind}": Exchange(f"amq.{kind}", kind) for kind in Exchange.TYPES}
+        self.queues = {}
+        self.names = itertools.count(1)
+
+    def exchange(self, name: str) -> Exchange:
+        if name not in self.exchanges:
+            raise AMQPError(NOT_FOUND, f"NOT_FOUND - no exchange '{name}'")
+        return self.exchanges[name]
+
+    def queue(self, name: str, connection) -> Queue:
+        if name not in self.queues:
+            raise AMQPError(NOT_FOUND, f"NOT_FOUND - no queue '{name}'")
+        queue = self.queues[name]
+        if queue.owner is not None and queue.owner is not connection:
+            raise AMQPError(RESOURCE_LOCKED, f"RESOURCE_LOCKED - queue '{name}' is exclusive to another connection")
+        return queue
+
+    def route(self, message: Message):
+        if message.exchange == "":
+            names = {message.routing_key}
+        else:
+            names = self.exchange(message.exchange).route(message.routing_key)
+        queues = [self.queues[name] for name in names if name in self.queues]
+        for queue in queues:
+            # every queue gets its own copy, redelivered is tracked per queue
+            copy = Message(message.exchange, message.routing_key, message.properties, message.body)
+            queue.messages.append(copy)
+            queue.dispatch()
+        return queues
+
+    def delete_queue(self, name: str) -> int:
+        queue = self.queues.pop(name)
+        for exchange in list(self.exchanges.values()):
+            exchange.bindings = {(q, key) for q, key in exchange.bindings if q != name}
+            if exchange.auto_delete and not exchange.bindings:
+                del self.exchanges[exchange.name]
+        for consumer in list(queue.consumers):
+            consumer.channel.consumers.pop(consumer.tag, None)
+        return len(queue.messages)
+
+
+class ChannelState:
+    def __init__(self, connection: "ClientConnection", channel_id: int):
+        self.connection = connection
+        self.id = channel_id
+        self.prefetch_count = 0
+        self.consumers = {}  # consumer tag -> (consumer, queue)
+        self.unacked = collections.OrderedDict()  # delivery tag -> (queue, message)
+        self.delivery_tags = itertools.count(1)
+        self.confirm = False
+        self.publish_tags = itertools.count(1)
+        self.publish = None  # [publish arguments, properties, body size, body chunks] of the content being received
+        self.closing = False
+
+    def has_capacity(self) -> bool:
+        return self.prefetch_count == 0 or len(self.unacked) < self.prefetch_count
+
+    def deliver(self, consumer: Consumer, queue: Queue, message: Message):
+        codec = self.connection.codec
+        delivery_tag = next(self.delivery_tags)
+        if not consumer.no_ack:
+            self.unacked[delivery_tag] = (queue, message)
+        # the whole message goes out in one write, the client doesn't interleave content of different channels
+        frames = [
+            codec.method_frame(
+                self.id,
+                "basic",
+                "deliver",
+                consumer_tag=consumer.tag,
+                delivery_tag=delivery_tag,
+                redelivered=message.redelivered,
+                exchange=message.exchange,
+                routing_key=message.routing_key,
+            ),
+            codec.content_header_frame(self.id, "basic", len(message.body), **message.properties),
+        ]
+        frames += codec.body_frames(self.id, message.body, self.connection.frame_max)
+        self.connection.write(b"".join(frames))
+
+    def settle(self, delivery_tag: int, multiple: bool, requeue=None):
+        """acks (requeue is None) or rejects the deliveries, delivery tag 0 with multiple means everything"""
+        if multiple:
+            tags = [tag for tag in self.unacked if tag <= delivery_tag or delivery_tag == 0]
+        elif delivery_tag in self.unacked:
+            tags = [delivery_tag]
+        else:
+            raise AMQPError(PRECONDITION_FAILED, f"PRECONDITION_FAILED - unknown delivery tag {delivery_tag}")
+        requeued = collections.defaultdict(list)
+        for tag in tags:
+            queue, message = self.unacked.pop(tag)
+            requeued[queue].append(message)
+        for queue, messages in requeued.items():
+            if requeue:
+                for message in messages:
+                    message.redelivered = True
+                # back in front of the queue in the original order
+                queue.messages.extendleft(reversed(messages))
+        self.dispatch_all()
+        for queue in requeued:
+            queue.dispatch()
+
+    def dispatch_all(self):
+        for queue in {queue for _, queue in self.consumers.values()}:
+            queue.dispatch()
+
+    def close(self):
+        """cancels the consumers and requeues everything that wasn't acked"""
+        for consumer, queue in list(self.consumers.values()):
+            if queue.name in self.connection.broker.queues:
+                queue.remove_consumer(consumer)
+        self.consumers.clear()
+        requeued = collections.defaultdict(list)
+        for queue, message in self.unacked.values():
+            message.redelivered = True
+            requeued[queue].append(message)
+        self.unacked.clear()
+        for queue, messages in requeued.items():
+            queue.messages.extendleft(reversed(messages))
+            if queue.name in self.connection.broker.queues:
+                queue.dispatch()
+
+
+class ClientConnection:
+    def __init__(self, broker: Broker, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.broker = broker
+        self.codec = broker.codec
+        self.reader = reader
+        self.writer = writer
+        self.channels = {}
+        self.channel_max = broker.args.channel_max
+        self.frame_max = broker.args.frame_max
+        self.heartbeat = broker.args.heartbeat
+        self.buffer = b""
+        self.closing = False
+        self.consumer_tags = itertools.count(1)
+        self.handlers = {
+            ("channel", "open"): self.channel_open,
+            ("channel", "close"): self.channel_close,
+            ("channel", "close-ok"): self.channel_close_ok,
+            ("exchange", "declare"): self.exchange_declare,
+            ("exchange", "delete"): self.exchange_delete,
+            ("queue", "declare"): self.queue_declare,
+            ("queue", "bind"): self.queue_bind,
+            ("queue", "unbind"): self.queue_unbind,
+            ("queue", "purge"): self.queue_purge,
+            ("queue", "delete"): self.queue_delete,
+            ("basic", "qos"): self.basic_qos,
+            ("basic", "consume"): self.basic_consume,
+            ("basic", "cancel"): self.basic_cancel,
+            ("basic", "publish"): self.basic_publish,
+            ("basic", "ack"): self.basic_ack,
+            ("basic", "nack"): self.basic_nack,
+            ("basic", "reject"): self.basic_reject,
+            ("confirm", "select"): self.confirm_select,
+        }
+
+    def write(self, data: bytes):
+        if not self.writer.is_closing():
+            self.writer.write(data)
+
+    def send(self, channel: int, class_name: str, method_name: str, **values):
+        self.write(self.codec.method_frame(channel, class_name, method_name, **values))
+
+    async def read_frame(self):
+        """returns (frame type, channel, payload) or None when the peer went away or missed its heartbeats"""
+        while True:
+            frame = self.codec.split_frame(self.buffer)
+            if frame is not None:
+                frame_type, channel, payload, consumed = frame
+                self.buffer = self.buffer[consumed:]
+                return frame_type, channel, payload
+            try:
+                # 4.2.7 Heartbeat Frames: the peer is considered dead after two missed heartbeats
+                timeout = self.heartbeat * 2 if self.heartbeat else None
+                data = await asyncio.wait_for(self.reader.read(65536), timeout)
+            except (asyncio.TimeoutError, ConnectionError):
+                return None
+            if not data:
+                return None
+            self.buffer += data
+
+    async def expect_method(self, class_name: str, method_name: str) -> dict:
+        frame = await self.read_frame()
+        if frame is None:
+            raise ConnectionError("connection closed during the handshake")
+        frame_type, channel, payload = frame
+        if frame_type != self.codec.frame_method or channel != 0:
+            raise AMQPError(UNEXPECTED_FRAME, "UNEXPECTED_FRAME - expected a method on channel 0", connection=True)
+        klass, method, values = self.codec.decode_method(payload)
+        if (klass, method) != (class_name, method_name):
+            raise AMQPError(COMMAND_INVALID, f"COMMAND_INVALID - expected {class_name}.{method_name}", connection=True)
+        return values
+
+    async def handshake(self) -> bool:
+        header = await self.reader.readexactly(len(PROTOCOL_HEADER))
+        if header != PROTOCOL_HEADER:
+            # 4.2.2 Protocol Header: reply with the supported protocol and close
+            self.write(PROTOCOL_HEADER)
+            return False
+        self.send(
+            0,
+            "connection",
+            "start",
+            server_properties={
+                "product": "swift-amqp stand-in broker",
+                "capabilities": {"publisher_confirms": True, "basic.nack": True, "consumer_cancel_notify": False},
+            },
+            mechanisms="PLAIN AMQPLAIN",
+        )
+        values = await self.expect_method("connection", "start-ok")
+        if values["mechanism"] not in ["PLAIN", "AMQPLAIN"]:
+            raise AMQPError(NOT_IMPLEMENTED, f"unsupported mechanism {values['mechanism']}", connection=True)
+        self.send(
+            0, "connection", "tune", channel_max=self.channel_max, frame_max=self.frame_max, heartbeat=self.heartbeat
+        )
+        values = await self.expect_method("connection", "tune-ok")
+        # the client may lower the proposed limits, 0 means no limit
+        self.channel_max = values["channel_max"] or self.channel_max
+        self.frame_max = values["frame_max"]
+        self.heartbeat = values["heartbeat"]
+        await self.expect_method("connection", "open")
+        self.send(0, "connection", "open-ok")
+        return True
+
+    async def send_heartbeats(self):
+        while True:
+            await asyncio.sleep(self.heartbeat / 2)
+            self.write(self.codec.heartbeat_frame())
+
+    async def serve(self):
+        heartbeats = None
+        try:
+            if not await self.handshake():
+                return
+            if self.heartbeat:
+                heartbeats = asyncio.create_task(self.send_heartbeats())
+            while not self.closing:
+                frame = await self.read_frame()
+                if frame is None:
+                    break
+                try:
+                    self.handle(*frame)
+                except AMQPError as error:
+                    self.fail(error, frame[1])
+                await self.writer.drain()
+        except AMQPError as error:
+            self.fail(error, 0)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            if heartbeats is not None:
+                heartbeats.cancel()
+            self.cleanup()
+            self.writer.close()
+
+    def fail(self, error: AMQPError, channel: int):
+        """a connection exception closes the connection, a channel exception only the channel"""
+        close = {"reply_code": error.reply_code, "reply_text": error.reply_text, "class_id": 0, "method_id": 0}
+        if error.connection or channel == 0:
+            self.send(0, "connection", "close", **close)
+            self.closing = True
+            return
+        self.channels[channel].closing = True
+        self.send(channel, "channel", "close", **close)
+
+    def cleanup(self):
+        for state in self.channels.values():
+            state.close()
+        self.channels.clear()
+        for name, queue in list(self.broker.queues.items()):
+            if queue.owner is self:
+                self.broker.delete_queue(name)
+
+    def handle(self, frame_type: int, channel: int, payload: bytes):
+        if frame_type == self.codec.frame_heartbeat:
+            return
+        if frame_type == self.codec.frame_method and channel == 0:
+            klass, method, _ = self.codec.decode_method(payload)
+            if (klass, method) == ("connection", "close"):
+                self.send(0, "connection", "close-ok")
+                self.closing = True
+                return
+            if (klass, method) == ("connection", "close-ok"):
+                self.closing = True
+                return
+            raise AMQPError(COMMAND_INVALID, f"COMMAND_INVALID - unexpected {klass}.{method}", connection=True)
+        state = self.channels.get(channel)
+        if frame_type == self.codec.frame_method:
+            klass, method, values = self.codec.decode_method(payload)
+            if (klass, method) != ("channel", "open") and state is None:
+                raise AMQPError(CHANNEL_ERROR, f"CHANNEL_ERROR - channel {channel} is not open", connection=True)
+            if state is not None and state.publish is not None:
+                raise AMQPError(UNEXPECTED_FRAME, "UNEXPECTED_FRAME - expected content", connection=True)
+            # 2.3.7 a closing channel discards everything but close and close-ok
+            if state is not None and state.closing and klass != "channel":
+                return
+            handler = self.handlers.get((klass, method))
+            if handler is None:
+                raise AMQPError(NOT_IMPLEMENTED, f"NOT_IMPLEMENTED - {klass}.{method}", connection=True)
+            handler(channel, values)
+            return
+        if state is not None and state.closing:
+            return
+        if state is None or state.publish is None:
+            raise AMQPError(UNEXPECTED_FRAME, "UNEXPECTED_FRAME - content without basic.publish", connection=True)
+        if frame_type == self.codec.frame_header:
+            _, body_size, properties = self.codec.decode_content_header(payload)
+            state.publish[1:] = [properties, body_size, []]
+        elif frame_type == self.codec.frame_body:
+            if self.frame_max and len(payload) + 8 > self.frame_max:
+                raise AMQPError(FRAME_ERROR, "FRAME_ERROR - body frame exceeds frame_max", connection=True)
+            state.publish[3].append(payload)
+        else:
+            raise AMQPError(FRAME_ERROR, f"FRAME_ERROR - unknown frame type {frame_type}", connection=True)
+        arguments, properties, body_size, chunks = state.publish
+        if body_size is not None and sum(len(chunk) for chunk in chunks) >= body_size:
+            state.publish = None
+            self.publish(state, arguments, properties, b"".join(chunks))
+
+    def publish(self, state: ChannelState, arguments: dict, properties: dict, body: bytes):
+        message = Message(arguments["exchange"], arguments["routing_key"], properties, body)
+        queues = self.broker.route(message)
+        if not queues and arguments["mandatory"]:
+            self.write(
+                b"".join(
+                    [
+                        self.codec.method_frame(
+                            state.id,
+                            "basic",
+                            "return",
+                            reply_code=312,
+                            reply_text="NO_ROUTE",
+                            exchange=message.exchange,
+                            routing_key=message.routing_key,
+                        ),
+                        self.codec.content_header_frame(state.id, "basic", len(body), **properties),
+                    ]
+                    + self.codec.body_frames(state.id, body, self.frame_max)
+                )
+            )
+        if state.confirm:
+            self.send(state.id, "basic", "ack", delivery_tag=next(state.publish_tags))
+
+    # MARK: - method handlers, each gets the channel id and the decoded arguments
+
+    def channel_open(self, channel: int, values: dict):
+        if channel in self.channels or channel > self.channel_max:
+            raise AMQPError(CHANNEL_ERROR, f"CHANNEL_ERROR - can't open channel {channel}", connection=True)
+        self.channels[channel] = ChannelState(self, channel)
+        self.send(channel, "channel", "open-ok")
+
+    def channel_close(self, channel: int, values: dict):
+        self.channels.pop(channel).close()
+        self.send(channel, "channel", "close-ok")
+
+    def channel_close_ok(self, channel: int, values: dict):
+        self.channels.pop(channel).close()
+
+    def exchange_declare(self, channel: int, values: dict):
+        name = values["exchange"]
+        if values["passive"]:
+            self.broker.exchange(name)
+        elif name in self.broker.exchanges:
+            if self.broker.exchanges[name].kind != values["type"]:
+                raise AMQPError(PRECONDITION_FAILED, f"PRECONDITION_FAILED - exchange '{name}' has a different type")
+        elif values["type"] not in Exchange.TYPES:
+            kind = values["type"]
+            raise AMQPError(COMMAND_INVALID, f"COMMAND_INVALID - unknown exchange type '{kind}'", connection=True)
+        else:
+            self.broker.exchanges[name] = Exchange(name, values["type"], values["auto_delete"])
+        if not values["nowait"]:
+            self.send(channel, "exchange", "declare-ok")
+
+    def exchange_delete(self, channel: int, values: dict):
+        exchange = self.broker.exchange(values["exchange"])
+        if values["if_unused"] and exchange.bindings:
+            raise AMQPError(PRECONDITION_FAILED, f"PRECONDITION_FAILED - exchange '{exchange.name}' in use")
+        del self.broker.exchanges[exchange.name]
+        if not values["nowait"]:
+            self.send(channel, "exchange", "delete-ok")
+
+    def queue_declare(self, channel: int, values: dict):
+        name = values["queue"]
+        if values["passive"]:
+            queue = self.broker.queue(name, self)
+        elif name in self.broker.queues:
+            queue = self.broker.queue(name, self)
+        else:
+            name = name or f"amq.gen-{next(self.broker.names)}"
+            owner = self if values["exclusive"] else None
+            queue = self.broker.queues[name] = Queue(self.broker, name, owner, values["auto_delete"])
+        if not values["nowait"]:
+            self.send(
+                channel,
+                "queue",
+                "declare-ok",
+                queue=queue.name,
+                message_count=len(queue.messages),
+                consumer_count=len(queue.consumers),
+            )
+
+    def queue_bind(self, channel: int, values: dict):
+        queue = self.broker.queue(values["queue"], self)
+        self.broker.exchange(values["exchange"]).bindings.add((queue.name, values["routing_key"]))
+        if not values["nowait"]:
+            self.send(channel, "queue", "bind-ok")
+
+    def queue_unbind(self, channel: int, values: dict):
+        queue = self.broker.queue(values["queue"], self)
+        self.broker.exchange(values["exchange"]).bindings.discard((queue.name, values["routing_key"]))
+        self.send(channel, "queue", "unbind-ok")
+
+    def queue_purge(self, channel: int, values: dict):
+        queue = self.broker.queue(values["queue"], self)
+        count = len(queue.messages)
+        queue.messages.clear()
+        if not values["nowait"]:
+            self.send(channel, "queue", "purge-ok", message_count=count)
+
+    def queue_delete(self, channel: int, values: dict):
+        queue = self.broker.queue(values["queue"], self)
+        if values["if_unused"] and queue.consumers:
+            raise AMQPError(PRECONDITION_FAILED, f"PRECONDITION_FAILED - queue '{queue.name}' in use")
+        if values["if_empty"] and queue.messages:
+            raise AMQPError(PRECONDITION_FAILED, f"PRECONDITION_FAILED - queue '{queue.name}' not empty")
+        count = self.broker.delete_queue(queue.name)
+        if not values["nowait"]:
+            self.send(channel, "queue", "delete-ok", message_count=count)
+
+    def basic_qos(self, channel: int, values: dict):
+        # prefetch-size isn't supported by RabbitMQ either, global applies per channel here
+        state = self.channels[channel]
+        state.prefetch_count = values["prefetch_count"]
+        self.send(channel, "basic", "qos-ok")
+        state.dispatch_all()
+
+    def basic_consume(self, channel: int, values: dict):
+        state = self.channels[channel]
+        queue = self.broker.queue(values["queue"], self)
+        tag = values["consumer_tag"] or f"amq.ctag-{next(self.consumer_tags)}"
+        if tag in state.consumers:
+            raise AMQPError(COMMAND_INVALID, f"COMMAND_INVALID - duplicate consumer tag '{tag}'", connection=True)
+        consumer = Consumer(state, tag, values["no_ack"])
+        state.consumers[tag] = (consumer, queue)
+        queue.consumers.append(consumer)
+        if not values["nowait"]:
+            self.send(channel, "basic", "consume-ok", consumer_tag=tag)
+        queue.dispatch()
+
+    def basic_cancel(self, channel: int, values: dict):
+        state = self.channels[channel]
+        consumer, queue = state.consumers.pop(values["consumer_tag"], (None, None))
+        if consumer is not None:
+            queue.remove_consumer(consumer)
+        if not values["nowait"]:
+            self.send(channel, "basic", "cancel-ok", consumer_tag=values["consumer_tag"])
+
+    def basic_publish(self, channel: int, values: dict):
+        if values["exchange"] != "":
+            self.broker.exchange(values["exchange"])
+        self.channels[channel].publish = [values, {}, None, []]
+
+    def basic_ack(self, channel: int, values: dict):
+        self.channels[channel].settle(values["delivery_tag"], values["multiple"])
+
+    def basic_nack(self, channel: int, values: dict):
+        self.channels[channel].settle(values["delivery_tag"], values["multiple"], values["requeue"])
+
+    def basic_reject(self, channel: int, values: dict):
+        self.channels[channel].settle(values["delivery_tag"], False, values["requeue"])
+
+    def confirm_select(self, channel: int, values: dict):
+        self.channels[channel].confirm = True
+        if not values["nowait"]:
+            self.send(channel, "confirm", "select-ok")
+
+
+async def serve(args):
+    broker = Broker(WireCodec(AmqpSpec([args.spec])), args)
+
+    async def accept(reader, writer):
+        await ClientConnection(broker, reader, writer).serve()
+
+    server = await asyncio.start_server(accept, args.host, args.port)
+    print(f"stand-in broker listening on {args.host}:{args.port}", file=sys.stderr)
+    async with server:
+        await server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="in memory AMQP 0-9-1 stand-in broker for end to end measurements")
+    parser.add_argument("spec", help="path to amqp-rabbitmq-0.9.1.json")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=5672)
+    parser.add_argument("--channel-max", type=int, default=2047)
+    parser.add_argument("--frame-max", type=int, default=131_072, help="proposed in connection.tune, 0 for no limit")
+    parser.add_argument("--heartbeat", type=int, default=60, help="proposed in connection.tune, 0 disables heartbeats")
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,9 @@
 #!/usr/bin/env python
 
 # this generator requires https://github.com/rabbitmq/rabbitmq-server/tree/main/deps/rabbitmq_codegen to work
+import sys
+from typing import TextIO
+
 from shared.utilities import *
 from rabbitmq_codegen.amqp_codegen import *
 
@@ -8,13 +11,13 @@ from rabbitmq_codegen.amqp_codegen import *
 # --------------------------------------------------------------------------------
 
 
-def gen_swift_tests(spec: AmqpSpec):
+def gen_swift_tests(spec: AmqpSpec, out: TextIO):
     def header():
-        print_file_header()
-        print("import Testing")
-        print("")
-        print("@testable import AMQP")
-        print("")
+        print_file_header(out)
+        print("import NIOCore", file=out)
+        print("import Testing", file=out)
+        print("", file=out)
+        print("@testable import AMQP", file=out)
 
     def generate_value(spec, domain: str):
         t = swift_type(spec, domain)
@@ -30,44 +33,49 @@ def gen_swift_tests(spec: AmqpSpec):
 
     def amqp_classes_and_methods():
         for c in spec.classes:
-            print()
-            print(f"@Suite struct {struct_name(c.name)}Coding {{")
+            print(file=out)
+            print(f"@Suite struct {struct_name(c.name)}Coding {{", file=out)
             for m in c.allMethods():
                 must_be_specified = [a for a in m.arguments if a.defaultvalue is None]
                 obj = f"Spec.{struct_name(c.name)}.{struct_name(m.name)}"
-                print(f'    @Test("{obj} default encoding/decoding roundtrip")')
+                print(f'    @Test("{obj} default encoding/decoding roundtrip")', file=out)
                 print(
-                    f"    func amqp{struct_name(c.name)}{struct_name(m.name)}Coding() async throws {{"
+                    f"    func amqp{struct_name(c.name)}{struct_name(m.name)}Coding() async throws {{",
+                    file=out,
                 )
                 if not len(must_be_specified):
-                    print(f"        let object = {obj}()")
+                    print(f"        let object = {obj}()", file=out)
                 else:
                     args = [
                         f"{variable_name(a.name)}: {generate_value(spec, a.domain)}"
                         for a in must_be_specified
                     ]
-                    print(f"        let object = {obj}({', '.join(args)})")
-                print("         let binary = try FrameEncoder().encode(object)")
-                print("         #expect(binary.count == object.bytesCount)")
+                    print(f"        let object = {obj}({', '.join(args)})", file=out)
+                print("        let binary = try FrameEncoder().encode(object)", file=out)
+                print("        #expect(binary.count == object.bytesCount)", file=out)
                 print(
-                    f"         let decoded = try FrameDecoder().decode({obj}.self, from: binary)"
+                    f"        let decoded = try FrameDecoder().decode({obj}.self, from: binary)",
+                    file=out,
                 )
-                print("         #expect(decoded == object)")
-                print("    }")
-                print()
+                print("        #expect(decoded == object)", file=out)
+                print("        var written = ByteBuffer()", file=out)
+                print("        object.write(into: &written)", file=out)
+                print("        #expect(written == binary)", file=out)
+                print("    }", file=out)
+                print(file=out)
 
-            print("}")
+            print("}", file=out)
 
     header()
     amqp_classes_and_methods()
 
 
-def gen_swift_verify_tests(spec: AmqpSpec):
+def gen_swift_verify_tests(spec: AmqpSpec, out: TextIO):
     def header():
-        print_file_header()
-        print("import Testing")
-        print("")
-        print("@testable import AMQP")
+        print_file_header(out)
+        print("import Testing", file=out)
+        print("", file=out)
+        print("@testable import AMQP", file=out)
 
     def generate_value(spec, domain: str):
         t = swift_type(spec, domain)
@@ -83,39 +91,131 @@ def gen_swift_verify_tests(spec: AmqpSpec):
 
     def amqp_classes_and_methods():
         for c in spec.classes:
-            print()
-            print(f"@Suite struct {struct_name(c.name)}Decode {{")
+            print(file=out)
+            print(f"@Suite struct {struct_name(c.name)}Decode {{", file=out)
             for m in c.allMethods():
                 must_be_specified = [a for a in m.arguments if a.defaultvalue is None]
                 obj = f"{struct_name(c.name)}.{struct_name(m.name)}"
-                print(f'    @Test("Spec.{obj} verify decode bytes")')
+                print(f'    @Test("Spec.{obj} verify decode bytes")', file=out)
                 print(
-                    f"    func amqp{struct_name(c.name)}{struct_name(m.name)}DecodeBytes() async throws {{"
+                    f"    func amqp{struct_name(c.name)}{struct_name(m.name)}DecodeBytes() async throws {{",
+                    file=out,
                 )
-                print(f'        let input = try fixtureData(named: "{obj}")')
+                print(f'        let input = try fixtureData(named: "{obj}")', file=out)
                 print(
-                    f"        let decoded = try FrameDecoder().decode(Spec.{obj}.self, from: input)"
+                    f"        let decoded = try FrameDecoder().decode(Spec.{obj}.self, from: input)",
+                    file=out,
                 )
                 if not len(must_be_specified):
-                    print(f"        let expected = Spec.{obj}()")
+                    print(f"        let expected = Spec.{obj}()", file=out)
                 else:
                     args = [
                         f"{variable_name(a.name)}: {generate_value(spec, a.domain)}"
                         for a in must_be_specified
                     ]
-                    print(f"        let expected = Spec.{obj}({', '.join(args)})")
-                print(f"        #expect(decoded == expected)")
-                print("    }")
-                print()
+                    print_call(out, "        ", f"let expected = Spec.{obj}", args)
+                print(f"        #expect(decoded == expected)", file=out)
+                if (c.name, m.name) in LAZY_VIEW_METHODS:
+                    print(
+                        f"        let view = try Spec.{struct_name(c.name)}.{view_name(m.name)}(buffer: input)",
+                        file=out,
+                    )
+                    print(f"        #expect(view.materialize() == expected)", file=out)
+                print("    }", file=out)
+                print(file=out)
+
+            print("}", file=out)
+
+    header()
+    amqp_classes_and_methods()
 
-            print("}")
+
+def gen_swift_benchmarks(spec: AmqpSpec, out: TextIO):
+    """emits encode/write/decode benchmarks of every method and content properties, grouped by class"""
+
+    def header():
+        print_file_header(out)
+        print("import Benchmark", file=out)
+        print("", file=out)
+        print("@testable import AMQP", file=out)
+
+    def profile_value(spec, domain: str):
+        t = spec.resolveDomain(domain)
+        if t == "shortstr":
+            return "profile.shortString"
+        if t == "longstr":
+            return "profile.longString"
+        if t == "table":
+            return "profile.table"
+        if t == "bit":
+            return "true"
+        if t == "timestamp":
+            return "Timestamp(millisecondsSince1970: 1)"
+        return "1"
+
+    def profiles(spec, fields):
+        domains = [spec.resolveDomain(f.domain) for f in fields]
+        result = [".minimal"]
+        if "shortstr" in domains or "longstr" in domains:
+            result.append(".long")
+        if "table" in domains:
+            result += [".headers10", ".headers100"]
+        return result
+
+    def register(spec, name: str, type_name: str, fields):
+        uses_profile = any(profile_value(spec, f.domain).startswith("profile.") for f in fields)
+        print(
+            f'    registerCodecBenchmarks("{name}", profiles: [{", ".join(profiles(spec, fields))}]) {{ {"profile" if uses_profile else "_"} in',
+            file=out,
+        )
+        if not len(fields):
+            print(f"        {type_name}()", file=out)
+        else:
+            print(f"        {type_name}(", file=out)
+            print(
+                ",\n".join(
+                    f"            {variable_name(f.name)}: {profile_value(spec, f.domain)}" for f in fields
+                ),
+                file=out,
+            )
+            print("        )", file=out)
+        print("    }", file=out)
+
+    def amqp_classes_and_methods():
+        print(file=out)
+        print("let benchmarks: @Sendable () -> Void = {", file=out)
+        for c in spec.classes:
+            print(f"    register{struct_name(c.name)}Benchmarks()", file=out)
+        print("    registerCorpusBenchmarks()", file=out)
+        print("}", file=out)
+        for c in spec.classes:
+            print(file=out)
+            print(f"func register{struct_name(c.name)}Benchmarks() {{", file=out)
+            for m in c.allMethods():
+                register(
+                    spec,
+                    f"{struct_name(c.name)}.{struct_name(m.name)}",
+                    f"Spec.{struct_name(c.name)}.{struct_name(m.name)}",
+                    m.arguments,
+                )
+            if c.hasContentProperties:
+                register(
+                    spec,
+                    f"{struct_name(c.name)}Properties",
+                    f"Spec.{struct_name(c.name)}Properties",
+                    c.fields,
+                )
+            print("}", file=out)
 
     header()
     amqp_classes_and_methods()
 
 
 if __name__ == "__main__":
-    do_main(
-        lambda x: gen_swift_tests(AmqpSpec(x)),
-        lambda x: gen_swift_verify_tests(AmqpSpec(x)),
+    do_main_dict(
+        {
+            "header": lambda x: gen_swift_tests(AmqpSpec(x), sys.stdout),
+            "body": lambda x: gen_swift_verify_tests(AmqpSpec(x), sys.stdout),
+            "bench": lambda x: gen_swift_benchmarks(AmqpSpec(x), sys.stdout),
+        }
     )
@@ -0,0 +1,319 @@
+#!/usr/bin/env python
+
+# this generator requires https://github.com/rabbitmq/rabbitmq-server/tree/main/deps/rabbitmq_codegen to work
+
+# Parses raw AMQP byte captures and reports what the traffic looks like, to tune frame_max, heartbeat and prefetch on
+# real numbers: per-method counts, frame size distributions, how often content bodies are split into several body
+# frames (and would be for another frame_max), how channels interleave, inter-frame gaps and deliveries in flight.
+# Understands two kinds of captures:
+#   raw     one direction of a TCP stream as extracted from a pcap (e.g. with tshark or Wireshark's "Follow TCP
+#           Stream"), or a corpus written by corpusgen.py; it has no timings
+#   record  a recording of both directions with timings, see Configuration.rawBytesRecordingPath and
+#           Sources/Transport/RawBytesRecorderHandler.swift
+# Prints a summary table, writes the full report as JSON and can extract the received frames for the decoder
+# benchmarks (AMQP_BENCHMARK_CORPUS):
+#   python traffic_analyzer.py rabbitmq_codegen/amqp-rabbitmq-0.9.1.json capture.amqprec --json report.json
+#   python traffic_analyzer.py rabbitmq_codegen/amqp-rabbitmq-0.9.1.json capture.amqprec --extract-inbound traffic.bin
+
+import argparse
+import bisect
+import json
+import struct
+import sys
+from collections import Counter, defaultdict
+
+from shared.wire import WireCodec
+from rabbitmq_codegen.amqp_codegen import AmqpSpec
+
+RECORD_MAGIC = b"AMQPREC1"
+PROTOCOL_HEADER = b"AMQP"
+INBOUND, OUTBOUND = 0, 1
+DIRECTIONS = {INBOUND: "inbound", OUTBOUND: "outbound"}
+# type(1) + channel(2) + size(4) + frame-end(1), see ContentBodyFrame.maxPossibleFragmentSize
+FRAME_OVERHEAD = 8
+
+
+def read_capture(path: str, capture_format: str, direction: int):
+    """returns [(direction, time in ns or None, bytes)] chunks of the capture"""
+    with open(path, "rb") as f:
+        data = f.read()
+    if capture_format == "auto":
+        capture_format = "record" if data.startswith(RECORD_MAGIC) else "raw"
+    if capture_format == "raw":
+        return [(direction, None, data)]
+    if not data.startswith(RECORD_MAGIC):
+        raise ValueError(f"{path} isn't a recording, it doesn't start with {RECORD_MAGIC}")
+    chunks = []
+    offset = len(RECORD_MAGIC)
+    while offset + 13 <= len(data):
+        chunk_direction, time, length = struct.unpack_from(">BQI", data, offset)
+        offset += 13
+        chunks.append((chunk_direction, time, data[offset : offset + length]))
+        offset += length
+    return chunks
+
+
+def percentiles(values: list) -> dict:
+    if not values:
+        return {}
+    values = sorted(values)
+
+    def at(p):
+        return values[min(len(values) - 1, int(len(values) * p))]
+
+    return {
+        "count": len(values),
+        "min": values[0],
+        "p50": at(0.5),
+        "p90": at(0.9),
+        "p99": at(0.99),
+        "max": values[-1],
+        "mean": sum(values) / len(values),
+    }
+
+
+def histogram(values: list) -> dict:
+    """counts per power of two bucket, keyed by the upper bound of the bucket"""
+    buckets = Counter(1 << max(0, value - 1).bit_length() for value in values)
+    return {str(bound): buckets[bound] for bound in sorted(buckets)}
+
+
+class Stream:
+    """the frames of one direction, reassembled from the chunks"""
+
+    def __init__(self, codec: WireCodec):
+        self.codec = codec
+        self.pending = b""
+        self.frames = []  # (time, frame type, channel, payload, size)
+
+    def feed(self, time, data: bytes):
+        self.pending += data
+        # the protocol header precedes the frames of the client
+        if self.pending.startswith(PROTOCOL_HEADER) and not self.frames:
+            if len(self.pending) < 8:
+                return
+            self.pending = self.pending[8:]
+        offset = 0
+        while True:
+            split = self.codec.split_frame(self.pending[offset:])
+            if split is None:
+                break
+            frame_type, channel, payload, consumed = split
+            self.frames.append((time, frame_type, channel, payload, consumed))
+            offset += consumed
+        self.pending = self.pending[offset:]
+
+
+class Analyzer:
+    def __init__(self, codec: WireCodec, frame_max: list):
+        self.codec = codec
+        self.frame_max = frame_max
+        self.method_names = {
+            (c.index, m.index): f"{c.name}.{m.name}" for c in codec.spec.allClasses() for m in c.allMethods()
+        }
+        self.frame_types = {
+            codec.frame_method: "method",
+            codec.frame_header: "header",
+            codec.frame_body: "body",
+            codec.frame_heartbeat: "heartbeat",
+        }
+
+    def method_name(self, payload: bytes) -> str:
+        key = struct.unpack_from(">HH", payload)
+        return self.method_names.get(key, f"unknown({key[0]}, {key[1]})")
+
+    def analyze_direction(self, frames: list) -> dict:
+        methods = Counter()
+        sizes = defaultdict(list)
+        channels = Counter()
+        # content: channel -> [expected body size, received body bytes, body frames]
+        content = {}
+        bodies = []  # (body size, body frames)
+        switches = 0
+        interleaved_frames = 0
+        previous_channel = None
+        gaps = []
+        previous_time = None
+        for time, frame_type, channel, payload, size in frames:
+            kind = self.frame_types.get(frame_type, f"unknown({frame_type})")
+            sizes[kind].append(size)
+            channels[channel] += 1
+            if frame_type == self.codec.frame_method:
+                methods[self.method_name(payload)] += 1
+            elif frame_type == self.codec.frame_header:
+                _, body_size, _ = self.codec.decode_content_header(payload)
+                content[channel] = [body_size, 0, 0]
+                if body_size == 0:
+                    bodies.append((0, 0))
+                    del content[channel]
+            elif frame_type == self.codec.frame_body and channel in content:
+                state = content[channel]
+                state[1] += len(payload)
+                state[2] += 1
+                if state[1] >= state[0]:
+                    bodies.append((state[0], state[2]))
+                    del content[channel]
+            # frames of other channels arriving while a channel's content is incomplete
+            if any(c != channel for c in content):
+                interleaved_frames += 1
+            if previous_channel is not None and channel != previous_channel:
+                switches += 1
+            previous_channel = channel
+            if time is not None:
+                if previous_time is not None:
+                    gaps.append(time - previous_time)
+                previous_time = time
+        body_sizes = [body_size for body_size, _ in bodies]
+        fragmentation = {
+            "bodies": len(bodies),
+            "split": sum(1 for _, count in bodies if count > 1),
+            "body frames per body": percentiles([count for _, count in bodies]),
+            "body sizes": percentiles(body_sizes),
+            "body size histogram": histogram(body_sizes),
+            # how many bodies would be split into more than one frame, and into how many frames, for other frame_max
+            "at frame_max": {
+                str(frame_max): {
+                    "split": sum(1 for s in body_sizes if s > frame_max - FRAME_OVERHEAD),
+                    "body frames": sum(max(1, -(-s // (frame_max - FRAME_OVERHEAD))) for s in body_sizes),
+                }
+                for frame_max in self.frame_max
+            },
+        }
+        return {
+            "frames": len(frames),
+            "bytes": sum(size for *_, size in frames),
+            "methods": dict(methods.most_common()),
+            "frame sizes": {kind: percentiles(values) for kind, values in sizes.items()},
+            "frame size histogram": {kind: histogram(values) for kind, values in sizes.items()},
+            "fragmentation": fragmentation,
+            "channels": {
+                "frames per channel": {str(c): n for c, n in channels.most_common()},
+                "channel switches": switches,
+                "switch ratio": switches / max(1, len(frames) - 1),
+                "frames interleaved with incomplete content": interleaved_frames,
+            },
+            "inter-frame gaps ns": percentiles(gaps),
+        }
+
+    def in_flight(self, inbound: list, outbound: list) -> dict:
+        """deliveries received but not acked yet per channel, sampled at every delivery, needs both directions"""
+        events = []
+        for time, frame_type, channel, payload, _ in inbound:
+            if frame_type == self.codec.frame_method and self.method_name(payload) == "basic.deliver":
+                _, _, values = self.codec.decode_method(payload)
+                events.append((time, 0, channel, "deliver", values["delivery_tag"], False))
+        for time, frame_type, channel, payload, _ in outbound:
+            if frame_type != self.codec.frame_method:
+                continue
+            name = self.method_name(payload)
+            if name in ["basic.ack", "basic.nack", "basic.reject"]:
+                _, _, values = self.codec.decode_method(payload)
+                events.append((time, 1, channel, "settle", values["delivery_tag"], values.get("multiple", False)))
+        events.sort(key=lambda e: (e[0], e[1]))
+        outstanding = defaultdict(list)  # channel -> sorted delivery tags
+        samples = []
+        for _, _, channel, event, tag, multiple in events:
+            tags = outstanding[channel]
+            if event == "deliver":
+                bisect.insort(tags, tag)
+                samples.append(len(tags))
+            elif multiple:
+                # tag 0 with multiple settles everything outstanding
+                del tags[: bisect.bisect_right(tags, tag) if tag else len(tags)]
+            else:
+                index = bisect.bisect_left(tags, tag)
+                if index < len(tags) and tags[index] == tag:
+                    del tags[index]
+        return percentiles(samples)
+
+    def analyze(self, streams: dict) -> dict:
+        report = {DIRECTIONS[d]: self.analyze_direction(s.frames) for d, s in streams.items() if s.frames}
+        inbound, outbound = streams[INBOUND].frames, streams[OUTBOUND].frames
+        timed = all(f[0] is not None for f in inbound + outbound)
+        if inbound and outbound and timed:
+            report["deliveries in flight"] = self.in_flight(inbound, outbound)
+        return report
+
+
+def summary(report: dict) -> str:
+    lines = []
+    for direction in DIRECTIONS.values():
+        if direction not in report:
+            continue
+        r = report[direction]
+        lines.append(f"{direction}: {r['frames']} frames, {r['bytes']} bytes")
+        lines.append(f"  {'method':<32} {'count':>10}")
+        for name, count in r["methods"].items():
+            lines.append(f"  {name:<32} {count:>10}")
+        lines.append(f"  {'frame':<12} {'count':>10} {'p50':>10} {'p99':>10} {'max':>10}")
+        for kind, p in r["frame sizes"].items():
+            lines.append(f"  {kind:<12} {p['count']:>10} {p['p50']:>10} {p['p99']:>10} {p['max']:>10}")
+        f = r["fragmentation"]
+        lines.append(f"  bodies: {f['bodies']}, split into several frames: {f['split']}")
+        for frame_max, at in f["at frame_max"].items():
+            lines.append(f"    at frame_max {frame_max}: {at['split']} split, {at['body frames']} body frames")
+        c = r["channels"]
+        lines.append(
+            f"  channels: {len(c['frames per channel'])}, switches: {c['channel switches']}"
+            f" ({c['switch ratio']:.1%}), interleaved with incomplete content: "
+            f"{c['frames interleaved with incomplete content']}"
+        )
+        if r["inter-frame gaps ns"]:
+            g = r["inter-frame gaps ns"]
+            lines.append(
+                f"  inter-frame gaps µs: p50 {g['p50'] / 1000:.1f}, p99 {g['p99'] / 1000:.1f}, max {g['max'] / 1000:.1f}"
+            )
+    if report.get("deliveries in flight"):
+        p = report["deliveries in flight"]
+        lines.append(f"deliveries in flight per channel: p50 {p['p50']}, p99 {p['p99']}, max {p['max']}")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="reports per-method, frame size and channel statistics of captures")
+    parser.add_argument("spec", help="path to amqp-rabbitmq-0.9.1.json")
+    parser.add_argument("captures", nargs="+", help="raw streams or recordings, analysed as one capture")
+    parser.add_argument("--format", choices=["auto", "raw", "record"], default="auto")
+    parser.add_argument(
+        "--direction",
+        choices=["inbound", "outbound"],
+        default="inbound",
+        help="direction of raw streams, inbound is what the client received",
+    )
+    parser.add_argument(
+        "--frame-max",
+        type=int,
+        action="append",
+        help="frame_max to evaluate the body fragmentation for (repeatable), 4096 and 131072 by default",
+    )
+    parser.add_argument("--json", metavar="PATH", help="write the report as JSON, - for stdout")
+    parser.add_argument("--extract-inbound", metavar="PATH", help="write the received frames as a raw corpus")
+    args = parser.parse_args()
+
+    codec = WireCodec(AmqpSpec([args.spec]))
+    direction = INBOUND if args.direction == "inbound" else OUTBOUND
+    streams = {INBOUND: Stream(codec), OUTBOUND: Stream(codec)}
+    for path in args.captures:
+        for chunk_direction, time, data in read_capture(path, args.format, direction):
+            streams[chunk_direction].feed(time, data)
+    for d, stream in streams.items():
+        if stream.pending:
+            print(f"{DIRECTIONS[d]}: {len(stream.pending)} trailing bytes of an incomplete frame", file=sys.stderr)
+
+    report = Analyzer(codec, sorted(set(args.frame_max or [4096, 131_072]))).analyze(streams)
+    if args.json == "-":
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    else:
+        print(summary(report))
+        if args.json:
+            with open(args.json, "w") as f:
+                json.dump(report, f, indent=2)
+    if args.extract_inbound:
+        with open(args.extract_inbound, "wb") as f:
+            for time, frame_type, channel, payload, _ in streams[INBOUND].frames:
+                f.write(codec.frame(frame_type, channel, payload))
+
+
+if __name__ == "__main__":
+    main()
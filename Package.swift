@@ -37,6 +37,11 @@ let package = Package(
             description:
                 "logs debug message for in/outbound frames (primary used to ease debugging in development)"
         ),
+        .trait(
+            name: "CodecMetrics",
+            description:
+                "counts encoded/decoded methods, bytes and optionally time per method (see Connection.codecMetrics)"
+        ),
         .default(enabledTraits: []),
     ],
     dependencies: [
@@ -75,10 +80,39 @@ let package = Package(
         .testTarget(
             name: "AMQPTests",
             dependencies: [
-                "AMQP"
+                "AMQP",
+                .product(name: "NIOEmbedded", package: "swift-nio"),
             ],
             resources: [.process("Resources")],
             swiftSettings: sharedSwiftSettings,
         ),
     ]
 )
+
+// the codec benchmarks (see Benchmarks/) pull package-benchmark and compile the library with testing enabled
+// to reach the internal codec, so they are only part of the package when asked for:
+// AMQP_ENABLE_BENCHMARKS=1 swift package benchmark
+if Context.environment["AMQP_ENABLE_BENCHMARKS"] != nil {
+    package.dependencies.append(
+        .package(url: "https://github.com/ordo-one/package-benchmark", .upToNextMajor(from: "1.27.0"))
+    )
+    for target in package.targets where target.name == "AMQP" {
+        target.swiftSettings = (target.swiftSettings ?? []) + [.unsafeFlags(["-enable-testing"])]
+    }
+    package.targets.append(
+        .executableTarget(
+            name: "CodecBenchmarks",
+            dependencies: [
+                "AMQP",
+                .product(name: "Benchmark", package: "package-benchmark"),
+                .product(name: "NIOCore", package: "swift-nio"),
+                .product(name: "NIOEmbedded", package: "swift-nio"),
+            ],
+            path: "Benchmarks/CodecBenchmarks",
+            swiftSettings: sharedSwiftSettings,
+            plugins: [
+                .plugin(name: "BenchmarkPlugin", package: "package-benchmark")
+            ]
+        )
+    )
+}
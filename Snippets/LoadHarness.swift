@@ -0,0 +1,208 @@
+import AMQP
+import Foundation  // ProcessInfo, DispatchTime
+import NIOConcurrencyHelpers  // locks
+
+// End to end throughput and latency of the client. Runs WorkQueue, PublishAndConsume and RPC shaped scenarios for
+// every message size and prefetch and prints msgs/s and p50/p99/p999 latency. Latency is measured from publishing
+// to consuming with a timestamp the publisher puts into the headers, so both sides must run on the same host.
+// Meant to be run against Generator/standin_broker.py (see Readme.md), works against RabbitMQ as well.
+//
+// Configured with environment variables:
+//   AMQP_LOAD_HOST, AMQP_LOAD_PORT       broker address, localhost:5672 by default
+//   AMQP_LOAD_MESSAGES                   messages per run, 10000 by default
+//   AMQP_LOAD_SIZES                      body sizes in bytes, 64,1024,16384,262144 by default
+//   AMQP_LOAD_PREFETCH                   prefetch counts, 1,10,100 by default
+//   AMQP_LOAD_CONSUMERS                  consumers of the work-queue scenario, 4 by default
+//   AMQP_LOAD_SCENARIOS                  publish-consume,work-queue,rpc by default
+
+let sentAtHeader = "x-sent-ns"
+
+func setting(_ name: String) -> String? {
+    ProcessInfo.processInfo.environment[name]
+}
+
+func setting(_ name: String, default value: Int) -> Int {
+    setting(name).flatMap { Int($0) } ?? value
+}
+
+func setting(_ name: String, default value: [Int]) -> [Int] {
+    setting(name)?.split(separator: ",").compactMap { Int($0) } ?? value
+}
+
+let configuration = {
+    var configuration = Configuration.default
+    configuration.host = setting("AMQP_LOAD_HOST") ?? configuration.host
+    configuration.port = setting("AMQP_LOAD_PORT", default: configuration.port)
+    return configuration
+}()
+let messageCount = setting("AMQP_LOAD_MESSAGES", default: 10_000)
+let sizes = setting("AMQP_LOAD_SIZES", default: [64, 1024, 16384, 262_144])
+let prefetches = setting("AMQP_LOAD_PREFETCH", default: [1, 10, 100])
+let consumerCount = setting("AMQP_LOAD_CONSUMERS", default: 4)
+let scenarios =
+    setting("AMQP_LOAD_SCENARIOS")?.split(separator: ",").map(String.init) ?? ["publish-consume", "work-queue", "rpc"]
+
+func now() -> UInt64 {
+    DispatchTime.now().uptimeNanoseconds
+}
+
+func stamped(correlationId: String? = nil, replyTo: String? = nil) -> Spec.BasicProperties {
+    Spec.BasicProperties(
+        headers: [sentAtHeader: .int64(Int64(bitPattern: now()))],
+        correlationId: correlationId,
+        replyTo: replyTo
+    )
+}
+
+/// nanoseconds since the message was published, 0 if it has no timestamp
+func latency(of message: Message) -> UInt64 {
+    guard case .int64(let sentAt) = message.properties.headers?[sentAtHeader] else {
+        return 0
+    }
+    return now() - UInt64(bitPattern: sentAt)
+}
+
+func report(_ scenario: String, size: Int, prefetch: Int, elapsed: UInt64, latencies: [UInt64]) {
+    let sorted = latencies.sorted()
+    func percentile(_ p: Double) -> String {
+        guard !sorted.isEmpty else { return "-" }
+        let index = min(sorted.count - 1, Int(Double(sorted.count) * p))
+        return String(format: "%.1f", Double(sorted[index]) / 1_000)
+    }
+    let throughput = Double(latencies.count) / (Double(elapsed) / 1_000_000_000)
+    print(
+        [
+            scenario.padding(toLength: 16, withPad: " ", startingAt: 0),
+            String(size).padding(toLength: 8, withPad: " ", startingAt: 0),
+            String(prefetch).padding(toLength: 9, withPad: " ", startingAt: 0),
+            String(format: "%10.0f", throughput),
+            percentile(0.5),
+            percentile(0.99),
+            percentile(0.999),
+        ].joined(separator: " ")
+    )
+}
+
+/// consumes from each stream concurrently until `total` messages were acked, returns the latencies of all of them
+func consume(_ streams: [AsyncThrowingStream<Message, Error>], total: Int) async throws -> [UInt64] {
+    let consumed = NIOLockedValueBox(0)
+    return try await withThrowingTaskGroup(of: [UInt64].self) { group in
+        for stream in streams {
+            group.addTask {
+                var latencies = [UInt64]()
+                // the stream finishes when the task group is cancelled
+                for try await message in stream {
+                    latencies.append(latency(of: message))
+                    try await message.ack()
+                    if consumed.withLockedValue({ $0 += 1; return $0 }) == total {
+                        break
+                    }
+                }
+                return latencies
+            }
+        }
+        var latencies = [UInt64]()
+        while let result = try await group.next() {
+            latencies += result
+            if consumed.withLockedValue({ $0 }) == total {
+                group.cancelAll()
+            }
+        }
+        return latencies
+    }
+}
+
+/// one publisher and `consumers` competing consumers on a single queue (WorkQueue with a single consumer is
+/// PublishAndConsume)
+func workQueue(consumers: Int, size: Int, prefetch: Int) async throws -> (UInt64, [UInt64]) {
+    let connection = try await Connection(with: configuration)
+    let publisher = try await connection.makeChannel()
+    let queue = try await publisher.queueDeclare(named: "", exclusive: true).queueName
+    var streams = [AsyncThrowingStream<Message, Error>]()
+    for _ in 0..<consumers {
+        let channel = try await connection.makeChannel()
+        try await channel.basicQos(prefetchCount: prefetch)
+        streams.append(try await channel.basicConsume(queue: queue))
+    }
+    let body = String(repeating: "x", count: size)
+    let start = now()
+    async let latencies = consume(streams, total: messageCount)
+    for _ in 0..<messageCount {
+        try await publisher.basicPublish(exchange: "", routingKey: queue, body: body, properties: stamped())
+    }
+    let result = try await latencies
+    let elapsed = now() - start
+    try await connection.close()
+    return (elapsed, result)
+}
+
+/// `prefetch` requests are in flight, every reply triggers the next request, latency is the round trip
+func rpc(size: Int, prefetch: Int) async throws -> (UInt64, [UInt64]) {
+    let connection = try await Connection(with: configuration)
+    let server = try await connection.makeChannel()
+    let requestQueue = try await server.queueDeclare(named: "", exclusive: true).queueName
+    try await server.basicQos(prefetchCount: prefetch)
+    let requests = try await server.basicConsume(queue: requestQueue)
+    let client = try await connection.makeChannel()
+    let replyQueue = try await client.queueDeclare(named: "", exclusive: true).queueName
+    let replies = try await client.basicConsume(queue: replyQueue, autoAck: true)
+
+    let serverTask = Task {
+        for try await request in requests {
+            // the reply keeps the timestamp of the request
+            let properties = Spec.BasicProperties(
+                headers: request.properties.headers,
+                correlationId: request.properties.correlationId
+            )
+            try await server.basicPublish(
+                exchange: "",
+                routingKey: request.properties.replyTo ?? "",
+                body: String(decoding: request.body, as: UTF8.self),
+                properties: properties
+            )
+            try await request.ack()
+        }
+    }
+    let body = String(repeating: "x", count: size)
+    var sent = 0
+    func call() async throws {
+        sent += 1
+        let properties = stamped(correlationId: String(sent), replyTo: replyQueue)
+        try await client.basicPublish(exchange: "", routingKey: requestQueue, body: body, properties: properties)
+    }
+    var latencies = [UInt64]()
+    latencies.reserveCapacity(messageCount)
+    let start = now()
+    for _ in 0..<min(prefetch, messageCount) {
+        try await call()
+    }
+    for try await reply in replies {
+        latencies.append(latency(of: reply))
+        if latencies.count == messageCount {
+            break
+        }
+        if sent < messageCount {
+            try await call()
+        }
+    }
+    let elapsed = now() - start
+    serverTask.cancel()
+    try await connection.close()
+    return (elapsed, latencies)
+}
+
+print("scenario         size     prefetch   msgs/s p50/p99/p999 latency in µs")
+for scenario in scenarios {
+    for size in sizes {
+        for prefetch in prefetches {
+            let (elapsed, latencies) =
+                switch scenario {
+                case "publish-consume": try await workQueue(consumers: 1, size: size, prefetch: prefetch)
+                case "work-queue": try await workQueue(consumers: consumerCount, size: size, prefetch: prefetch)
+                case "rpc": try await rpc(size: size, prefetch: prefetch)
+                default: fatalError("unknown scenario \(scenario)")
+                }
+            report(scenario, size: size, prefetch: prefetch, elapsed: elapsed, latencies: latencies)
+        }
+    }
+}
@@ -0,0 +1,122 @@
+import NIOConcurrencyHelpers
+import NIOCore
+
+// Buffers the acks of a channel and sends them as one Basic.Ack with multiple=true, after `maxPendingAcks` acks or
+// `maxDelay`, whichever comes first. See `Channel.enableAckCoalescing(maxPendingAcks:maxDelay:)`.
+// The broker numbers the deliveries of a channel 1, 2, 3, ..., so once the application acked every tag up to T a
+// single multiple ack of T settles them all. Acks above a gap (out of order) wait for the gap to be filled, the timer
+// sends them one by one if it isn't filled in time. Nacks and closing the channel flush everything first.
+// Everything is sent while the lock is held: an ack overtaking another one which covers the same tags would be
+// rejected by the broker.
+final class AckCoalescer: Sendable {
+    private struct State {
+        // every tag up to it is acked by the application
+        var ackedThrough: Int64 = 0
+        // the largest tag up to ackedThrough which wasn't sent yet, the target of the next multiple ack
+        var unsentThrough: Int64?
+        // acked by the application above a gap, not sent yet
+        var outOfOrder: Set<Int64> = []
+        // settled on the wire one by one above a gap
+        var sentOutOfOrder: Set<Int64> = []
+        // acks received since the last flush
+        var pending = 0
+        var timer: Scheduled<Void>?
+    }
+
+    typealias SendT = @Sendable (any AMQPMethodProtocol & FrameCodable) -> Void
+
+    let maxPendingAcks: Int
+    let maxDelay: TimeAmount
+    private let eventLoop: any EventLoop
+    private let send: SendT
+    private let state: NIOLockedValueBox<State> = .init(.init())
+
+    init(maxPendingAcks: Int, maxDelay: TimeAmount, eventLoop: any EventLoop, send: @escaping SendT) {
+        precondition(maxPendingAcks > 0, "maxPendingAcks should be larger than 0")
+        self.maxPendingAcks = maxPendingAcks
+        self.maxDelay = maxDelay
+        self.eventLoop = eventLoop
+        self.send = send
+    }
+
+    func ack(deliveryTag: Int64, multiple: Bool) {
+        state.withLockedValue { state in
+            if multiple {
+                // the application never acks a tag twice, so the tag itself wasn't sent
+                if deliveryTag > state.ackedThrough {
+                    state.ackedThrough = deliveryTag
+                    state.unsentThrough = deliveryTag
+                }
+                state.outOfOrder = state.outOfOrder.filter { $0 > deliveryTag }
+                state.sentOutOfOrder = state.sentOutOfOrder.filter { $0 > deliveryTag }
+            } else if deliveryTag > state.ackedThrough {
+                state.outOfOrder.insert(deliveryTag)
+            }
+            advance(&state)
+            state.pending += 1
+            if state.pending >= maxPendingAcks {
+                flush(&state, isForced: false)
+            }
+            if state.pending > 0 && state.timer == nil {
+                state.timer = eventLoop.scheduleTask(in: maxDelay) { [weak self] in
+                    self?.flush()
+                }
+            }
+        }
+    }
+
+    func nack(deliveryTag: Int64, multiple: Bool, requeue: Bool) {
+        state.withLockedValue { state in
+            flush(&state, isForced: true)
+            send(Spec.Basic.Nack(deliveryTag: deliveryTag, multiple: multiple, requeue: requeue))
+            // settled as well, the acks after it can still be coalesced
+            if multiple {
+                state.ackedThrough = max(state.ackedThrough, deliveryTag)
+                state.sentOutOfOrder = state.sentOutOfOrder.filter { $0 > deliveryTag }
+            } else if deliveryTag > state.ackedThrough {
+                state.sentOutOfOrder.insert(deliveryTag)
+            }
+            advance(&state)
+        }
+    }
+
+    /// Sends every buffered ack.
+    func flush() {
+        state.withLockedValue {
+            flush(&$0, isForced: true)
+        }
+    }
+
+    // moves ackedThrough over the tags which follow it and are acked or settled already
+    private func advance(_ state: inout State) {
+        while true {
+            let next = state.ackedThrough + 1
+            if state.outOfOrder.remove(next) != nil {
+                state.unsentThrough = next
+            } else if state.sentOutOfOrder.remove(next) == nil {
+                break
+            }
+            state.ackedThrough = next
+        }
+    }
+
+    private func flush(_ state: inout State, isForced: Bool) {
+        if let unsentThrough = state.unsentThrough {
+            send(Spec.Basic.Ack(deliveryTag: unsentThrough, multiple: true))
+            state.unsentThrough = nil
+        }
+        if isForced {
+            for deliveryTag in state.outOfOrder.sorted() {
+                send(Spec.Basic.Ack(deliveryTag: deliveryTag, multiple: false))
+            }
+            state.sentOutOfOrder.formUnion(state.outOfOrder)
+            state.outOfOrder.removeAll()
+        }
+        // the acks left behind a gap wait for the timer
+        state.pending = state.outOfOrder.count
+        if state.pending == 0 {
+            state.timer?.cancel()
+            state.timer = nil
+        }
+    }
+}
@@ -0,0 +1,196 @@
+import NIOConcurrencyHelpers
+import NIOCore
+
+/// Bounds and target of the adaptive prefetch of a consumer, see
+/// ``Channel/basicConsume(queue:autoAck:tag:noLocal:exclusive:arguments:adaptivePrefetch:)``.
+///
+/// The prefetch count is sized so that messages wait about `targetLatency` between being delivered and being acked:
+/// a consumer which keeps up gets a larger window (so it doesn't stall waiting for round-trips to the broker), a slow
+/// one a smaller window (so it doesn't hold many messages in memory).
+public struct AdaptivePrefetch: Sendable, Equatable {
+    /// the prefetch count is never set below this
+    public var minimum: Int
+    /// the prefetch count is never set above this, it bounds the memory held by the consumer
+    public var maximum: Int
+    /// the prefetch count until the first adjustment
+    public var initial: Int
+    /// how long a message should be held by the client until it is acked
+    public var targetLatency: TimeAmount
+    /// how often the throughput is measured and the prefetch count reconsidered
+    public var interval: TimeAmount
+
+    public init(
+        minimum: Int = 1,
+        maximum: Int = 1000,
+        initial: Int = 50,
+        targetLatency: TimeAmount = .milliseconds(200),
+        interval: TimeAmount = .seconds(1)
+    ) {
+        precondition(minimum > 0 && minimum <= maximum, "minimum should be within [1, maximum]")
+        precondition(maximum <= UInt16.max, "maximum should be within [minimum, UInt16.max]")
+        precondition(initial >= minimum && initial <= maximum, "initial should be within [minimum, maximum]")
+        precondition(targetLatency > .zero && interval > .zero, "targetLatency and interval should be positive")
+        self.minimum = minimum
+        self.maximum = maximum
+        self.initial = initial
+        self.targetLatency = targetLatency
+        self.interval = interval
+    }
+
+    public static let `default` = AdaptivePrefetch()
+}
+
+/// What the adaptive prefetch of a channel measured last, see ``Channel/prefetchStatistics``.
+public struct PrefetchStatistics: Sendable, Equatable {
+    /// the prefetch count currently requested from the broker
+    public let prefetchCount: Int
+    /// messages delivered and not acked or nacked yet
+    public let inFlight: Int
+    /// acked or nacked messages per second, averaged over the last intervals
+    public let ackRate: Double
+    /// time between a delivery and its ack or nack, averaged over the last intervals
+    public let ackLatency: TimeAmount
+    /// how often the prefetch count was changed
+    public let adjustments: Int
+}
+
+// Measures the ack rate and latency of a channel and decides the prefetch count. It doesn't talk to the broker, the
+// channel sends Basic.Qos whenever `recordDelivery` or `recordSettlement` return a new count.
+// The count aims at rate * targetLatency messages in flight (Little's law); while the window is full and the
+// consumer still acks faster than targetLatency the window is what limits it, so the count is doubled instead.
+final class PrefetchController: Sendable {
+    private struct State {
+        var prefetchCount: Int
+        // unsettled deliveries ordered by delivery tag
+        var deliveries: [(tag: Int64, time: NIODeadline)] = []
+        var windowStart: NIODeadline
+        var settledInWindow = 0
+        var latencyInWindow: TimeAmount = .zero
+        var peakInFlight = 0
+        var ackRate: Double?
+        var ackLatency: TimeAmount?
+        var adjustments = 0
+    }
+
+    let configuration: AdaptivePrefetch
+    private let now: @Sendable () -> NIODeadline
+    private let state: NIOLockedValueBox<State>
+
+    init(configuration: AdaptivePrefetch, now: @escaping @Sendable () -> NIODeadline = { .now() }) {
+        self.configuration = configuration
+        self.now = now
+        self.state = .init(.init(prefetchCount: configuration.initial, windowStart: now()))
+    }
+
+    var statistics: PrefetchStatistics {
+        state.withLockedValue {
+            .init(
+                prefetchCount: $0.prefetchCount,
+                inFlight: $0.deliveries.count,
+                ackRate: $0.ackRate ?? 0,
+                ackLatency: $0.ackLatency ?? .zero,
+                adjustments: $0.adjustments
+            )
+        }
+    }
+
+    /// Returns the new prefetch count if it should be changed.
+    func recordDelivery(tag: Int64) -> Int? {
+        let now = self.now()
+        return state.withLockedValue {
+            // the window which ends now doesn't include this delivery, otherwise the first delivery after a pause
+            // would look like a stalled consumer
+            let prefetchCount = evaluate(&$0, at: now)
+            $0.deliveries.append((tag, now))
+            $0.peakInFlight = max($0.peakInFlight, $0.deliveries.count)
+            return prefetchCount
+        }
+    }
+
+    /// Returns the new prefetch count if it should be changed.
+    func recordSettlement(tag: Int64, multiple: Bool) -> Int? {
+        let now = self.now()
+        return state.withLockedValue { state in
+            let range: Range<Int>
+            if multiple {
+                // tag 0 with multiple settles everything outstanding
+                let end = tag == 0 ? state.deliveries.endIndex : state.deliveries.partitioningIndex { $0.tag > tag }
+                range = state.deliveries.startIndex..<end
+            } else {
+                let index = state.deliveries.partitioningIndex { $0.tag >= tag }
+                let isKnown = index < state.deliveries.endIndex && state.deliveries[index].tag == tag
+                range = isKnown ? index..<index + 1 : index..<index
+            }
+            // indexed instead of sliced, a slice alive while the deliveries are removed would copy the whole array
+            for index in range {
+                state.latencyInWindow = state.latencyInWindow + (now - state.deliveries[index].time)
+            }
+            state.settledInWindow += range.count
+            if multiple {
+                state.deliveries.removeFirst(range.count)
+            } else {
+                state.deliveries.removeSubrange(range)
+            }
+            return evaluate(&state, at: now)
+        }
+    }
+
+    private func evaluate(_ state: inout State, at now: NIODeadline) -> Int? {
+        let elapsed = now - state.windowStart
+        guard elapsed >= configuration.interval else {
+            return nil
+        }
+        defer {
+            state.windowStart = now
+            state.settledInWindow = 0
+            state.latencyInWindow = .zero
+            state.peakInFlight = state.deliveries.count
+        }
+        // an idle consumer keeps its window for when the traffic comes back
+        guard state.settledInWindow > 0 || !state.deliveries.isEmpty else {
+            return nil
+        }
+        let rate = Double(state.settledInWindow) / seconds(elapsed)
+        state.ackRate = state.ackRate.map { ($0 + rate) / 2 } ?? rate
+        if state.settledInWindow > 0 {
+            let latency = TimeAmount.nanoseconds(state.latencyInWindow.nanoseconds / Int64(state.settledInWindow))
+            state.ackLatency = state.ackLatency.map { .nanoseconds(($0 + latency).nanoseconds / 2) } ?? latency
+        }
+        var desired = Int((state.ackRate! * seconds(configuration.targetLatency)).rounded(.up))
+        let isSaturated = state.peakInFlight >= state.prefetchCount
+        if isSaturated, let latency = state.ackLatency, latency < configuration.targetLatency {
+            desired = max(desired, state.prefetchCount * 2)
+        }
+        desired = min(max(desired, configuration.minimum), configuration.maximum)
+        // small changes aren't worth a round-trip, unless they reach a bound
+        let isBound = desired == configuration.minimum || desired == configuration.maximum
+        let isLarge = abs(desired - state.prefetchCount) * 4 >= state.prefetchCount
+        guard desired != state.prefetchCount, isBound || isLarge else {
+            return nil
+        }
+        state.prefetchCount = desired
+        state.adjustments += 1
+        return desired
+    }
+
+    private func seconds(_ amount: TimeAmount) -> Double {
+        Double(amount.nanoseconds) / 1_000_000_000
+    }
+}
+
+extension Array {
+    // index of the first element matching `predicate`, the elements matching it should all be at the end
+    fileprivate func partitioningIndex(where predicate: (Element) -> Bool) -> Index {
+        var low = startIndex
+        var high = endIndex
+        while low < high {
+            let middle = low + (high - low) / 2
+            if predicate(self[middle]) {
+                high = middle
+            } else {
+                low = middle + 1
+            }
+        }
+        return low
+    }
+}
@@ -22,7 +22,50 @@ public class Channel: @unchecked Sendable {
     typealias MessageStreamT = AsyncThrowingStream<Message, Error>
     private let messages: MessageStreamT
     private let continuation: MessageStreamT.Continuation?
+    typealias StreamedMessageStreamT = AsyncThrowingStream<StreamedMessage, Error>
+    private let streamedMessages: StreamedMessageStreamT
+    private let streamedContinuation: StreamedMessageStreamT.Continuation?
+    // how many messages may wait to be read in `messages` or `streamedMessages`, the channel is closed once a
+    // consumer falls further behind
+    private let maxBufferedDeliveries: Int
+    // set by the first consumer, whether the deliveries of this channel go to `streamedMessages` with their bodies
+    // streamed, or to `messages` once the whole body arrived
+    private let streamsBodiesMode: NIOLockedValueBox<Bool?> = .init(nil)
+    // the body of the delivery which is being streamed to the consumer
+    private let streamedBody: NIOLockedValueBox<AsyncThrowingStream<ByteBuffer, Error>.Continuation?> = .init(nil)
+    // bytes of the streamed bodies which were handed over but not read yet, the dispatcher of the channel waits while
+    // there are more than `maxStreamedBacklog`; only changed under the lock of `streamedRoom`
+    private let streamedBacklog = ManagedAtomic(0)
+    private let maxStreamedBacklog = ManagedAtomic(Int.max)
+    // set while the dispatcher waits for the consumer to read the streamed body
+    private let streamedRoom: NIOLockedValueBox<EventLoopPromise<Void>?> = .init(nil)
+    // set once the consumer fell too far behind, the frames but Channel.CloseOk are dropped until the channel is closed
+    private let isOverrun = ManagedAtomic(false)
+    // set while basicPublish sends a body from an AsyncSequence, the broker expects nothing but its body frames on
+    // the channel then, so the other frames of the channel (acks, Basic.Qos, requests) wait here until it's done
+    private let heldFrames: NIOLockedValueBox<[any Frame]?> = .init(nil)
     private var promises: NIOLockedValueBox<[EventLoopPromise<any Frame>]> = .init([])
+    // set by basicConsume when the prefetch count should follow the consumer
+    private let prefetchController: NIOLockedValueBox<PrefetchController?> = .init(nil)
+    // set by confirmSelect, tracks the published messages until the broker confirms them
+    private let publisherConfirms: NIOLockedValueBox<PublisherConfirms?> = .init(nil)
+    // set by enableAckCoalescing, buffers the acks sent by basicAck
+    private let ackCoalescer: NIOLockedValueBox<AckCoalescer?> = .init(nil)
+
+    /// What the adaptive prefetch measured last, nil unless a consumer with `adaptivePrefetch` was started on this
+    /// channel.
+    public var prefetchStatistics: PrefetchStatistics? {
+        prefetchController.withLockedValue { $0?.statistics }
+    }
+
+    internal var streamsBodies: Bool {
+        streamsBodiesMode.withLockedValue { $0 ?? false }
+    }
+
+    // the requests waiting for a reply and the published messages waiting for a confirm
+    internal var inFlight: Int {
+        promises.withLockedValue { $0.count } + (publisherConfirms.withLockedValue { $0 }?.inFlight ?? 0)
+    }
 
     internal func dispatch0(frame: any Frame) -> Result<Bool, ConnectionError> {
         precondition(frame.channelId == 0, "dispatch0 called with non-zero channel id")
@@ -47,6 +90,18 @@ public class Channel: @unchecked Sendable {
             }
             return .success(false)
         }
+        // the broker stops reading from the socket while the connection is blocked, so the publishers are held
+        // before the queued frames pile up
+        if let payload = frame.unwrapPayload(as: Spec.Connection.Blocked.self) {
+            logger.warning("Connection blocked by broker: \(payload.reason)")
+            transportWeak?.outboundQueue?.setBlocked(true)
+            return .success(true)
+        }
+        if frame.isPayload(of: Spec.Connection.Unblocked.self) {
+            logger.info("Connection unblocked by broker")
+            transportWeak?.outboundQueue?.setBlocked(false)
+            return .success(true)
+        }
         fatalError("unreachable: in dispatch0 with frame \(frame)")
     }
 
@@ -57,6 +112,13 @@ public class Channel: @unchecked Sendable {
         if frame.channelId == 0 {
             return dispatch0(frame: frame)
         }
+        // the replies to the requests failed by handleOverrun() may still arrive, only the one to its close is awaited
+        if isOverrun.load(ordering: .acquiring) && !frame.isPayload(of: Spec.Channel.CloseOk.self) {
+            return .success(true)
+        }
+        if dispatchConfirmation(frame: frame) {
+            return .success(true)
+        }
         precondition(
             promises.withLockedValue { !$0.isEmpty },
             "channel got an unexpected frame \(frame)"
@@ -66,28 +128,194 @@ public class Channel: @unchecked Sendable {
         return .success(true)
     }
 
+    // in confirm mode the broker acks or nacks the published messages, returns false for any other frame
+    private func dispatchConfirmation(frame: any Frame) -> Bool {
+        guard let confirms = publisherConfirms.withLockedValue({ $0 }) else {
+            return false
+        }
+        if let ack = frame.unwrapPayload(as: Spec.Basic.AckView.self)
+            ?? frame.unwrapPayload(as: Spec.Basic.Ack.self).map(Spec.Basic.AckView.init)
+        {
+            confirms.confirm(deliveryTag: ack.deliveryTag, multiple: ack.multiple, isAck: true)
+            return true
+        }
+        if let nack = frame.unwrapPayload(as: Spec.Basic.NackView.self)
+            ?? frame.unwrapPayload(as: Spec.Basic.Nack.self).map(Spec.Basic.NackView.init)
+        {
+            confirms.confirm(deliveryTag: nack.deliveryTag, multiple: nack.multiple, isAck: false)
+            return true
+        }
+        return false
+    }
+
     internal func dispatch(content: [any Frame]) {
+        guard !isOverrun.load(ordering: .acquiring) else {
+            return
+        }
         precondition(
-            content.count > 2,
-            "Content should have at least 3 frames (deliver, header, body)"
+            content.count >= 2,
+            "Content should have at least 2 frames (deliver, header), an empty body has no body frames"
         )
-        let deliverFrame = content[0] as! MethodFrame
+        let deliver = deliverView(of: content[0] as! MethodFrame)
         let headerFrame = content[1] as! ContentHeaderFrame
-        var message = Message(
-            body: [],
-            deliverFrame: deliverFrame.payload as! Spec.Basic.Deliver,
+        let fragments = content[2...].map {
+            guard let bodyFrame = $0 as? ContentBodyFrame else {
+                preconditionFailure("Expected ContentBodyFrame but got \(type(of: $0))")
+            }
+            return bodyFrame.fragment
+        }
+        // a single fragment is the body as it is, more are joined into one allocation of the announced size
+        var body = fragments.first ?? ByteBuffer()
+        if fragments.count > 1 {
+            body = ByteBufferAllocator().buffer(capacity: Int(headerFrame.bodySize))
+            for fragment in fragments {
+                body.writeImmutableBuffer(fragment)
+            }
+        }
+        let message = Message(
+            body: body,
+            deliver: deliver,
             properties: headerFrame.properties,
             onChannel: self
         )
-        content[2...]
-            .forEach {
-                if let bodyFrame = $0 as? ContentBodyFrame {
-                    message.body.append(contentsOf: bodyFrame.fragment)
-                } else {
-                    preconditionFailure("Expected ContentBodyFrame but got \(type(of: $0))")
-                }
+        if case .dropped = continuation?.yield(message) {
+            handleOverrun("more than \(maxBufferedDeliveries) messages")
+            return
+        }
+        recordDelivery(tag: deliver.deliveryTag)
+    }
+
+    // the start of a delivery whose body is streamed, the body fragments follow with dispatch(body:isLast:)
+    internal func dispatch(deliver deliverFrame: MethodFrame, header: ContentHeaderFrame) {
+        guard !isOverrun.load(ordering: .acquiring) else {
+            return
+        }
+        let deliver = deliverView(of: deliverFrame)
+        let (body, fragments) = AsyncThrowingStream<ByteBuffer, Error>.makeStream()
+        if header.bodySize == 0 {
+            fragments.finish()
+        } else {
+            streamedBody.withLockedValue { $0 = fragments }
+        }
+        let message = StreamedMessage(
+            body: body,
+            bodySize: header.bodySize,
+            deliver: deliver,
+            properties: header.properties,
+            onChannel: self
+        )
+        if case .dropped = streamedContinuation?.yield(message) {
+            handleOverrun("more than \(maxBufferedDeliveries) messages")
+            return
+        }
+        recordDelivery(tag: deliver.deliveryTag)
+    }
+
+    // hands the fragment over, it waits in the body until the consumer reads it and counts against
+    // `maxStreamedBacklog`; while the consumer is further behind the dispatcher waits, so the next frames of the
+    // channel wait in its route (which closes the channel once it's full) and the other channels aren't held up
+    internal func dispatch(body: ContentBodyFrame, isLast: Bool) async {
+        // nil if the body was failed by a connection error or the consumer fell behind
+        guard let fragments = streamedBody.withLockedValue({ $0 }) else {
+            return
+        }
+        streamedRoom.withLockedValue { _ in
+            streamedBacklog.wrappingIncrement(by: body.fragment.readableBytes, ordering: .relaxed)
+        }
+        fragments.yield(body.fragment)
+        if isLast {
+            streamedBody.withLockedValue { $0 = nil }
+            fragments.finish()
+        }
+        let room: EventLoopFuture<Void>? = streamedRoom.withLockedValue {
+            guard streamedBacklog.load(ordering: .relaxed) > maxStreamedBacklog.load(ordering: .relaxed),
+                !isOverrun.load(ordering: .acquiring),
+                let transport = transportWeak, transport.isActive
+            else {
+                return nil
             }
-        continuation?.yield(message)
+            let promise = transport.eventLoop.makePromise(of: Void.self)
+            $0 = promise
+            return promise.futureResult
+        }
+        try? await room?.get()
+    }
+
+    // the consumer read a fragment of a streamed body, the dispatcher goes on once the backlog fits the limit again
+    internal func didRead(streamedFragment fragment: ByteBuffer) {
+        let waiter: EventLoopPromise<Void>? = streamedRoom.withLockedValue {
+            let backlog = streamedBacklog.wrappingDecrementThenLoad(by: fragment.readableBytes, ordering: .relaxed)
+            guard backlog <= maxStreamedBacklog.load(ordering: .relaxed) else {
+                return nil
+            }
+            let current = $0
+            $0 = nil
+            return current
+        }
+        waiter?.succeed()
+    }
+
+    // lets the dispatcher go on, the frames it dispatches are dropped
+    private func releaseStreamedRoom() {
+        let waiter = streamedRoom.withLockedValue {
+            let current = $0
+            $0 = nil
+            return current
+        }
+        waiter?.succeed()
+    }
+
+    // the consumer reads slower than the broker sends and the buffers of the channel are full, the broker can't be
+    // asked to slow down a single channel, so the consumer fails and the channel is closed with RESOURCE_ERROR; the
+    // frames which still arrive for the channel are dropped, the unacked messages are requeued by the broker
+    internal func handleOverrun(_ backlog: String) {
+        let (exchanged, _) = isOverrun.compareExchange(expected: false, desired: true, ordering: .acquiringAndReleasing)
+        guard exchanged else {
+            return
+        }
+        logger.error("Closing the channel, its consumer fell behind by \(backlog)")
+        let body = streamedBody.withLockedValue {
+            let current = $0
+            $0 = nil
+            return current
+        }
+        body?.finish(throwing: ConnectionError.consumerOverrun)
+        streamedContinuation?.finish(throwing: ConnectionError.consumerOverrun)
+        continuation?.finish(throwing: ConnectionError.consumerOverrun)
+        releaseStreamedRoom()
+        // their replies may have been dropped
+        let pending = promises.withLockedValue {
+            let current = $0
+            $0.removeAll()
+            return current
+        }
+        for promise in pending {
+            promise.fail(ConnectionError.consumerOverrun)
+        }
+        let method = Spec.Channel.Close(
+            replyCode: UInt16(Spec.HardError.resourceError.rawValue),
+            replyText: "the consumer fell behind",
+            classId: 0,
+            methodId: 0
+        )
+        // the Channel.CloseOk is taken off the replies of the channel when it arrives
+        _ = try? send(method: method)
+        isOpenShadow.store(false, ordering: .releasing)
+    }
+
+    private func deliverView(of frame: MethodFrame) -> Spec.Basic.DeliverView {
+        switch frame.payload {
+        case let view as Spec.Basic.DeliverView: view
+        case let method as Spec.Basic.Deliver: .init(method)
+        default: preconditionFailure("Expected Basic.Deliver but got \(type(of: frame.payload))")
+        }
+    }
+
+    private func recordDelivery(tag: Int64) {
+        let controller = prefetchController.withLockedValue { $0 }
+        if let prefetchCount = controller?.recordDelivery(tag: tag) {
+            requestPrefetch(count: prefetchCount)
+        }
     }
 
     // MARK: - init
@@ -95,10 +323,12 @@ public class Channel: @unchecked Sendable {
         transport: any TransportProtocol,
         id: UInt16,
         logger: Logger,
-        manager: ChannelManager? = nil
+        manager: ChannelManager? = nil,
+        maxBufferedDeliveries: Int = .max
     ) {
         self.id = id
         self.manager = manager
+        self.maxBufferedDeliveries = maxBufferedDeliveries
         self.maxFragmentSize = ContentBodyFrame.maxPossibleFragmentSize(
             for: transport.negotiatedProperties.0.maxFrameSize
         )
@@ -107,10 +337,16 @@ public class Channel: @unchecked Sendable {
         decoratedLogger[metadataKey: "channel-id"] = "\(id)"
         self.logger = decoratedLogger
         var messagesContinuation: MessageStreamT.Continuation?
-        self.messages = MessageStreamT { continuation in
+        self.messages = MessageStreamT(bufferingPolicy: .bufferingOldest(maxBufferedDeliveries)) { continuation in
             messagesContinuation = continuation
         }
         self.continuation = messagesContinuation
+        var streamedMessagesContinuation: StreamedMessageStreamT.Continuation?
+        self.streamedMessages = StreamedMessageStreamT(bufferingPolicy: .bufferingOldest(maxBufferedDeliveries)) {
+            continuation in
+            streamedMessagesContinuation = continuation
+        }
+        self.streamedContinuation = streamedMessagesContinuation
     }
 
     deinit {
@@ -151,25 +387,75 @@ extension Channel {
         for promise in promises {
             promise.fail(error)
         }
+        publisherConfirms.withLockedValue { $0 }?.fail(with: error)
         continuation?.finish(throwing: error)
+        let body = streamedBody.withLockedValue {
+            let current = $0
+            $0 = nil
+            return current
+        }
+        body?.finish(throwing: error)
+        streamedContinuation?.finish(throwing: error)
+        releaseStreamedRoom()
     }
 
-    private func sendReturningResponse(
-        method: some AMQPMethodProtocol & FrameCodable,
-    ) async throws -> MethodFrame? {
+    // the promise is fulfilled with the response, responses are matched to the requests in the order they were sent
+    private func send(method: some AMQPMethodProtocol & FrameCodable) throws -> EventLoopPromise<any Frame> {
         let frame = makeFrame(with: method)
-        let promise = try promises.withLockedValue {
+        return try promises.withLockedValue {
             let promise = try withTransport { transport in
-                transport.send(frame)
+                let promise = transport.eventLoop.makePromise(of: (any Frame).self)
+                sendOrHold(frame, on: transport)
+                return promise
             }
             $0.append(promise)
             return promise
         }
+    }
+
+    private func sendReturningResponse(
+        method: some AMQPMethodProtocol & FrameCodable,
+    ) async throws -> MethodFrame? {
+        let promise = try send(method: method)
         let response = try await promise.futureResult.get() as? MethodFrame
         return response
     }
 
+    // sends the frame, or holds it until the body of the message streamed on this channel is sent
+    private func sendOrHold(_ frame: any Frame, on transport: any TransportProtocol) {
+        heldFrames.withLockedValue {
+            guard $0 != nil else {
+                // sent under the lock, so a stream claimed meanwhile can't put its header before the frame
+                transport.sendAsync(frame)
+                return
+            }
+            $0!.append(frame)
+        }
+    }
+
+    // claims the channel for a streamed message, the other frames of the channel are held until it's released
+    private func claimStream() throws {
+        try heldFrames.withLockedValue {
+            guard $0 == nil else {
+                throw PublishError.channelBusy
+            }
+            $0 = []
+        }
+    }
+
+    // sends the frames held while the body was streamed, after it and in the order they came
+    private func releaseStream() {
+        heldFrames.withLockedValue {
+            if let frames = $0, !frames.isEmpty {
+                transportWeak?.sendAsync(frames)
+            }
+            $0 = nil
+        }
+    }
+
     public func close(replyCode: UInt16 = 0, replyText: String = "") async throws {
+        // the acks which weren't sent yet would be lost with the channel, the messages redelivered
+        ackCoalescer.withLockedValue { $0 }?.flush()
         let method = Spec.Channel.Close(
             replyCode: replyCode,
             replyText: replyText,
@@ -254,6 +540,32 @@ extension Channel {
         )
     }
 
+    // adjusts the prefetch shared by the channel (global=true): RabbitMQ applies a per consumer prefetch only to the
+    // consumers started after it, so changing it wouldn't reach the running adaptive consumer. A channel limit the user
+    // set is replaced. Neither the delivery nor the ack which triggered it waits for the round-trip, the Basic.QosOk is
+    // taken off the replies of the channel when it arrives
+    private func requestPrefetch(count: Int) {
+        let method = Spec.Basic.Qos(prefetchSize: 0, prefetchCount: UInt16(count), global: true)
+        let promise: EventLoopPromise<any Frame>
+        do {
+            promise = try send(method: method)
+        } catch {
+            logger.debug("Couldn't adjust the prefetch count to \(count): \(error)")
+            return
+        }
+        let logger = self.logger
+        promise.futureResult.whenComplete { result in
+            switch result {
+            case .success(let frame) where frame.isPayload(of: Spec.Basic.QosOk.self):
+                break
+            case .success(let frame):
+                logger.error("Adjusting the prefetch count expects Spec.Basic.QosOk but got \(frame)")
+            case .failure(let error):
+                logger.debug("Couldn't adjust the prefetch count to \(count): \(error)")
+            }
+        }
+    }
+
     /// Declares an exchange on the broker.
     /// If the exchange doesn't exist already, if it exists the broker will verify the parameters match
     /// and return an error if they don't.
@@ -319,7 +631,7 @@ extension Channel {
         )
         let frame = makeFrame(with: method)
         try withTransport {
-            $0.sendAsync(frame)
+            sendOrHold(frame, on: $0)
         }
     }
 
@@ -387,7 +699,7 @@ extension Channel {
 
         let frame = makeFrame(with: method)
         try withTransport {
-            $0.sendAsync(frame)
+            sendOrHold(frame, on: $0)
         }
     }
 
@@ -442,10 +754,14 @@ extension Channel {
         )
         let frame = makeFrame(with: method)
         try withTransport {
-            $0.sendAsync(frame)
+            sendOrHold(frame, on: $0)
         }
     }
 
+    /// Publishes a message with the UTF-8 bytes of `body`.
+    ///  - Throws: if connection or this channel has been already closed, `PublishError.channelBusy` while the
+    ///    body of a message is streamed on this channel, see
+    ///    ``basicPublish(exchange:routingKey:bodySize:body:properties:mandatory:)``.
     public func basicPublish(
         exchange: String,
         routingKey: String,
@@ -453,49 +769,464 @@ extension Channel {
         properties: Spec.BasicProperties = .init(),
         mandatory: Bool = false
     ) async throws {
+        try await basicPublish(
+            exchange: exchange,
+            routingKey: routingKey,
+            body: ByteBuffer(string: body),
+            properties: properties,
+            mandatory: mandatory
+        )
+    }
+
+    /// Publishes a message, the bytes of `body` are copied into one buffer.
+    ///  - Throws: if connection or this channel has been already closed, `PublishError.channelBusy` while the
+    ///    body of a message is streamed on this channel, see
+    ///    ``basicPublish(exchange:routingKey:bodySize:body:properties:mandatory:)``.
+    public func basicPublish(
+        exchange: String,
+        routingKey: String,
+        body: some Collection<UInt8>,
+        properties: Spec.BasicProperties = .init(),
+        mandatory: Bool = false
+    ) async throws {
+        try await basicPublish(
+            exchange: exchange,
+            routingKey: routingKey,
+            body: ByteBuffer(bytes: body),
+            properties: properties,
+            mandatory: mandatory
+        )
+    }
+
+    /// Publishes a message, the body frames are slices of `body` so its bytes aren't copied before encoding. On a
+    /// channel in confirm mode it waits for room in the in-flight window like ``basicPublishConfirmed(_:)``, the
+    /// confirmation isn't returned.
+    ///  - Throws: if connection or this channel has been already closed, `PublishError.channelBusy` while the
+    ///    body of a message is streamed on this channel, see
+    ///    ``basicPublish(exchange:routingKey:bodySize:body:properties:mandatory:)``.
+    public func basicPublish(
+        exchange: String,
+        routingKey: String,
+        body: ByteBuffer,
+        properties: Spec.BasicProperties = .init(),
+        mandatory: Bool = false
+    ) async throws {
+        let message = OutboundMessage(
+            exchange: exchange,
+            routingKey: routingKey,
+            body: body,
+            properties: properties,
+            mandatory: mandatory
+        )
+        let framesToPublish = makePublishFrames(for: message)
+        try await waitForOutboundRoom()
+        _ = try await publish(count: 1) {
+            $0.sendAsync(framesToPublish)
+        }
+    }
+
+    /// Publishes a message whose body is produced while it's sent, e.g. read from a file chunk by chunk, so the body
+    /// doesn't have to be in memory at once. The chunks are sent as body frames as soon as they fill one, a chunk
+    /// larger than the negotiated frame size is split into several.
+    ///
+    /// The frames of a message can't be interleaved with other frames of its channel, publishing another message on
+    /// this channel until this returns throws `PublishError.channelBusy`. Acks and other requests of this channel are
+    /// held until the body is sent.
+    /// - Parameters:
+    ///   - bodySize: the size of the body in bytes, the chunks have to add up to it.
+    ///   - body: the chunks of the body, in order.
+    ///  - Throws: if connection or this channel has been already closed, `PublishError.bodySizeMismatch` if the
+    ///    chunks don't add up to `bodySize`, or what `body` throws. A message whose header was sent can't be
+    ///    completed then and the connection is closed, the broker would close it on the next frame of this channel.
+    public func basicPublish<Body: AsyncSequence>(
+        exchange: String,
+        routingKey: String,
+        bodySize: Int,
+        body: Body,
+        properties: Spec.BasicProperties = .init(),
+        mandatory: Bool = false
+    ) async throws where Body.Element == ByteBuffer {
+        precondition(bodySize >= 0, "bodySize can't be negative")
         let method = Spec.Basic.Publish(exchange: exchange, routingKey: routingKey, mandatory: mandatory)
-        let frame = makeFrame(with: method)
-        let contentHeaderFrame = ContentHeaderFrame(
+        let header = ContentHeaderFrame(
             channelId: self.id,
             classId: method.amqpClassId,
-            bodySize: UInt64(body.utf8.count),
+            bodySize: UInt64(bodySize),
             properties: properties
         )
-        var framesToPublish: [any Frame] = [frame, contentHeaderFrame]
-        if body.utf8.count > self.maxFragmentSize {
+        // claimed before anything is sent, the frames of two streamed messages would be interleaved otherwise
+        try claimStream()
+        defer { releaseStream() }
+        try await waitForOutboundRoom()
+        _ = try await publish(count: 1, isStreamed: true) {
+            $0.sendAsync([makeFrame(with: method), header])
+        }
+        do {
+            try await sendStreamedBody(body, bodySize: bodySize)
+        } catch {
+            await abandonStreamedMessage(dueTo: error)
+            throw error
+        }
+    }
+
+    /// Publishes a message whose body is produced while it's sent, see
+    /// ``basicPublish(exchange:routingKey:bodySize:body:properties:mandatory:)``.
+    public func basicPublish<Body: AsyncSequence>(
+        exchange: String,
+        routingKey: String,
+        bodySize: Int,
+        body: Body,
+        properties: Spec.BasicProperties = .init(),
+        mandatory: Bool = false
+    ) async throws where Body.Element: Collection, Body.Element.Element == UInt8 {
+        try await basicPublish(
+            exchange: exchange,
+            routingKey: routingKey,
+            bodySize: bodySize,
+            body: body.map { ByteBuffer(bytes: $0) },
+            properties: properties,
+            mandatory: mandatory
+        )
+    }
+
+    // sends the chunks of `body` in frames of the negotiated size
+    private func sendStreamedBody<Body: AsyncSequence>(
+        _ body: Body,
+        bodySize: Int
+    ) async throws where Body.Element == ByteBuffer {
+        let fragmentSize: Int? = maxFragmentSize > 0 ? Int(maxFragmentSize) : nil
+        // a large body waits for room frame by frame, so it's never queued at once
+        let sendFragment = { (fragment: ByteBuffer) async throws in
+            try await self.waitForOutboundRoom()
+            let frame = ContentBodyFrame(channelId: self.id, fragment: fragment)
+            try self.withTransport { $0.sendAsync(frame) }
+        }
+        var readBytes = 0
+        // the bytes which don't fill a frame yet
+        var pending = ByteBuffer()
+        for try await chunk in body {
+            readBytes += chunk.readableBytes
+            guard readBytes <= bodySize else {
+                throw PublishError.bodySizeMismatch(bodySize: bodySize, readBytes: readBytes)
+            }
+            var chunk = chunk
+            // without a negotiated limit every chunk is a frame of its own
+            guard let fragmentSize else {
+                if chunk.readableBytes > 0 {
+                    try await sendFragment(chunk)
+                }
+                continue
+            }
+            if pending.readableBytes > 0 {
+                var head = chunk.readSlice(length: min(chunk.readableBytes, fragmentSize - pending.readableBytes))!
+                pending.writeBuffer(&head)
+                guard pending.readableBytes == fragmentSize else {
+                    continue
+                }
+                try await sendFragment(pending)
+                pending.clear()
+            }
+            // whole fragments are slices of the chunk, they aren't copied
+            while chunk.readableBytes >= fragmentSize {
+                try await sendFragment(chunk.readSlice(length: fragmentSize)!)
+            }
+            if chunk.readableBytes > 0 {
+                pending = chunk
+            }
+        }
+        if pending.readableBytes > 0 {
+            try await sendFragment(pending)
+        }
+        guard readBytes == bodySize else {
+            throw PublishError.bodySizeMismatch(bodySize: bodySize, readBytes: readBytes)
+        }
+    }
+
+    // the broker can't be told to drop a message whose header is out, it closes the connection with UNEXPECTED_FRAME
+    // once anything else is sent on the channel, so the connection is closed right away instead
+    private func abandonStreamedMessage(dueTo error: any Error) async {
+        isOpenShadow.store(false, ordering: .releasing)
+        // nothing may follow Connection.Close, the requests held meanwhile fail with the connection
+        heldFrames.withLockedValue { $0 = [] }
+        logger.error("Closing the connection, the body of a streamed message couldn't be sent: \(error)")
+        let method = Spec.Basic.Publish()
+        try? await manager?.channel0.connectionClose(
+            replyCode: UInt16(Spec.HardError.internalError.rawValue),
+            replyText: "the body of a streamed message couldn't be sent",
+            classId: method.amqpClassId,
+            methodId: method.amqpMethodId
+        )
+    }
+
+    /// Publishes all messages at once. The frames of every message are encoded into one buffer which is allocated
+    /// up front, written and flushed once, which is cheaper than publishing the messages one by one when there are
+    /// many small ones. On a channel in confirm mode it waits for room for all of them in the in-flight window.
+    /// - Parameter messages: the messages to publish, in order.
+    ///  - Throws: if connection or this channel has been already closed, `PublishError.channelBusy` while the
+    ///    body of a message is streamed on this channel, see
+    ///    ``basicPublish(exchange:routingKey:bodySize:body:properties:mandatory:)``.
+    public func basicPublishBatch(_ messages: [OutboundMessage]) async throws {
+        guard !messages.isEmpty else {
+            return
+        }
+        let batch = FrameBatch(frames: messages.flatMap { makePublishFrames(for: $0) })
+        try await waitForOutboundRoom()
+        _ = try await publish(count: messages.count) {
+            $0.sendAsync(batch)
+        }
+    }
+
+    /// Puts this channel in confirm mode, in which the broker acks every published message once it took
+    /// responsibility for it (or nacks it if it couldn't). The acks come asynchronously, so publishing doesn't wait
+    /// for a round-trip per message like transactions do.
+    /// - Parameter maxInFlight: how many messages may be unconfirmed at a time, every publish on this channel
+    ///   (``basicPublishConfirmed(_:)`` as well as ``basicPublish(exchange:routingKey:body:properties:mandatory:)``
+    ///   and the other publish methods) waits for the broker to catch up beyond that. The window is set by the first
+    ///   call.
+    ///  - Throws: if connection or this channel has been already closed, `PublishError.confirmWindowMismatch` if
+    ///    this channel is in confirm mode with a different `maxInFlight` already.
+    public func confirmSelect(maxInFlight: Int = 1024) async throws {
+        let transport = try withTransport { $0 }
+        // installed before the request, so nothing published right after it is missed
+        try publisherConfirms.withLockedValue {
+            guard let confirms = $0 else {
+                $0 = PublisherConfirms(maxInFlight: maxInFlight, eventLoop: transport.eventLoop)
+                return
+            }
+            guard confirms.maxInFlight == maxInFlight else {
+                throw PublishError.confirmWindowMismatch(maxInFlight: confirms.maxInFlight, requested: maxInFlight)
+            }
+        }
+        let frame = try await sendReturningResponse(method: Spec.Confirm.Select(nowait: false))
+        precondition(
+            frame?.payload is Spec.Confirm.SelectOk,
+            "confirmSelect expects Spec.Confirm.SelectOk but got \(String(describing: frame))"
+        )
+    }
+
+    /// Publishes a message on a channel in confirm mode (see ``confirmSelect(maxInFlight:)``), waiting first if
+    /// `maxInFlight` messages are unconfirmed already.
+    /// - Returns: the confirmation to await, as many can be awaited later the publishing isn't held up by the acks.
+    ///  - Throws: if connection or this channel has been already closed, `PublishError.channelBusy` while the
+    ///    body of a message is streamed on this channel, see
+    ///    ``basicPublish(exchange:routingKey:bodySize:body:properties:mandatory:)``.
+    public func basicPublishConfirmed(_ message: OutboundMessage) async throws -> PublishConfirmation {
+        let frames = makePublishFrames(for: message)
+        try await waitForOutboundRoom()
+        let confirmations = try await publishConfirmed(count: 1) {
+            $0.sendAsync(frames)
+        }
+        return .init(future: confirmations[0])
+    }
+
+    /// Publishes all messages at once like ``basicPublishBatch(_:)`` on a channel in confirm mode (see
+    /// ``confirmSelect(maxInFlight:)``), waiting first until there is room for all of them in the in-flight window.
+    /// - Returns: the confirmation of the whole batch, it fails if any of the messages is nacked.
+    ///  - Throws: if connection or this channel has been already closed, `PublishError.channelBusy` while the
+    ///    body of a message is streamed on this channel, see
+    ///    ``basicPublish(exchange:routingKey:bodySize:body:properties:mandatory:)``.
+    public func basicPublishBatchConfirmed(_ messages: [OutboundMessage]) async throws -> PublishConfirmation {
+        let transport = try withTransport { $0 }
+        guard !messages.isEmpty else {
+            return .init(future: transport.eventLoop.makeSucceededVoidFuture())
+        }
+        let batch = FrameBatch(frames: messages.flatMap { makePublishFrames(for: $0) })
+        try await waitForOutboundRoom()
+        let confirmations = try await publishConfirmed(count: messages.count) {
+            $0.sendAsync(batch)
+        }
+        return .init(future: .andAllSucceed(confirmations, on: transport.eventLoop))
+    }
+
+    // waits while the outbound queue of the connection is full or the broker blocked the connection
+    private func waitForOutboundRoom() async throws {
+        let transport = try withTransport { $0 }
+        try await transport.outboundQueue?.reserve().get()
+    }
+
+    // sends the frames of `count` messages; in confirm mode it waits for room in the in-flight window first, the
+    // delivery tags are tracked and the returned futures complete when the broker confirms them. Only the streamed
+    // message itself is sent while its body is streamed
+    private func publish(
+        count: Int,
+        isStreamed: Bool = false,
+        _ send: (any TransportProtocol) -> Void
+    ) async throws -> [EventLoopFuture<Void>] {
+        let reserved = publisherConfirms.withLockedValue { $0 }
+        try await reserved?.reserve(count).get()
+        do {
+            // checked under the lock the stream is claimed with, so no message slips in after the streamed header
+            return try heldFrames.withLockedValue { held in
+                guard isStreamed || held == nil else {
+                    throw PublishError.channelBusy
+                }
+                // confirmSelect may have been called meanwhile, the broker counts the message from then on
+                guard let confirms = publisherConfirms.withLockedValue({ $0 }) else {
+                    try withTransport(send)
+                    return []
+                }
+                return try confirms.track(count, isReserved: confirms === reserved) {
+                    try withTransport(send)
+                }
+            }
+        } catch {
+            reserved?.release(count)
+            throw error
+        }
+    }
+
+    private func publishConfirmed(
+        count: Int,
+        _ send: (any TransportProtocol) -> Void
+    ) async throws -> [EventLoopFuture<Void>] {
+        precondition(
+            publisherConfirms.withLockedValue { $0 != nil },
+            "confirmSelect should be called before publishing with confirmations"
+        )
+        return try await publish(count: count, send)
+    }
+
+    private func makePublishFrames(for message: OutboundMessage) -> [any Frame] {
+        let method = Spec.Basic.Publish(
+            exchange: message.exchange,
+            routingKey: message.routingKey,
+            mandatory: message.mandatory
+        )
+        let body = message.body
+        let contentHeaderFrame = ContentHeaderFrame(
+            channelId: self.id,
+            classId: method.amqpClassId,
+            bodySize: UInt64(body.readableBytes),
+            properties: message.properties
+        )
+        var frames: [any Frame] = [makeFrame(with: method), contentHeaderFrame]
+        if body.readableBytes > self.maxFragmentSize {
             forEachChunk(
-                of: body.utf8,
+                of: body.readableBytesView,
                 maxChunkSize: Int(self.maxFragmentSize),
                 perform: {
-                    framesToPublish.append(
-                        ContentBodyFrame(
-                            channelId: self.id,
-                            fragment: .init($0)
-                        )
-                    )
+                    // a buffer made of a view shares the storage of `body`
+                    frames.append(ContentBodyFrame(channelId: self.id, fragment: ByteBuffer($0)))
                 }
             )
         } else {
-            framesToPublish.append(
-                ContentBodyFrame(
-                    channelId: self.id,
-                    fragment: .init(body.utf8)
-                )
-            )
-        }
-        try withTransport {
-            $0.sendAsync(framesToPublish)
+            frames.append(ContentBodyFrame(channelId: self.id, fragment: body))
         }
+        return frames
     }
 
+    /// Starts a consumer on the queue, the messages of all consumers of this channel are delivered to the returned
+    /// stream.
+    /// - Parameters:
+    ///   - queue: the name of the queue to consume from.
+    ///   - autoAck: if true, the broker considers the messages acknowledged once they are sent.
+    ///   - tag: the consumer tag, the broker generates one if empty.
+    ///   - noLocal: if true, the broker won't deliver messages published on this connection.
+    ///   - exclusive: if true, no other consumer can consume from the queue.
+    ///   - arguments: table with additional keys and values for the consumer.
+    ///   - adaptivePrefetch: if set, the prefetch count of the channel (`global: true`) follows how fast the messages
+    ///     are acked, within the given bounds, instead of a static ``basicQos(prefetchSize:prefetchCount:global:)``.
+    ///     RabbitMQ only applies a changed per consumer prefetch count to the consumers started afterwards, so the
+    ///     limit of the channel is adjusted instead: it replaces a channel limit set before, and the other consumers
+    ///     of the channel share it. Start the adaptive consumer on a channel of its own.
+    ///     It can't be combined with `autoAck`, which ignores the prefetch count.
+    /// - Returns: the stream of messages delivered on this channel.
+    ///  - Throws: if connection or this channel has been already closed.
     public func basicConsume(
         queue: String,
         autoAck: Bool = false,
         tag: String = "",
         noLocal: Bool = false,
         exclusive: Bool = false,
-        arguments: Spec.Table = .init()
+        arguments: Spec.Table = .init(),
+        adaptivePrefetch: AdaptivePrefetch? = nil
     ) async throws -> AsyncThrowingStream<Message, Error> {
+        try await startConsumer(
+            queue: queue,
+            autoAck: autoAck,
+            tag: tag,
+            noLocal: noLocal,
+            exclusive: exclusive,
+            arguments: arguments,
+            adaptivePrefetch: adaptivePrefetch,
+            streamsBodies: false
+        )
+        return messages
+    }
+
+    /// Starts a consumer on the queue like
+    /// ``basicConsume(queue:autoAck:tag:noLocal:exclusive:arguments:adaptivePrefetch:)``, but each message is
+    /// delivered as soon as its header arrives and its body is streamed fragment by fragment instead of being
+    /// buffered until it's complete. Fits large bodies which shouldn't be held in memory at once.
+    ///
+    /// The deliveries of a channel are either streamed or buffered, all consumers of this channel have to be started
+    /// with this method. The body of every message has to be read to the end.
+    ///
+    /// The broker can't be asked to slow down a single channel of a connection, so the fragments which arrive
+    /// before they are read are buffered. Once a consumer falls behind by more than `maxBufferedBytes` the frames of
+    /// this channel wait to be handed over, up to ``Configuration/maxBufferedDeliveries`` of them, the other
+    /// channels go on. A consumer which falls further behind has its channel closed, the stream of messages and the
+    /// body being read fail with it. A small prefetch count (see ``basicQos(prefetchSize:prefetchCount:global:)``)
+    /// keeps the broker from running too far ahead.
+    /// - Parameters:
+    ///   - queue: the name of the queue to consume from.
+    ///   - autoAck: if true, the broker considers the messages acknowledged once they are sent.
+    ///   - tag: the consumer tag, the broker generates one if empty.
+    ///   - noLocal: if true, the broker won't deliver messages published on this connection.
+    ///   - exclusive: if true, no other consumer can consume from the queue.
+    ///   - arguments: table with additional keys and values for the consumer.
+    ///   - maxBufferedBytes: how many bytes of the bodies may wait to be read before the frames of this channel are
+    ///     held back.
+    /// - Returns: the stream of messages delivered on this channel.
+    ///  - Throws: if connection or this channel has been already closed.
+    public func basicConsumeStreamingBodies(
+        queue: String,
+        autoAck: Bool = false,
+        tag: String = "",
+        noLocal: Bool = false,
+        exclusive: Bool = false,
+        arguments: Spec.Table = .init(),
+        maxBufferedBytes: Int = 4 * 1024 * 1024
+    ) async throws -> AsyncThrowingStream<StreamedMessage, Error> {
+        precondition(maxBufferedBytes > 0, "maxBufferedBytes should be positive")
+        maxStreamedBacklog.store(maxBufferedBytes, ordering: .relaxed)
+        try await startConsumer(
+            queue: queue,
+            autoAck: autoAck,
+            tag: tag,
+            noLocal: noLocal,
+            exclusive: exclusive,
+            arguments: arguments,
+            adaptivePrefetch: nil,
+            streamsBodies: true
+        )
+        return streamedMessages
+    }
+
+    private func startConsumer(
+        queue: String,
+        autoAck: Bool,
+        tag: String,
+        noLocal: Bool,
+        exclusive: Bool,
+        arguments: Spec.Table,
+        adaptivePrefetch: AdaptivePrefetch?,
+        streamsBodies: Bool
+    ) async throws {
+        streamsBodiesMode.withLockedValue {
+            precondition(
+                $0 == nil || $0 == streamsBodies,
+                "consumers with streamed and buffered bodies can't be mixed on one channel"
+            )
+            $0 = streamsBodies
+        }
+        if let adaptivePrefetch {
+            precondition(!autoAck, "adaptivePrefetch can't be used with autoAck")
+            try await basicQos(prefetchCount: adaptivePrefetch.initial, global: true)
+            prefetchController.withLockedValue {
+                $0 = PrefetchController(configuration: adaptivePrefetch)
+            }
+        }
         let method = Spec.Basic.Consume(
             queue: queue,
             consumerTag: tag,
@@ -510,7 +1241,6 @@ extension Channel {
             frame?.payload is Spec.Basic.ConsumeOk,
             "basicConsume expects Spec.Basic.ConsumeOk but got \(String(describing: frame))"
         )
-        return messages
     }
 
     /// Sends ack for one or more messages on this channel.
@@ -519,10 +1249,48 @@ extension Channel {
     ///   - multiple: if true, acknowledges all messages up to and including this one.
     ///  - Throws: if connection or this channel has been already closed.
     public func basicAck(deliveryTag: Int64, multiple: Bool = false) async throws {
-        let method = Spec.Basic.Ack(deliveryTag: deliveryTag, multiple: multiple)
-        let frame = makeFrame(with: method)
-        try withTransport {
-            $0.sendAsync(frame)
+        if let coalescer = ackCoalescer.withLockedValue({ $0 }) {
+            // fails the same way as sending would
+            _ = try withTransport { $0 }
+            coalescer.ack(deliveryTag: deliveryTag, multiple: multiple)
+        } else {
+            let method = Spec.Basic.Ack(deliveryTag: deliveryTag, multiple: multiple)
+            let frame = makeFrame(with: method)
+            try withTransport {
+                sendOrHold(frame, on: $0)
+            }
+        }
+        recordSettlement(deliveryTag: deliveryTag, multiple: multiple)
+    }
+
+    /// Makes ``basicAck(deliveryTag:multiple:)`` (and so ``Message/ack(multiple:)``) buffer the acks and send them as
+    /// one ack with `multiple` set, which acks all messages up to it: after `maxPendingAcks` acks or `maxDelay`,
+    /// whichever comes first. Acks received out of order wait until the messages before them are acked, nacks and
+    /// closing the channel send the buffered acks right away.
+    ///
+    /// All consumers of this channel should ack their messages (no `autoAck`), the deliveries of the channel are
+    /// expected to be acked one after the other.
+    /// - Parameters:
+    ///   - maxPendingAcks: how many acks are buffered at most.
+    ///   - maxDelay: how long an ack is buffered at most.
+    ///  - Throws: if connection or this channel has been already closed.
+    public func enableAckCoalescing(maxPendingAcks: Int = 64, maxDelay: TimeAmount = .microseconds(500)) throws {
+        let eventLoop = try withTransport { $0.eventLoop }
+        ackCoalescer.withLockedValue {
+            guard $0 == nil else {
+                return
+            }
+            $0 = AckCoalescer(
+                maxPendingAcks: maxPendingAcks,
+                maxDelay: maxDelay,
+                eventLoop: eventLoop
+            ) { [weak self] method in
+                // the channel or the connection was closed, the broker will redeliver the messages
+                guard let self, let transport = try? self.withTransport({ $0 }) else {
+                    return
+                }
+                self.sendOrHold(self.makeFrame(with: method), on: transport)
+            }
         }
     }
 
@@ -535,14 +1303,28 @@ extension Channel {
     public func basicNack(deliveryTag: Int64, multiple: Bool = false, requeue: Bool = true)
         async throws
     {
-        let method = Spec.Basic.Nack(
-            deliveryTag: deliveryTag,
-            multiple: multiple,
-            requeue: requeue
-        )
-        let frame = makeFrame(with: method)
-        try withTransport {
-            $0.sendAsync(frame)
+        if let coalescer = ackCoalescer.withLockedValue({ $0 }) {
+            _ = try withTransport { $0 }
+            // sends the buffered acks first
+            coalescer.nack(deliveryTag: deliveryTag, multiple: multiple, requeue: requeue)
+        } else {
+            let method = Spec.Basic.Nack(
+                deliveryTag: deliveryTag,
+                multiple: multiple,
+                requeue: requeue
+            )
+            let frame = makeFrame(with: method)
+            try withTransport {
+                sendOrHold(frame, on: $0)
+            }
+        }
+        recordSettlement(deliveryTag: deliveryTag, multiple: multiple)
+    }
+
+    private func recordSettlement(deliveryTag: Int64, multiple: Bool) {
+        let controller = prefetchController.withLockedValue { $0 }
+        if let prefetchCount = controller?.recordSettlement(tag: deliveryTag, multiple: multiple) {
+            requestPrefetch(count: prefetchCount)
         }
     }
 
@@ -0,0 +1,155 @@
+import Collections
+import NIOConcurrencyHelpers
+import NIOCore
+
+/// Completes once the broker confirmed the message, or every message of the batch, it was returned for. See
+/// ``Channel/confirmSelect(maxInFlight:)``.
+public struct PublishConfirmation: Sendable {
+    let future: EventLoopFuture<Void>
+
+    /// Waits until the broker took responsibility for the message(s).
+    ///  - Throws: `PublishError.nacked` if the broker nacked any of them, or the connection error if the connection
+    ///    dropped before they were confirmed.
+    public func wait() async throws {
+        try await future.get()
+    }
+}
+
+// Tracks the messages published on a channel in confirm mode. The delivery tags are assigned by the broker in the
+// order the messages are published, starting with 1, so the unconfirmed messages are a deque indexed by the delivery
+// tag minus the tag of its first element. A multiple ack or nack pops from the front, a single one clears its slot
+// (the cleared slots are popped once they reach the front), both in O(1) per message.
+// At most `maxInFlight` messages are unconfirmed at a time, the publishers wait for a slot in the order they came.
+final class PublisherConfirms: Sendable {
+    private struct State {
+        var firstTag: Int64 = 1
+        // nil once confirmed out of order
+        var unconfirmed: Deque<EventLoopPromise<Void>?> = []
+        // unconfirmed messages and the slots reserved for the messages which are about to be published
+        var inFlight = 0
+        var waiters: Deque<(count: Int, promise: EventLoopPromise<Void>)> = []
+        var error: (any Error)?
+    }
+
+    let maxInFlight: Int
+    private let eventLoop: any EventLoop
+    private let state: NIOLockedValueBox<State> = .init(.init())
+
+    init(maxInFlight: Int, eventLoop: any EventLoop) {
+        precondition(maxInFlight > 0, "maxInFlight should be larger than 0")
+        self.maxInFlight = maxInFlight
+        self.eventLoop = eventLoop
+    }
+
+    var inFlight: Int {
+        state.withLockedValue { $0.inFlight }
+    }
+
+    /// Completes once there is room for `count` more messages, a batch larger than `maxInFlight` waits until nothing
+    /// else is in flight.
+    func reserve(_ count: Int) -> EventLoopFuture<Void> {
+        state.withLockedValue {
+            if let error = $0.error {
+                return eventLoop.makeFailedFuture(error)
+            }
+            if $0.waiters.isEmpty && fits(count, in: $0) {
+                $0.inFlight += count
+                return eventLoop.makeSucceededVoidFuture()
+            }
+            let promise = eventLoop.makePromise(of: Void.self)
+            $0.waiters.append((count, promise))
+            return promise.futureResult
+        }
+    }
+
+    /// Gives back reserved slots which weren't used because publishing failed.
+    func release(_ count: Int) {
+        let ready = state.withLockedValue {
+            $0.inFlight -= count
+            return takeReadyWaiters(from: &$0)
+        }
+        ready.forEach { $0.succeed() }
+    }
+
+    /// Assigns the next `count` delivery tags to the messages `send` publishes. Has to wrap the sending, so the
+    /// messages published concurrently get their tags in the order they were sent.
+    func track(
+        _ count: Int,
+        isReserved: Bool,
+        _ send: () throws -> Void
+    ) throws -> [EventLoopFuture<Void>] {
+        try state.withLockedValue {
+            try send()
+            if !isReserved {
+                $0.inFlight += count
+            }
+            return (0..<count).map { _ in
+                let promise = eventLoop.makePromise(of: Void.self)
+                $0.unconfirmed.append(promise)
+                return promise.futureResult
+            }
+        }
+    }
+
+    /// Handles Basic.Ack and Basic.Nack sent by the broker.
+    func confirm(deliveryTag: Int64, multiple: Bool, isAck: Bool) {
+        let (confirmed, ready) = state.withLockedValue {
+            var confirmed: [EventLoopPromise<Void>] = []
+            if multiple {
+                while let first = $0.unconfirmed.first, $0.firstTag <= deliveryTag {
+                    if let first {
+                        confirmed.append(first)
+                    }
+                    $0.unconfirmed.removeFirst()
+                    $0.firstTag += 1
+                }
+            } else {
+                let index = Int(deliveryTag - $0.firstTag)
+                if index >= 0 && index < $0.unconfirmed.count, let promise = $0.unconfirmed[index] {
+                    confirmed.append(promise)
+                    $0.unconfirmed[index] = nil
+                }
+                while let first = $0.unconfirmed.first, first == nil {
+                    $0.unconfirmed.removeFirst()
+                    $0.firstTag += 1
+                }
+            }
+            $0.inFlight -= confirmed.count
+            return (confirmed, takeReadyWaiters(from: &$0))
+        }
+        for promise in confirmed {
+            if isAck {
+                promise.succeed()
+            } else {
+                promise.fail(PublishError.nacked(deliveryTag: deliveryTag))
+            }
+        }
+        ready.forEach { $0.succeed() }
+    }
+
+    /// Fails every unconfirmed message and waiting publisher, and whatever is published later.
+    func fail(with error: any Error) {
+        let promises = state.withLockedValue {
+            $0.error = error
+            let promises = $0.unconfirmed.compactMap { $0 } + $0.waiters.map(\.promise)
+            $0.unconfirmed.removeAll()
+            $0.waiters.removeAll()
+            return promises
+        }
+        promises.forEach { $0.fail(error) }
+    }
+
+    private func fits(_ count: Int, in state: State) -> Bool {
+        state.inFlight == 0 || state.inFlight + count <= maxInFlight
+    }
+
+    private func takeReadyWaiters(from state: inout State) -> [EventLoopPromise<Void>] {
+        var ready: [EventLoopPromise<Void>] = []
+        while let waiter = state.waiters.first, fits(waiter.count, in: state) {
+            state.inFlight += waiter.count
+            state.waiters.removeFirst()
+            ready.append(waiter.promise)
+        }
+        return ready
+    }
+}
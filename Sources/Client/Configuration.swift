@@ -1,4 +1,5 @@
 import Logging
+import NIOCore
 
 public struct Configuration: Sendable {
     public enum AuthType: Sendable {
@@ -48,6 +49,25 @@ public struct Configuration: Sendable {
     }
     public var heartbeat: HeartbeatValue = .serverDefault
 
+    /// When set, the bytes sent and received on the connection are recorded into this file (truncated on connect),
+    /// to be analysed with Generator/traffic_analyzer.py. Every connection needs a path of its own.
+    public var rawBytesRecordingPath: String? = nil
+
+    /// Bounds the frames waiting to be written to the socket, publishing suspends while the queue is full or the
+    /// broker blocked the connection.
+    public var outboundQueue: OutboundQueueConfiguration = .default
+
+    /// The connection runs on the next event loop of this group, e.g. the one the application runs on already.
+    /// When nil every connection starts an event loop thread of its own.
+    public var eventLoopGroup: (any EventLoopGroup)? = nil
+
+    /// Bounds the deliveries and replies which wait for each channel, either to be handed over to the channel or to
+    /// be read by its consumer. A consumer which falls further behind has its channel closed and its stream of
+    /// messages fails, the broker requeues the messages it didn't ack. A prefetch count (see
+    /// ``Channel/basicQos(prefetchSize:prefetchCount:global:)``) below this keeps the broker from running that far
+    /// ahead.
+    public var maxBufferedDeliveries: Int = 10_000
+
     public var logger = {
         var l = Logger(label: "swift.amqp")
         #if DebugNIOEventHandlers
@@ -54,16 +54,30 @@ final class ChannelManager: @unchecked Sendable {
     }
 
     private let channelsLock = NIOLock()
-    private var channels: [UInt16: ChannelHandle] = [:]
+    // indexed by the channel id, the ids are handed out from 1 up so the table stays dense
+    private var channels: [ChannelHandle?] = [nil]
+    private var channelsCount = 0
     private var channelIDs: ChannelIDs
+    // how many deliveries may wait for the consumers of each channel
+    private let maxBufferedDeliveries: Int
 
     // throws ConnectionError.maxChannelsLimitReached if no more channels can be
     // created (within agreed limits)
     func makeChannel(transport: TransportProtocol, logger: Logger) throws -> Channel {
         let channel: Channel = try channelsLock.withLock {
             let id = try channelIDs.next()
-            let channel = Channel.init(transport: transport, id: id, logger: logger, manager: self)
-            channels[id] = ChannelHandle(channel: channel)
+            let channel = Channel.init(
+                transport: transport,
+                id: id,
+                logger: logger,
+                manager: self,
+                maxBufferedDeliveries: maxBufferedDeliveries
+            )
+            if Int(id) >= channels.count {
+                channels.append(contentsOf: repeatElement(nil, count: Int(id) - channels.count + 1))
+            }
+            channels[Int(id)] = ChannelHandle(channel: channel)
+            channelsCount += 1
             return channel
         }
         return channel
@@ -71,7 +85,9 @@ final class ChannelManager: @unchecked Sendable {
 
     func removeChannel(id: UInt16) {
         channelsLock.withLock {
-            if channels.removeValue(forKey: id) != nil {
+            if Int(id) < channels.count && channels[Int(id)] != nil {
+                channels[Int(id)] = nil
+                channelsCount -= 1
                 channelIDs.remove(id: id)
             }
         }
@@ -82,13 +98,18 @@ final class ChannelManager: @unchecked Sendable {
             return channel0
         }
         return channelsLock.withLock {
-            return channels[id]?.channel
+            return Int(id) < channels.count ? channels[Int(id)]?.channel : nil
         }
     }
 
+    // the number of channels in use, channel0 excluded
+    var count: Int {
+        channelsLock.withLock { channelsCount }
+    }
+
     func forEach(_ body: (Channel) -> Void) {
         channelsLock.withLock {
-            for handle in channels.values {
+            for case let handle? in channels {
                 body(handle.channel)
             }
         }
@@ -97,8 +118,9 @@ final class ChannelManager: @unchecked Sendable {
     // MARK: - init
 
     // initializes the channel0 with given transport and the logger
-    init(transport: TransportProtocol, logger: Logger, maxChannels: UInt16 = .max) {
+    init(transport: TransportProtocol, logger: Logger, maxChannels: UInt16 = .max, maxBufferedDeliveries: Int = .max) {
         self.channel0 = .init(transport: transport, id: 0, logger: logger)
         self.channelIDs = .init(maxID: maxChannels)
+        self.maxBufferedDeliveries = maxBufferedDeliveries
     }
 }
@@ -47,3 +47,24 @@ extension Connection {
         }
     }
 }
+
+#if CodecMetrics
+    extension Connection {
+        /// Per method counts, byte totals and time spent encoding and decoding. The counters are process wide,
+        /// they cover all connections since the start or the last `resetCodecMetrics()`.
+        public static func codecMetrics() -> CodecMetricsSnapshot {
+            CodecMetrics.shared.snapshot()
+        }
+
+        public static func resetCodecMetrics() {
+            CodecMetrics.shared.reset()
+        }
+
+        /// Measures the time spent in the codec of every method, off by default as it reads the clock twice per
+        /// encoded or decoded method.
+        public static var isCodecTimingEnabled: Bool {
+            get { CodecMetrics.shared.isTimingEnabled.load(ordering: .relaxed) }
+            set { CodecMetrics.shared.isTimingEnabled.store(newValue, ordering: .relaxed) }
+        }
+    }
+#endif  // CodecMetrics
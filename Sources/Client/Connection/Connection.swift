@@ -39,6 +39,28 @@ public final class Connection: Sendable {
     // MARK: - lifecycle management
     public var isOpen: Bool { transport.isActive }
 
+    /// How often the repeating shortstr fields of inbound methods (exchange, routing key, consumer tag) were served
+    /// from the interning cache of this connection.
+    public var interningStatistics: InterningStatistics {
+        transport.interner?.statistics ?? .init(hits: 0, misses: 0)
+    }
+
+    /// How many frames wait to be written to the socket of this connection and how large its flushes are, nil if
+    /// the transport doesn't queue the frames.
+    public var outboundStatistics: OutboundQueueStatistics? {
+        transport.outboundQueue?.statistics
+    }
+
+    // the number of channels made off this connection which are still in use
+    internal var channelCount: Int { channels.count }
+
+    // see Channel.inFlight, summed over all channels
+    internal var inFlight: Int {
+        var inFlight = 0
+        channels.forEach { inFlight += $0.inFlight }
+        return inFlight
+    }
+
     public func close() async throws {
         try await self.channels.channel0.connectionClose()
         // from now on no more frames will be sent out
@@ -68,7 +90,7 @@ public final class Connection: Sendable {
         let properties = defaultProperties.merging(properties) { _, new in new }
 
         // create inbound AsyncStream
-        var inboundContinuation: AsyncStream<any Frame>.Continuation?
+        var inboundContinuation: AsyncStream<InboundFrame>.Continuation?
         let inboundFrames = AsyncStream { continuation in
             inboundContinuation = continuation
         }
@@ -81,6 +103,9 @@ public final class Connection: Sendable {
         self.transport = try await env.transportFactory(
             configuration.host,
             configuration.port,
+            configuration.rawBytesRecordingPath,
+            configuration.outboundQueue,
+            configuration.eventLoopGroup,
             self.logger,
             inboundContinuation,
             {
@@ -96,7 +121,8 @@ public final class Connection: Sendable {
         self.channels = .init(
             transport: sharedTransport,
             logger: self.logger,
-            maxChannels: negotiatedConfig.maxChannelCount
+            maxChannels: negotiatedConfig.maxChannelCount,
+            maxBufferedDeliveries: configuration.maxBufferedDeliveries
         )
 
         // create a task to distribute incoming frames
@@ -104,7 +130,8 @@ public final class Connection: Sendable {
             inboundFrames: inboundFrames,
             channels: self.channels,
             transportTask: self.transportExecutor,
-            maxFrameSize: negotiatedConfig.maxFrameSize
+            maxFrameSize: negotiatedConfig.maxFrameSize,
+            maxBufferedDeliveries: configuration.maxBufferedDeliveries
         )
         self.inboundFramesDispatcher = Task {
             await framesRouter.execute()
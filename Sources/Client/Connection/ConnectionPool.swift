@@ -0,0 +1,195 @@
+import Atomics
+import NIOConcurrencyHelpers
+import NIOCore
+
+/// Keeps several connections to the same broker and hands out channels of them, so the publishing and consuming
+/// spreads over as many threads as there are connections. Every connection runs on an event loop thread of its own,
+/// unless an `eventLoopGroup` is given, then the connections take the loops of the group in turn.
+///
+/// A connection which dropped is replaced by a new one the next time a channel is requested from it, the channels
+/// made off the dropped connection have to be made again.
+public final class ConnectionPool: Sendable {
+    /// How a connection is picked for a new channel.
+    public enum Balancing: Sendable, Equatable {
+        /// one connection after the other
+        case roundRobin
+        /// the connection with the fewest requests waiting for a reply and published messages waiting for a confirm,
+        /// the fewest channels in use breaks ties
+        case leastInFlight
+        /// the same routing key always gets a channel of the same connection, which keeps the messages published
+        /// with it in order; channels requested without a routing key are spread round-robin
+        case stickyByRoutingKey
+    }
+
+    public let size: Int
+    public let balancing: Balancing
+    private let configuration: Configuration
+    private let properties: Spec.Table
+    private let env: Environment
+    // the last attempt to connect for every member, replaced when the connection drops
+    private let members: NIOLockedValueBox<[Task<Connection, Error>]>
+    private let nextMember = ManagedAtomic<UInt>(0)
+
+    /// Opens `size` connections with the given configuration.
+    /// - Parameter eventLoopGroup: the group the connections run on, replaces the one of the `configuration`.
+    ///
+    /// - Throws: if any of the connections can't be made, the ones which were made are closed then.
+    public convenience init(
+        size: Int,
+        balancing: Balancing = .roundRobin,
+        with configuration: Configuration = .default,
+        andProperties properties: Spec.Table = .init(),
+        eventLoopGroup: (any EventLoopGroup)? = nil
+    ) async throws {
+        var configuration = configuration
+        if let eventLoopGroup {
+            configuration.eventLoopGroup = eventLoopGroup
+        }
+        try await self.init(
+            size: size,
+            balancing: balancing,
+            with: configuration,
+            env: Environment.shared,
+            properties: properties
+        )
+    }
+
+    init(
+        size: Int,
+        balancing: Balancing,
+        with configuration: Configuration,
+        env: Environment,
+        properties: Spec.Table = .init()
+    ) async throws {
+        precondition(size > 0, "size should be larger than 0")
+        self.size = size
+        self.balancing = balancing
+        self.configuration = configuration
+        self.properties = properties
+        self.env = env
+        self.members = .init([])
+        let members = (0..<size).map { _ in connect() }
+        self.members.withLockedValue { $0 = members }
+        var firstError: (any Error)?
+        var connections: [Connection] = []
+        for member in members {
+            do {
+                connections.append(try await member.value)
+            } catch {
+                firstError = firstError ?? error
+            }
+        }
+        if let firstError {
+            // nobody gets the pool, the connections which were made would leak otherwise
+            for connection in connections where connection.isOpen {
+                try? await connection.close()
+            }
+            throw firstError
+        }
+    }
+
+    /// Makes a channel on one of the connections, picked as configured by `balancing`.
+    /// - Parameter routingKey: the routing key the channel will publish with, only used by `.stickyByRoutingKey`.
+    ///
+    /// - Throws: if the picked connection dropped and couldn't be made again, or it has no more channels available.
+    public func makeChannel(routingKey: String? = nil) async throws -> Channel {
+        let connection = try await openConnection(at: pickMember(routingKey: routingKey))
+        return try await connection.makeChannel()
+    }
+
+    /// Makes a channel, see ``makeChannel(routingKey:)``, passes it to the `handler` and closes it afterwards.
+    public func withChannel<T>(
+        routingKey: String? = nil,
+        _ handler: @Sendable (Result<Channel, Error>) async throws -> T
+    ) async rethrows -> T {
+        do {
+            let channel = try await self.makeChannel(routingKey: routingKey)
+            let result = try await handler(.success(channel))
+            // ignore exceptions here to make sure that handler is not called twice (same as Connection.withChannel)
+            try? await channel.close()
+            return result
+        } catch {
+            return try await handler(.failure(error))
+        }
+    }
+
+    /// Closes all connections of the pool, the connections which dropped already are skipped.
+    public func close() async throws {
+        let members = self.members.withLockedValue { $0 }
+        for member in members {
+            guard let connection = try? await member.value, connection.isOpen else {
+                continue
+            }
+            try await connection.close()
+        }
+    }
+
+    // the connection of every member, nil while it is being made, or if it dropped or couldn't be made
+    internal func openConnections() async -> [Connection?] {
+        let members = self.members.withLockedValue { $0 }
+        var connections: [Connection?] = []
+        for member in members {
+            let connection = try? await member.value
+            connections.append(connection?.isOpen == true ? connection : nil)
+        }
+        return connections
+    }
+
+    // the member with the least in flight, then with the fewest channels; a dropped member (nil) is picked only if
+    // all of them dropped, then it is made again
+    internal static func leastLoaded(of loads: [(inFlight: Int, channels: Int)?]) -> Int {
+        var picked = 0
+        var least: (inFlight: Int, channels: Int)?
+        for (index, load) in loads.enumerated() {
+            guard let load else {
+                continue
+            }
+            if least.map({ (load.inFlight, load.channels) < ($0.inFlight, $0.channels) }) ?? true {
+                (picked, least) = (index, load)
+            }
+        }
+        return picked
+    }
+
+    private func connect() -> Task<Connection, Error> {
+        let (configuration, env, properties) = (self.configuration, self.env, self.properties)
+        return Task {
+            try await Connection(with: configuration, env: env, properties: properties)
+        }
+    }
+
+    private func pickMember(routingKey: String?) async -> Int {
+        switch balancing {
+        case .stickyByRoutingKey where routingKey != nil:
+            // FNV-1a, unlike hashValue it is the same in every process
+            var hash: UInt64 = 0xcbf2_9ce4_8422_2325
+            for byte in routingKey!.utf8 {
+                hash = (hash ^ UInt64(byte)) &* 0x100_0000_01b3
+            }
+            return Int(hash % UInt64(size))
+        case .leastInFlight:
+            let loads = await openConnections().map { connection in
+                connection.map { (inFlight: $0.inFlight, channels: $0.channelCount) }
+            }
+            return Self.leastLoaded(of: loads)
+        case .roundRobin, .stickyByRoutingKey:
+            return Int(nextMember.loadThenWrappingIncrement(ordering: .relaxed) % UInt(size))
+        }
+    }
+
+    // returns the connection of the member, connecting again if it dropped or the last attempt failed
+    private func openConnection(at index: Int) async throws -> Connection {
+        let member = members.withLockedValue { $0[index] }
+        if let connection = try? await member.value, connection.isOpen {
+            return connection
+        }
+        // the first one to notice replaces the member, the others wait for the same attempt
+        let replacement = members.withLockedValue {
+            if $0[index] == member {
+                $0[index] = connect()
+            }
+            return $0[index]
+        }
+        return try await replacement.value
+    }
+}
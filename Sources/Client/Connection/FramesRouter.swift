@@ -5,23 +5,30 @@ private struct ContentContext {
     private(set) var expectedBodyBytes: UInt64 = 0
     private(set) var actualBodyBytes: UInt64 = 0
     private(set) var contentFrames = [any Frame]()
+    private(set) var hasHeader = false
+    // the body frames of a streamed delivery are dispatched as they arrive instead of being collected
+    private(set) var isStreamed = false
 
     // channel 0 can't wait for content frames
     func waitForContent() -> Bool { channelId != 0 }
     func isComplete() -> Bool { actualBodyBytes == expectedBodyBytes }
 
-    mutating func push(deliver: any Frame) {
+    mutating func push(deliver: any Frame, isStreamed: Bool) {
         channelId = deliver.channelId
+        self.isStreamed = isStreamed
         contentFrames.append(deliver)
     }
 
     mutating func push(header: ContentHeaderFrame) {
         expectedBodyBytes = header.bodySize
+        hasHeader = true
         contentFrames.append(header)
     }
 
     mutating func push(body: ContentBodyFrame) {
-        contentFrames.append(body)
+        if !isStreamed {
+            contentFrames.append(body)
+        }
         actualBodyBytes += UInt64(body.fragment.count)
     }
 
@@ -29,96 +36,203 @@ private struct ContentContext {
         channelId = 0
         expectedBodyBytes = 0
         actualBodyBytes = 0
+        hasHeader = false
+        isStreamed = false
         contentFrames.removeAll()
     }
 }
 
+// Frames of one channel on their way to it. Each channel gets a dispatcher task fed through its own bounded queue,
+// so a channel busy with its deliveries doesn't hold up the others. The router never waits for a channel, the
+// dispatcher only waits for a consumer which reads a streamed body too slowly; a channel whose queue or consumer falls
+// too far behind gets closed instead (see Channel.handleOverrun(_:)).
+private struct ChannelRoute {
+    enum Item: Sendable {
+        case method(MethodFrame)
+        case content([any Frame])
+        // a delivery with a streamed body starts with its deliver and header frames, the body frames follow one by one
+        case streamedContent(MethodFrame, ContentHeaderFrame)
+        case streamedBody(ContentBodyFrame, isLast: Bool)
+    }
+
+    // the route doesn't keep the channel alive, a closed channel is dropped by the manager
+    weak var channel: Channel?
+    var content = ContentContext()
+    let input: AsyncStream<Item>.Continuation
+    let dispatcher: Task<Void, Never>
+
+    init(channel: Channel, capacity: Int) {
+        let (items, input) = AsyncStream<Item>.makeStream(bufferingPolicy: .bufferingOldest(capacity))
+        self.channel = channel
+        self.input = input
+        self.dispatcher = Task { [weak channel] in
+            for await item in items {
+                // the frames of a channel which is gone are dropped
+                guard let channel else { continue }
+                switch item {
+                case .method(let frame):
+                    // only frames of channel 0 fail or stop the connection, those aren't routed here
+                    _ = channel.dispatch(frame: frame)
+                case .content(let frames):
+                    channel.dispatch(content: frames)
+                case .streamedContent(let deliver, let header):
+                    channel.dispatch(deliver: deliver, header: header)
+                case .streamedBody(let body, let isLast):
+                    // waits while the consumer is too far behind, the items of the channel wait meanwhile
+                    await channel.dispatch(body: body, isLast: isLast)
+                }
+            }
+        }
+    }
+
+    // collects the frames of a delivery, returns what is ready to be dispatched
+    mutating func assemble(_ frame: InboundFrame) -> Item? {
+        switch frame {
+        case .header(let header):
+            guard content.waitForContent() else {
+                preconditionFailure("Received content frame without prior deliver method")
+            }
+            content.push(header: header)
+            if content.isStreamed {
+                defer {
+                    if content.isComplete() {
+                        content.reset()
+                    }
+                }
+                return .streamedContent(content.contentFrames[0] as! MethodFrame, header)
+            }
+        case .body(let body):
+            guard content.waitForContent() else {
+                preconditionFailure("Received content frame without prior deliver method")
+            }
+            content.push(body: body)
+            if content.isStreamed {
+                let isLast = content.isComplete()
+                if isLast {
+                    content.reset()
+                }
+                return .streamedBody(body, isLast: isLast)
+            }
+        case .method(let method):
+            // the deliver arguments stay as wire bytes, only the channel id is needed for routing
+            if method.payload is Spec.Basic.DeliverView || method.payload is Spec.Basic.Deliver {
+                content.push(deliver: method, isStreamed: channel?.streamsBodies ?? false)
+                return nil
+            }
+            return .method(method)
+        case .heartbeat:
+            return nil
+        }
+        // a header announcing an empty body completes the content as well
+        guard content.hasHeader && content.isComplete() else {
+            return nil
+        }
+        defer { content.reset() }
+        return .content(content.contentFrames)
+    }
+
+    func finish() {
+        input.finish()
+    }
+}
+
 final class FramesRouter: Sendable {
-    private let inboundFrames: AsyncStream<any Frame>
+    private let inboundFrames: AsyncStream<InboundFrame>
     private let channels: ChannelManager
     private let transportTask: Task<Void, Never>
     private let maxFrameSize: Int32
+    // how many items may wait in the queue of a channel
+    private let maxBufferedDeliveries: Int
 
     func execute() async {
-        var contentContext = ContentContext()
-        for await frame in inboundFrames {
-            if frame.isPayload(of: Spec.Basic.Deliver.self) {
-                contentContext.push(deliver: frame)
-                continue
+        // indexed by the channel id, filled on the first frame for a channel, so the manager's lock is taken once
+        // per channel instead of once per frame
+        var routes: [ChannelRoute?] = []
+        defer {
+            for route in routes {
+                route?.finish()
             }
-            if frame.isContent() {
-                guard contentContext.waitForContent() else {
-                    preconditionFailure(
-                        "Received content frame without prior deliver method"
-                    )
-                }
-                if let header = frame as? ContentHeaderFrame {
-                    contentContext.push(header: header)
+        }
+        for await frame in inboundFrames {
+            let id = Int(frame.channelId)
+            if id == 0 {
+                // heartbeats are consumed by the heartbeat handler, unless they weren't negotiated
+                guard case .method(let method) = frame else {
                     continue
                 }
-                if let body = frame as? ContentBodyFrame {
-                    // only ContentBodyFrame is checked for maxFrameSize
-                    // because there is no way to split other frames into smaller pieces
-                    // see also: https://www.rabbitmq.com/amqp-0-9-1-errata#section_11
-                    // check for exceeding expected body size
-                    // as per "2.3.3 Protocol Negotiation"
-                    // in case maxFrameSize is exceeded the connection must be
-                    // closed
-                    if maxFrameSize != 0 && body.bytesCount > UInt32(maxFrameSize) {
-                        channels.forEach {
-                            $0.handleConnectionError(
-                                ConnectionError.frameSizeLimitExceeded(
-                                    maxFrameSize: UInt32(maxFrameSize),
-                                    actualSize: body.bytesCount
-                                )
-                            )
-                        }
-                        transportTask.cancel()  // drops the connection
-                        break  // stop processing any further frames
+                // the connection level frames are handled right away, they may stop the connection
+                switch channels.findChannel(id: 0)!.dispatch(frame: method) {
+                case .failure:
+                    channels.forEach {
+                        $0.handleConnectionError(ConnectionError.connectionIsClosed)
                     }
-                    contentContext.push(body: body)
-                }
-                if contentContext.isComplete() {
-                    guard let channel = channels.findChannel(id: frame.channelId) else {
-                        preconditionFailure(
-                            "Received frame for non-existing channel \(frame.channelId)"
-                        )
+                case .success(let keepGoing):
+                    if keepGoing {
+                        continue
                     }
-                    channel.dispatch(content: contentContext.contentFrames)
-                    contentContext.reset()
                 }
-                continue
+                transportTask.cancel()  // drops the connection
+                break  // stop processing any further frames
             }
-            guard let channel = channels.findChannel(id: frame.channelId) else {
-                preconditionFailure(
-                    "Received frame for non-existing channel \(frame.channelId)"
-                )
-            }
-            let res = channel.dispatch(frame: frame)
-            switch res {
-            case .failure:
+            // only ContentBodyFrame is checked for maxFrameSize
+            // because there is no way to split other frames into smaller pieces
+            // see also: https://www.rabbitmq.com/amqp-0-9-1-errata#section_11
+            // check for exceeding expected body size
+            // as per "2.3.3 Protocol Negotiation"
+            // in case maxFrameSize is exceeded the connection must be
+            // closed
+            if case .body(let body) = frame, maxFrameSize != 0 && body.bytesCount > UInt32(maxFrameSize) {
                 channels.forEach {
-                    $0.handleConnectionError(ConnectionError.connectionIsClosed)
+                    $0.handleConnectionError(
+                        ConnectionError.frameSizeLimitExceeded(
+                            maxFrameSize: UInt32(maxFrameSize),
+                            actualSize: body.bytesCount
+                        )
+                    )
                 }
-            case .success(let keepGoing):
-                if keepGoing {
-                    continue
+                transportTask.cancel()  // drops the connection
+                break  // stop processing any further frames
+            }
+            if id >= routes.count {
+                routes.append(contentsOf: repeatElement(nil, count: id - routes.count + 1))
+            }
+            // Channel.OpenOk is the first frame of a (re)opened channel, the id may belong to a closed channel before
+            if routes[id]?.channel == nil || frame.isChannelOpenOk {
+                routes[id]?.finish()
+                guard let channel = channels.findChannel(id: frame.channelId) else {
+                    preconditionFailure(
+                        "Received frame for non-existing channel \(frame.channelId)"
+                    )
                 }
+                routes[id] = ChannelRoute(channel: channel, capacity: maxBufferedDeliveries)
+            }
+            if let item = routes[id]!.assemble(frame), case .dropped = routes[id]!.input.yield(item) {
+                // the frames of a channel which is being closed don't matter anymore, they may be dropped as well
+                routes[id]!.channel?.handleOverrun("more than \(maxBufferedDeliveries) frames")
             }
-            transportTask.cancel()  // drops the connection
-            break  // stop processing any further frames
         }
     }
 
     init(
-        inboundFrames: AsyncStream<any Frame>,
+        inboundFrames: AsyncStream<InboundFrame>,
         channels: ChannelManager,
         transportTask: Task<Void, Never>,
-        maxFrameSize: Int32 = 0  // no limit
+        maxFrameSize: Int32 = 0,  // no limit
+        maxBufferedDeliveries: Int = .max
     ) {
         self.inboundFrames = inboundFrames
         self.channels = channels
         self.transportTask = transportTask
         self.maxFrameSize = maxFrameSize
+        self.maxBufferedDeliveries = maxBufferedDeliveries
+    }
+}
+
+extension InboundFrame {
+    fileprivate var isChannelOpenOk: Bool {
+        guard case .method(let method) = self else {
+            return false
+        }
+        return method.payload is Spec.Channel.OpenOk
     }
 }
@@ -1,14 +1,26 @@
+import NIOCore
+
 public struct Message: Sendable {
-    public var body: [UInt8]
+    /// the body as received, a body which arrived in a single frame shares the storage of the inbound bytes,
+    /// copy it out if it's kept around for long so the rest of the inbound bytes can be released
+    public var bodyBuffer: ByteBuffer
+    /// the body bytes, every access copies them out of `bodyBuffer`
+    public var body: [UInt8] {
+        get { Array(bodyBuffer.readableBytesView) }
+        set { bodyBuffer = ByteBuffer(bytes: newValue) }
+    }
     /// consumer tag of the message
-    public let consumerTag: String
+    public var consumerTag: String { deliver.consumerTag }
     /// delivery tag of the message
     public let deliveryTag: Int64
-    public let redelivered: Bool = false
-    public let exchange: String
-    public let routingKey: String
+    public var redelivered: Bool { deliver.redelivered }
+    public var exchange: String { deliver.exchange }
+    public var routingKey: String { deliver.routingKey }
     public var properties: Spec.BasicProperties
 
+    /// the Basic.Deliver arguments as received, the strings are decoded on every access
+    internal let deliver: Spec.Basic.DeliverView
+
     /// the channel this message was received on
     internal let channel: Channel
 
@@ -29,16 +41,14 @@ public struct Message: Sendable {
     }
 
     internal init(
-        body: [UInt8],
-        deliverFrame: Spec.Basic.Deliver,
+        body: ByteBuffer,
+        deliver: Spec.Basic.DeliverView,
         properties: Spec.BasicProperties,
         onChannel channel: Channel
     ) {
-        self.body = body
-        self.consumerTag = deliverFrame.consumerTag
-        self.deliveryTag = deliverFrame.deliveryTag
-        self.exchange = deliverFrame.exchange
-        self.routingKey = deliverFrame.routingKey
+        self.bodyBuffer = body
+        self.deliveryTag = deliver.deliveryTag
+        self.deliver = deliver
         self.properties = properties
         self.channel = channel
     }
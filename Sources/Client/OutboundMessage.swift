@@ -0,0 +1,56 @@
+import NIOCore
+
+/// A message to publish with `Channel.basicPublishBatch`.
+public struct OutboundMessage: Sendable {
+    public var exchange: String
+    public var routingKey: String
+    public var body: ByteBuffer
+    public var properties: Spec.BasicProperties
+    public var mandatory: Bool
+
+    public init(
+        exchange: String,
+        routingKey: String,
+        body: ByteBuffer,
+        properties: Spec.BasicProperties = .init(),
+        mandatory: Bool = false
+    ) {
+        self.exchange = exchange
+        self.routingKey = routingKey
+        self.body = body
+        self.properties = properties
+        self.mandatory = mandatory
+    }
+
+    public init(
+        exchange: String,
+        routingKey: String,
+        body: some Collection<UInt8>,
+        properties: Spec.BasicProperties = .init(),
+        mandatory: Bool = false
+    ) {
+        self.init(
+            exchange: exchange,
+            routingKey: routingKey,
+            body: ByteBuffer(bytes: body),
+            properties: properties,
+            mandatory: mandatory
+        )
+    }
+
+    public init(
+        exchange: String,
+        routingKey: String,
+        body: String,
+        properties: Spec.BasicProperties = .init(),
+        mandatory: Bool = false
+    ) {
+        self.init(
+            exchange: exchange,
+            routingKey: routingKey,
+            body: ByteBuffer(string: body),
+            properties: properties,
+            mandatory: mandatory
+        )
+    }
+}
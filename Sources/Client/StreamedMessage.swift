@@ -0,0 +1,86 @@
+import NIOCore
+
+/// A message delivered to a consumer started with
+/// ``Channel/basicConsumeStreamingBodies(queue:autoAck:tag:noLocal:exclusive:arguments:maxBufferedBytes:)``. It is
+/// delivered as soon as its header arrived, the body follows fragment by fragment as the broker sends it.
+public struct StreamedMessage: Sendable {
+    /// The fragments of a body in the order they arrived, each one is the payload of a body frame. The fragments
+    /// wait to be read in the buffer of the channel, while a consumer is behind by more than its `maxBufferedBytes`
+    /// the frames of the channel are held back, and if it falls further behind its channel is closed and reading the
+    /// body fails.
+    public struct Body: AsyncSequence, Sendable {
+        public typealias Element = ByteBuffer
+
+        public struct AsyncIterator: AsyncIteratorProtocol {
+            fileprivate var base: AsyncThrowingStream<ByteBuffer, Error>.AsyncIterator
+            fileprivate let channel: Channel
+
+            public mutating func next() async throws -> ByteBuffer? {
+                let fragment = try await base.next()
+                if let fragment {
+                    // frees the room the fragment took in the buffer of the channel
+                    channel.didRead(streamedFragment: fragment)
+                }
+                return fragment
+            }
+        }
+
+        fileprivate let fragments: AsyncThrowingStream<ByteBuffer, Error>
+        fileprivate let channel: Channel
+
+        public func makeAsyncIterator() -> AsyncIterator {
+            AsyncIterator(base: fragments.makeAsyncIterator(), channel: channel)
+        }
+    }
+
+    /// the body fragments, it has to be read to the end, the fragments left unread keep taking room in the buffer of
+    /// the channel
+    public let body: Body
+    /// the size of the body in bytes as announced by the header
+    public let bodySize: UInt64
+    /// consumer tag of the message
+    public var consumerTag: String { deliver.consumerTag }
+    /// delivery tag of the message
+    public let deliveryTag: Int64
+    public var redelivered: Bool { deliver.redelivered }
+    public var exchange: String { deliver.exchange }
+    public var routingKey: String { deliver.routingKey }
+    public let properties: Spec.BasicProperties
+
+    /// the Basic.Deliver arguments as received, the strings are decoded on every access
+    internal let deliver: Spec.Basic.DeliverView
+
+    /// the channel this message was received on
+    internal let channel: Channel
+
+    /// Sends ack to the broker.
+    /// - Parameter multiple: If true, acknowledges all messages up to and including this one.
+    ///  - Throws: if connection or this channel has been already closed.
+    public func ack(multiple: Bool = false) async throws {
+        try await channel.basicAck(deliveryTag: deliveryTag, multiple: multiple)
+    }
+
+    /// Sends nack to the broker.
+    /// - Parameters:
+    ///   - requeue: If true, the message will be requeued.
+    ///   - multiple: If true, rejects all messages up to and including this one.
+    ///  - Throws: if connection or this channel has been already closed.
+    public func nack(requeue: Bool = true, multiple: Bool = false) async throws {
+        try await channel.basicNack(deliveryTag: deliveryTag, multiple: multiple, requeue: requeue)
+    }
+
+    internal init(
+        body: AsyncThrowingStream<ByteBuffer, Error>,
+        bodySize: UInt64,
+        deliver: Spec.Basic.DeliverView,
+        properties: Spec.BasicProperties,
+        onChannel channel: Channel
+    ) {
+        self.body = Body(fragments: body, channel: channel)
+        self.bodySize = bodySize
+        self.deliveryTag = deliver.deliveryTag
+        self.deliver = deliver
+        self.properties = properties
+        self.channel = channel
+    }
+}
@@ -0,0 +1,98 @@
+#if CodecMetrics
+    import Atomics
+    import NIOCore  // for NIODeadline
+
+    /// Frames, bytes and time spent per method in the codec, see `Connection.codecMetrics()`.
+    public struct CodecMetricsSnapshot: Sendable {
+        public struct Counters: Sendable, Equatable {
+            /// number of encoded or decoded methods
+            public let count: UInt64
+            /// sum of the argument bytes, without the frame and class/method ids
+            public let bytes: UInt64
+            /// time spent, 0 unless `Connection.isCodecTimingEnabled` was on
+            public let nanoseconds: UInt64
+        }
+
+        public struct Method: Sendable {
+            public let classId: UInt16
+            public let methodId: UInt16
+            /// e.g. "basic.publish"
+            public let name: String
+            public let encoded: Counters
+            public let decoded: Counters
+        }
+
+        /// the methods which were encoded or decoded at least once, in the order of the spec
+        public let methods: [Method]
+        /// inbound methods which were rejected because their class and method ids are unknown
+        public let unknownMethods: UInt64
+    }
+
+    // Process wide counters the generated codecs record into (only compiled with the CodecMetrics trait). Every
+    // method owns a slot (see `Spec.metricsSlots`), a slot is a count, bytes and nanoseconds for encoding followed by
+    // the same for decoding.
+    final class CodecMetrics: Sendable {
+        enum Operation: Int {
+            case encode = 0
+            case decode = 1
+        }
+
+        static let shared = CodecMetrics(slots: Spec.metricsSlots.count)
+
+        private static let countersPerSlot = 6
+        private let counters: [ManagedAtomic<UInt64>]
+        private let unknownMethods = ManagedAtomic<UInt64>(0)
+        // reading the clock twice per method isn't free, so timing is opt-in
+        let isTimingEnabled = ManagedAtomic<Bool>(false)
+
+        init(slots: Int) {
+            counters = (0..<slots * Self.countersPerSlot).map { _ in ManagedAtomic(0) }
+        }
+
+        /// the start of a timed operation, 0 if timing is disabled
+        static func now() -> UInt64 {
+            shared.isTimingEnabled.load(ordering: .relaxed) ? NIODeadline.now().uptimeNanoseconds : 0
+        }
+
+        func record(_ operation: Operation, slot: Int, bytes: UInt32, since start: UInt64) {
+            let base = slot * Self.countersPerSlot + operation.rawValue * 3
+            counters[base].wrappingIncrement(ordering: .relaxed)
+            counters[base + 1].wrappingIncrement(by: UInt64(bytes), ordering: .relaxed)
+            if start != 0 {
+                let elapsed = NIODeadline.now().uptimeNanoseconds - start
+                counters[base + 2].wrappingIncrement(by: elapsed, ordering: .relaxed)
+            }
+        }
+
+        func recordUnknownMethod() {
+            unknownMethods.wrappingIncrement(ordering: .relaxed)
+        }
+
+        func snapshot() -> CodecMetricsSnapshot {
+            func counters(at base: Int) -> CodecMetricsSnapshot.Counters {
+                .init(
+                    count: self.counters[base].load(ordering: .relaxed),
+                    bytes: self.counters[base + 1].load(ordering: .relaxed),
+                    nanoseconds: self.counters[base + 2].load(ordering: .relaxed)
+                )
+            }
+            let methods = Spec.metricsSlots.enumerated()
+                .map { slot, method in
+                    CodecMetricsSnapshot.Method(
+                        classId: method.classId,
+                        methodId: method.methodId,
+                        name: method.name,
+                        encoded: counters(at: slot * Self.countersPerSlot),
+                        decoded: counters(at: slot * Self.countersPerSlot + 3)
+                    )
+                }
+                .filter { $0.encoded.count != 0 || $0.decoded.count != 0 }
+            return .init(methods: methods, unknownMethods: unknownMethods.load(ordering: .relaxed))
+        }
+
+        func reset() {
+            counters.forEach { $0.store(0, ordering: .relaxed) }
+            unknownMethods.store(0, ordering: .relaxed)
+        }
+    }
+#endif  // CodecMetrics
@@ -4,6 +4,8 @@ protocol Frame: Sendable, FrameCodable {
     var type: UInt8 { get }
     var channelId: UInt16 { get }
     func asData() throws -> ByteBuffer
+    /// appends the serialized frame to `buffer`, used to put several frames into one buffer
+    func writeFrame(into buffer: inout ByteBuffer) throws
 }
 
 extension Frame {
@@ -12,6 +14,11 @@ extension Frame {
         let encoder = FrameEncoder()
         return try encoder.encode(self)
     }
+
+    func writeFrame(into buffer: inout ByteBuffer) throws {
+        var data = try asData()
+        buffer.writeBuffer(&data)
+    }
 }
 
 // this extension allows comparing any Frame to any Frame, otherwise == fails
@@ -33,31 +40,6 @@ extension Frame {
         }
         return (self as! MethodFrame).payload as? T
     }
-
-    func isContent() -> Bool {
-        self is ContentHeaderFrame || self is ContentBodyFrame
-    }
-}
-
-func decodeFrame(type: UInt8, from data: ByteBuffer) throws -> any Frame {
-    precondition(data.count != 0)
-    // for errors see 4.2.3 General Frame Format
-    if data.readableBytesView.last != Spec.frameEnd {
-        throw FramingError.fatal("Frame doesn't end with the frame-end octet")
-    }
-    let decoder: FrameDecoder = .init()
-    switch type {
-    case Spec.frameHeader:
-        return try decoder.decode(ContentHeaderFrame.self, from: data)
-    case Spec.frameBody:
-        return try decoder.decode(ContentBodyFrame.self, from: data)
-    case Spec.frameMethod:
-        return try decoder.decode(MethodFrame.self, from: data)
-    case Spec.frameHeartbeat:
-        return try decoder.decode(HeartbeatFrame.self, from: data)
-    default:
-        throw FramingError.fatal("Unknown frame type \(type) to decode")
-    }
 }
 
 // 4.2.2 Protocol Header
@@ -130,17 +112,40 @@ extension MethodFrame: Equatable {
 extension MethodFrame: Frame {
     init(from decoder: any FrameDecoderProtocol) throws {
         let wireType = try decoder.decode(UInt8.self)
-        precondition(wireType == Spec.frameMethod)
+        guard wireType == Spec.frameMethod else {
+            throw Spec.HardError.frameError
+        }
         channelId = try decoder.decode(UInt16.self)
         let expectedSize = try decoder.decode(UInt32.self)
         let classId = try decoder.decode(UInt16.self)
         let methodId = try decoder.decode(UInt16.self)
-        let factory = try Spec.makeFactory(with: classId, and: methodId)
-        payload = try factory(decoder)
+        if decoder.decodesLazyViews, let viewFactory = Spec.makeViewFactory(with: classId, and: methodId) {
+            guard expectedSize >= 4 else {
+                throw FramingError.fatal("Method frame size \(expectedSize) is too small")
+            }
+            #if CodecMetrics
+                let metricsStart = CodecMetrics.now()
+            #endif
+            // the arguments stay as a slice of the frame and are read on access, but the interned ones
+            payload = try viewFactory(try decoder.decodeBytes(count: Int(expectedSize) - 4), decoder.interner)
+            #if CodecMetrics
+                // views don't go through the generated init(from:)
+                if let slot = Spec.metricsSlot(with: classId, and: methodId) {
+                    CodecMetrics.shared.record(.decode, slot: slot, bytes: payload.bytesCount, since: metricsStart)
+                }
+            #endif
+        } else {
+            let factory = try Spec.makeFactory(with: classId, and: methodId)
+            payload = try factory(decoder)
+        }
 
-        precondition(payload.bytesCount + 4 == expectedSize)
+        guard payload.bytesCount + 4 == expectedSize else {
+            throw Spec.HardError.frameError
+        }
         let end = try decoder.decode(UInt8.self)
-        precondition(end == Spec.frameEnd)
+        guard end == Spec.frameEnd else {
+            throw FramingError.fatal("Frame doesn't end with the frame-end octet")
+        }
     }
 
     func encode(to encoder: any FrameEncoderProtocol) throws {
@@ -160,6 +165,42 @@ extension MethodFrame: Frame {
     var bytesCount: UInt32 { 1 + 2 + 4 + 2 + 2 + payload.bytesCount + 1 }
 }
 
+extension MethodFrame {
+    /// serializes this frame straight into a buffer of the exact size if the payload supports it,
+    /// otherwise falls back to the `FrameEncoder`
+    func asData() throws -> ByteBuffer {
+        guard payload is any FrameBufferWritable else {
+            return try FrameEncoder().encode(self)
+        }
+        var data = ByteBufferAllocator().buffer(capacity: Int(bytesCount))
+        try writeFrame(into: &data)
+        return data
+    }
+
+    func writeFrame(into data: inout ByteBuffer) throws {
+        guard let writable = payload as? any FrameBufferWritable,
+            let method = payload as? any AMQPMethodProtocol
+        else {
+            var encoded = try FrameEncoder().encode(self)
+            data.writeBuffer(&encoded)
+            return
+        }
+        // whether a method has a template is decided by its type, the call costs nothing more for the others
+        if writable.writeFrameFromTemplate(channelId: channelId, into: &data) {
+            return
+        }
+        // type(1) + channelId(2) + size(4) + classId(2) + methodId(2) + payload + frameEnd(1)
+        data.writeInteger(type)
+        data.writeInteger(channelId)
+        // accounting for class and method IDs
+        data.writeInteger(payload.bytesCount + 2 + 2)
+        data.writeInteger(method.amqpClassId)
+        data.writeInteger(method.amqpMethodId)
+        writable.write(into: &data)
+        data.writeInteger(Spec.frameEnd)
+    }
+}
+
 // 4.2.3 General Frame Format
 // 4.2.7 Heartbeat Frames
 // Also https://www.rabbitmq.com/amqp-0-9-1-errata#section_12
@@ -173,15 +214,21 @@ extension HeartbeatFrame: Equatable {}
 extension HeartbeatFrame: Frame {
     init(from decoder: any FrameDecoderProtocol) throws {
         let wireType = try decoder.decode(UInt8.self)
-        precondition(wireType == Spec.frameHeartbeat)
+        guard wireType == Spec.frameHeartbeat else {
+            throw Spec.HardError.frameError
+        }
         let wireChannelId = try decoder.decode(UInt16.self)
         if wireChannelId != 0 {
             throw Spec.HardError.frameError
         }
         let expectedSize = try decoder.decode(UInt32.self)
-        precondition(expectedSize == 0)
+        guard expectedSize == 0 else {
+            throw Spec.HardError.frameError
+        }
         let end = try decoder.decode(UInt8.self)
-        precondition(end == Spec.frameEnd)
+        guard end == Spec.frameEnd else {
+            throw FramingError.fatal("Frame doesn't end with the frame-end octet")
+        }
     }
 
     func encode(to encoder: any FrameEncoderProtocol) throws {
@@ -194,6 +241,17 @@ extension HeartbeatFrame: Frame {
     var bytesCount: UInt32 { 1 + 2 + 4 + 1 }
 }
 
+extension HeartbeatFrame {
+    /// the heartbeat never changes, the template generated from the spec is shared instead of encoding it
+    func asData() throws -> ByteBuffer {
+        Spec.heartbeatFrame
+    }
+
+    func writeFrame(into data: inout ByteBuffer) throws {
+        data.writeImmutableBuffer(Spec.heartbeatFrame)
+    }
+}
+
 // 4.2.3 General Frame Format
 // 2.3.5.2 Content Frames
 struct ContentHeaderFrame {
@@ -210,7 +268,9 @@ extension ContentHeaderFrame: Equatable {}
 extension ContentHeaderFrame: Frame {
     init(from decoder: any FrameDecoderProtocol) throws {
         let wireType = try decoder.decode(UInt8.self)
-        precondition(wireType == Spec.frameHeader)
+        guard wireType == Spec.frameHeader else {
+            throw Spec.HardError.frameError
+        }
         channelId = try decoder.decode(UInt16.self)
         if channelId == 0 {
             throw Spec.HardError.channelError
@@ -219,11 +279,15 @@ extension ContentHeaderFrame: Frame {
         classId = try decoder.decode(UInt16.self)
         let wireWeight = try decoder.decode(UInt16.self)
         // as per specs in 4.2.6.1
-        precondition(wireWeight == 0)
+        guard wireWeight == 0 else {
+            throw Spec.HardError.frameError
+        }
         bodySize = try decoder.decode(UInt64.self)
         properties = try .init(from: decoder)
         let end = try decoder.decode(UInt8.self)
-        precondition(end == Spec.frameEnd)
+        guard end == Spec.frameEnd else {
+            throw FramingError.fatal("Frame doesn't end with the frame-end octet")
+        }
     }
 
     func encode(to encoder: any FrameEncoderProtocol) throws {
@@ -241,11 +305,35 @@ extension ContentHeaderFrame: Frame {
     var bytesCount: UInt32 { 1 + 2 + 4 + 2 + 2 + 8 + properties.bytesCount + 1 }
 }
 
+extension ContentHeaderFrame {
+    /// serializes this frame straight into a buffer of the exact size
+    func asData() throws -> ByteBuffer {
+        var data = ByteBufferAllocator().buffer(capacity: Int(bytesCount))
+        try writeFrame(into: &data)
+        return data
+    }
+
+    func writeFrame(into data: inout ByteBuffer) throws {
+        let propertiesSize = properties.bytesCount
+        // type(1) + channelId(2) + size(4) + classId(2) + weight(2) + bodySize(8) + properties + frameEnd(1)
+        data.writeInteger(type)
+        data.writeInteger(channelId)
+        // 8 for bodySize, 2 and 2 for classId and weight
+        data.writeInteger(UInt32(8 + 2 + 2) + propertiesSize)
+        data.writeInteger(classId)
+        data.writeInteger(weight)
+        data.writeInteger(bodySize)
+        properties.write(into: &data)
+        data.writeInteger(Spec.frameEnd)
+    }
+}
+
 // 2.3.5.2 Content Frames
 struct ContentBodyFrame {
     var type: UInt8 { Spec.frameBody }
     var channelId: UInt16
-    var fragment: [UInt8]  // max size is UInt32.max
+    // when decoded this is a slice sharing the storage of the inbound bytes, max size is UInt32.max
+    var fragment: ByteBuffer
 }
 
 extension ContentBodyFrame: Equatable {}
@@ -254,17 +342,16 @@ extension ContentBodyFrame: Frame {
     // don't decode type the same was as classId and methodId in Methods are not decoded
     init(from decoder: any FrameDecoderProtocol) throws {
         let wireType = try decoder.decode(UInt8.self)
-        precondition(wireType == Spec.frameBody)
+        guard wireType == Spec.frameBody else {
+            throw Spec.HardError.frameError
+        }
         channelId = try decoder.decode(UInt16.self)
         let expectedSize = try decoder.decode(UInt32.self)
-        var wireFragment = [UInt8]()
-        wireFragment.reserveCapacity(Int(expectedSize))
-        for _ in 0..<expectedSize {
-            wireFragment.append(try decoder.decode(UInt8.self))
-        }
-        fragment = consume wireFragment
+        fragment = try decoder.decodeBytes(count: Int(expectedSize))
         let end = try decoder.decode(UInt8.self)
-        precondition(end == Spec.frameEnd)
+        guard end == Spec.frameEnd else {
+            throw FramingError.fatal("Frame doesn't end with the frame-end octet")
+        }
     }
 
     // don't encode type the same way as classId and methodId in Methods are not encoded
@@ -272,7 +359,7 @@ extension ContentBodyFrame: Frame {
         try encoder.encode(type)
         try encoder.encode(channelId)
         try encoder.encode(UInt32(fragment.count))
-        try fragment.forEach { try encoder.encode($0) }
+        try encoder.encode(fragment)
         try encoder.encode(Spec.frameEnd)
     }
 
@@ -280,8 +367,63 @@ extension ContentBodyFrame: Frame {
 }
 
 extension ContentBodyFrame {
+    /// serializes this frame straight into a buffer of the exact size
+    func asData() throws -> ByteBuffer {
+        // type(1) + channelId(2) + size(4) + fragment + frameEnd(1)
+        var data = ByteBufferAllocator().buffer(capacity: fragment.count + 8)
+        try writeFrame(into: &data)
+        return data
+    }
+
+    func writeFrame(into data: inout ByteBuffer) throws {
+        data.writeInteger(type)
+        data.writeInteger(channelId)
+        data.writeInteger(UInt32(fragment.count))
+        data.writeImmutableBuffer(fragment)
+        data.writeInteger(Spec.frameEnd)
+    }
+
     static func maxPossibleFragmentSize(for maxFrameSize: Int32) -> Int32 {
         // maxFrameSize - type(1) - channelId(2) - size(4) - frameEnd(1)
         return maxFrameSize - 8
     }
 }
+
+// Not an AMQP frame, a run of frames which is serialized into one buffer and so written and flushed at once.
+// Only ever sent, the frames are written back to back as they would be one by one.
+struct FrameBatch {
+    var type: UInt8 { frames.first?.type ?? 0 }
+    var channelId: UInt16 { frames.first?.channelId ?? 0 }
+    var frames: [any Frame]
+}
+
+extension FrameBatch: Equatable {
+    static func == (lhs: FrameBatch, rhs: FrameBatch) -> Bool {
+        lhs.frames.count == rhs.frames.count && zip(lhs.frames, rhs.frames).allSatisfy { $0.isEqual(to: $1) }
+    }
+}
+
+extension FrameBatch: Frame {
+    init(from decoder: any FrameDecoderProtocol) throws {
+        throw FramingError.fatal("FrameBatch can't be decoded, frames are received one by one")
+    }
+
+    func encode(to encoder: any FrameEncoderProtocol) throws {
+        try frames.forEach { try $0.encode(to: encoder) }
+    }
+
+    var bytesCount: UInt32 { frames.reduce(0) { $0 + $1.bytesCount } }
+}
+
+extension FrameBatch {
+    /// serializes all frames into one buffer sized up front
+    func asData() throws -> ByteBuffer {
+        var data = ByteBufferAllocator().buffer(capacity: Int(bytesCount))
+        try writeFrame(into: &data)
+        return data
+    }
+
+    func writeFrame(into data: inout ByteBuffer) throws {
+        try frames.forEach { try $0.writeFrame(into: &data) }
+    }
+}
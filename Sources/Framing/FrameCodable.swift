@@ -1,3 +1,5 @@
+import NIOCore  // for ByteBuffer
+
 protocol FrameDecoderProtocol {
     func decode(_ type: Bool.Type) throws -> Bool
     func decode(_ type: Int8.Type) throws -> Int8
@@ -15,6 +17,15 @@ protocol FrameDecoderProtocol {
     func decode(_ type: [String: Spec.FieldValue].Type) throws -> [String: Spec.FieldValue]
     func decode(_ type: [Spec.FieldValue].Type) throws -> [Spec.FieldValue]
     func decode(_ type: [UInt8].Type) throws -> [UInt8]
+    /// returns the next `count` bytes as a slice (sharing the storage) after a single bounds check,
+    /// so a run of fixed width fields can be read at known offsets
+    func decodeBytes(count: Int) throws -> ByteBuffer
+    /// decodes a shortstr through the interning cache of the connection if there is one (see `ShortStringInterner`)
+    func decodeInterned(_ type: String.Type) throws -> String
+    /// when true the methods which have a lazy view (see `Spec.makeViewFactory`) are decoded into the view
+    var decodesLazyViews: Bool { get }
+    /// the interning cache of the connection, the lazy views read their repeating shortstr fields through it
+    var interner: ShortStringInterner? { get }
 }
 
 protocol FrameDecodable {
@@ -36,6 +47,8 @@ protocol FrameEncoderProtocol {
     func encode(_ value: Timestamp) throws
     func encode(_ value: String, isLong: Bool) throws
     func encode(_ value: [String: Spec.FieldValue]) throws
+    /// writes the readable bytes of the buffer as they are, without a length prefix
+    func encode(_ value: ByteBuffer) throws
 }
 
 protocol FrameEncodable {
@@ -45,6 +58,20 @@ protocol FrameEncodable {
     var bytesCount: UInt32 { get }
 }
 
+/// Serializes the object straight into a `ByteBuffer`, producing the same bytes as `encode(to:)` but without
+/// going through `FrameEncoderProtocol` (and its intermediate storage)
+protocol FrameBufferWritable {
+    func write(into buffer: inout ByteBuffer)
+    /// Writes the whole method frame by copying the template the generator pre-encoded (see `Spec+Templates.swift`)
+    /// and storing the channel id and the fixed width arguments into their slots. Only the methods without variable
+    /// length arguments have a template, the others return false and write nothing.
+    func writeFrameFromTemplate(channelId: UInt16, into buffer: inout ByteBuffer) -> Bool
+}
+
+extension FrameBufferWritable {
+    func writeFrameFromTemplate(channelId: UInt16, into buffer: inout ByteBuffer) -> Bool { false }
+}
+
 protocol FrameCodable: Sendable, FrameDecodable, FrameEncodable, Equatable {}
 
 extension FrameCodable where Self: Equatable {
@@ -1,122 +1,114 @@
 import NIOCore
 
-class FrameDecoder {
+final class FrameDecoder {
+    let decodesLazyViews: Bool
+    let interner: ShortStringInterner?
+    // reused by every decode, so decoding a frame doesn't allocate a decoder
+    private let decoder: _FrameDecoder
+
+    init(decodesLazyViews: Bool = false, interner: ShortStringInterner? = nil) {
+        self.decodesLazyViews = decodesLazyViews
+        self.interner = interner
+        self.decoder = _FrameDecoder(decodesLazyViews: decodesLazyViews, interner: interner)
+    }
+
     func decode<T>(_ type: T.Type, from data: ByteBuffer) throws -> T where T: FrameDecodable {
-        let decoder = _FrameDecoder()
-        return try decoder.with(data: data) { try T.init(from: $0) }
+        try decoder.with(data: data) { try T.init(from: $0) }
     }
-}
 
-extension Spec.FieldValue {
-    fileprivate static let charToValue: [UInt8: Spec.FieldValue] = {
-        return Self.allCases.reduce(into: [:]) { $0[$1.type] = $1 }
-    }()
-
-    // swiftlint:disable:next cyclomatic_complexity
-    fileprivate func decode(from decoder: FrameDecoderProtocol) throws -> Self {
-        switch self {
-        case .int32: return .int32(try decoder.decode(Int32.self))
-        case .decimal:
-            let scale = try decoder.decode(UInt8.self)
-            let value = try decoder.decode(Int32.self)
-            return .decimal(scale, value)
-        case .longstr: return .longstr(try decoder.decode(String.self, isLong: true))
-        case .timestamp: return .timestamp(try decoder.decode(Timestamp.self))
-        case .table: return .table(try decoder.decode(Spec.Table.self))
-        case .void:
-            _ = try decoder.decode(UInt8.self)
-            return .void
-        case .bool: return .bool(try decoder.decode(Bool.self))
-        case .int8: return .int8(try decoder.decode(Int8.self))
-        case .uint8: return .uint8(try decoder.decode(UInt8.self))
-        case .int16: return .int16(try decoder.decode(Int16.self))
-        case .uint16: return .uint16(try decoder.decode(UInt16.self))
-        case .uint32: return .uint32(try decoder.decode(UInt32.self))
-        case .int64: return .int64(try decoder.decode(Int64.self))
-        // case .uint64: return .uint64(try decoder.decode(UInt64.self))
-        case .f32: return .f32(try decoder.decode(Float.self))
-        case .f64: return .f64(try decoder.decode(Double.self))
-        // case .shortstr: return .shortstr(try decoder.decode(String.self, isLong: false))
-        case .array: return .array(try decoder.decode([Spec.FieldValue].self))
-        case .bytes: return .bytes(try decoder.decode([UInt8].self))
-        }
+    /// decodes `data` with a factory instead of a type, e.g. the method arguments made by `Spec.makeFactory`
+    func decode<T>(from data: ByteBuffer, with factory: (any FrameDecoderProtocol) throws -> T) throws -> T {
+        try decoder.with(data: data, closure: factory)
     }
 }
 
 private class _FrameDecoder: FrameDecoderProtocol {
     private var _data: ByteBuffer = .init()
     private var _position: Int = 0
+    let decodesLazyViews: Bool
+    let interner: ShortStringInterner?
+
+    init(decodesLazyViews: Bool, interner: ShortStringInterner?) {
+        self.decodesLazyViews = decodesLazyViews
+        self.interner = interner
+    }
 
     private func _reset() {
         _position = 0
         _data = .init()
     }
 
-    func with<T>(data: ByteBuffer, closure: (FrameDecoderProtocol) throws -> T) throws -> T
-    where T: FrameDecodable {
+    func with<T>(data: ByteBuffer, closure: (FrameDecoderProtocol) throws -> T) throws -> T {
         self._data = data
         defer { self._reset() }
         return try closure(self)
     }
 
+    // throws instead of trapping so a malformed frame can be reported to the caller
+    private func ensureReadable(_ count: Int) throws {
+        guard _position + count <= _data.count else {
+            throw FramingError.insufficientData(needed: count, available: _data.count - _position)
+        }
+    }
+
     func decode(_ type: Bool.Type) throws -> Bool {
-        precondition(_position + 1 <= _data.count)
+        try ensureReadable(1)
         defer { _position += 1 }
         return _data.getInteger(at: _position, endianness: .big, as: Int8.self) != 0
     }
 
     func decode(_ type: Int8.Type) throws -> Int8 {
         let offset = 1
-        precondition(_position + offset <= _data.count)
+        try ensureReadable(offset)
         defer { _position += offset }
         return _data.getInteger(at: _position, endianness: .big, as: type)!
     }
 
     func decode(_ type: Int16.Type) throws -> Int16 {
         let offset = 2
-        precondition(_position + offset <= _data.count)
+        try ensureReadable(offset)
         defer { _position += offset }
         return _data.getInteger(at: _position, endianness: .big, as: type)!
     }
 
     func decode(_ type: Int32.Type) throws -> Int32 {
         let offset = 4
-        precondition(_position + offset <= _data.count)
+        try ensureReadable(offset)
         defer { _position += offset }
         return _data.getInteger(at: _position, endianness: .big, as: type)!
     }
 
     func decode(_ type: Int64.Type) throws -> Int64 {
         let offset = 8
-        precondition(_position + offset <= _data.count)
+        try ensureReadable(offset)
         defer { _position += offset }
         return _data.getInteger(at: _position, endianness: .big, as: type)!
     }
 
     func decode(_ type: UInt8.Type) throws -> UInt8 {
         let offset = 1
-        precondition(_position + offset <= _data.count)
+        try ensureReadable(offset)
         defer { _position += offset }
         return _data.getInteger(at: _position, endianness: .big, as: type)!
     }
 
     func decode(_ type: UInt16.Type) throws -> UInt16 {
         let offset = 2
-        precondition(_position + offset <= _data.count)
+        try ensureReadable(offset)
         defer { _position += offset }
         return _data.getInteger(at: _position, endianness: .big, as: type)!
     }
 
     func decode(_ type: UInt32.Type) throws -> UInt32 {
         let offset = 4
-        precondition(_position + offset <= _data.count)
+        try ensureReadable(offset)
         defer { _position += offset }
         return _data.getInteger(at: _position, endianness: .big, as: type)!
     }
 
     func decode(_ type: UInt64.Type) throws -> UInt64 {
         let offset = 8
-        precondition(_position + offset <= _data.count)
+        try ensureReadable(offset)
         defer { _position += offset }
         return _data.getInteger(at: _position, endianness: .big, as: type)!
     }
@@ -135,11 +127,25 @@ private class _FrameDecoder: FrameDecoderProtocol {
 
     func decode(_ type: String.Type, isLong: Bool) throws -> String {
         let length = isLong ? Int(try decode(UInt32.self)) : Int(try decode(UInt8.self))
-        precondition(_position + length <= _data.count)
+        try ensureReadable(length)
         defer { _position += length }
         return .init(buffer: _data.subdata(in: _position..<_position + length))
     }
 
+    func decodeBytes(count: Int) throws -> ByteBuffer {
+        try ensureReadable(count)
+        defer { _position += count }
+        return _data.subdata(in: _position..<_position + count)
+    }
+
+    func decodeInterned(_ type: String.Type) throws -> String {
+        guard let interner else {
+            return try decode(String.self, isLong: false)
+        }
+        let length = Int(try decode(UInt8.self))
+        return interner.string(for: try decodeBytes(count: length))
+    }
+
     func decode(_ type: [String: Spec.FieldValue].Type) throws -> [String: Spec.FieldValue] {
         let byteCount = Int(try decode(UInt32.self))
         let endPosition = _position + byteCount
@@ -156,7 +162,7 @@ private class _FrameDecoder: FrameDecoderProtocol {
         let byteCount = Int(try decode(UInt32.self))
         let endPosition = _position + byteCount
         var result = [Spec.FieldValue]()
-        while _position <= endPosition {
+        while _position < endPosition {
             result.append(try decode(Spec.FieldValue.self))
         }
         return result
@@ -164,16 +170,12 @@ private class _FrameDecoder: FrameDecoderProtocol {
 
     func decode(_ type: [UInt8].Type) throws -> [UInt8] {
         let length = Int(try decode(UInt32.self))
-        precondition(_position + length <= _data.count)
+        try ensureReadable(length)
         defer { _position += length }
         return [UInt8](buffer: _data.subdata(in: _position..<_position + length))
     }
 
     func decode(_ type: Spec.FieldValue.Type) throws -> Spec.FieldValue {
-        let type = try decode(UInt8.self)
-        guard let prototype = Spec.FieldValue.charToValue[type] else {
-            fatalError("Unknown field value type in frame: \(type)")
-        }
-        return try prototype.decode(from: self)
+        try .decode(tag: try decode(UInt8.self), from: self)
     }
 }
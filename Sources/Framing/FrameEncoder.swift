@@ -8,37 +8,6 @@ class FrameEncoder {
     }
 }
 
-extension Spec.FieldValue {
-    fileprivate func encode(to data: inout ByteBuffer) throws {
-        data.writeInteger(self.type)
-        self.asWrappedValue.encode(to: &data)
-    }
-
-    fileprivate var asWrappedValue: _FrameEncoder.WrappedValue {
-        return switch self {
-        case .int32(let value): .int32(value)
-        case .decimal(let scale, let value): .decimal(scale, value)
-        case .longstr(let value): .longstring(value)
-        case .timestamp(let value): .timestamp(value)
-        case .table(let value): .dictionary(value)
-        case .void: .void(self.type)
-        case .bool(let value): .bool(value)
-        case .int8(let value): .int8(value)
-        case .uint8(let value): .uint8(value)
-        case .int16(let value): .int16(value)
-        case .uint16(let value): .uint16(value)
-        case .uint32(let value): .uint32(value)
-        case .int64(let value): .int64(value)
-        // case .uint64(let value): .uint64(value)
-        case .f32(let value): .float(value)
-        case .f64(let value): .double(value)
-        // case .shortstr(let value): .shortstring(value)
-        case .array(let value): .array(value.map(\.asWrappedValue))
-        case .bytes(let value): .data(value)
-        }
-    }
-}
-
 private class _FrameEncoder: FrameEncoderProtocol {
     enum WrappedValue: Equatable {
         case shortstring(String)
@@ -56,19 +25,16 @@ private class _FrameEncoder: FrameEncoderProtocol {
         case bool(Bool)
         case timestamp(Timestamp)
         case dictionary(Spec.Table)
-        case void(UInt8)  // only for field values
-        case decimal(UInt8, Int32)  // only for field values
-        case array([WrappedValue])  // only for field values
-        case data([UInt8])  // only for field values
+        case buffer(ByteBuffer)
 
         // swiftlint:disable:next cyclomatic_complexity
         func encode(to data: inout ByteBuffer) {
             switch self {
             case .shortstring(let value):
-                data.writeInteger(UInt8(value.count), endianness: .big)
+                data.writeInteger(UInt8(value.utf8.count), endianness: .big)
                 data.writeBytes(value.utf8)
             case .longstring(let value):
-                data.writeInteger(UInt32(value.count), endianness: .big)
+                data.writeInteger(UInt32(value.utf8.count), endianness: .big)
                 data.writeBytes(value.utf8)
             case .uint8(let value): data.writeInteger(value, endianness: .big)
             case .int8(let value): data.writeInteger(value, endianness: .big)
@@ -84,40 +50,22 @@ private class _FrameEncoder: FrameEncoderProtocol {
             case .timestamp(let value):
                 let milliseconds = value.millisecondsSince1970
                 data.writeInteger(milliseconds, endianness: .big)
-            case .dictionary(let table):
-                precondition(table.count <= UInt16.max)
-                // 4 bytes are needed to store the size of the Table
-                data.writeInteger((table.bytesCount - 4), endianness: .big)
-                for (key, value) in table {
-                    WrappedValue.shortstring(key).encode(to: &data)
-                    data.writeInteger(value.type, endianness: .big)
-                    value.asWrappedValue.encode(to: &data)
-                }
-            case .void(let value): data.writeInteger(value)
-            case .decimal(let scale, let value):
-                data.writeInteger(scale, endianness: .big)
-                data.writeInteger(value, endianness: .big)
-            case .array(let value):
-                data.writeInteger(UInt32(value.count), endianness: .big)
-                value.forEach { $0.encode(to: &data) }
-            case .data(let value):
-                data.writeInteger(UInt32(value.count), endianness: .big)
-                data.writeBytes(value)
+            case .dictionary(let table): data.writeTable(table)
+            case .buffer(let value): data.writeImmutableBuffer(value)
             }
         }
 
-        var bytesCount: Int {
+        // tables aren't walked to size them, they are measured while written (see `writeTable`)
+        var reservedBytesCount: Int {
             return switch self {
             case .shortstring(let value): Int(value.shortBytesCount)
             case .longstring(let value): Int(value.longBytesCount)
-            case .bool, .int8, .uint8, .void: 1
+            case .bool, .int8, .uint8: 1
             case .int16, .uint16: 2
             case .int32, .uint32, .float: 4
-            case .decimal: 5
             case .int64, .uint64, .timestamp, .double: 8
-            case .dictionary(let value): Int(value.bytesCount)
-            case .array(let value): Int(value.reduce(into: 0) { $0 += $1.bytesCount }) + 4  // UInt32 for length
-            case .data(let value): Int(value.count) + 4  // UInt32 for length
+            case .dictionary: 4
+            case .buffer(let value): value.readableBytes
             }
         }
     }
@@ -125,7 +73,7 @@ private class _FrameEncoder: FrameEncoderProtocol {
 
     func complete() -> ByteBuffer {
         var data: ByteBuffer = .init()
-        let expectedCapacity = self.storage.reduce(into: 0) { $0 += $1.bytesCount }
+        let expectedCapacity = self.storage.reduce(into: 0) { $0 += $1.reservedBytesCount }
         data.reserveCapacity(expectedCapacity)
         for value in self.storage {
             value.encode(to: &data)
@@ -188,4 +136,40 @@ private class _FrameEncoder: FrameEncoderProtocol {
     func encode(_ value: [String: Spec.FieldValue]) throws {
         storage.append(.dictionary(value))
     }
+
+    func encode(_ value: ByteBuffer) throws {
+        storage.append(.buffer(value))
+    }
+}
+
+// helpers used by the generated `FrameBufferWritable` conformances
+extension ByteBuffer {
+    mutating func writeShortString(_ value: String) {
+        self.writeInteger(UInt8(value.utf8.count))
+        self.writeString(value)
+    }
+
+    mutating func writeLongString(_ value: String) {
+        self.writeInteger(UInt32(value.utf8.count))
+        self.writeString(value)
+    }
+
+    /// Writes a UInt32 length prefix followed by whatever `body` writes. The length is patched in afterwards, so
+    /// tables and arrays are walked once instead of being sized first.
+    mutating func writeWithLengthPrefix(_ body: (inout ByteBuffer) -> Void) {
+        let lengthIndex = self.writerIndex
+        self.writeInteger(UInt32(0))
+        body(&self)
+        self.setInteger(UInt32(self.writerIndex - lengthIndex - 4), at: lengthIndex)
+    }
+
+    mutating func writeTable(_ value: Spec.Table) {
+        precondition(value.count <= UInt16.max)
+        self.writeWithLengthPrefix { buffer in
+            for (key, value) in value {
+                buffer.writeShortString(key)
+                value.write(into: &buffer)
+            }
+        }
+    }
 }
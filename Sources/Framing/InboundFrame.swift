@@ -0,0 +1,159 @@
+import NIOCore
+
+// A frame received from the broker as ByteToFrameCoderHandler decodes it. The kind is known without casting and the
+// channel id without unwrapping the frame.
+enum InboundFrame: Sendable {
+    case method(MethodFrame)
+    case header(ContentHeaderFrame)
+    case body(ContentBodyFrame)
+    case heartbeat
+
+    var channelId: UInt16 {
+        switch self {
+        case .method(let frame): frame.channelId
+        case .header(let frame): frame.channelId
+        case .body(let frame): frame.channelId
+        case .heartbeat: 0
+        }
+    }
+
+    // for the code which handles frames of any kind
+    var frame: any Frame {
+        switch self {
+        case .method(let frame): frame
+        case .header(let frame): frame
+        case .body(let frame): frame
+        case .heartbeat: HeartbeatFrame()
+        }
+    }
+}
+
+extension InboundFrame {
+    // type(1) + channelId(2) + size(4)
+    static let headerSize = 7
+    // header + frameEnd(1)
+    static let overhead = headerSize + 1
+
+    /// Decodes the frame at the reader index of `buffer` in one pass and moves the reader index past it. The fields
+    /// are read in place, the body fragment and the arguments of the lazily decoded methods are slices of `buffer`.
+    ///  - Parameter decoder: decodes the methods without a lazy view and the content properties.
+    ///  - Returns: nil if `buffer` doesn't hold the whole frame yet, the reader index is left untouched then.
+    ///  - Throws: `Spec.HardError` if the frame breaks the rules of the spec, `FramingError.fatal` if it doesn't end
+    ///    with the frame-end octet. The connection has to be closed in both cases.
+    static func decode(from buffer: inout ByteBuffer, decoder: FrameDecoder) throws -> InboundFrame? {
+        let start = buffer.readerIndex
+        guard let type = buffer.getInteger(at: start, as: UInt8.self),
+            let channelId = buffer.getInteger(at: start + 1, as: UInt16.self),
+            let size = buffer.getInteger(at: start + 3, as: UInt32.self)
+        else {
+            return nil
+        }
+        let totalSize = Int(size) + overhead
+        guard buffer.readableBytes >= totalSize else {
+            return nil
+        }
+        // 4.2.3 General Frame Format, checked before anything else is decoded
+        guard buffer.getInteger(at: start + totalSize - 1, as: UInt8.self) == Spec.frameEnd else {
+            throw FramingError.fatal("Frame doesn't end with the frame-end octet")
+        }
+        let payload = buffer.getSlice(at: start + headerSize, length: Int(size))!
+        let frame: InboundFrame
+        switch type {
+        case Spec.frameMethod:
+            frame = .method(try decodeMethod(channelId: channelId, payload: payload, decoder: decoder))
+        case Spec.frameHeader:
+            frame = .header(try decodeHeader(channelId: channelId, payload: payload, decoder: decoder))
+        case Spec.frameBody:
+            // 4.2.6 content frames can't be sent on channel 0
+            guard channelId != 0 else {
+                throw Spec.HardError.channelError
+            }
+            frame = .body(ContentBodyFrame(channelId: channelId, fragment: payload))
+        case Spec.frameHeartbeat:
+            // 4.2.7 heartbeats are sent on channel 0 and carry nothing
+            guard channelId == 0 && size == 0 else {
+                throw Spec.HardError.frameError
+            }
+            frame = .heartbeat
+        default:
+            throw Spec.HardError.frameError
+        }
+        buffer.moveReaderIndex(forwardBy: totalSize)
+        return frame
+    }
+
+    private static func decodeMethod(
+        channelId: UInt16,
+        payload: ByteBuffer,
+        decoder: FrameDecoder
+    ) throws -> MethodFrame {
+        // classId(2) + methodId(2)
+        guard payload.readableBytes >= 4 else {
+            throw Spec.HardError.frameError
+        }
+        let classId = payload.getInteger(at: 0, as: UInt16.self)!
+        let methodId = payload.getInteger(at: 2, as: UInt16.self)!
+        let arguments = payload.getSlice(at: 4, length: payload.readableBytes - 4)!
+        let method: any FrameCodable
+        do {
+            if let viewFactory = Spec.makeViewFactory(with: classId, and: methodId) {
+                #if CodecMetrics
+                    let metricsStart = CodecMetrics.now()
+                #endif
+                // the arguments stay as a slice of the frame and are read on access, but the interned ones
+                method = try viewFactory(arguments, decoder.interner)
+                #if CodecMetrics
+                    // views don't go through the generated init(from:)
+                    if let slot = Spec.metricsSlot(with: classId, and: methodId) {
+                        CodecMetrics.shared.record(.decode, slot: slot, bytes: method.bytesCount, since: metricsStart)
+                    }
+                #endif
+            } else {
+                method = try decoder.decode(from: arguments, with: try Spec.makeFactory(with: classId, and: methodId))
+            }
+        } catch FramingError.unknownClassAndMethod {
+            throw Spec.HardError.commandInvalid
+        } catch is FramingError {
+            // the arguments don't fit into the frame
+            throw Spec.HardError.syntaxError
+        }
+        guard method.bytesCount == arguments.readableBytes else {
+            throw Spec.HardError.frameError
+        }
+        return MethodFrame(channelId: channelId, payload: method)
+    }
+
+    private static func decodeHeader(
+        channelId: UInt16,
+        payload: ByteBuffer,
+        decoder: FrameDecoder
+    ) throws -> ContentHeaderFrame {
+        // 4.2.6 content frames can't be sent on channel 0
+        guard channelId != 0 else {
+            throw Spec.HardError.channelError
+        }
+        // classId(2) + weight(2) + bodySize(8)
+        guard payload.readableBytes >= 12 else {
+            throw Spec.HardError.frameError
+        }
+        let classId = payload.getInteger(at: 0, as: UInt16.self)!
+        // 4.2.6.1 the weight field is unused and must be zero
+        guard payload.getInteger(at: 2, as: UInt16.self)! == 0 else {
+            throw Spec.HardError.frameError
+        }
+        let bodySize = payload.getInteger(at: 4, as: UInt64.self)!
+        let properties: Spec.BasicProperties
+        do {
+            properties = try decoder.decode(
+                Spec.BasicProperties.self,
+                from: payload.getSlice(at: 12, length: payload.readableBytes - 12)!
+            )
+        } catch is FramingError {
+            throw Spec.HardError.syntaxError
+        }
+        guard properties.bytesCount + 12 == payload.readableBytes else {
+            throw Spec.HardError.frameError
+        }
+        return ContentHeaderFrame(channelId: channelId, classId: classId, bodySize: bodySize, properties: properties)
+    }
+}
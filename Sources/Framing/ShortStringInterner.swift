@@ -0,0 +1,110 @@
+import Atomics
+import NIOCore
+
+/// Hit and miss counts of the shortstr interning cache of a connection.
+public struct InterningStatistics: Sendable, Equatable {
+    /// decodes which returned a cached string
+    public let hits: Int
+    /// decodes which had to create a string
+    public let misses: Int
+}
+
+// Decodes the shortstr fields which repeat a lot into shared Strings, see INTERNED_FIELDS in Generator/codegen.py.
+// The cache is keyed by the raw bytes, so a hit neither validates UTF-8 nor allocates. At most `capacity` strings are
+// kept, the least recently used one is evicted to make room. The entries are a doubly linked list threaded through
+// `slots` by index, most recently used first, so a hit and an eviction are O(1).
+// The lazy views of Basic.Deliver and Basic.Return (see Spec+Views.swift) read these fields through the cache when
+// they are made, the methods without a view (Basic.GetOk) when they are decoded.
+// Only the decoder of the connection (on its event loop) uses the cache, the counters can be read from anywhere.
+final class ShortStringInterner: @unchecked Sendable {
+    private struct Slot {
+        var key: ByteBuffer
+        var value: String
+        var previous: Int?
+        var next: Int?
+    }
+
+    let capacity: Int
+    // the index of the slot of each key
+    private var indices: [ByteBuffer: Int] = [:]
+    private var slots: [Slot] = []
+    // most and least recently used slots
+    private var head: Int?
+    private var tail: Int?
+    private let hits = ManagedAtomic<Int>(0)
+    private let misses = ManagedAtomic<Int>(0)
+
+    init(capacity: Int = 256) {
+        precondition(capacity > 0)
+        self.capacity = capacity
+        indices.reserveCapacity(capacity)
+        slots.reserveCapacity(capacity)
+    }
+
+    var statistics: InterningStatistics {
+        .init(hits: hits.load(ordering: .relaxed), misses: misses.load(ordering: .relaxed))
+    }
+
+    func string(for bytes: ByteBuffer) -> String {
+        if let index = indices[bytes] {
+            hits.wrappingIncrement(ordering: .relaxed)
+            moveToFront(index)
+            return slots[index].value
+        }
+        misses.wrappingIncrement(ordering: .relaxed)
+        let value = String(buffer: bytes)
+        // the key is copied out, a slice would keep the whole inbound buffer alive
+        var key = ByteBufferAllocator().buffer(capacity: bytes.readableBytes)
+        key.writeImmutableBuffer(bytes)
+        let index: Int
+        if slots.count < capacity {
+            index = slots.count
+            slots.append(Slot(key: key, value: value))
+        } else {
+            // the least recently used slot is reused
+            index = tail!
+            unlink(index)
+            indices.removeValue(forKey: slots[index].key)
+            slots[index].key = key
+            slots[index].value = value
+        }
+        indices[key] = index
+        pushFront(index)
+        return value
+    }
+
+    private func moveToFront(_ index: Int) {
+        guard head != index else {
+            return
+        }
+        unlink(index)
+        pushFront(index)
+    }
+
+    private func unlink(_ index: Int) {
+        let (previous, next) = (slots[index].previous, slots[index].next)
+        if let previous {
+            slots[previous].next = next
+        } else {
+            head = next
+        }
+        if let next {
+            slots[next].previous = previous
+        } else {
+            tail = previous
+        }
+        slots[index].previous = nil
+        slots[index].next = nil
+    }
+
+    private func pushFront(_ index: Int) {
+        slots[index].next = head
+        if let head {
+            slots[head].previous = index
+        }
+        head = index
+        if tail == nil {
+            tail = index
+        }
+    }
+}
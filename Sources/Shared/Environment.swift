@@ -1,4 +1,5 @@
 import Logging
+import NIOCore
 
 struct Environment: Sendable {
     typealias NegotiationFactoryT =
@@ -6,8 +7,8 @@ struct Environment: Sendable {
 
     typealias TransportFactoryT =
         @Sendable (
-            String, Int, Logger, AsyncStream<any Frame>.Continuation,
-            @escaping @Sendable () -> any AMQPNegotiationDelegateProtocol
+            String, Int, String?, OutboundQueueConfiguration, (any EventLoopGroup)?, Logger,
+            AsyncStream<InboundFrame>.Continuation, @escaping @Sendable () -> any AMQPNegotiationDelegateProtocol
         ) async throws -> any TransportProtocol & Sendable
 
     private(set) var negotiationFactory: NegotiationFactoryT = Spec.AMQPNegotiator.init
@@ -13,10 +13,28 @@ enum ConnectionError: Error {
     // (everything can be still used as normal, but new channel can be made only
     // if some are closed)
     case maxChannelsLimitReached
+    // the consumer of a channel read slower than its deliveries arrived and fell further behind than the channel may
+    // buffer, the channel was closed
+    case consumerOverrun
 }
 
 extension ConnectionError: Equatable {}
 
+enum PublishError: Error {
+    // the broker couldn't take responsibility for the message published in confirm mode, with the delivery tag of
+    // the nack (which may cover several messages)
+    case nacked(deliveryTag: Int64)
+    // the body of another message is being streamed on the channel, its frames can't be interleaved with others
+    case channelBusy
+    // the chunks of a streamed body didn't add up to the size announced in its header, `readBytes` were read when
+    // it was noticed
+    case bodySizeMismatch(bodySize: Int, readBytes: Int)
+    // confirmSelect was called again on the channel with another in-flight window than the one it is using
+    case confirmWindowMismatch(maxInFlight: Int, requested: Int)
+}
+
+extension PublishError: Equatable {}
+
 enum NegotiationError: Error {
     case protocolVersionMismatch(server: String, client: String)
     case unsupportedAuthMechanism(String)
@@ -31,6 +49,8 @@ enum FramingError: Error {
     case fatal(String)
     case unknownClassAndMethod(class: UInt16, method: UInt16)
     case unknownFrameType(_ type: UInt8)
+    // the frame is shorter than its fields require
+    case insufficientData(needed: Int, available: Int)
 }
 
 enum TransportError: Error {
@@ -10,3 +10,51 @@ extension ByteBuffer {
         return self.readableBytes
     }
 }
+
+// helpers used by the generated lazy method views, the offsets are relative to the slice start
+extension ByteBuffer {
+    // size of the short string at index including its length octet, throws when it runs past the written bytes
+    func shortStringSize(at index: Int) throws -> Int {
+        guard let length = self.getInteger(at: index, as: UInt8.self) else {
+            throw FramingError.insufficientData(needed: 1, available: 0)
+        }
+        let size = 1 + Int(length)
+        guard index + size <= self.writerIndex else {
+            throw FramingError.insufficientData(needed: size, available: self.writerIndex - index)
+        }
+        return size
+    }
+
+    // size of the long string at index including its length, throws when it runs past the written bytes
+    func longStringSize(at index: Int) throws -> Int {
+        guard let length = self.getInteger(at: index, as: UInt32.self) else {
+            throw FramingError.insufficientData(needed: 4, available: max(0, self.writerIndex - index))
+        }
+        let size = 4 + Int(length)
+        guard index + size <= self.writerIndex else {
+            throw FramingError.insufficientData(needed: size, available: self.writerIndex - index)
+        }
+        return size
+    }
+
+    // the bounds are expected to be validated with shortStringSize(at:) beforehand
+    func getShortString(at index: Int) -> String {
+        let length = Int(self.getInteger(at: index, as: UInt8.self)!)
+        return self.getString(at: index + 1, length: length)!
+    }
+
+    // same as getShortString(at:), but a string seen before is served from the cache without allocating
+    func getShortString(at index: Int, interner: ShortStringInterner?) -> String {
+        guard let interner else {
+            return getShortString(at: index)
+        }
+        let length = Int(self.getInteger(at: index, as: UInt8.self)!)
+        return interner.string(for: self.getSlice(at: index + 1, length: length)!)
+    }
+
+    // the bounds are expected to be validated with longStringSize(at:) beforehand
+    func getLongString(at index: Int) -> String {
+        let length = Int(self.getInteger(at: index, as: UInt32.self)!)
+        return self.getString(at: index + 4, length: length)!
+    }
+}
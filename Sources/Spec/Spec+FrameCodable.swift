@@ -11,42 +11,149 @@
 // SPDX-License-Identifier: Apache-2.0
 //
 
+import NIOCore
+
 private typealias FieldValue = Spec.FieldValue
 
-extension Spec.Basic.Qos: FrameCodable {
+extension Spec.FieldValue: FrameBufferWritable {
+    /// Decodes the value which follows the type `tag` (see `type`).
+    static func decode(tag: UInt8, from decoder: FrameDecoderProtocol) throws -> Self {
+        switch tag {
+        case UInt8(ascii: "t"): return .bool(try decoder.decode(Bool.self))
+        case UInt8(ascii: "b"): return .int8(try decoder.decode(Int8.self))
+        case UInt8(ascii: "B"): return .uint8(try decoder.decode(UInt8.self))
+        case UInt8(ascii: "s"): return .int16(try decoder.decode(Int16.self))
+        case UInt8(ascii: "u"): return .uint16(try decoder.decode(UInt16.self))
+        case UInt8(ascii: "I"): return .int32(try decoder.decode(Int32.self))
+        case UInt8(ascii: "i"): return .uint32(try decoder.decode(UInt32.self))
+        case UInt8(ascii: "l"): return .int64(try decoder.decode(Int64.self))
+        case UInt8(ascii: "f"): return .f32(try decoder.decode(Float.self))
+        case UInt8(ascii: "d"): return .f64(try decoder.decode(Double.self))
+        case UInt8(ascii: "D"):
+            let scale = try decoder.decode(UInt8.self)
+            return .decimal(scale, try decoder.decode(Int32.self))
+        case UInt8(ascii: "S"): return .longstr(try decoder.decode(String.self, isLong: true))
+        case UInt8(ascii: "A"): return .array(try decoder.decode([FieldValue].self))
+        case UInt8(ascii: "T"): return .timestamp(try decoder.decode(Timestamp.self))
+        case UInt8(ascii: "F"): return .table(try decoder.decode([String: FieldValue].self))
+        case UInt8(ascii: "x"): return .bytes(try decoder.decode([UInt8].self))
+        case UInt8(ascii: "V"):
+            _ = try decoder.decode(UInt8.self)
+            return .void
+        default: throw FramingError.fatal("Unknown field value type \(tag)")
+        }
+    }
+
+    /// Writes the type tag followed by the value.
+    func write(into buffer: inout ByteBuffer) {
+        buffer.writeInteger(type)
+        switch self {
+        case .bool(let value): buffer.writeInteger(UInt8(value ? 1 : 0))
+        case .int8(let value): buffer.writeInteger(value)
+        case .uint8(let value): buffer.writeInteger(value)
+        case .int16(let value): buffer.writeInteger(value)
+        case .uint16(let value): buffer.writeInteger(value)
+        case .int32(let value): buffer.writeInteger(value)
+        case .uint32(let value): buffer.writeInteger(value)
+        case .int64(let value): buffer.writeInteger(value)
+        case .f32(let value): buffer.writeInteger(value.bitPattern)
+        case .f64(let value): buffer.writeInteger(value.bitPattern)
+        case .decimal(let scale, let value):
+            buffer.writeInteger(scale)
+            buffer.writeInteger(value)
+        case .longstr(let value): buffer.writeLongString(value)
+        case .array(let value):
+            buffer.writeWithLengthPrefix { buffer in
+                for element in value {
+                    element.write(into: &buffer)
+                }
+            }
+        case .timestamp(let value): buffer.writeInteger(value.millisecondsSince1970)
+        case .table(let value): buffer.writeTable(value)
+        case .bytes(let value):
+            buffer.writeInteger(UInt32(value.count))
+            buffer.writeBytes(value)
+        case .void: buffer.writeInteger(type)
+        }
+    }
+}
+
+extension Spec.Basic.Qos: FrameCodable, FrameBufferWritable {
     func encode(to encoder: FrameEncoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 0, bytes: bytesCount, since: metricsStart) }
+        #endif
         try encoder.encode(prefetchSize)
         try encoder.encode(prefetchCount)
         try encoder.encode(global)
     }
 
+    func write(into buffer: inout ByteBuffer) {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 0, bytes: bytesCount, since: metricsStart) }
+        #endif
+        buffer.writeInteger(prefetchSize)
+        buffer.writeInteger(prefetchCount)
+        buffer.writeInteger(UInt8(global ? 1 : 0))
+    }
+
     init(from decoder: FrameDecoderProtocol) throws {
-        let prefetchSize = try decoder.decode(Int32.self)
-        let prefetchCount = try decoder.decode(UInt16.self)
-        let global = try decoder.decode(Bool.self)
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+        #endif
+        let fixedWidth = try decoder.decodeBytes(count: 7)
+        let prefetchSize = fixedWidth.getInteger(at: 0, as: Int32.self)!
+        let prefetchCount = fixedWidth.getInteger(at: 4, as: UInt16.self)!
+        let global = fixedWidth.getInteger(at: 6, as: UInt8.self)! != 0
         self.init(
             prefetchSize: prefetchSize,
             prefetchCount: prefetchCount,
             global: global
         )
+        #if CodecMetrics
+            CodecMetrics.shared.record(.decode, slot: 0, bytes: bytesCount, since: metricsStart)
+        #endif
     }
 
     var bytesCount: UInt32 { 1 + 2 + 4 }
 }
 
-extension Spec.Basic.QosOk: FrameCodable {
+extension Spec.Basic.QosOk: FrameCodable, FrameBufferWritable {
     func encode(to encoder: FrameEncoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 1, bytes: bytesCount, since: metricsStart) }
+        #endif
+    }
+
+    func write(into buffer: inout ByteBuffer) {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 1, bytes: bytesCount, since: metricsStart) }
+        #endif
     }
 
     init(from decoder: FrameDecoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+        #endif
         self.init()
+        #if CodecMetrics
+            CodecMetrics.shared.record(.decode, slot: 1, bytes: bytesCount, since: metricsStart)
+        #endif
     }
 
     var bytesCount: UInt32 { 0 }
 }
 
-extension Spec.Basic.Consume: FrameCodable {
+extension Spec.Basic.Consume: FrameCodable, FrameBufferWritable {
     func encode(to encoder: FrameEncoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 2, bytes: bytesCount, since: metricsStart) }
+        #endif
         try encoder.encode(ticket)
         try encoder.encode(queue, isLong: false)
         try encoder.encode(consumerTag, isLong: false)
@@ -59,7 +166,27 @@ extension Spec.Basic.Consume: FrameCodable {
         try encoder.encode(arguments)
     }
 
+    func write(into buffer: inout ByteBuffer) {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 2, bytes: bytesCount, since: metricsStart) }
+        #endif
+        buffer.writeInteger(ticket)
+        buffer.writeShortString(queue)
+        buffer.writeShortString(consumerTag)
+        var bitPack: UInt8 = 0
+        if noLocal { bitPack |= 1 << 0 }
+        if noAck { bitPack |= 1 << 1 }
+        if exclusive { bitPack |= 1 << 2 }
+        if nowait { bitPack |= 1 << 3 }
+        buffer.writeInteger(bitPack)
+        buffer.writeTable(arguments)
+    }
+
     init(from decoder: FrameDecoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+        #endif
         let ticket = try decoder.decode(UInt16.self)
         let queue = try decoder.decode(String.self, isLong: false)
         let consumerTag = try decoder.decode(String.self, isLong: false)
@@ -79,6 +206,9 @@ extension Spec.Basic.Consume: FrameCodable {
             nowait: nowait,
             arguments: arguments
         )
+        #if CodecMetrics
+            CodecMetrics.shared.record(.decode, slot: 2, bytes: bytesCount, since: metricsStart)
+        #endif
     }
 
     var bytesCount: UInt32 {
@@ -86,56 +216,115 @@ extension Spec.Basic.Consume: FrameCodable {
     }
 }
 
-extension Spec.Basic.ConsumeOk: FrameCodable {
+extension Spec.Basic.ConsumeOk: FrameCodable, FrameBufferWritable {
     func encode(to encoder: FrameEncoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 3, bytes: bytesCount, since: metricsStart) }
+        #endif
         try encoder.encode(consumerTag, isLong: false)
     }
 
+    func write(into buffer: inout ByteBuffer) {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 3, bytes: bytesCount, since: metricsStart) }
+        #endif
+        buffer.writeShortString(consumerTag)
+    }
+
     init(from decoder: FrameDecoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+        #endif
         let consumerTag = try decoder.decode(String.self, isLong: false)
         self.init(
             consumerTag: consumerTag
         )
+        #if CodecMetrics
+            CodecMetrics.shared.record(.decode, slot: 3, bytes: bytesCount, since: metricsStart)
+        #endif
     }
 
     var bytesCount: UInt32 { UInt32(consumerTag.shortBytesCount) }
 }
 
-extension Spec.Basic.Cancel: FrameCodable {
+extension Spec.Basic.Cancel: FrameCodable, FrameBufferWritable {
     func encode(to encoder: FrameEncoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 4, bytes: bytesCount, since: metricsStart) }
+        #endif
         try encoder.encode(consumerTag, isLong: false)
         try encoder.encode(nowait)
     }
 
+    func write(into buffer: inout ByteBuffer) {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 4, bytes: bytesCount, since: metricsStart) }
+        #endif
+        buffer.writeShortString(consumerTag)
+        buffer.writeInteger(UInt8(nowait ? 1 : 0))
+    }
+
     init(from decoder: FrameDecoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+        #endif
         let consumerTag = try decoder.decode(String.self, isLong: false)
         let nowait = try decoder.decode(Bool.self)
         self.init(
             consumerTag: consumerTag,
             nowait: nowait
         )
+        #if CodecMetrics
+            CodecMetrics.shared.record(.decode, slot: 4, bytes: bytesCount, since: metricsStart)
+        #endif
     }
 
     var bytesCount: UInt32 { 1 + UInt32(consumerTag.shortBytesCount) }
 }
 
-extension Spec.Basic.CancelOk: FrameCodable {
+extension Spec.Basic.CancelOk: FrameCodable, FrameBufferWritable {
     func encode(to encoder: FrameEncoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 5, bytes: bytesCount, since: metricsStart) }
+        #endif
         try encoder.encode(consumerTag, isLong: false)
     }
 
+    func write(into buffer: inout ByteBuffer) {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 5, bytes: bytesCount, since: metricsStart) }
+        #endif
+        buffer.writeShortString(consumerTag)
+    }
+
     init(from decoder: FrameDecoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+        #endif
         let consumerTag = try decoder.decode(String.self, isLong: false)
         self.init(
             consumerTag: consumerTag
         )
+        #if CodecMetrics
+            CodecMetrics.shared.record(.decode, slot: 5, bytes: bytesCount, since: metricsStart)
+        #endif
     }
 
     var bytesCount: UInt32 { UInt32(consumerTag.shortBytesCount) }
 }
 
-extension Spec.Basic.Publish: FrameCodable {
+extension Spec.Basic.Publish: FrameCodable, FrameBufferWritable {
     func encode(to encoder: FrameEncoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 6, bytes: bytesCount, since: metricsStart) }
+        #endif
         try encoder.encode(ticket)
         try encoder.encode(exchange, isLong: false)
         try encoder.encode(routingKey, isLong: false)
@@ -145,7 +334,24 @@ extension Spec.Basic.Publish: FrameCodable {
         try encoder.encode(bitPack)
     }
 
+    func write(into buffer: inout ByteBuffer) {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 6, bytes: bytesCount, since: metricsStart) }
+        #endif
+        buffer.writeInteger(ticket)
+        buffer.writeShortString(exchange)
+        buffer.writeShortString(routingKey)
+        var bitPack: UInt8 = 0
+        if mandatory { bitPack |= 1 << 0 }
+        if immediate { bitPack |= 1 << 1 }
+        buffer.writeInteger(bitPack)
+    }
+
     init(from decoder: FrameDecoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+        #endif
         let ticket = try decoder.decode(UInt16.self)
         let exchange = try decoder.decode(String.self, isLong: false)
         let routingKey = try decoder.decode(String.self, isLong: false)
@@ -159,30 +365,54 @@ extension Spec.Basic.Publish: FrameCodable {
             mandatory: mandatory,
             immediate: immediate
         )
+        #if CodecMetrics
+            CodecMetrics.shared.record(.decode, slot: 6, bytes: bytesCount, since: metricsStart)
+        #endif
     }
 
     var bytesCount: UInt32 { 1 + 2 + UInt32(exchange.shortBytesCount) + UInt32(routingKey.shortBytesCount) }
 }
 
-extension Spec.Basic.Return: FrameCodable {
+extension Spec.Basic.Return: FrameCodable, FrameBufferWritable {
     func encode(to encoder: FrameEncoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 7, bytes: bytesCount, since: metricsStart) }
+        #endif
         try encoder.encode(replyCode)
         try encoder.encode(replyText, isLong: false)
         try encoder.encode(exchange, isLong: false)
         try encoder.encode(routingKey, isLong: false)
     }
 
+    func write(into buffer: inout ByteBuffer) {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 7, bytes: bytesCount, since: metricsStart) }
+        #endif
+        buffer.writeInteger(replyCode)
+        buffer.writeShortString(replyText)
+        buffer.writeShortString(exchange)
+        buffer.writeShortString(routingKey)
+    }
+
     init(from decoder: FrameDecoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+        #endif
         let replyCode = try decoder.decode(UInt16.self)
         let replyText = try decoder.decode(String.self, isLong: false)
-        let exchange = try decoder.decode(String.self, isLong: false)
-        let routingKey = try decoder.decode(String.self, isLong: false)
+        let exchange = try decoder.decodeInterned(String.self)
+        let routingKey = try decoder.decodeInterned(String.self)
         self.init(
             replyCode: replyCode,
             replyText: replyText,
             exchange: exchange,
             routingKey: routingKey
         )
+        #if CodecMetrics
+            CodecMetrics.shared.record(.decode, slot: 7, bytes: bytesCount, since: metricsStart)
+        #endif
     }
 
     var bytesCount: UInt32 {
@@ -190,8 +420,12 @@ extension Spec.Basic.Return: FrameCodable {
     }
 }
 
-extension Spec.Basic.Deliver: FrameCodable {
+extension Spec.Basic.Deliver: FrameCodable, FrameBufferWritable {
     func encode(to encoder: FrameEncoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 8, bytes: bytesCount, since: metricsStart) }
+        #endif
         try encoder.encode(consumerTag, isLong: false)
         try encoder.encode(deliveryTag)
         try encoder.encode(redelivered)
@@ -199,12 +433,28 @@ extension Spec.Basic.Deliver: FrameCodable {
         try encoder.encode(routingKey, isLong: false)
     }
 
-    init(from decoder: FrameDecoderProtocol) throws {
-        let consumerTag = try decoder.decode(String.self, isLong: false)
-        let deliveryTag = try decoder.decode(Int64.self)
-        let redelivered = try decoder.decode(Bool.self)
-        let exchange = try decoder.decode(String.self, isLong: false)
-        let routingKey = try decoder.decode(String.self, isLong: false)
+    func write(into buffer: inout ByteBuffer) {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 8, bytes: bytesCount, since: metricsStart) }
+        #endif
+        buffer.writeShortString(consumerTag)
+        buffer.writeInteger(deliveryTag)
+        buffer.writeInteger(UInt8(redelivered ? 1 : 0))
+        buffer.writeShortString(exchange)
+        buffer.writeShortString(routingKey)
+    }
+
+    init(from decoder: FrameDecoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+        #endif
+        let consumerTag = try decoder.decodeInterned(String.self)
+        let fixedWidth = try decoder.decodeBytes(count: 9)
+        let deliveryTag = fixedWidth.getInteger(at: 0, as: Int64.self)!
+        let redelivered = fixedWidth.getInteger(at: 8, as: UInt8.self)! != 0
+        let exchange = try decoder.decodeInterned(String.self)
+        let routingKey = try decoder.decodeInterned(String.self)
         self.init(
             consumerTag: consumerTag,
             deliveryTag: deliveryTag,
@@ -212,6 +462,9 @@ extension Spec.Basic.Deliver: FrameCodable {
             exchange: exchange,
             routingKey: routingKey
         )
+        #if CodecMetrics
+            CodecMetrics.shared.record(.decode, slot: 8, bytes: bytesCount, since: metricsStart)
+        #endif
     }
 
     var bytesCount: UInt32 {
@@ -220,14 +473,31 @@ extension Spec.Basic.Deliver: FrameCodable {
     }
 }
 
-extension Spec.Basic.Get: FrameCodable {
+extension Spec.Basic.Get: FrameCodable, FrameBufferWritable {
     func encode(to encoder: FrameEncoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 9, bytes: bytesCount, since: metricsStart) }
+        #endif
         try encoder.encode(ticket)
         try encoder.encode(queue, isLong: false)
         try encoder.encode(noAck)
     }
 
+    func write(into buffer: inout ByteBuffer) {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 9, bytes: bytesCount, since: metricsStart) }
+        #endif
+        buffer.writeInteger(ticket)
+        buffer.writeShortString(queue)
+        buffer.writeInteger(UInt8(noAck ? 1 : 0))
+    }
+
     init(from decoder: FrameDecoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+        #endif
         let ticket = try decoder.decode(UInt16.self)
         let queue = try decoder.decode(String.self, isLong: false)
         let noAck = try decoder.decode(Bool.self)
@@ -236,13 +506,20 @@ extension Spec.Basic.Get: FrameCodable {
             queue: queue,
             noAck: noAck
         )
+        #if CodecMetrics
+            CodecMetrics.shared.record(.decode, slot: 9, bytes: bytesCount, since: metricsStart)
+        #endif
     }
 
     var bytesCount: UInt32 { 1 + 2 + UInt32(queue.shortBytesCount) }
 }
 
-extension Spec.Basic.GetOk: FrameCodable {
+extension Spec.Basic.GetOk: FrameCodable, FrameBufferWritable {
     func encode(to encoder: FrameEncoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 10, bytes: bytesCount, since: metricsStart) }
+        #endif
         try encoder.encode(deliveryTag)
         try encoder.encode(redelivered)
         try encoder.encode(exchange, isLong: false)
@@ -250,11 +527,27 @@ extension Spec.Basic.GetOk: FrameCodable {
         try encoder.encode(messageCount)
     }
 
+    func write(into buffer: inout ByteBuffer) {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 10, bytes: bytesCount, since: metricsStart) }
+        #endif
+        buffer.writeInteger(deliveryTag)
+        buffer.writeInteger(UInt8(redelivered ? 1 : 0))
+        buffer.writeShortString(exchange)
+        buffer.writeShortString(routingKey)
+        buffer.writeInteger(messageCount)
+    }
+
     init(from decoder: FrameDecoderProtocol) throws {
-        let deliveryTag = try decoder.decode(Int64.self)
-        let redelivered = try decoder.decode(Bool.self)
-        let exchange = try decoder.decode(String.self, isLong: false)
-        let routingKey = try decoder.decode(String.self, isLong: false)
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+        #endif
+        let fixedWidth = try decoder.decodeBytes(count: 9)
+        let deliveryTag = fixedWidth.getInteger(at: 0, as: Int64.self)!
+        let redelivered = fixedWidth.getInteger(at: 8, as: UInt8.self)! != 0
+        let exchange = try decoder.decodeInterned(String.self)
+        let routingKey = try decoder.decodeInterned(String.self)
         let messageCount = try decoder.decode(Int32.self)
         self.init(
             deliveryTag: deliveryTag,
@@ -263,105 +556,223 @@ extension Spec.Basic.GetOk: FrameCodable {
             routingKey: routingKey,
             messageCount: messageCount
         )
+        #if CodecMetrics
+            CodecMetrics.shared.record(.decode, slot: 10, bytes: bytesCount, since: metricsStart)
+        #endif
     }
 
     var bytesCount: UInt32 { 1 + 4 + 8 + UInt32(exchange.shortBytesCount) + UInt32(routingKey.shortBytesCount) }
 }
 
-extension Spec.Basic.GetEmpty: FrameCodable {
+extension Spec.Basic.GetEmpty: FrameCodable, FrameBufferWritable {
     func encode(to encoder: FrameEncoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 11, bytes: bytesCount, since: metricsStart) }
+        #endif
         try encoder.encode(clusterId, isLong: false)
     }
 
+    func write(into buffer: inout ByteBuffer) {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 11, bytes: bytesCount, since: metricsStart) }
+        #endif
+        buffer.writeShortString(clusterId)
+    }
+
     init(from decoder: FrameDecoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+        #endif
         let clusterId = try decoder.decode(String.self, isLong: false)
         self.init(
             clusterId: clusterId
         )
+        #if CodecMetrics
+            CodecMetrics.shared.record(.decode, slot: 11, bytes: bytesCount, since: metricsStart)
+        #endif
     }
 
     var bytesCount: UInt32 { UInt32(clusterId.shortBytesCount) }
 }
 
-extension Spec.Basic.Ack: FrameCodable {
+extension Spec.Basic.Ack: FrameCodable, FrameBufferWritable {
     func encode(to encoder: FrameEncoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 12, bytes: bytesCount, since: metricsStart) }
+        #endif
         try encoder.encode(deliveryTag)
         try encoder.encode(multiple)
     }
 
+    func write(into buffer: inout ByteBuffer) {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 12, bytes: bytesCount, since: metricsStart) }
+        #endif
+        buffer.writeInteger(deliveryTag)
+        buffer.writeInteger(UInt8(multiple ? 1 : 0))
+    }
+
     init(from decoder: FrameDecoderProtocol) throws {
-        let deliveryTag = try decoder.decode(Int64.self)
-        let multiple = try decoder.decode(Bool.self)
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+        #endif
+        let fixedWidth = try decoder.decodeBytes(count: 9)
+        let deliveryTag = fixedWidth.getInteger(at: 0, as: Int64.self)!
+        let multiple = fixedWidth.getInteger(at: 8, as: UInt8.self)! != 0
         self.init(
             deliveryTag: deliveryTag,
             multiple: multiple
         )
+        #if CodecMetrics
+            CodecMetrics.shared.record(.decode, slot: 12, bytes: bytesCount, since: metricsStart)
+        #endif
     }
 
     var bytesCount: UInt32 { 1 + 8 }
 }
 
-extension Spec.Basic.Reject: FrameCodable {
+extension Spec.Basic.Reject: FrameCodable, FrameBufferWritable {
     func encode(to encoder: FrameEncoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 13, bytes: bytesCount, since: metricsStart) }
+        #endif
         try encoder.encode(deliveryTag)
         try encoder.encode(requeue)
     }
 
+    func write(into buffer: inout ByteBuffer) {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 13, bytes: bytesCount, since: metricsStart) }
+        #endif
+        buffer.writeInteger(deliveryTag)
+        buffer.writeInteger(UInt8(requeue ? 1 : 0))
+    }
+
     init(from decoder: FrameDecoderProtocol) throws {
-        let deliveryTag = try decoder.decode(Int64.self)
-        let requeue = try decoder.decode(Bool.self)
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+        #endif
+        let fixedWidth = try decoder.decodeBytes(count: 9)
+        let deliveryTag = fixedWidth.getInteger(at: 0, as: Int64.self)!
+        let requeue = fixedWidth.getInteger(at: 8, as: UInt8.self)! != 0
         self.init(
             deliveryTag: deliveryTag,
             requeue: requeue
         )
+        #if CodecMetrics
+            CodecMetrics.shared.record(.decode, slot: 13, bytes: bytesCount, since: metricsStart)
+        #endif
     }
 
     var bytesCount: UInt32 { 1 + 8 }
 }
 
-extension Spec.Basic.RecoverAsync: FrameCodable {
+extension Spec.Basic.RecoverAsync: FrameCodable, FrameBufferWritable {
     func encode(to encoder: FrameEncoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 14, bytes: bytesCount, since: metricsStart) }
+        #endif
         try encoder.encode(requeue)
     }
 
+    func write(into buffer: inout ByteBuffer) {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 14, bytes: bytesCount, since: metricsStart) }
+        #endif
+        buffer.writeInteger(UInt8(requeue ? 1 : 0))
+    }
+
     init(from decoder: FrameDecoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+        #endif
         let requeue = try decoder.decode(Bool.self)
         self.init(
             requeue: requeue
         )
+        #if CodecMetrics
+            CodecMetrics.shared.record(.decode, slot: 14, bytes: bytesCount, since: metricsStart)
+        #endif
     }
 
     var bytesCount: UInt32 { 1 }
 }
 
-extension Spec.Basic.Recover: FrameCodable {
+extension Spec.Basic.Recover: FrameCodable, FrameBufferWritable {
     func encode(to encoder: FrameEncoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 15, bytes: bytesCount, since: metricsStart) }
+        #endif
         try encoder.encode(requeue)
     }
 
+    func write(into buffer: inout ByteBuffer) {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 15, bytes: bytesCount, since: metricsStart) }
+        #endif
+        buffer.writeInteger(UInt8(requeue ? 1 : 0))
+    }
+
     init(from decoder: FrameDecoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+        #endif
         let requeue = try decoder.decode(Bool.self)
         self.init(
             requeue: requeue
         )
+        #if CodecMetrics
+            CodecMetrics.shared.record(.decode, slot: 15, bytes: bytesCount, since: metricsStart)
+        #endif
     }
 
     var bytesCount: UInt32 { 1 }
 }
 
-extension Spec.Basic.RecoverOk: FrameCodable {
+extension Spec.Basic.RecoverOk: FrameCodable, FrameBufferWritable {
     func encode(to encoder: FrameEncoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 16, bytes: bytesCount, since: metricsStart) }
+        #endif
+    }
+
+    func write(into buffer: inout ByteBuffer) {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 16, bytes: bytesCount, since: metricsStart) }
+        #endif
     }
 
     init(from decoder: FrameDecoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+        #endif
         self.init()
+        #if CodecMetrics
+            CodecMetrics.shared.record(.decode, slot: 16, bytes: bytesCount, since: metricsStart)
+        #endif
     }
 
     var bytesCount: UInt32 { 0 }
 }
 
-extension Spec.Basic.Nack: FrameCodable {
+extension Spec.Basic.Nack: FrameCodable, FrameBufferWritable {
     func encode(to encoder: FrameEncoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 17, bytes: bytesCount, since: metricsStart) }
+        #endif
         try encoder.encode(deliveryTag)
         var bitPack: UInt8 = 0
         if multiple { bitPack |= 1 << 0 }
@@ -369,9 +780,25 @@ extension Spec.Basic.Nack: FrameCodable {
         try encoder.encode(bitPack)
     }
 
+    func write(into buffer: inout ByteBuffer) {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 17, bytes: bytesCount, since: metricsStart) }
+        #endif
+        buffer.writeInteger(deliveryTag)
+        var bitPack: UInt8 = 0
+        if multiple { bitPack |= 1 << 0 }
+        if requeue { bitPack |= 1 << 1 }
+        buffer.writeInteger(bitPack)
+    }
+
     init(from decoder: FrameDecoderProtocol) throws {
-        let deliveryTag = try decoder.decode(Int64.self)
-        let bitPack: UInt8 = try decoder.decode(UInt8.self)
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+        #endif
+        let fixedWidth = try decoder.decodeBytes(count: 9)
+        let deliveryTag = fixedWidth.getInteger(at: 0, as: Int64.self)!
+        let bitPack = fixedWidth.getInteger(at: 8, as: UInt8.self)!
         let multiple: Bool = ((bitPack & (1 << 0)) != 0)
         let requeue: Bool = ((bitPack & (1 << 1)) != 0)
         self.init(
@@ -379,13 +806,20 @@ extension Spec.Basic.Nack: FrameCodable {
             multiple: multiple,
             requeue: requeue
         )
+        #if CodecMetrics
+            CodecMetrics.shared.record(.decode, slot: 17, bytes: bytesCount, since: metricsStart)
+        #endif
     }
 
     var bytesCount: UInt32 { 1 + 8 }
 }
 
-extension Spec.Connection.Start: FrameCodable {
+extension Spec.Connection.Start: FrameCodable, FrameBufferWritable {
     func encode(to encoder: FrameEncoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 18, bytes: bytesCount, since: metricsStart) }
+        #endif
         try encoder.encode(versionMajor)
         try encoder.encode(versionMinor)
         try encoder.encode(serverProperties)
@@ -393,9 +827,25 @@ extension Spec.Connection.Start: FrameCodable {
         try encoder.encode(locales, isLong: true)
     }
 
+    func write(into buffer: inout ByteBuffer) {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 18, bytes: bytesCount, since: metricsStart) }
+        #endif
+        buffer.writeInteger(versionMajor)
+        buffer.writeInteger(versionMinor)
+        buffer.writeTable(serverProperties)
+        buffer.writeLongString(mechanisms)
+        buffer.writeLongString(locales)
+    }
+
     init(from decoder: FrameDecoderProtocol) throws {
-        let versionMajor = try decoder.decode(Int8.self)
-        let versionMinor = try decoder.decode(Int8.self)
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+        #endif
+        let fixedWidth = try decoder.decodeBytes(count: 2)
+        let versionMajor = fixedWidth.getInteger(at: 0, as: Int8.self)!
+        let versionMinor = fixedWidth.getInteger(at: 1, as: Int8.self)!
         let serverProperties = try decoder.decode([String: FieldValue].self)
         let mechanisms = try decoder.decode(String.self, isLong: true)
         let locales = try decoder.decode(String.self, isLong: true)
@@ -406,20 +856,41 @@ extension Spec.Connection.Start: FrameCodable {
             mechanisms: mechanisms,
             locales: locales
         )
+        #if CodecMetrics
+            CodecMetrics.shared.record(.decode, slot: 18, bytes: bytesCount, since: metricsStart)
+        #endif
     }
 
     var bytesCount: UInt32 { 1 + 1 + locales.longBytesCount + mechanisms.longBytesCount + serverProperties.bytesCount }
 }
 
-extension Spec.Connection.StartOk: FrameCodable {
+extension Spec.Connection.StartOk: FrameCodable, FrameBufferWritable {
     func encode(to encoder: FrameEncoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 19, bytes: bytesCount, since: metricsStart) }
+        #endif
         try encoder.encode(clientProperties)
         try encoder.encode(mechanism, isLong: false)
         try encoder.encode(response, isLong: true)
         try encoder.encode(locale, isLong: false)
     }
 
+    func write(into buffer: inout ByteBuffer) {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 19, bytes: bytesCount, since: metricsStart) }
+        #endif
+        buffer.writeTable(clientProperties)
+        buffer.writeShortString(mechanism)
+        buffer.writeLongString(response)
+        buffer.writeShortString(locale)
+    }
+
     init(from decoder: FrameDecoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+        #endif
         let clientProperties = try decoder.decode([String: FieldValue].self)
         let mechanism = try decoder.decode(String.self, isLong: false)
         let response = try decoder.decode(String.self, isLong: true)
@@ -430,6 +901,9 @@ extension Spec.Connection.StartOk: FrameCodable {
             response: response,
             locale: locale
         )
+        #if CodecMetrics
+            CodecMetrics.shared.record(.decode, slot: 19, bytes: bytesCount, since: metricsStart)
+        #endif
     }
 
     var bytesCount: UInt32 {
@@ -438,86 +912,181 @@ extension Spec.Connection.StartOk: FrameCodable {
     }
 }
 
-extension Spec.Connection.Secure: FrameCodable {
+extension Spec.Connection.Secure: FrameCodable, FrameBufferWritable {
     func encode(to encoder: FrameEncoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 20, bytes: bytesCount, since: metricsStart) }
+        #endif
         try encoder.encode(challenge, isLong: true)
     }
 
+    func write(into buffer: inout ByteBuffer) {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 20, bytes: bytesCount, since: metricsStart) }
+        #endif
+        buffer.writeLongString(challenge)
+    }
+
     init(from decoder: FrameDecoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+        #endif
         let challenge = try decoder.decode(String.self, isLong: true)
         self.init(
             challenge: challenge
         )
+        #if CodecMetrics
+            CodecMetrics.shared.record(.decode, slot: 20, bytes: bytesCount, since: metricsStart)
+        #endif
     }
 
     var bytesCount: UInt32 { challenge.longBytesCount }
 }
 
-extension Spec.Connection.SecureOk: FrameCodable {
+extension Spec.Connection.SecureOk: FrameCodable, FrameBufferWritable {
     func encode(to encoder: FrameEncoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 21, bytes: bytesCount, since: metricsStart) }
+        #endif
         try encoder.encode(response, isLong: true)
     }
 
+    func write(into buffer: inout ByteBuffer) {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 21, bytes: bytesCount, since: metricsStart) }
+        #endif
+        buffer.writeLongString(response)
+    }
+
     init(from decoder: FrameDecoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+        #endif
         let response = try decoder.decode(String.self, isLong: true)
         self.init(
             response: response
         )
+        #if CodecMetrics
+            CodecMetrics.shared.record(.decode, slot: 21, bytes: bytesCount, since: metricsStart)
+        #endif
     }
 
     var bytesCount: UInt32 { response.longBytesCount }
 }
 
-extension Spec.Connection.Tune: FrameCodable {
+extension Spec.Connection.Tune: FrameCodable, FrameBufferWritable {
     func encode(to encoder: FrameEncoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 22, bytes: bytesCount, since: metricsStart) }
+        #endif
         try encoder.encode(channelMax)
         try encoder.encode(frameMax)
         try encoder.encode(heartbeat)
     }
 
+    func write(into buffer: inout ByteBuffer) {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 22, bytes: bytesCount, since: metricsStart) }
+        #endif
+        buffer.writeInteger(channelMax)
+        buffer.writeInteger(frameMax)
+        buffer.writeInteger(heartbeat)
+    }
+
     init(from decoder: FrameDecoderProtocol) throws {
-        let channelMax = try decoder.decode(UInt16.self)
-        let frameMax = try decoder.decode(Int32.self)
-        let heartbeat = try decoder.decode(UInt16.self)
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+        #endif
+        let fixedWidth = try decoder.decodeBytes(count: 8)
+        let channelMax = fixedWidth.getInteger(at: 0, as: UInt16.self)!
+        let frameMax = fixedWidth.getInteger(at: 2, as: Int32.self)!
+        let heartbeat = fixedWidth.getInteger(at: 6, as: UInt16.self)!
         self.init(
             channelMax: channelMax,
             frameMax: frameMax,
             heartbeat: heartbeat
         )
+        #if CodecMetrics
+            CodecMetrics.shared.record(.decode, slot: 22, bytes: bytesCount, since: metricsStart)
+        #endif
     }
 
     var bytesCount: UInt32 { 2 + 2 + 4 }
 }
 
-extension Spec.Connection.TuneOk: FrameCodable {
+extension Spec.Connection.TuneOk: FrameCodable, FrameBufferWritable {
     func encode(to encoder: FrameEncoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 23, bytes: bytesCount, since: metricsStart) }
+        #endif
         try encoder.encode(channelMax)
         try encoder.encode(frameMax)
         try encoder.encode(heartbeat)
     }
 
+    func write(into buffer: inout ByteBuffer) {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 23, bytes: bytesCount, since: metricsStart) }
+        #endif
+        buffer.writeInteger(channelMax)
+        buffer.writeInteger(frameMax)
+        buffer.writeInteger(heartbeat)
+    }
+
     init(from decoder: FrameDecoderProtocol) throws {
-        let channelMax = try decoder.decode(UInt16.self)
-        let frameMax = try decoder.decode(Int32.self)
-        let heartbeat = try decoder.decode(UInt16.self)
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+        #endif
+        let fixedWidth = try decoder.decodeBytes(count: 8)
+        let channelMax = fixedWidth.getInteger(at: 0, as: UInt16.self)!
+        let frameMax = fixedWidth.getInteger(at: 2, as: Int32.self)!
+        let heartbeat = fixedWidth.getInteger(at: 6, as: UInt16.self)!
         self.init(
             channelMax: channelMax,
             frameMax: frameMax,
             heartbeat: heartbeat
         )
+        #if CodecMetrics
+            CodecMetrics.shared.record(.decode, slot: 23, bytes: bytesCount, since: metricsStart)
+        #endif
     }
 
     var bytesCount: UInt32 { 2 + 2 + 4 }
 }
 
-extension Spec.Connection.Open: FrameCodable {
+extension Spec.Connection.Open: FrameCodable, FrameBufferWritable {
     func encode(to encoder: FrameEncoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 24, bytes: bytesCount, since: metricsStart) }
+        #endif
         try encoder.encode(virtualHost, isLong: false)
         try encoder.encode(capabilities, isLong: false)
         try encoder.encode(insist)
     }
 
+    func write(into buffer: inout ByteBuffer) {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 24, bytes: bytesCount, since: metricsStart) }
+        #endif
+        buffer.writeShortString(virtualHost)
+        buffer.writeShortString(capabilities)
+        buffer.writeInteger(UInt8(insist ? 1 : 0))
+    }
+
     init(from decoder: FrameDecoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+        #endif
         let virtualHost = try decoder.decode(String.self, isLong: false)
         let capabilities = try decoder.decode(String.self, isLong: false)
         let insist = try decoder.decode(Bool.self)
@@ -526,213 +1095,459 @@ extension Spec.Connection.Open: FrameCodable {
             capabilities: capabilities,
             insist: insist
         )
+        #if CodecMetrics
+            CodecMetrics.shared.record(.decode, slot: 24, bytes: bytesCount, since: metricsStart)
+        #endif
     }
 
     var bytesCount: UInt32 { 1 + UInt32(capabilities.shortBytesCount) + UInt32(virtualHost.shortBytesCount) }
 }
 
-extension Spec.Connection.OpenOk: FrameCodable {
+extension Spec.Connection.OpenOk: FrameCodable, FrameBufferWritable {
     func encode(to encoder: FrameEncoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 25, bytes: bytesCount, since: metricsStart) }
+        #endif
         try encoder.encode(knownHosts, isLong: false)
     }
 
+    func write(into buffer: inout ByteBuffer) {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 25, bytes: bytesCount, since: metricsStart) }
+        #endif
+        buffer.writeShortString(knownHosts)
+    }
+
     init(from decoder: FrameDecoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+        #endif
         let knownHosts = try decoder.decode(String.self, isLong: false)
         self.init(
             knownHosts: knownHosts
         )
+        #if CodecMetrics
+            CodecMetrics.shared.record(.decode, slot: 25, bytes: bytesCount, since: metricsStart)
+        #endif
     }
 
     var bytesCount: UInt32 { UInt32(knownHosts.shortBytesCount) }
 }
 
-extension Spec.Connection.Close: FrameCodable {
+extension Spec.Connection.Close: FrameCodable, FrameBufferWritable {
     func encode(to encoder: FrameEncoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 26, bytes: bytesCount, since: metricsStart) }
+        #endif
         try encoder.encode(replyCode)
         try encoder.encode(replyText, isLong: false)
         try encoder.encode(classId)
         try encoder.encode(methodId)
     }
 
+    func write(into buffer: inout ByteBuffer) {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 26, bytes: bytesCount, since: metricsStart) }
+        #endif
+        buffer.writeInteger(replyCode)
+        buffer.writeShortString(replyText)
+        buffer.writeInteger(classId)
+        buffer.writeInteger(methodId)
+    }
+
     init(from decoder: FrameDecoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+        #endif
         let replyCode = try decoder.decode(UInt16.self)
         let replyText = try decoder.decode(String.self, isLong: false)
-        let classId = try decoder.decode(UInt16.self)
-        let methodId = try decoder.decode(UInt16.self)
+        let fixedWidth = try decoder.decodeBytes(count: 4)
+        let classId = fixedWidth.getInteger(at: 0, as: UInt16.self)!
+        let methodId = fixedWidth.getInteger(at: 2, as: UInt16.self)!
         self.init(
             replyCode: replyCode,
             replyText: replyText,
             classId: classId,
             methodId: methodId
         )
+        #if CodecMetrics
+            CodecMetrics.shared.record(.decode, slot: 26, bytes: bytesCount, since: metricsStart)
+        #endif
     }
 
     var bytesCount: UInt32 { 2 + 2 + 2 + UInt32(replyText.shortBytesCount) }
 }
 
-extension Spec.Connection.CloseOk: FrameCodable {
+extension Spec.Connection.CloseOk: FrameCodable, FrameBufferWritable {
     func encode(to encoder: FrameEncoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 27, bytes: bytesCount, since: metricsStart) }
+        #endif
+    }
+
+    func write(into buffer: inout ByteBuffer) {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 27, bytes: bytesCount, since: metricsStart) }
+        #endif
     }
 
     init(from decoder: FrameDecoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+        #endif
         self.init()
+        #if CodecMetrics
+            CodecMetrics.shared.record(.decode, slot: 27, bytes: bytesCount, since: metricsStart)
+        #endif
     }
 
     var bytesCount: UInt32 { 0 }
 }
 
-extension Spec.Connection.Blocked: FrameCodable {
+extension Spec.Connection.Blocked: FrameCodable, FrameBufferWritable {
     func encode(to encoder: FrameEncoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 28, bytes: bytesCount, since: metricsStart) }
+        #endif
         try encoder.encode(reason, isLong: false)
     }
 
+    func write(into buffer: inout ByteBuffer) {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 28, bytes: bytesCount, since: metricsStart) }
+        #endif
+        buffer.writeShortString(reason)
+    }
+
     init(from decoder: FrameDecoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+        #endif
         let reason = try decoder.decode(String.self, isLong: false)
         self.init(
             reason: reason
         )
+        #if CodecMetrics
+            CodecMetrics.shared.record(.decode, slot: 28, bytes: bytesCount, since: metricsStart)
+        #endif
     }
 
     var bytesCount: UInt32 { UInt32(reason.shortBytesCount) }
 }
 
-extension Spec.Connection.Unblocked: FrameCodable {
+extension Spec.Connection.Unblocked: FrameCodable, FrameBufferWritable {
     func encode(to encoder: FrameEncoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 29, bytes: bytesCount, since: metricsStart) }
+        #endif
+    }
+
+    func write(into buffer: inout ByteBuffer) {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 29, bytes: bytesCount, since: metricsStart) }
+        #endif
     }
 
     init(from decoder: FrameDecoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+        #endif
         self.init()
+        #if CodecMetrics
+            CodecMetrics.shared.record(.decode, slot: 29, bytes: bytesCount, since: metricsStart)
+        #endif
     }
 
     var bytesCount: UInt32 { 0 }
 }
 
-extension Spec.Connection.UpdateSecret: FrameCodable {
+extension Spec.Connection.UpdateSecret: FrameCodable, FrameBufferWritable {
     func encode(to encoder: FrameEncoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 30, bytes: bytesCount, since: metricsStart) }
+        #endif
         try encoder.encode(newSecret, isLong: true)
         try encoder.encode(reason, isLong: false)
     }
 
+    func write(into buffer: inout ByteBuffer) {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 30, bytes: bytesCount, since: metricsStart) }
+        #endif
+        buffer.writeLongString(newSecret)
+        buffer.writeShortString(reason)
+    }
+
     init(from decoder: FrameDecoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+        #endif
         let newSecret = try decoder.decode(String.self, isLong: true)
         let reason = try decoder.decode(String.self, isLong: false)
         self.init(
             newSecret: newSecret,
             reason: reason
         )
+        #if CodecMetrics
+            CodecMetrics.shared.record(.decode, slot: 30, bytes: bytesCount, since: metricsStart)
+        #endif
     }
 
     var bytesCount: UInt32 { UInt32(reason.shortBytesCount) + newSecret.longBytesCount }
 }
 
-extension Spec.Connection.UpdateSecretOk: FrameCodable {
+extension Spec.Connection.UpdateSecretOk: FrameCodable, FrameBufferWritable {
     func encode(to encoder: FrameEncoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 31, bytes: bytesCount, since: metricsStart) }
+        #endif
+    }
+
+    func write(into buffer: inout ByteBuffer) {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 31, bytes: bytesCount, since: metricsStart) }
+        #endif
     }
 
     init(from decoder: FrameDecoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+        #endif
         self.init()
+        #if CodecMetrics
+            CodecMetrics.shared.record(.decode, slot: 31, bytes: bytesCount, since: metricsStart)
+        #endif
     }
 
     var bytesCount: UInt32 { 0 }
 }
 
-extension Spec.Channel.Open: FrameCodable {
+extension Spec.Channel.Open: FrameCodable, FrameBufferWritable {
     func encode(to encoder: FrameEncoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 32, bytes: bytesCount, since: metricsStart) }
+        #endif
         try encoder.encode(outOfBand, isLong: false)
     }
 
+    func write(into buffer: inout ByteBuffer) {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 32, bytes: bytesCount, since: metricsStart) }
+        #endif
+        buffer.writeShortString(outOfBand)
+    }
+
     init(from decoder: FrameDecoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+        #endif
         let outOfBand = try decoder.decode(String.self, isLong: false)
         self.init(
             outOfBand: outOfBand
         )
+        #if CodecMetrics
+            CodecMetrics.shared.record(.decode, slot: 32, bytes: bytesCount, since: metricsStart)
+        #endif
     }
 
     var bytesCount: UInt32 { UInt32(outOfBand.shortBytesCount) }
 }
 
-extension Spec.Channel.OpenOk: FrameCodable {
+extension Spec.Channel.OpenOk: FrameCodable, FrameBufferWritable {
     func encode(to encoder: FrameEncoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 33, bytes: bytesCount, since: metricsStart) }
+        #endif
         try encoder.encode(channelId, isLong: true)
     }
 
+    func write(into buffer: inout ByteBuffer) {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 33, bytes: bytesCount, since: metricsStart) }
+        #endif
+        buffer.writeLongString(channelId)
+    }
+
     init(from decoder: FrameDecoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+        #endif
         let channelId = try decoder.decode(String.self, isLong: true)
         self.init(
             channelId: channelId
         )
+        #if CodecMetrics
+            CodecMetrics.shared.record(.decode, slot: 33, bytes: bytesCount, since: metricsStart)
+        #endif
     }
 
     var bytesCount: UInt32 { channelId.longBytesCount }
 }
 
-extension Spec.Channel.Flow: FrameCodable {
+extension Spec.Channel.Flow: FrameCodable, FrameBufferWritable {
     func encode(to encoder: FrameEncoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 34, bytes: bytesCount, since: metricsStart) }
+        #endif
         try encoder.encode(active)
     }
 
+    func write(into buffer: inout ByteBuffer) {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 34, bytes: bytesCount, since: metricsStart) }
+        #endif
+        buffer.writeInteger(UInt8(active ? 1 : 0))
+    }
+
     init(from decoder: FrameDecoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+        #endif
         let active = try decoder.decode(Bool.self)
         self.init(
             active: active
         )
+        #if CodecMetrics
+            CodecMetrics.shared.record(.decode, slot: 34, bytes: bytesCount, since: metricsStart)
+        #endif
     }
 
     var bytesCount: UInt32 { 1 }
 }
 
-extension Spec.Channel.FlowOk: FrameCodable {
+extension Spec.Channel.FlowOk: FrameCodable, FrameBufferWritable {
     func encode(to encoder: FrameEncoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 35, bytes: bytesCount, since: metricsStart) }
+        #endif
         try encoder.encode(active)
     }
 
+    func write(into buffer: inout ByteBuffer) {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 35, bytes: bytesCount, since: metricsStart) }
+        #endif
+        buffer.writeInteger(UInt8(active ? 1 : 0))
+    }
+
     init(from decoder: FrameDecoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+        #endif
         let active = try decoder.decode(Bool.self)
         self.init(
             active: active
         )
+        #if CodecMetrics
+            CodecMetrics.shared.record(.decode, slot: 35, bytes: bytesCount, since: metricsStart)
+        #endif
     }
 
     var bytesCount: UInt32 { 1 }
 }
 
-extension Spec.Channel.Close: FrameCodable {
+extension Spec.Channel.Close: FrameCodable, FrameBufferWritable {
     func encode(to encoder: FrameEncoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 36, bytes: bytesCount, since: metricsStart) }
+        #endif
         try encoder.encode(replyCode)
         try encoder.encode(replyText, isLong: false)
         try encoder.encode(classId)
         try encoder.encode(methodId)
     }
 
+    func write(into buffer: inout ByteBuffer) {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 36, bytes: bytesCount, since: metricsStart) }
+        #endif
+        buffer.writeInteger(replyCode)
+        buffer.writeShortString(replyText)
+        buffer.writeInteger(classId)
+        buffer.writeInteger(methodId)
+    }
+
     init(from decoder: FrameDecoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+        #endif
         let replyCode = try decoder.decode(UInt16.self)
         let replyText = try decoder.decode(String.self, isLong: false)
-        let classId = try decoder.decode(UInt16.self)
-        let methodId = try decoder.decode(UInt16.self)
+        let fixedWidth = try decoder.decodeBytes(count: 4)
+        let classId = fixedWidth.getInteger(at: 0, as: UInt16.self)!
+        let methodId = fixedWidth.getInteger(at: 2, as: UInt16.self)!
         self.init(
             replyCode: replyCode,
             replyText: replyText,
             classId: classId,
             methodId: methodId
         )
+        #if CodecMetrics
+            CodecMetrics.shared.record(.decode, slot: 36, bytes: bytesCount, since: metricsStart)
+        #endif
     }
 
     var bytesCount: UInt32 { 2 + 2 + 2 + UInt32(replyText.shortBytesCount) }
 }
 
-extension Spec.Channel.CloseOk: FrameCodable {
+extension Spec.Channel.CloseOk: FrameCodable, FrameBufferWritable {
     func encode(to encoder: FrameEncoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 37, bytes: bytesCount, since: metricsStart) }
+        #endif
+    }
+
+    func write(into buffer: inout ByteBuffer) {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 37, bytes: bytesCount, since: metricsStart) }
+        #endif
     }
 
     init(from decoder: FrameDecoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+        #endif
         self.init()
+        #if CodecMetrics
+            CodecMetrics.shared.record(.decode, slot: 37, bytes: bytesCount, since: metricsStart)
+        #endif
     }
 
     var bytesCount: UInt32 { 0 }
 }
 
-extension Spec.Access.Request: FrameCodable {
+extension Spec.Access.Request: FrameCodable, FrameBufferWritable {
     func encode(to encoder: FrameEncoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 38, bytes: bytesCount, since: metricsStart) }
+        #endif
         try encoder.encode(realm, isLong: false)
         var bitPack: UInt8 = 0
         if exclusive { bitPack |= 1 << 0 }
@@ -743,7 +1558,25 @@ extension Spec.Access.Request: FrameCodable {
         try encoder.encode(bitPack)
     }
 
+    func write(into buffer: inout ByteBuffer) {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 38, bytes: bytesCount, since: metricsStart) }
+        #endif
+        buffer.writeShortString(realm)
+        var bitPack: UInt8 = 0
+        if exclusive { bitPack |= 1 << 0 }
+        if passive { bitPack |= 1 << 1 }
+        if active { bitPack |= 1 << 2 }
+        if write { bitPack |= 1 << 3 }
+        if read { bitPack |= 1 << 4 }
+        buffer.writeInteger(bitPack)
+    }
+
     init(from decoder: FrameDecoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+        #endif
         let realm = try decoder.decode(String.self, isLong: false)
         let bitPack: UInt8 = try decoder.decode(UInt8.self)
         let exclusive: Bool = ((bitPack & (1 << 0)) != 0)
@@ -759,28 +1592,53 @@ extension Spec.Access.Request: FrameCodable {
             write: write,
             read: read
         )
+        #if CodecMetrics
+            CodecMetrics.shared.record(.decode, slot: 38, bytes: bytesCount, since: metricsStart)
+        #endif
     }
 
     var bytesCount: UInt32 { 1 + UInt32(realm.shortBytesCount) }
 }
 
-extension Spec.Access.RequestOk: FrameCodable {
+extension Spec.Access.RequestOk: FrameCodable, FrameBufferWritable {
     func encode(to encoder: FrameEncoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 39, bytes: bytesCount, since: metricsStart) }
+        #endif
         try encoder.encode(ticket)
     }
 
+    func write(into buffer: inout ByteBuffer) {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 39, bytes: bytesCount, since: metricsStart) }
+        #endif
+        buffer.writeInteger(ticket)
+    }
+
     init(from decoder: FrameDecoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+        #endif
         let ticket = try decoder.decode(UInt16.self)
         self.init(
             ticket: ticket
         )
+        #if CodecMetrics
+            CodecMetrics.shared.record(.decode, slot: 39, bytes: bytesCount, since: metricsStart)
+        #endif
     }
 
     var bytesCount: UInt32 { 2 }
 }
 
-extension Spec.Exchange.Declare: FrameCodable {
+extension Spec.Exchange.Declare: FrameCodable, FrameBufferWritable {
     func encode(to encoder: FrameEncoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 40, bytes: bytesCount, since: metricsStart) }
+        #endif
         try encoder.encode(ticket)
         try encoder.encode(exchange, isLong: false)
         try encoder.encode(type, isLong: false)
@@ -794,7 +1652,28 @@ extension Spec.Exchange.Declare: FrameCodable {
         try encoder.encode(arguments)
     }
 
+    func write(into buffer: inout ByteBuffer) {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 40, bytes: bytesCount, since: metricsStart) }
+        #endif
+        buffer.writeInteger(ticket)
+        buffer.writeShortString(exchange)
+        buffer.writeShortString(type)
+        var bitPack: UInt8 = 0
+        if passive { bitPack |= 1 << 0 }
+        if durable { bitPack |= 1 << 1 }
+        if autoDelete { bitPack |= 1 << 2 }
+        if `internal` { bitPack |= 1 << 3 }
+        if nowait { bitPack |= 1 << 4 }
+        buffer.writeInteger(bitPack)
+        buffer.writeTable(arguments)
+    }
+
     init(from decoder: FrameDecoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+        #endif
         let ticket = try decoder.decode(UInt16.self)
         let exchange = try decoder.decode(String.self, isLong: false)
         let type = try decoder.decode(String.self, isLong: false)
@@ -816,6 +1695,9 @@ extension Spec.Exchange.Declare: FrameCodable {
             nowait: nowait,
             arguments: arguments
         )
+        #if CodecMetrics
+            CodecMetrics.shared.record(.decode, slot: 40, bytes: bytesCount, since: metricsStart)
+        #endif
     }
 
     var bytesCount: UInt32 {
@@ -823,19 +1705,40 @@ extension Spec.Exchange.Declare: FrameCodable {
     }
 }
 
-extension Spec.Exchange.DeclareOk: FrameCodable {
+extension Spec.Exchange.DeclareOk: FrameCodable, FrameBufferWritable {
     func encode(to encoder: FrameEncoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 41, bytes: bytesCount, since: metricsStart) }
+        #endif
+    }
+
+    func write(into buffer: inout ByteBuffer) {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 41, bytes: bytesCount, since: metricsStart) }
+        #endif
     }
 
     init(from decoder: FrameDecoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+        #endif
         self.init()
+        #if CodecMetrics
+            CodecMetrics.shared.record(.decode, slot: 41, bytes: bytesCount, since: metricsStart)
+        #endif
     }
 
     var bytesCount: UInt32 { 0 }
 }
 
-extension Spec.Exchange.Delete: FrameCodable {
+extension Spec.Exchange.Delete: FrameCodable, FrameBufferWritable {
     func encode(to encoder: FrameEncoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 42, bytes: bytesCount, since: metricsStart) }
+        #endif
         try encoder.encode(ticket)
         try encoder.encode(exchange, isLong: false)
         var bitPack: UInt8 = 0
@@ -844,7 +1747,23 @@ extension Spec.Exchange.Delete: FrameCodable {
         try encoder.encode(bitPack)
     }
 
+    func write(into buffer: inout ByteBuffer) {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 42, bytes: bytesCount, since: metricsStart) }
+        #endif
+        buffer.writeInteger(ticket)
+        buffer.writeShortString(exchange)
+        var bitPack: UInt8 = 0
+        if ifUnused { bitPack |= 1 << 0 }
+        if nowait { bitPack |= 1 << 1 }
+        buffer.writeInteger(bitPack)
+    }
+
     init(from decoder: FrameDecoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+        #endif
         let ticket = try decoder.decode(UInt16.self)
         let exchange = try decoder.decode(String.self, isLong: false)
         let bitPack: UInt8 = try decoder.decode(UInt8.self)
@@ -856,24 +1775,48 @@ extension Spec.Exchange.Delete: FrameCodable {
             ifUnused: ifUnused,
             nowait: nowait
         )
+        #if CodecMetrics
+            CodecMetrics.shared.record(.decode, slot: 42, bytes: bytesCount, since: metricsStart)
+        #endif
     }
 
     var bytesCount: UInt32 { 1 + 2 + UInt32(exchange.shortBytesCount) }
 }
 
-extension Spec.Exchange.DeleteOk: FrameCodable {
+extension Spec.Exchange.DeleteOk: FrameCodable, FrameBufferWritable {
     func encode(to encoder: FrameEncoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 43, bytes: bytesCount, since: metricsStart) }
+        #endif
+    }
+
+    func write(into buffer: inout ByteBuffer) {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 43, bytes: bytesCount, since: metricsStart) }
+        #endif
     }
 
     init(from decoder: FrameDecoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+        #endif
         self.init()
+        #if CodecMetrics
+            CodecMetrics.shared.record(.decode, slot: 43, bytes: bytesCount, since: metricsStart)
+        #endif
     }
 
     var bytesCount: UInt32 { 0 }
 }
 
-extension Spec.Exchange.Bind: FrameCodable {
+extension Spec.Exchange.Bind: FrameCodable, FrameBufferWritable {
     func encode(to encoder: FrameEncoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 44, bytes: bytesCount, since: metricsStart) }
+        #endif
         try encoder.encode(ticket)
         try encoder.encode(destination, isLong: false)
         try encoder.encode(source, isLong: false)
@@ -882,7 +1825,23 @@ extension Spec.Exchange.Bind: FrameCodable {
         try encoder.encode(arguments)
     }
 
+    func write(into buffer: inout ByteBuffer) {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 44, bytes: bytesCount, since: metricsStart) }
+        #endif
+        buffer.writeInteger(ticket)
+        buffer.writeShortString(destination)
+        buffer.writeShortString(source)
+        buffer.writeShortString(routingKey)
+        buffer.writeInteger(UInt8(nowait ? 1 : 0))
+        buffer.writeTable(arguments)
+    }
+
     init(from decoder: FrameDecoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+        #endif
         let ticket = try decoder.decode(UInt16.self)
         let destination = try decoder.decode(String.self, isLong: false)
         let source = try decoder.decode(String.self, isLong: false)
@@ -897,6 +1856,9 @@ extension Spec.Exchange.Bind: FrameCodable {
             nowait: nowait,
             arguments: arguments
         )
+        #if CodecMetrics
+            CodecMetrics.shared.record(.decode, slot: 44, bytes: bytesCount, since: metricsStart)
+        #endif
     }
 
     var bytesCount: UInt32 {
@@ -905,19 +1867,40 @@ extension Spec.Exchange.Bind: FrameCodable {
     }
 }
 
-extension Spec.Exchange.BindOk: FrameCodable {
+extension Spec.Exchange.BindOk: FrameCodable, FrameBufferWritable {
     func encode(to encoder: FrameEncoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 45, bytes: bytesCount, since: metricsStart) }
+        #endif
+    }
+
+    func write(into buffer: inout ByteBuffer) {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 45, bytes: bytesCount, since: metricsStart) }
+        #endif
     }
 
     init(from decoder: FrameDecoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+        #endif
         self.init()
+        #if CodecMetrics
+            CodecMetrics.shared.record(.decode, slot: 45, bytes: bytesCount, since: metricsStart)
+        #endif
     }
 
     var bytesCount: UInt32 { 0 }
 }
 
-extension Spec.Exchange.Unbind: FrameCodable {
+extension Spec.Exchange.Unbind: FrameCodable, FrameBufferWritable {
     func encode(to encoder: FrameEncoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 46, bytes: bytesCount, since: metricsStart) }
+        #endif
         try encoder.encode(ticket)
         try encoder.encode(destination, isLong: false)
         try encoder.encode(source, isLong: false)
@@ -926,7 +1909,23 @@ extension Spec.Exchange.Unbind: FrameCodable {
         try encoder.encode(arguments)
     }
 
+    func write(into buffer: inout ByteBuffer) {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 46, bytes: bytesCount, since: metricsStart) }
+        #endif
+        buffer.writeInteger(ticket)
+        buffer.writeShortString(destination)
+        buffer.writeShortString(source)
+        buffer.writeShortString(routingKey)
+        buffer.writeInteger(UInt8(nowait ? 1 : 0))
+        buffer.writeTable(arguments)
+    }
+
     init(from decoder: FrameDecoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+        #endif
         let ticket = try decoder.decode(UInt16.self)
         let destination = try decoder.decode(String.self, isLong: false)
         let source = try decoder.decode(String.self, isLong: false)
@@ -941,6 +1940,9 @@ extension Spec.Exchange.Unbind: FrameCodable {
             nowait: nowait,
             arguments: arguments
         )
+        #if CodecMetrics
+            CodecMetrics.shared.record(.decode, slot: 46, bytes: bytesCount, since: metricsStart)
+        #endif
     }
 
     var bytesCount: UInt32 {
@@ -949,19 +1951,40 @@ extension Spec.Exchange.Unbind: FrameCodable {
     }
 }
 
-extension Spec.Exchange.UnbindOk: FrameCodable {
+extension Spec.Exchange.UnbindOk: FrameCodable, FrameBufferWritable {
     func encode(to encoder: FrameEncoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 47, bytes: bytesCount, since: metricsStart) }
+        #endif
+    }
+
+    func write(into buffer: inout ByteBuffer) {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 47, bytes: bytesCount, since: metricsStart) }
+        #endif
     }
 
     init(from decoder: FrameDecoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+        #endif
         self.init()
+        #if CodecMetrics
+            CodecMetrics.shared.record(.decode, slot: 47, bytes: bytesCount, since: metricsStart)
+        #endif
     }
 
     var bytesCount: UInt32 { 0 }
 }
 
-extension Spec.Queue.Declare: FrameCodable {
+extension Spec.Queue.Declare: FrameCodable, FrameBufferWritable {
     func encode(to encoder: FrameEncoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 48, bytes: bytesCount, since: metricsStart) }
+        #endif
         try encoder.encode(ticket)
         try encoder.encode(queue, isLong: false)
         var bitPack: UInt8 = 0
@@ -974,7 +1997,27 @@ extension Spec.Queue.Declare: FrameCodable {
         try encoder.encode(arguments)
     }
 
+    func write(into buffer: inout ByteBuffer) {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 48, bytes: bytesCount, since: metricsStart) }
+        #endif
+        buffer.writeInteger(ticket)
+        buffer.writeShortString(queue)
+        var bitPack: UInt8 = 0
+        if passive { bitPack |= 1 << 0 }
+        if durable { bitPack |= 1 << 1 }
+        if exclusive { bitPack |= 1 << 2 }
+        if autoDelete { bitPack |= 1 << 3 }
+        if nowait { bitPack |= 1 << 4 }
+        buffer.writeInteger(bitPack)
+        buffer.writeTable(arguments)
+    }
+
     init(from decoder: FrameDecoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+        #endif
         let ticket = try decoder.decode(UInt16.self)
         let queue = try decoder.decode(String.self, isLong: false)
         let bitPack: UInt8 = try decoder.decode(UInt8.self)
@@ -994,34 +2037,62 @@ extension Spec.Queue.Declare: FrameCodable {
             nowait: nowait,
             arguments: arguments
         )
+        #if CodecMetrics
+            CodecMetrics.shared.record(.decode, slot: 48, bytes: bytesCount, since: metricsStart)
+        #endif
     }
 
     var bytesCount: UInt32 { 1 + 2 + UInt32(queue.shortBytesCount) + arguments.bytesCount }
 }
 
-extension Spec.Queue.DeclareOk: FrameCodable {
+extension Spec.Queue.DeclareOk: FrameCodable, FrameBufferWritable {
     func encode(to encoder: FrameEncoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 49, bytes: bytesCount, since: metricsStart) }
+        #endif
         try encoder.encode(queue, isLong: false)
         try encoder.encode(messageCount)
         try encoder.encode(consumerCount)
     }
 
+    func write(into buffer: inout ByteBuffer) {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 49, bytes: bytesCount, since: metricsStart) }
+        #endif
+        buffer.writeShortString(queue)
+        buffer.writeInteger(messageCount)
+        buffer.writeInteger(consumerCount)
+    }
+
     init(from decoder: FrameDecoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+        #endif
         let queue = try decoder.decode(String.self, isLong: false)
-        let messageCount = try decoder.decode(Int32.self)
-        let consumerCount = try decoder.decode(Int32.self)
+        let fixedWidth = try decoder.decodeBytes(count: 8)
+        let messageCount = fixedWidth.getInteger(at: 0, as: Int32.self)!
+        let consumerCount = fixedWidth.getInteger(at: 4, as: Int32.self)!
         self.init(
             queue: queue,
             messageCount: messageCount,
             consumerCount: consumerCount
         )
+        #if CodecMetrics
+            CodecMetrics.shared.record(.decode, slot: 49, bytes: bytesCount, since: metricsStart)
+        #endif
     }
 
     var bytesCount: UInt32 { 4 + 4 + UInt32(queue.shortBytesCount) }
 }
 
-extension Spec.Queue.Bind: FrameCodable {
+extension Spec.Queue.Bind: FrameCodable, FrameBufferWritable {
     func encode(to encoder: FrameEncoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 50, bytes: bytesCount, since: metricsStart) }
+        #endif
         try encoder.encode(ticket)
         try encoder.encode(queue, isLong: false)
         try encoder.encode(exchange, isLong: false)
@@ -1030,7 +2101,23 @@ extension Spec.Queue.Bind: FrameCodable {
         try encoder.encode(arguments)
     }
 
+    func write(into buffer: inout ByteBuffer) {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 50, bytes: bytesCount, since: metricsStart) }
+        #endif
+        buffer.writeInteger(ticket)
+        buffer.writeShortString(queue)
+        buffer.writeShortString(exchange)
+        buffer.writeShortString(routingKey)
+        buffer.writeInteger(UInt8(nowait ? 1 : 0))
+        buffer.writeTable(arguments)
+    }
+
     init(from decoder: FrameDecoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+        #endif
         let ticket = try decoder.decode(UInt16.self)
         let queue = try decoder.decode(String.self, isLong: false)
         let exchange = try decoder.decode(String.self, isLong: false)
@@ -1045,6 +2132,9 @@ extension Spec.Queue.Bind: FrameCodable {
             nowait: nowait,
             arguments: arguments
         )
+        #if CodecMetrics
+            CodecMetrics.shared.record(.decode, slot: 50, bytes: bytesCount, since: metricsStart)
+        #endif
     }
 
     var bytesCount: UInt32 {
@@ -1053,25 +2143,59 @@ extension Spec.Queue.Bind: FrameCodable {
     }
 }
 
-extension Spec.Queue.BindOk: FrameCodable {
+extension Spec.Queue.BindOk: FrameCodable, FrameBufferWritable {
     func encode(to encoder: FrameEncoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 51, bytes: bytesCount, since: metricsStart) }
+        #endif
+    }
+
+    func write(into buffer: inout ByteBuffer) {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 51, bytes: bytesCount, since: metricsStart) }
+        #endif
     }
 
     init(from decoder: FrameDecoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+        #endif
         self.init()
+        #if CodecMetrics
+            CodecMetrics.shared.record(.decode, slot: 51, bytes: bytesCount, since: metricsStart)
+        #endif
     }
 
     var bytesCount: UInt32 { 0 }
 }
 
-extension Spec.Queue.Purge: FrameCodable {
+extension Spec.Queue.Purge: FrameCodable, FrameBufferWritable {
     func encode(to encoder: FrameEncoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 52, bytes: bytesCount, since: metricsStart) }
+        #endif
         try encoder.encode(ticket)
         try encoder.encode(queue, isLong: false)
         try encoder.encode(nowait)
     }
 
+    func write(into buffer: inout ByteBuffer) {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 52, bytes: bytesCount, since: metricsStart) }
+        #endif
+        buffer.writeInteger(ticket)
+        buffer.writeShortString(queue)
+        buffer.writeInteger(UInt8(nowait ? 1 : 0))
+    }
+
     init(from decoder: FrameDecoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+        #endif
         let ticket = try decoder.decode(UInt16.self)
         let queue = try decoder.decode(String.self, isLong: false)
         let nowait = try decoder.decode(Bool.self)
@@ -1080,28 +2204,53 @@ extension Spec.Queue.Purge: FrameCodable {
             queue: queue,
             nowait: nowait
         )
+        #if CodecMetrics
+            CodecMetrics.shared.record(.decode, slot: 52, bytes: bytesCount, since: metricsStart)
+        #endif
     }
 
     var bytesCount: UInt32 { 1 + 2 + UInt32(queue.shortBytesCount) }
 }
 
-extension Spec.Queue.PurgeOk: FrameCodable {
+extension Spec.Queue.PurgeOk: FrameCodable, FrameBufferWritable {
     func encode(to encoder: FrameEncoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 53, bytes: bytesCount, since: metricsStart) }
+        #endif
         try encoder.encode(messageCount)
     }
 
+    func write(into buffer: inout ByteBuffer) {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 53, bytes: bytesCount, since: metricsStart) }
+        #endif
+        buffer.writeInteger(messageCount)
+    }
+
     init(from decoder: FrameDecoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+        #endif
         let messageCount = try decoder.decode(Int32.self)
         self.init(
             messageCount: messageCount
         )
+        #if CodecMetrics
+            CodecMetrics.shared.record(.decode, slot: 53, bytes: bytesCount, since: metricsStart)
+        #endif
     }
 
     var bytesCount: UInt32 { 4 }
 }
 
-extension Spec.Queue.Delete: FrameCodable {
+extension Spec.Queue.Delete: FrameCodable, FrameBufferWritable {
     func encode(to encoder: FrameEncoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 54, bytes: bytesCount, since: metricsStart) }
+        #endif
         try encoder.encode(ticket)
         try encoder.encode(queue, isLong: false)
         var bitPack: UInt8 = 0
@@ -1111,7 +2260,24 @@ extension Spec.Queue.Delete: FrameCodable {
         try encoder.encode(bitPack)
     }
 
+    func write(into buffer: inout ByteBuffer) {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 54, bytes: bytesCount, since: metricsStart) }
+        #endif
+        buffer.writeInteger(ticket)
+        buffer.writeShortString(queue)
+        var bitPack: UInt8 = 0
+        if ifUnused { bitPack |= 1 << 0 }
+        if ifEmpty { bitPack |= 1 << 1 }
+        if nowait { bitPack |= 1 << 2 }
+        buffer.writeInteger(bitPack)
+    }
+
     init(from decoder: FrameDecoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+        #endif
         let ticket = try decoder.decode(UInt16.self)
         let queue = try decoder.decode(String.self, isLong: false)
         let bitPack: UInt8 = try decoder.decode(UInt8.self)
@@ -1125,28 +2291,53 @@ extension Spec.Queue.Delete: FrameCodable {
             ifEmpty: ifEmpty,
             nowait: nowait
         )
+        #if CodecMetrics
+            CodecMetrics.shared.record(.decode, slot: 54, bytes: bytesCount, since: metricsStart)
+        #endif
     }
 
     var bytesCount: UInt32 { 1 + 2 + UInt32(queue.shortBytesCount) }
 }
 
-extension Spec.Queue.DeleteOk: FrameCodable {
+extension Spec.Queue.DeleteOk: FrameCodable, FrameBufferWritable {
     func encode(to encoder: FrameEncoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 55, bytes: bytesCount, since: metricsStart) }
+        #endif
         try encoder.encode(messageCount)
     }
 
+    func write(into buffer: inout ByteBuffer) {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 55, bytes: bytesCount, since: metricsStart) }
+        #endif
+        buffer.writeInteger(messageCount)
+    }
+
     init(from decoder: FrameDecoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+        #endif
         let messageCount = try decoder.decode(Int32.self)
         self.init(
             messageCount: messageCount
         )
+        #if CodecMetrics
+            CodecMetrics.shared.record(.decode, slot: 55, bytes: bytesCount, since: metricsStart)
+        #endif
     }
 
     var bytesCount: UInt32 { 4 }
 }
 
-extension Spec.Queue.Unbind: FrameCodable {
+extension Spec.Queue.Unbind: FrameCodable, FrameBufferWritable {
     func encode(to encoder: FrameEncoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 56, bytes: bytesCount, since: metricsStart) }
+        #endif
         try encoder.encode(ticket)
         try encoder.encode(queue, isLong: false)
         try encoder.encode(exchange, isLong: false)
@@ -1154,7 +2345,22 @@ extension Spec.Queue.Unbind: FrameCodable {
         try encoder.encode(arguments)
     }
 
+    func write(into buffer: inout ByteBuffer) {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 56, bytes: bytesCount, since: metricsStart) }
+        #endif
+        buffer.writeInteger(ticket)
+        buffer.writeShortString(queue)
+        buffer.writeShortString(exchange)
+        buffer.writeShortString(routingKey)
+        buffer.writeTable(arguments)
+    }
+
     init(from decoder: FrameDecoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+        #endif
         let ticket = try decoder.decode(UInt16.self)
         let queue = try decoder.decode(String.self, isLong: false)
         let exchange = try decoder.decode(String.self, isLong: false)
@@ -1167,6 +2373,9 @@ extension Spec.Queue.Unbind: FrameCodable {
             routingKey: routingKey,
             arguments: arguments
         )
+        #if CodecMetrics
+            CodecMetrics.shared.record(.decode, slot: 56, bytes: bytesCount, since: metricsStart)
+        #endif
     }
 
     var bytesCount: UInt32 {
@@ -1175,104 +2384,258 @@ extension Spec.Queue.Unbind: FrameCodable {
     }
 }
 
-extension Spec.Queue.UnbindOk: FrameCodable {
+extension Spec.Queue.UnbindOk: FrameCodable, FrameBufferWritable {
     func encode(to encoder: FrameEncoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 57, bytes: bytesCount, since: metricsStart) }
+        #endif
+    }
+
+    func write(into buffer: inout ByteBuffer) {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 57, bytes: bytesCount, since: metricsStart) }
+        #endif
     }
 
     init(from decoder: FrameDecoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+        #endif
         self.init()
+        #if CodecMetrics
+            CodecMetrics.shared.record(.decode, slot: 57, bytes: bytesCount, since: metricsStart)
+        #endif
     }
 
     var bytesCount: UInt32 { 0 }
 }
 
-extension Spec.Tx.Select: FrameCodable {
+extension Spec.Tx.Select: FrameCodable, FrameBufferWritable {
     func encode(to encoder: FrameEncoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 58, bytes: bytesCount, since: metricsStart) }
+        #endif
+    }
+
+    func write(into buffer: inout ByteBuffer) {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 58, bytes: bytesCount, since: metricsStart) }
+        #endif
     }
 
     init(from decoder: FrameDecoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+        #endif
         self.init()
+        #if CodecMetrics
+            CodecMetrics.shared.record(.decode, slot: 58, bytes: bytesCount, since: metricsStart)
+        #endif
     }
 
     var bytesCount: UInt32 { 0 }
 }
 
-extension Spec.Tx.SelectOk: FrameCodable {
+extension Spec.Tx.SelectOk: FrameCodable, FrameBufferWritable {
     func encode(to encoder: FrameEncoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 59, bytes: bytesCount, since: metricsStart) }
+        #endif
+    }
+
+    func write(into buffer: inout ByteBuffer) {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 59, bytes: bytesCount, since: metricsStart) }
+        #endif
     }
 
     init(from decoder: FrameDecoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+        #endif
         self.init()
+        #if CodecMetrics
+            CodecMetrics.shared.record(.decode, slot: 59, bytes: bytesCount, since: metricsStart)
+        #endif
     }
 
     var bytesCount: UInt32 { 0 }
 }
 
-extension Spec.Tx.Commit: FrameCodable {
+extension Spec.Tx.Commit: FrameCodable, FrameBufferWritable {
     func encode(to encoder: FrameEncoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 60, bytes: bytesCount, since: metricsStart) }
+        #endif
+    }
+
+    func write(into buffer: inout ByteBuffer) {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 60, bytes: bytesCount, since: metricsStart) }
+        #endif
     }
 
     init(from decoder: FrameDecoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+        #endif
         self.init()
+        #if CodecMetrics
+            CodecMetrics.shared.record(.decode, slot: 60, bytes: bytesCount, since: metricsStart)
+        #endif
     }
 
     var bytesCount: UInt32 { 0 }
 }
 
-extension Spec.Tx.CommitOk: FrameCodable {
+extension Spec.Tx.CommitOk: FrameCodable, FrameBufferWritable {
     func encode(to encoder: FrameEncoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 61, bytes: bytesCount, since: metricsStart) }
+        #endif
+    }
+
+    func write(into buffer: inout ByteBuffer) {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 61, bytes: bytesCount, since: metricsStart) }
+        #endif
     }
 
     init(from decoder: FrameDecoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+        #endif
         self.init()
+        #if CodecMetrics
+            CodecMetrics.shared.record(.decode, slot: 61, bytes: bytesCount, since: metricsStart)
+        #endif
     }
 
     var bytesCount: UInt32 { 0 }
 }
 
-extension Spec.Tx.Rollback: FrameCodable {
+extension Spec.Tx.Rollback: FrameCodable, FrameBufferWritable {
     func encode(to encoder: FrameEncoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 62, bytes: bytesCount, since: metricsStart) }
+        #endif
+    }
+
+    func write(into buffer: inout ByteBuffer) {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 62, bytes: bytesCount, since: metricsStart) }
+        #endif
     }
 
     init(from decoder: FrameDecoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+        #endif
         self.init()
+        #if CodecMetrics
+            CodecMetrics.shared.record(.decode, slot: 62, bytes: bytesCount, since: metricsStart)
+        #endif
     }
 
     var bytesCount: UInt32 { 0 }
 }
 
-extension Spec.Tx.RollbackOk: FrameCodable {
+extension Spec.Tx.RollbackOk: FrameCodable, FrameBufferWritable {
     func encode(to encoder: FrameEncoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 63, bytes: bytesCount, since: metricsStart) }
+        #endif
+    }
+
+    func write(into buffer: inout ByteBuffer) {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 63, bytes: bytesCount, since: metricsStart) }
+        #endif
     }
 
     init(from decoder: FrameDecoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+        #endif
         self.init()
+        #if CodecMetrics
+            CodecMetrics.shared.record(.decode, slot: 63, bytes: bytesCount, since: metricsStart)
+        #endif
     }
 
     var bytesCount: UInt32 { 0 }
 }
 
-extension Spec.Confirm.Select: FrameCodable {
+extension Spec.Confirm.Select: FrameCodable, FrameBufferWritable {
     func encode(to encoder: FrameEncoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 64, bytes: bytesCount, since: metricsStart) }
+        #endif
         try encoder.encode(nowait)
     }
 
+    func write(into buffer: inout ByteBuffer) {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 64, bytes: bytesCount, since: metricsStart) }
+        #endif
+        buffer.writeInteger(UInt8(nowait ? 1 : 0))
+    }
+
     init(from decoder: FrameDecoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+        #endif
         let nowait = try decoder.decode(Bool.self)
         self.init(
             nowait: nowait
         )
+        #if CodecMetrics
+            CodecMetrics.shared.record(.decode, slot: 64, bytes: bytesCount, since: metricsStart)
+        #endif
     }
 
     var bytesCount: UInt32 { 1 }
 }
 
-extension Spec.Confirm.SelectOk: FrameCodable {
+extension Spec.Confirm.SelectOk: FrameCodable, FrameBufferWritable {
     func encode(to encoder: FrameEncoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 65, bytes: bytesCount, since: metricsStart) }
+        #endif
+    }
+
+    func write(into buffer: inout ByteBuffer) {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 65, bytes: bytesCount, since: metricsStart) }
+        #endif
     }
 
     init(from decoder: FrameDecoderProtocol) throws {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+        #endif
         self.init()
+        #if CodecMetrics
+            CodecMetrics.shared.record(.decode, slot: 65, bytes: bytesCount, since: metricsStart)
+        #endif
     }
 
     var bytesCount: UInt32 { 0 }
@@ -1350,7 +2713,313 @@ extension Spec {
         case (90, 31): return Spec.Tx.RollbackOk.init
         case (85, 10): return Spec.Confirm.Select.init
         case (85, 11): return Spec.Confirm.SelectOk.init
-        default: throw FramingError.unknownClassAndMethod(class: classId, method: methodId)
+        default:
+            #if CodecMetrics
+                CodecMetrics.shared.recordUnknownMethod()
+            #endif
+            throw FramingError.unknownClassAndMethod(class: classId, method: methodId)
         }
     }
 }
+
+#if CodecMetrics
+    extension Spec {
+        /// class id, method id and name of every method, indexed by the CodecMetrics slot
+        static let metricsSlots: [(classId: UInt16, methodId: UInt16, name: String)] = [
+            (60, 10, "basic.qos"),
+            (60, 11, "basic.qos-ok"),
+            (60, 20, "basic.consume"),
+            (60, 21, "basic.consume-ok"),
+            (60, 30, "basic.cancel"),
+            (60, 31, "basic.cancel-ok"),
+            (60, 40, "basic.publish"),
+            (60, 50, "basic.return"),
+            (60, 60, "basic.deliver"),
+            (60, 70, "basic.get"),
+            (60, 71, "basic.get-ok"),
+            (60, 72, "basic.get-empty"),
+            (60, 80, "basic.ack"),
+            (60, 90, "basic.reject"),
+            (60, 100, "basic.recover-async"),
+            (60, 110, "basic.recover"),
+            (60, 111, "basic.recover-ok"),
+            (60, 120, "basic.nack"),
+            (10, 10, "connection.start"),
+            (10, 11, "connection.start-ok"),
+            (10, 20, "connection.secure"),
+            (10, 21, "connection.secure-ok"),
+            (10, 30, "connection.tune"),
+            (10, 31, "connection.tune-ok"),
+            (10, 40, "connection.open"),
+            (10, 41, "connection.open-ok"),
+            (10, 50, "connection.close"),
+            (10, 51, "connection.close-ok"),
+            (10, 60, "connection.blocked"),
+            (10, 61, "connection.unblocked"),
+            (10, 70, "connection.update-secret"),
+            (10, 71, "connection.update-secret-ok"),
+            (20, 10, "channel.open"),
+            (20, 11, "channel.open-ok"),
+            (20, 20, "channel.flow"),
+            (20, 21, "channel.flow-ok"),
+            (20, 40, "channel.close"),
+            (20, 41, "channel.close-ok"),
+            (30, 10, "access.request"),
+            (30, 11, "access.request-ok"),
+            (40, 10, "exchange.declare"),
+            (40, 11, "exchange.declare-ok"),
+            (40, 20, "exchange.delete"),
+            (40, 21, "exchange.delete-ok"),
+            (40, 30, "exchange.bind"),
+            (40, 31, "exchange.bind-ok"),
+            (40, 40, "exchange.unbind"),
+            (40, 51, "exchange.unbind-ok"),
+            (50, 10, "queue.declare"),
+            (50, 11, "queue.declare-ok"),
+            (50, 20, "queue.bind"),
+            (50, 21, "queue.bind-ok"),
+            (50, 30, "queue.purge"),
+            (50, 31, "queue.purge-ok"),
+            (50, 40, "queue.delete"),
+            (50, 41, "queue.delete-ok"),
+            (50, 50, "queue.unbind"),
+            (50, 51, "queue.unbind-ok"),
+            (90, 10, "tx.select"),
+            (90, 11, "tx.select-ok"),
+            (90, 20, "tx.commit"),
+            (90, 21, "tx.commit-ok"),
+            (90, 30, "tx.rollback"),
+            (90, 31, "tx.rollback-ok"),
+            (85, 10, "confirm.select"),
+            (85, 11, "confirm.select-ok"),
+        ]
+
+        static func metricsSlot(with classId: UInt16, and methodId: UInt16) -> Int? {
+            switch (classId, methodId) {
+            case (60, 10): return 0
+            case (60, 11): return 1
+            case (60, 20): return 2
+            case (60, 21): return 3
+            case (60, 30): return 4
+            case (60, 31): return 5
+            case (60, 40): return 6
+            case (60, 50): return 7
+            case (60, 60): return 8
+            case (60, 70): return 9
+            case (60, 71): return 10
+            case (60, 72): return 11
+            case (60, 80): return 12
+            case (60, 90): return 13
+            case (60, 100): return 14
+            case (60, 110): return 15
+            case (60, 111): return 16
+            case (60, 120): return 17
+            case (10, 10): return 18
+            case (10, 11): return 19
+            case (10, 20): return 20
+            case (10, 21): return 21
+            case (10, 30): return 22
+            case (10, 31): return 23
+            case (10, 40): return 24
+            case (10, 41): return 25
+            case (10, 50): return 26
+            case (10, 51): return 27
+            case (10, 60): return 28
+            case (10, 61): return 29
+            case (10, 70): return 30
+            case (10, 71): return 31
+            case (20, 10): return 32
+            case (20, 11): return 33
+            case (20, 20): return 34
+            case (20, 21): return 35
+            case (20, 40): return 36
+            case (20, 41): return 37
+            case (30, 10): return 38
+            case (30, 11): return 39
+            case (40, 10): return 40
+            case (40, 11): return 41
+            case (40, 20): return 42
+            case (40, 21): return 43
+            case (40, 30): return 44
+            case (40, 31): return 45
+            case (40, 40): return 46
+            case (40, 51): return 47
+            case (50, 10): return 48
+            case (50, 11): return 49
+            case (50, 20): return 50
+            case (50, 21): return 51
+            case (50, 30): return 52
+            case (50, 31): return 53
+            case (50, 40): return 54
+            case (50, 41): return 55
+            case (50, 50): return 56
+            case (50, 51): return 57
+            case (90, 10): return 58
+            case (90, 11): return 59
+            case (90, 20): return 60
+            case (90, 21): return 61
+            case (90, 30): return 62
+            case (90, 31): return 63
+            case (85, 10): return 64
+            case (85, 11): return 65
+            default: return nil
+            }
+        }
+    }
+#endif
+
+extension Spec.BasicProperties: FrameCodable, FrameBufferWritable {
+    /// presence bits of the set properties, one value per flag word
+    var propertyFlags: UInt16 {
+        var flags0: UInt16 = 0
+        if contentType != nil { flags0 |= 1 << 15 }
+        if contentEncoding != nil { flags0 |= 1 << 14 }
+        if headers != nil { flags0 |= 1 << 13 }
+        if deliveryMode != nil { flags0 |= 1 << 12 }
+        if priority != nil { flags0 |= 1 << 11 }
+        if correlationId != nil { flags0 |= 1 << 10 }
+        if replyTo != nil { flags0 |= 1 << 9 }
+        if expiration != nil { flags0 |= 1 << 8 }
+        if messageId != nil { flags0 |= 1 << 7 }
+        if timestamp != nil { flags0 |= 1 << 6 }
+        if type != nil { flags0 |= 1 << 5 }
+        if userId != nil { flags0 |= 1 << 4 }
+        if appId != nil { flags0 |= 1 << 3 }
+        if clusterId != nil { flags0 |= 1 << 2 }
+        return flags0
+    }
+
+    func encode(to encoder: FrameEncoderProtocol) throws {
+        try encoder.encode(propertyFlags)
+        if let contentType { try encoder.encode(contentType, isLong: false) }
+        if let contentEncoding { try encoder.encode(contentEncoding, isLong: false) }
+        if let headers { try encoder.encode(headers) }
+        if let deliveryMode { try encoder.encode(deliveryMode) }
+        if let priority { try encoder.encode(priority) }
+        if let correlationId { try encoder.encode(correlationId, isLong: false) }
+        if let replyTo { try encoder.encode(replyTo, isLong: false) }
+        if let expiration { try encoder.encode(expiration, isLong: false) }
+        if let messageId { try encoder.encode(messageId, isLong: false) }
+        if let timestamp { try encoder.encode(timestamp) }
+        if let type { try encoder.encode(type, isLong: false) }
+        if let userId { try encoder.encode(userId, isLong: false) }
+        if let appId { try encoder.encode(appId, isLong: false) }
+        if let clusterId { try encoder.encode(clusterId, isLong: false) }
+    }
+
+    func write(into buffer: inout ByteBuffer) {
+        buffer.writeInteger(propertyFlags)
+        if let contentType { buffer.writeShortString(contentType) }
+        if let contentEncoding { buffer.writeShortString(contentEncoding) }
+        if let headers { buffer.writeTable(headers) }
+        if let deliveryMode { buffer.writeInteger(deliveryMode) }
+        if let priority { buffer.writeInteger(priority) }
+        if let correlationId { buffer.writeShortString(correlationId) }
+        if let replyTo { buffer.writeShortString(replyTo) }
+        if let expiration { buffer.writeShortString(expiration) }
+        if let messageId { buffer.writeShortString(messageId) }
+        if let timestamp { buffer.writeInteger(timestamp.millisecondsSince1970) }
+        if let type { buffer.writeShortString(type) }
+        if let userId { buffer.writeShortString(userId) }
+        if let appId { buffer.writeShortString(appId) }
+        if let clusterId { buffer.writeShortString(clusterId) }
+    }
+
+    init(from decoder: FrameDecoderProtocol) throws {
+        let flags0 = try decoder.decode(UInt16.self)
+        guard flags0 & 1 == 0 else {
+            throw FramingError.fatal("Content header announces more property flags than the spec defines")
+        }
+        var contentType: String?
+        var contentEncoding: String?
+        var headers: [String: FieldValue]?
+        var deliveryMode: Int8?
+        var priority: Int8?
+        var correlationId: String?
+        var replyTo: String?
+        var expiration: String?
+        var messageId: String?
+        var timestamp: Timestamp?
+        var type: String?
+        var userId: String?
+        var appId: String?
+        var clusterId: String?
+        if flags0 & (1 << 15) != 0 {
+            contentType = try decoder.decode(String.self, isLong: false)
+        }
+        if flags0 & (1 << 14) != 0 {
+            contentEncoding = try decoder.decode(String.self, isLong: false)
+        }
+        if flags0 & (1 << 13) != 0 {
+            headers = try decoder.decode([String: FieldValue].self)
+        }
+        if flags0 & (1 << 12) != 0 {
+            deliveryMode = try decoder.decode(Int8.self)
+        }
+        if flags0 & (1 << 11) != 0 {
+            priority = try decoder.decode(Int8.self)
+        }
+        if flags0 & (1 << 10) != 0 {
+            correlationId = try decoder.decode(String.self, isLong: false)
+        }
+        if flags0 & (1 << 9) != 0 {
+            replyTo = try decoder.decode(String.self, isLong: false)
+        }
+        if flags0 & (1 << 8) != 0 {
+            expiration = try decoder.decode(String.self, isLong: false)
+        }
+        if flags0 & (1 << 7) != 0 {
+            messageId = try decoder.decode(String.self, isLong: false)
+        }
+        if flags0 & (1 << 6) != 0 {
+            timestamp = try decoder.decode(Timestamp.self)
+        }
+        if flags0 & (1 << 5) != 0 {
+            type = try decoder.decode(String.self, isLong: false)
+        }
+        if flags0 & (1 << 4) != 0 {
+            userId = try decoder.decode(String.self, isLong: false)
+        }
+        if flags0 & (1 << 3) != 0 {
+            appId = try decoder.decode(String.self, isLong: false)
+        }
+        if flags0 & (1 << 2) != 0 {
+            clusterId = try decoder.decode(String.self, isLong: false)
+        }
+        self.init(
+            contentType: contentType,
+            contentEncoding: contentEncoding,
+            headers: headers,
+            deliveryMode: deliveryMode,
+            priority: priority,
+            correlationId: correlationId,
+            replyTo: replyTo,
+            expiration: expiration,
+            messageId: messageId,
+            timestamp: timestamp,
+            type: type,
+            userId: userId,
+            appId: appId,
+            clusterId: clusterId
+        )
+    }
+
+    var bytesCount: UInt32 {
+        var size: UInt32 = 2
+        if let contentType { size += UInt32(contentType.shortBytesCount) }
+        if let contentEncoding { size += UInt32(contentEncoding.shortBytesCount) }
+        if headers != nil { size += headersBytesCount }
+        if deliveryMode != nil { size += 1 }
+        if priority != nil { size += 1 }
+        if let correlationId { size += UInt32(correlationId.shortBytesCount) }
+        if let replyTo { size += UInt32(replyTo.shortBytesCount) }
+        if let expiration { size += UInt32(expiration.shortBytesCount) }
+        if let messageId { size += UInt32(messageId.shortBytesCount) }
+        if timestamp != nil { size += 8 }
+        if let type { size += UInt32(type.shortBytesCount) }
+        if let userId { size += UInt32(userId.shortBytesCount) }
+        if let appId { size += UInt32(appId.shortBytesCount) }
+        if let clusterId { size += UInt32(clusterId.shortBytesCount) }
+        return size
+    }
+}
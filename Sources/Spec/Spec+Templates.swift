@@ -0,0 +1,550 @@
+//   NOTE: This -*- swift -*- source code is autogenerated from the AMQP
+//         specification!
+//
+// This source file is part of the swift-amqp open source project
+//
+// Copyright (c) 2024-2025 swift-amqp project authors
+// Licensed under Apache License 2.0
+//
+// See LICENSE for license information
+//
+// SPDX-License-Identifier: Apache-2.0
+//
+
+import NIOCore
+
+extension Spec {
+    /// The heartbeat frame, it never changes.
+    static let heartbeatFrame = ByteBuffer(bytes: [8, 0, 0, 0, 0, 0, 0, 206])
+}
+
+extension Spec.Basic.Qos {
+    private static let frameTemplate = ByteBuffer(bytes: [1, 0, 0, 0, 0, 0, 11, 0, 60, 0, 10, 0, 0, 0, 0, 0, 0, 0, 206])
+
+    func writeFrameFromTemplate(channelId: UInt16, into buffer: inout ByteBuffer) -> Bool {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 0, bytes: bytesCount, since: metricsStart) }
+        #endif
+        let start = buffer.writerIndex
+        buffer.writeImmutableBuffer(Self.frameTemplate)
+        buffer.setInteger(channelId, at: start + 1)
+        buffer.setInteger(prefetchSize, at: start + 11)
+        buffer.setInteger(prefetchCount, at: start + 15)
+        buffer.setInteger(UInt8(global ? 1 : 0), at: start + 17)
+        return true
+    }
+}
+
+extension Spec.Basic.QosOk {
+    private static let frameTemplate = ByteBuffer(bytes: [1, 0, 0, 0, 0, 0, 4, 0, 60, 0, 11, 206])
+
+    func writeFrameFromTemplate(channelId: UInt16, into buffer: inout ByteBuffer) -> Bool {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 1, bytes: bytesCount, since: metricsStart) }
+        #endif
+        let start = buffer.writerIndex
+        buffer.writeImmutableBuffer(Self.frameTemplate)
+        buffer.setInteger(channelId, at: start + 1)
+        return true
+    }
+}
+
+extension Spec.Basic.Ack {
+    private static let frameTemplate = ByteBuffer(bytes: [
+        1, 0, 0, 0, 0, 0, 13, 0, 60, 0, 80, 0, 0, 0, 0, 0, 0, 0, 0, 0, 206,
+    ])
+
+    func writeFrameFromTemplate(channelId: UInt16, into buffer: inout ByteBuffer) -> Bool {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 12, bytes: bytesCount, since: metricsStart) }
+        #endif
+        let start = buffer.writerIndex
+        buffer.writeImmutableBuffer(Self.frameTemplate)
+        buffer.setInteger(channelId, at: start + 1)
+        buffer.setInteger(deliveryTag, at: start + 11)
+        buffer.setInteger(UInt8(multiple ? 1 : 0), at: start + 19)
+        return true
+    }
+}
+
+extension Spec.Basic.Reject {
+    private static let frameTemplate = ByteBuffer(bytes: [
+        1, 0, 0, 0, 0, 0, 13, 0, 60, 0, 90, 0, 0, 0, 0, 0, 0, 0, 0, 0, 206,
+    ])
+
+    func writeFrameFromTemplate(channelId: UInt16, into buffer: inout ByteBuffer) -> Bool {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 13, bytes: bytesCount, since: metricsStart) }
+        #endif
+        let start = buffer.writerIndex
+        buffer.writeImmutableBuffer(Self.frameTemplate)
+        buffer.setInteger(channelId, at: start + 1)
+        buffer.setInteger(deliveryTag, at: start + 11)
+        buffer.setInteger(UInt8(requeue ? 1 : 0), at: start + 19)
+        return true
+    }
+}
+
+extension Spec.Basic.RecoverAsync {
+    private static let frameTemplate = ByteBuffer(bytes: [1, 0, 0, 0, 0, 0, 5, 0, 60, 0, 100, 0, 206])
+
+    func writeFrameFromTemplate(channelId: UInt16, into buffer: inout ByteBuffer) -> Bool {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 14, bytes: bytesCount, since: metricsStart) }
+        #endif
+        let start = buffer.writerIndex
+        buffer.writeImmutableBuffer(Self.frameTemplate)
+        buffer.setInteger(channelId, at: start + 1)
+        buffer.setInteger(UInt8(requeue ? 1 : 0), at: start + 11)
+        return true
+    }
+}
+
+extension Spec.Basic.Recover {
+    private static let frameTemplate = ByteBuffer(bytes: [1, 0, 0, 0, 0, 0, 5, 0, 60, 0, 110, 0, 206])
+
+    func writeFrameFromTemplate(channelId: UInt16, into buffer: inout ByteBuffer) -> Bool {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 15, bytes: bytesCount, since: metricsStart) }
+        #endif
+        let start = buffer.writerIndex
+        buffer.writeImmutableBuffer(Self.frameTemplate)
+        buffer.setInteger(channelId, at: start + 1)
+        buffer.setInteger(UInt8(requeue ? 1 : 0), at: start + 11)
+        return true
+    }
+}
+
+extension Spec.Basic.RecoverOk {
+    private static let frameTemplate = ByteBuffer(bytes: [1, 0, 0, 0, 0, 0, 4, 0, 60, 0, 111, 206])
+
+    func writeFrameFromTemplate(channelId: UInt16, into buffer: inout ByteBuffer) -> Bool {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 16, bytes: bytesCount, since: metricsStart) }
+        #endif
+        let start = buffer.writerIndex
+        buffer.writeImmutableBuffer(Self.frameTemplate)
+        buffer.setInteger(channelId, at: start + 1)
+        return true
+    }
+}
+
+extension Spec.Basic.Nack {
+    private static let frameTemplate = ByteBuffer(bytes: [
+        1, 0, 0, 0, 0, 0, 13, 0, 60, 0, 120, 0, 0, 0, 0, 0, 0, 0, 0, 0, 206,
+    ])
+
+    func writeFrameFromTemplate(channelId: UInt16, into buffer: inout ByteBuffer) -> Bool {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 17, bytes: bytesCount, since: metricsStart) }
+        #endif
+        let start = buffer.writerIndex
+        buffer.writeImmutableBuffer(Self.frameTemplate)
+        buffer.setInteger(channelId, at: start + 1)
+        buffer.setInteger(deliveryTag, at: start + 11)
+        var bitPack: UInt8 = 0
+        if multiple { bitPack |= 1 << 0 }
+        if requeue { bitPack |= 1 << 1 }
+        buffer.setInteger(bitPack, at: start + 19)
+        return true
+    }
+}
+
+extension Spec.Connection.Tune {
+    private static let frameTemplate = ByteBuffer(bytes: [
+        1, 0, 0, 0, 0, 0, 12, 0, 10, 0, 30, 0, 0, 0, 0, 0, 0, 0, 0, 206,
+    ])
+
+    func writeFrameFromTemplate(channelId: UInt16, into buffer: inout ByteBuffer) -> Bool {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 22, bytes: bytesCount, since: metricsStart) }
+        #endif
+        let start = buffer.writerIndex
+        buffer.writeImmutableBuffer(Self.frameTemplate)
+        buffer.setInteger(channelId, at: start + 1)
+        buffer.setInteger(channelMax, at: start + 11)
+        buffer.setInteger(frameMax, at: start + 13)
+        buffer.setInteger(heartbeat, at: start + 17)
+        return true
+    }
+}
+
+extension Spec.Connection.TuneOk {
+    private static let frameTemplate = ByteBuffer(bytes: [
+        1, 0, 0, 0, 0, 0, 12, 0, 10, 0, 31, 0, 0, 0, 0, 0, 0, 0, 0, 206,
+    ])
+
+    func writeFrameFromTemplate(channelId: UInt16, into buffer: inout ByteBuffer) -> Bool {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 23, bytes: bytesCount, since: metricsStart) }
+        #endif
+        let start = buffer.writerIndex
+        buffer.writeImmutableBuffer(Self.frameTemplate)
+        buffer.setInteger(channelId, at: start + 1)
+        buffer.setInteger(channelMax, at: start + 11)
+        buffer.setInteger(frameMax, at: start + 13)
+        buffer.setInteger(heartbeat, at: start + 17)
+        return true
+    }
+}
+
+extension Spec.Connection.CloseOk {
+    private static let frameTemplate = ByteBuffer(bytes: [1, 0, 0, 0, 0, 0, 4, 0, 10, 0, 51, 206])
+
+    func writeFrameFromTemplate(channelId: UInt16, into buffer: inout ByteBuffer) -> Bool {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 27, bytes: bytesCount, since: metricsStart) }
+        #endif
+        let start = buffer.writerIndex
+        buffer.writeImmutableBuffer(Self.frameTemplate)
+        buffer.setInteger(channelId, at: start + 1)
+        return true
+    }
+}
+
+extension Spec.Connection.Unblocked {
+    private static let frameTemplate = ByteBuffer(bytes: [1, 0, 0, 0, 0, 0, 4, 0, 10, 0, 61, 206])
+
+    func writeFrameFromTemplate(channelId: UInt16, into buffer: inout ByteBuffer) -> Bool {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 29, bytes: bytesCount, since: metricsStart) }
+        #endif
+        let start = buffer.writerIndex
+        buffer.writeImmutableBuffer(Self.frameTemplate)
+        buffer.setInteger(channelId, at: start + 1)
+        return true
+    }
+}
+
+extension Spec.Connection.UpdateSecretOk {
+    private static let frameTemplate = ByteBuffer(bytes: [1, 0, 0, 0, 0, 0, 4, 0, 10, 0, 71, 206])
+
+    func writeFrameFromTemplate(channelId: UInt16, into buffer: inout ByteBuffer) -> Bool {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 31, bytes: bytesCount, since: metricsStart) }
+        #endif
+        let start = buffer.writerIndex
+        buffer.writeImmutableBuffer(Self.frameTemplate)
+        buffer.setInteger(channelId, at: start + 1)
+        return true
+    }
+}
+
+extension Spec.Channel.Flow {
+    private static let frameTemplate = ByteBuffer(bytes: [1, 0, 0, 0, 0, 0, 5, 0, 20, 0, 20, 0, 206])
+
+    func writeFrameFromTemplate(channelId: UInt16, into buffer: inout ByteBuffer) -> Bool {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 34, bytes: bytesCount, since: metricsStart) }
+        #endif
+        let start = buffer.writerIndex
+        buffer.writeImmutableBuffer(Self.frameTemplate)
+        buffer.setInteger(channelId, at: start + 1)
+        buffer.setInteger(UInt8(active ? 1 : 0), at: start + 11)
+        return true
+    }
+}
+
+extension Spec.Channel.FlowOk {
+    private static let frameTemplate = ByteBuffer(bytes: [1, 0, 0, 0, 0, 0, 5, 0, 20, 0, 21, 0, 206])
+
+    func writeFrameFromTemplate(channelId: UInt16, into buffer: inout ByteBuffer) -> Bool {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 35, bytes: bytesCount, since: metricsStart) }
+        #endif
+        let start = buffer.writerIndex
+        buffer.writeImmutableBuffer(Self.frameTemplate)
+        buffer.setInteger(channelId, at: start + 1)
+        buffer.setInteger(UInt8(active ? 1 : 0), at: start + 11)
+        return true
+    }
+}
+
+extension Spec.Channel.CloseOk {
+    private static let frameTemplate = ByteBuffer(bytes: [1, 0, 0, 0, 0, 0, 4, 0, 20, 0, 41, 206])
+
+    func writeFrameFromTemplate(channelId: UInt16, into buffer: inout ByteBuffer) -> Bool {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 37, bytes: bytesCount, since: metricsStart) }
+        #endif
+        let start = buffer.writerIndex
+        buffer.writeImmutableBuffer(Self.frameTemplate)
+        buffer.setInteger(channelId, at: start + 1)
+        return true
+    }
+}
+
+extension Spec.Access.RequestOk {
+    private static let frameTemplate = ByteBuffer(bytes: [1, 0, 0, 0, 0, 0, 6, 0, 30, 0, 11, 0, 0, 206])
+
+    func writeFrameFromTemplate(channelId: UInt16, into buffer: inout ByteBuffer) -> Bool {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 39, bytes: bytesCount, since: metricsStart) }
+        #endif
+        let start = buffer.writerIndex
+        buffer.writeImmutableBuffer(Self.frameTemplate)
+        buffer.setInteger(channelId, at: start + 1)
+        buffer.setInteger(ticket, at: start + 11)
+        return true
+    }
+}
+
+extension Spec.Exchange.DeclareOk {
+    private static let frameTemplate = ByteBuffer(bytes: [1, 0, 0, 0, 0, 0, 4, 0, 40, 0, 11, 206])
+
+    func writeFrameFromTemplate(channelId: UInt16, into buffer: inout ByteBuffer) -> Bool {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 41, bytes: bytesCount, since: metricsStart) }
+        #endif
+        let start = buffer.writerIndex
+        buffer.writeImmutableBuffer(Self.frameTemplate)
+        buffer.setInteger(channelId, at: start + 1)
+        return true
+    }
+}
+
+extension Spec.Exchange.DeleteOk {
+    private static let frameTemplate = ByteBuffer(bytes: [1, 0, 0, 0, 0, 0, 4, 0, 40, 0, 21, 206])
+
+    func writeFrameFromTemplate(channelId: UInt16, into buffer: inout ByteBuffer) -> Bool {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 43, bytes: bytesCount, since: metricsStart) }
+        #endif
+        let start = buffer.writerIndex
+        buffer.writeImmutableBuffer(Self.frameTemplate)
+        buffer.setInteger(channelId, at: start + 1)
+        return true
+    }
+}
+
+extension Spec.Exchange.BindOk {
+    private static let frameTemplate = ByteBuffer(bytes: [1, 0, 0, 0, 0, 0, 4, 0, 40, 0, 31, 206])
+
+    func writeFrameFromTemplate(channelId: UInt16, into buffer: inout ByteBuffer) -> Bool {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 45, bytes: bytesCount, since: metricsStart) }
+        #endif
+        let start = buffer.writerIndex
+        buffer.writeImmutableBuffer(Self.frameTemplate)
+        buffer.setInteger(channelId, at: start + 1)
+        return true
+    }
+}
+
+extension Spec.Exchange.UnbindOk {
+    private static let frameTemplate = ByteBuffer(bytes: [1, 0, 0, 0, 0, 0, 4, 0, 40, 0, 51, 206])
+
+    func writeFrameFromTemplate(channelId: UInt16, into buffer: inout ByteBuffer) -> Bool {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 47, bytes: bytesCount, since: metricsStart) }
+        #endif
+        let start = buffer.writerIndex
+        buffer.writeImmutableBuffer(Self.frameTemplate)
+        buffer.setInteger(channelId, at: start + 1)
+        return true
+    }
+}
+
+extension Spec.Queue.BindOk {
+    private static let frameTemplate = ByteBuffer(bytes: [1, 0, 0, 0, 0, 0, 4, 0, 50, 0, 21, 206])
+
+    func writeFrameFromTemplate(channelId: UInt16, into buffer: inout ByteBuffer) -> Bool {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 51, bytes: bytesCount, since: metricsStart) }
+        #endif
+        let start = buffer.writerIndex
+        buffer.writeImmutableBuffer(Self.frameTemplate)
+        buffer.setInteger(channelId, at: start + 1)
+        return true
+    }
+}
+
+extension Spec.Queue.PurgeOk {
+    private static let frameTemplate = ByteBuffer(bytes: [1, 0, 0, 0, 0, 0, 8, 0, 50, 0, 31, 0, 0, 0, 0, 206])
+
+    func writeFrameFromTemplate(channelId: UInt16, into buffer: inout ByteBuffer) -> Bool {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 53, bytes: bytesCount, since: metricsStart) }
+        #endif
+        let start = buffer.writerIndex
+        buffer.writeImmutableBuffer(Self.frameTemplate)
+        buffer.setInteger(channelId, at: start + 1)
+        buffer.setInteger(messageCount, at: start + 11)
+        return true
+    }
+}
+
+extension Spec.Queue.DeleteOk {
+    private static let frameTemplate = ByteBuffer(bytes: [1, 0, 0, 0, 0, 0, 8, 0, 50, 0, 41, 0, 0, 0, 0, 206])
+
+    func writeFrameFromTemplate(channelId: UInt16, into buffer: inout ByteBuffer) -> Bool {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 55, bytes: bytesCount, since: metricsStart) }
+        #endif
+        let start = buffer.writerIndex
+        buffer.writeImmutableBuffer(Self.frameTemplate)
+        buffer.setInteger(channelId, at: start + 1)
+        buffer.setInteger(messageCount, at: start + 11)
+        return true
+    }
+}
+
+extension Spec.Queue.UnbindOk {
+    private static let frameTemplate = ByteBuffer(bytes: [1, 0, 0, 0, 0, 0, 4, 0, 50, 0, 51, 206])
+
+    func writeFrameFromTemplate(channelId: UInt16, into buffer: inout ByteBuffer) -> Bool {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 57, bytes: bytesCount, since: metricsStart) }
+        #endif
+        let start = buffer.writerIndex
+        buffer.writeImmutableBuffer(Self.frameTemplate)
+        buffer.setInteger(channelId, at: start + 1)
+        return true
+    }
+}
+
+extension Spec.Tx.Select {
+    private static let frameTemplate = ByteBuffer(bytes: [1, 0, 0, 0, 0, 0, 4, 0, 90, 0, 10, 206])
+
+    func writeFrameFromTemplate(channelId: UInt16, into buffer: inout ByteBuffer) -> Bool {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 58, bytes: bytesCount, since: metricsStart) }
+        #endif
+        let start = buffer.writerIndex
+        buffer.writeImmutableBuffer(Self.frameTemplate)
+        buffer.setInteger(channelId, at: start + 1)
+        return true
+    }
+}
+
+extension Spec.Tx.SelectOk {
+    private static let frameTemplate = ByteBuffer(bytes: [1, 0, 0, 0, 0, 0, 4, 0, 90, 0, 11, 206])
+
+    func writeFrameFromTemplate(channelId: UInt16, into buffer: inout ByteBuffer) -> Bool {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 59, bytes: bytesCount, since: metricsStart) }
+        #endif
+        let start = buffer.writerIndex
+        buffer.writeImmutableBuffer(Self.frameTemplate)
+        buffer.setInteger(channelId, at: start + 1)
+        return true
+    }
+}
+
+extension Spec.Tx.Commit {
+    private static let frameTemplate = ByteBuffer(bytes: [1, 0, 0, 0, 0, 0, 4, 0, 90, 0, 20, 206])
+
+    func writeFrameFromTemplate(channelId: UInt16, into buffer: inout ByteBuffer) -> Bool {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 60, bytes: bytesCount, since: metricsStart) }
+        #endif
+        let start = buffer.writerIndex
+        buffer.writeImmutableBuffer(Self.frameTemplate)
+        buffer.setInteger(channelId, at: start + 1)
+        return true
+    }
+}
+
+extension Spec.Tx.CommitOk {
+    private static let frameTemplate = ByteBuffer(bytes: [1, 0, 0, 0, 0, 0, 4, 0, 90, 0, 21, 206])
+
+    func writeFrameFromTemplate(channelId: UInt16, into buffer: inout ByteBuffer) -> Bool {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 61, bytes: bytesCount, since: metricsStart) }
+        #endif
+        let start = buffer.writerIndex
+        buffer.writeImmutableBuffer(Self.frameTemplate)
+        buffer.setInteger(channelId, at: start + 1)
+        return true
+    }
+}
+
+extension Spec.Tx.Rollback {
+    private static let frameTemplate = ByteBuffer(bytes: [1, 0, 0, 0, 0, 0, 4, 0, 90, 0, 30, 206])
+
+    func writeFrameFromTemplate(channelId: UInt16, into buffer: inout ByteBuffer) -> Bool {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 62, bytes: bytesCount, since: metricsStart) }
+        #endif
+        let start = buffer.writerIndex
+        buffer.writeImmutableBuffer(Self.frameTemplate)
+        buffer.setInteger(channelId, at: start + 1)
+        return true
+    }
+}
+
+extension Spec.Tx.RollbackOk {
+    private static let frameTemplate = ByteBuffer(bytes: [1, 0, 0, 0, 0, 0, 4, 0, 90, 0, 31, 206])
+
+    func writeFrameFromTemplate(channelId: UInt16, into buffer: inout ByteBuffer) -> Bool {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 63, bytes: bytesCount, since: metricsStart) }
+        #endif
+        let start = buffer.writerIndex
+        buffer.writeImmutableBuffer(Self.frameTemplate)
+        buffer.setInteger(channelId, at: start + 1)
+        return true
+    }
+}
+
+extension Spec.Confirm.Select {
+    private static let frameTemplate = ByteBuffer(bytes: [1, 0, 0, 0, 0, 0, 5, 0, 85, 0, 10, 0, 206])
+
+    func writeFrameFromTemplate(channelId: UInt16, into buffer: inout ByteBuffer) -> Bool {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 64, bytes: bytesCount, since: metricsStart) }
+        #endif
+        let start = buffer.writerIndex
+        buffer.writeImmutableBuffer(Self.frameTemplate)
+        buffer.setInteger(channelId, at: start + 1)
+        buffer.setInteger(UInt8(nowait ? 1 : 0), at: start + 11)
+        return true
+    }
+}
+
+extension Spec.Confirm.SelectOk {
+    private static let frameTemplate = ByteBuffer(bytes: [1, 0, 0, 0, 0, 0, 4, 0, 85, 0, 11, 206])
+
+    func writeFrameFromTemplate(channelId: UInt16, into buffer: inout ByteBuffer) -> Bool {
+        #if CodecMetrics
+            let metricsStart = CodecMetrics.now()
+            defer { CodecMetrics.shared.record(.encode, slot: 65, bytes: bytesCount, since: metricsStart) }
+        #endif
+        let start = buffer.writerIndex
+        buffer.writeImmutableBuffer(Self.frameTemplate)
+        buffer.setInteger(channelId, at: start + 1)
+        return true
+    }
+}
@@ -0,0 +1,278 @@
+//   NOTE: This -*- swift -*- source code is autogenerated from the AMQP
+//         specification!
+//
+// This source file is part of the swift-amqp open source project
+//
+// Copyright (c) 2024-2025 swift-amqp project authors
+// Licensed under Apache License 2.0
+//
+// See LICENSE for license information
+//
+// SPDX-License-Identifier: Apache-2.0
+//
+
+import NIOCore
+
+extension Spec.Basic {
+    /// Lazy representation of ``Spec.Basic.Return`` which keeps the arguments as wire bytes.
+    ///
+    /// Only the offsets past variable length arguments are computed on construction, every accessor
+    /// reads its argument when called. The full method is decoded with ``materialize()``.
+    /// The arguments which repeat a lot are read on construction instead, through the interning cache
+    /// of the connection, so a repeated value shares the storage of the cached String.
+    struct ReturnView: FrameCodable, FrameBufferWritable, AMQPMethodProtocol {
+        private let buffer: ByteBuffer
+        private let exchangeOffset: Int
+        private let routingKeyOffset: Int
+
+        var amqpClassId: UInt16 { 60 }
+        var amqpMethodId: UInt16 { 50 }
+        var amqpName: String { "basic.return" }
+
+        var replyCode: UInt16 { buffer.getInteger(at: 0, as: UInt16.self)! }
+        var replyText: String { buffer.getShortString(at: 2) }
+        let exchange: String
+        let routingKey: String
+
+        init(buffer: ByteBuffer, interner: ShortStringInterner? = nil) throws {
+            let buffer = buffer.slice()
+            var offset = 0
+            offset += 2
+            offset += try buffer.shortStringSize(at: offset)
+            self.exchangeOffset = offset
+            offset += try buffer.shortStringSize(at: offset)
+            self.routingKeyOffset = offset
+            offset += try buffer.shortStringSize(at: offset)
+            guard offset <= buffer.readableBytes else {
+                throw FramingError.insufficientData(needed: offset, available: buffer.readableBytes)
+            }
+            self.buffer = buffer.getSlice(at: 0, length: offset)!
+            self.exchange = buffer.getShortString(at: exchangeOffset, interner: interner)
+            self.routingKey = buffer.getShortString(at: routingKeyOffset, interner: interner)
+        }
+
+        init(_ method: Spec.Basic.Return) {
+            var buffer = ByteBuffer()
+            method.write(into: &buffer)
+            // the bytes were just written from a valid method
+            try! self.init(buffer: buffer)
+        }
+
+        func materialize() -> Spec.Basic.Return {
+            .init(
+                replyCode: replyCode,
+                replyText: replyText,
+                exchange: exchange,
+                routingKey: routingKey
+            )
+        }
+
+        func encode(to encoder: FrameEncoderProtocol) throws {
+            try materialize().encode(to: encoder)
+        }
+
+        func write(into buffer: inout ByteBuffer) {
+            buffer.writeImmutableBuffer(self.buffer)
+        }
+
+        init(from decoder: FrameDecoderProtocol) throws {
+            self.init(try Spec.Basic.Return(from: decoder))
+        }
+
+        var bytesCount: UInt32 { UInt32(buffer.readableBytes) }
+    }
+
+    /// Lazy representation of ``Spec.Basic.Deliver`` which keeps the arguments as wire bytes.
+    ///
+    /// Only the offsets past variable length arguments are computed on construction, every accessor
+    /// reads its argument when called. The full method is decoded with ``materialize()``.
+    /// The arguments which repeat a lot are read on construction instead, through the interning cache
+    /// of the connection, so a repeated value shares the storage of the cached String.
+    struct DeliverView: FrameCodable, FrameBufferWritable, AMQPMethodProtocol {
+        private let buffer: ByteBuffer
+        private let deliveryTagOffset: Int
+        private let routingKeyOffset: Int
+
+        var amqpClassId: UInt16 { 60 }
+        var amqpMethodId: UInt16 { 60 }
+        var amqpName: String { "basic.deliver" }
+
+        let consumerTag: String
+        var deliveryTag: Int64 { buffer.getInteger(at: deliveryTagOffset, as: Int64.self)! }
+        var redelivered: Bool { buffer.getInteger(at: deliveryTagOffset + 8, as: UInt8.self)! != 0 }
+        let exchange: String
+        let routingKey: String
+
+        init(buffer: ByteBuffer, interner: ShortStringInterner? = nil) throws {
+            let buffer = buffer.slice()
+            var offset = 0
+            offset += try buffer.shortStringSize(at: offset)
+            self.deliveryTagOffset = offset
+            offset += 9
+            offset += try buffer.shortStringSize(at: offset)
+            self.routingKeyOffset = offset
+            offset += try buffer.shortStringSize(at: offset)
+            guard offset <= buffer.readableBytes else {
+                throw FramingError.insufficientData(needed: offset, available: buffer.readableBytes)
+            }
+            self.buffer = buffer.getSlice(at: 0, length: offset)!
+            self.consumerTag = buffer.getShortString(at: 0, interner: interner)
+            self.exchange = buffer.getShortString(at: deliveryTagOffset + 9, interner: interner)
+            self.routingKey = buffer.getShortString(at: routingKeyOffset, interner: interner)
+        }
+
+        init(_ method: Spec.Basic.Deliver) {
+            var buffer = ByteBuffer()
+            method.write(into: &buffer)
+            // the bytes were just written from a valid method
+            try! self.init(buffer: buffer)
+        }
+
+        func materialize() -> Spec.Basic.Deliver {
+            .init(
+                consumerTag: consumerTag,
+                deliveryTag: deliveryTag,
+                redelivered: redelivered,
+                exchange: exchange,
+                routingKey: routingKey
+            )
+        }
+
+        func encode(to encoder: FrameEncoderProtocol) throws {
+            try materialize().encode(to: encoder)
+        }
+
+        func write(into buffer: inout ByteBuffer) {
+            buffer.writeImmutableBuffer(self.buffer)
+        }
+
+        init(from decoder: FrameDecoderProtocol) throws {
+            self.init(try Spec.Basic.Deliver(from: decoder))
+        }
+
+        var bytesCount: UInt32 { UInt32(buffer.readableBytes) }
+    }
+
+    /// Lazy representation of ``Spec.Basic.Ack`` which keeps the arguments as wire bytes.
+    ///
+    /// Only the offsets past variable length arguments are computed on construction, every accessor
+    /// reads its argument when called. The full method is decoded with ``materialize()``.
+    struct AckView: FrameCodable, FrameBufferWritable, AMQPMethodProtocol {
+        private let buffer: ByteBuffer
+
+        var amqpClassId: UInt16 { 60 }
+        var amqpMethodId: UInt16 { 80 }
+        var amqpName: String { "basic.ack" }
+
+        var deliveryTag: Int64 { buffer.getInteger(at: 0, as: Int64.self)! }
+        var multiple: Bool { buffer.getInteger(at: 8, as: UInt8.self)! != 0 }
+
+        init(buffer: ByteBuffer, interner: ShortStringInterner? = nil) throws {
+            let buffer = buffer.slice()
+            var offset = 0
+            offset += 9
+            guard offset <= buffer.readableBytes else {
+                throw FramingError.insufficientData(needed: offset, available: buffer.readableBytes)
+            }
+            self.buffer = buffer.getSlice(at: 0, length: offset)!
+        }
+
+        init(_ method: Spec.Basic.Ack) {
+            var buffer = ByteBuffer()
+            method.write(into: &buffer)
+            // the bytes were just written from a valid method
+            try! self.init(buffer: buffer)
+        }
+
+        func materialize() -> Spec.Basic.Ack {
+            .init(
+                deliveryTag: deliveryTag,
+                multiple: multiple
+            )
+        }
+
+        func encode(to encoder: FrameEncoderProtocol) throws {
+            try materialize().encode(to: encoder)
+        }
+
+        func write(into buffer: inout ByteBuffer) {
+            buffer.writeImmutableBuffer(self.buffer)
+        }
+
+        init(from decoder: FrameDecoderProtocol) throws {
+            self.init(try Spec.Basic.Ack(from: decoder))
+        }
+
+        var bytesCount: UInt32 { UInt32(buffer.readableBytes) }
+    }
+
+    /// Lazy representation of ``Spec.Basic.Nack`` which keeps the arguments as wire bytes.
+    ///
+    /// Only the offsets past variable length arguments are computed on construction, every accessor
+    /// reads its argument when called. The full method is decoded with ``materialize()``.
+    struct NackView: FrameCodable, FrameBufferWritable, AMQPMethodProtocol {
+        private let buffer: ByteBuffer
+
+        var amqpClassId: UInt16 { 60 }
+        var amqpMethodId: UInt16 { 120 }
+        var amqpName: String { "basic.nack" }
+
+        var deliveryTag: Int64 { buffer.getInteger(at: 0, as: Int64.self)! }
+        var multiple: Bool { (buffer.getInteger(at: 8, as: UInt8.self)! & (1 << 0)) != 0 }
+        var requeue: Bool { (buffer.getInteger(at: 8, as: UInt8.self)! & (1 << 1)) != 0 }
+
+        init(buffer: ByteBuffer, interner: ShortStringInterner? = nil) throws {
+            let buffer = buffer.slice()
+            var offset = 0
+            offset += 9
+            guard offset <= buffer.readableBytes else {
+                throw FramingError.insufficientData(needed: offset, available: buffer.readableBytes)
+            }
+            self.buffer = buffer.getSlice(at: 0, length: offset)!
+        }
+
+        init(_ method: Spec.Basic.Nack) {
+            var buffer = ByteBuffer()
+            method.write(into: &buffer)
+            // the bytes were just written from a valid method
+            try! self.init(buffer: buffer)
+        }
+
+        func materialize() -> Spec.Basic.Nack {
+            .init(
+                deliveryTag: deliveryTag,
+                multiple: multiple,
+                requeue: requeue
+            )
+        }
+
+        func encode(to encoder: FrameEncoderProtocol) throws {
+            try materialize().encode(to: encoder)
+        }
+
+        func write(into buffer: inout ByteBuffer) {
+            buffer.writeImmutableBuffer(self.buffer)
+        }
+
+        init(from decoder: FrameDecoderProtocol) throws {
+            self.init(try Spec.Basic.Nack(from: decoder))
+        }
+
+        var bytesCount: UInt32 { UInt32(buffer.readableBytes) }
+    }
+}
+
+extension Spec {
+    typealias ViewFactory = @Sendable (ByteBuffer, ShortStringInterner?) throws -> any FrameCodable
+
+    /// Returns the factory of the lazy view for the method or nil if the method is always decoded eagerly.
+    static func makeViewFactory(with classId: UInt16, and methodId: UInt16) -> ViewFactory? {
+        switch (classId, methodId) {
+        case (60, 50): return Spec.Basic.ReturnView.init(buffer:interner:)
+        case (60, 60): return Spec.Basic.DeliverView.init(buffer:interner:)
+        case (60, 80): return Spec.Basic.AckView.init(buffer:interner:)
+        case (60, 120): return Spec.Basic.NackView.init(buffer:interner:)
+        default: return nil
+        }
+    }
+}
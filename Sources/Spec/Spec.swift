@@ -70,23 +70,23 @@ public enum Spec {
 
         var type: UInt8 {
             switch self {
-            case .bool: return Character("t").asciiValue!
-            case .int8: return Character("b").asciiValue!
-            case .uint8: return Character("B").asciiValue!
-            case .int16: return Character("s").asciiValue!
-            case .uint16: return Character("u").asciiValue!
-            case .int32: return Character("I").asciiValue!
-            case .uint32: return Character("i").asciiValue!
-            case .int64: return Character("l").asciiValue!
-            case .f32: return Character("f").asciiValue!
-            case .f64: return Character("d").asciiValue!
-            case .decimal: return Character("D").asciiValue!
-            case .longstr: return Character("S").asciiValue!
-            case .array: return Character("A").asciiValue!
-            case .timestamp: return Character("T").asciiValue!
-            case .table: return Character("F").asciiValue!
-            case .bytes: return Character("x").asciiValue!
-            case .void: return Character("V").asciiValue!
+            case .bool: return UInt8(ascii: "t")
+            case .int8: return UInt8(ascii: "b")
+            case .uint8: return UInt8(ascii: "B")
+            case .int16: return UInt8(ascii: "s")
+            case .uint16: return UInt8(ascii: "u")
+            case .int32: return UInt8(ascii: "I")
+            case .uint32: return UInt8(ascii: "i")
+            case .int64: return UInt8(ascii: "l")
+            case .f32: return UInt8(ascii: "f")
+            case .f64: return UInt8(ascii: "d")
+            case .decimal: return UInt8(ascii: "D")
+            case .longstr: return UInt8(ascii: "S")
+            case .array: return UInt8(ascii: "A")
+            case .timestamp: return UInt8(ascii: "T")
+            case .table: return UInt8(ascii: "F")
+            case .bytes: return UInt8(ascii: "x")
+            case .void: return UInt8(ascii: "V")
             }
         }
 
@@ -819,6 +819,9 @@ public enum Spec {
         public private(set) var appId: String?
         public private(set) var clusterId: String?
 
+        // computed once so the encoder doesn't walk the tables for every size query
+        let headersBytesCount: UInt32
+
         public var amqpClassId: UInt16 { 60 }
         public var amqpName: String { "basic" }
 
@@ -852,6 +855,7 @@ public enum Spec {
             self.userId = userId
             self.appId = appId
             self.clusterId = clusterId
+            self.headersBytesCount = headers?.bytesCount ?? 0
         }
 
     }
@@ -15,9 +15,9 @@ extension NIOLockedValueBox where Value == NIODeadline {
 // connection should be closed without any handshake
 // it is Sendable because it is capturing itself in the timer handler
 final class AMQPHeartbeatHandler: ChannelDuplexHandler, Sendable {
-    typealias InboundIn = Frame
+    typealias InboundIn = InboundFrame
     typealias OutboundIn = Frame
-    typealias InboundOut = Frame
+    typealias InboundOut = InboundFrame
     typealias OutboundOut = Frame
 
     let maxInterval: TimeAmount
@@ -83,7 +83,7 @@ final class AMQPHeartbeatHandler: ChannelDuplexHandler, Sendable {
 
     func channelRead(context: ChannelHandlerContext, data: NIOAny) {
         self.lastInboundActivity.setToNow()
-        if unwrapInboundIn(data) as? HeartbeatFrame != nil {
+        if case .heartbeat = unwrapInboundIn(data) {
             // consume the frame
             return
         }
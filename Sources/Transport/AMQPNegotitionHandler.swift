@@ -6,7 +6,7 @@ import NIOCore
 final class AMQPNegotiationHandler: ChannelInboundHandler,
     RemovableChannelHandler
 {
-    typealias InboundIn = Frame
+    typealias InboundIn = InboundFrame
     typealias OutboundOut = Frame
 
     // used to remove the handler from the pipeline when negotiation completes
@@ -69,7 +69,7 @@ final class AMQPNegotiationHandler: ChannelInboundHandler,
     }
 
     func channelRead(context: ChannelHandlerContext, data: NIOAny) {
-        guard let frame = unwrapInboundIn(data) as? MethodFrame else {
+        guard case .method(let frame) = unwrapInboundIn(data) else {
             context.fireErrorCaught(NegotiationError.unexpectedMethod)
             return
         }
@@ -1,36 +1,62 @@
 import NIOCore
 
 struct ByteToFrameCoderHandler: ByteToMessageDecoder, MessageToByteEncoder {
+    // shared by all frames decoded on the connection
+    let interner: ShortStringInterner?
+    // decodes the content properties and the methods without a lazy view, reused for every frame
+    private let decoder: FrameDecoder
+    // set once a frame broke the framing rules, the connection is being closed and the rest of its bytes are dropped
+    private var isClosing = false
+
+    init(interner: ShortStringInterner? = nil) {
+        self.interner = interner
+        self.decoder = FrameDecoder(decodesLazyViews: true, interner: interner)
+    }
+
     // MARK: - ByteToMessageDecoder
-    typealias InboundOut = Frame
+    typealias InboundOut = InboundFrame
 
     mutating func decode(context: ChannelHandlerContext, buffer: inout ByteBuffer) throws
         -> DecodingState
     {
-        let startIdx = buffer.readerIndex
-        // peek inside the buffer to know how much data expected
-        let type = buffer.getInteger(at: startIdx, endianness: .big, as: UInt8.self)
-        let channelId = buffer.getInteger(at: startIdx + 1, endianness: .big, as: UInt16.self)
-        let expectedSize = buffer.getInteger(at: startIdx + 3, endianness: .big, as: UInt32.self)
-        guard let type, channelId != nil, let expectedSize else {
-            return .needMoreData
-        }
-        // 8 is standard overhead for frame = size(type) + size(channelId) + size(expectedSize) + size(endFrame)
-        let frameSizeOverhead: Int = 8
-        let totalFrameSize = Int(expectedSize) + frameSizeOverhead
-        if buffer.readableBytes < totalFrameSize {
+        if isClosing {
+            buffer.moveReaderIndex(to: buffer.writerIndex)
             return .needMoreData
         }
         do {
-            // force unwrapping is safe because of the previous check
-            let data = buffer.getSlice(at: buffer.readerIndex, length: totalFrameSize)!
-            let frame = try decodeFrame(type: type, from: data)
-            buffer.moveReaderIndex(forwardBy: totalFrameSize)
+            guard let frame = try InboundFrame.decode(from: &buffer, decoder: decoder) else {
+                return .needMoreData
+            }
             context.fireChannelRead(self.wrapInboundOut(frame))
+            return .continue
         } catch {
-            context.fireErrorCaught(error)
+            isClosing = true
+            close(context: context, dueTo: error)
+            return .needMoreData
+        }
+    }
+
+    // 2.3.7 Error Handling: a hard error closes the connection with Connection.Close carrying the reply code,
+    // a frame without the frame-end octet closes it without sending anything (4.2.3)
+    private func close(context: ChannelHandlerContext, dueTo error: any Error) {
+        if let hardError = error as? Spec.HardError {
+            let close = MethodFrame(
+                channelId: 0,
+                payload: Spec.Connection.Close(
+                    replyCode: UInt16(hardError.rawValue),
+                    replyText: "\(hardError)",
+                    classId: 0,
+                    methodId: 0
+                )
+            )
+            // the encoder is behind this handler, so the frame is written as bytes
+            if let data = try? close.asData() {
+                context.writeAndFlush(NIOAny(data), promise: nil)
+            }
         }
-        return .continue
+        context.fireErrorCaught(error)
+        // the broker's Close-Ok isn't awaited, nothing else would be read from the connection anyway
+        context.close(promise: nil)
     }
 
     mutating func decodeLast(
@@ -49,4 +75,5 @@ struct ByteToFrameCoderHandler: ByteToMessageDecoder, MessageToByteEncoder {
     }
 }
 
-extension ByteToFrameCoderHandler: Sendable {}
+// the decoder is only used on the event loop of the channel the handler is added to
+extension ByteToFrameCoderHandler: @unchecked Sendable {}
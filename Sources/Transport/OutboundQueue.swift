@@ -0,0 +1,213 @@
+import Collections
+import NIOConcurrencyHelpers
+import NIOCore
+
+/// Bounds the frames which wait to be written to the socket of a connection, see
+/// ``Configuration/outboundQueue``.
+///
+/// Publishing suspends while more than `maxPendingBytes` are queued, or while the broker blocked the connection
+/// (Connection.Blocked), so a publisher outrunning the socket or a throttled broker doesn't grow the memory of the
+/// client without limit.
+public struct OutboundQueueConfiguration: Sendable, Equatable {
+    /// the publishers wait while more bytes than this are queued
+    public var maxPendingBytes: Int
+    /// at most this many bytes are written with one flush, a single larger frame is written on its own
+    public var maxFlushBytes: Int
+    /// how long the writer waits for more frames before it flushes, zero flushes whatever was queued meanwhile as
+    /// soon as the previous write is done
+    public var flushDelay: TimeAmount
+
+    public init(
+        maxPendingBytes: Int = 4 * 1024 * 1024,
+        maxFlushBytes: Int = 256 * 1024,
+        flushDelay: TimeAmount = .zero
+    ) {
+        precondition(maxPendingBytes > 0 && maxFlushBytes > 0, "maxPendingBytes and maxFlushBytes should be positive")
+        precondition(flushDelay >= .zero, "flushDelay can't be negative")
+        self.maxPendingBytes = maxPendingBytes
+        self.maxFlushBytes = maxFlushBytes
+        self.flushDelay = flushDelay
+    }
+
+    public static let `default` = OutboundQueueConfiguration()
+}
+
+/// The depth of the outbound queue of a connection and the size of its flushes, see
+/// ``Connection/outboundStatistics``.
+public struct OutboundQueueStatistics: Sendable, Equatable {
+    /// frames waiting to be written
+    public let depth: Int
+    /// bytes of the frames waiting to be written
+    public let pendingBytes: Int
+    /// the most bytes that were waiting at a time
+    public let maxPendingBytes: Int
+    /// publishers waiting for room in the queue
+    public let waitingPublishers: Int
+    /// whether the broker blocked the connection with Connection.Blocked
+    public let isBlocked: Bool
+    /// how many flushes were written
+    public let flushes: Int
+    /// bytes written over all flushes
+    public let flushedBytes: Int
+    /// bytes of the last flush
+    public let lastFlushBytes: Int
+}
+
+// The frames on their way to the socket. Every frame is queued right away, the acks and heartbeats of a connection
+// must go out even while it's congested, but publishers wait for room (`reserve`) before they queue a message. The
+// writer of the transport takes the queued frames in one go (`next`) and writes them with a single flush, the next
+// batch is taken only once the writer is done, which happens while the NIO channel is writable.
+final class OutboundQueue: Sendable {
+    private struct State {
+        var frames: Deque<any Frame> = []
+        var pendingBytes = 0
+        var isBlocked = false
+        var isFinished = false
+        var publishers: Deque<EventLoopPromise<Void>> = []
+        // the writer waiting for frames
+        var writer: EventLoopPromise<Void>?
+        var maxPendingBytes = 0
+        var flushes = 0
+        var flushedBytes = 0
+        var lastFlushBytes = 0
+
+        var hasRoom: Bool {
+            !isBlocked && pendingBytes < configuration.maxPendingBytes
+        }
+
+        let configuration: OutboundQueueConfiguration
+    }
+
+    let configuration: OutboundQueueConfiguration
+    private let eventLoop: any EventLoop
+    private let state: NIOLockedValueBox<State>
+
+    init(configuration: OutboundQueueConfiguration, eventLoop: any EventLoop) {
+        self.configuration = configuration
+        self.eventLoop = eventLoop
+        self.state = .init(State(configuration: configuration))
+    }
+
+    var statistics: OutboundQueueStatistics {
+        state.withLockedValue {
+            OutboundQueueStatistics(
+                depth: $0.frames.count,
+                pendingBytes: $0.pendingBytes,
+                maxPendingBytes: $0.maxPendingBytes,
+                waitingPublishers: $0.publishers.count,
+                isBlocked: $0.isBlocked,
+                flushes: $0.flushes,
+                flushedBytes: $0.flushedBytes,
+                lastFlushBytes: $0.lastFlushBytes
+            )
+        }
+    }
+
+    /// Completes once there is room for a message, the publishers are let through in the order they came.
+    ///  - Throws: `ConnectionError.connectionIsClosed` if the connection was closed meanwhile.
+    func reserve() -> EventLoopFuture<Void> {
+        state.withLockedValue {
+            if $0.isFinished {
+                return eventLoop.makeFailedFuture(ConnectionError.connectionIsClosed)
+            }
+            if $0.publishers.isEmpty && $0.hasRoom {
+                return eventLoop.makeSucceededVoidFuture()
+            }
+            let promise = eventLoop.makePromise(of: Void.self)
+            $0.publishers.append(promise)
+            return promise.futureResult
+        }
+    }
+
+    /// Queues the frames, the frames queued after the connection was closed are dropped.
+    func enqueue(_ frames: some Sequence<any Frame>) {
+        let writer = state.withLockedValue {
+            guard !$0.isFinished else {
+                return EventLoopPromise<Void>?.none
+            }
+            for frame in frames {
+                $0.frames.append(frame)
+                $0.pendingBytes += Int(frame.bytesCount)
+            }
+            $0.maxPendingBytes = max($0.maxPendingBytes, $0.pendingBytes)
+            defer { $0.writer = nil }
+            return $0.writer
+        }
+        writer?.succeed()
+    }
+
+    /// Connection.Blocked holds the publishers until Connection.Unblocked, the other frames still go out.
+    func setBlocked(_ isBlocked: Bool) {
+        let ready = state.withLockedValue {
+            $0.isBlocked = isBlocked
+            return takeReadyPublishers(from: &$0)
+        }
+        ready.forEach { $0.succeed() }
+    }
+
+    /// Waits until frames are queued and takes them, up to `maxFlushBytes`.
+    /// - Returns: nil once the connection was closed.
+    func next() async -> [any Frame]? {
+        let writer = state.withLockedValue {
+            guard $0.frames.isEmpty && !$0.isFinished else {
+                return EventLoopPromise<Void>?.none
+            }
+            let promise = eventLoop.makePromise(of: Void.self)
+            $0.writer = promise
+            return promise
+        }
+        try? await writer?.futureResult.get()
+        let isFlushFull = state.withLockedValue { $0.pendingBytes >= configuration.maxFlushBytes }
+        if configuration.flushDelay > .zero && !isFlushFull {
+            // gathers more frames into the flush, or gives up early if the connection is closed
+            try? await Task.sleep(nanoseconds: UInt64(configuration.flushDelay.nanoseconds))
+        }
+        let (frames, ready) = state.withLockedValue { state -> ([any Frame]?, [EventLoopPromise<Void>]) in
+            guard !state.isFinished else {
+                return (nil, [])
+            }
+            var frames: [any Frame] = []
+            var bytes = 0
+            // the first frame is taken even if it's larger than a flush on its own
+            while let frame = state.frames.first,
+                frames.isEmpty || bytes + Int(frame.bytesCount) <= configuration.maxFlushBytes
+            {
+                state.frames.removeFirst()
+                bytes += Int(frame.bytesCount)
+                frames.append(frame)
+            }
+            state.pendingBytes -= bytes
+            state.flushes += 1
+            state.flushedBytes += bytes
+            state.lastFlushBytes = bytes
+            return (frames, takeReadyPublishers(from: &state))
+        }
+        ready.forEach { $0.succeed() }
+        return frames
+    }
+
+    /// Drops the queued frames, stops the writer and fails the waiting publishers and whoever reserves later.
+    func finish() {
+        let (writer, publishers) = state.withLockedValue {
+            $0.isFinished = true
+            $0.frames.removeAll()
+            $0.pendingBytes = 0
+            let publishers = Array($0.publishers)
+            $0.publishers.removeAll()
+            defer { $0.writer = nil }
+            return ($0.writer, publishers)
+        }
+        writer?.succeed()
+        publishers.forEach { $0.fail(ConnectionError.connectionIsClosed) }
+    }
+
+    // lets all waiting publishers through once there is room, each queues a message, so the queue may exceed the
+    // limit by the messages of the publishers which were waiting
+    private func takeReadyPublishers(from state: inout State) -> [EventLoopPromise<Void>] {
+        guard state.hasRoom else {
+            return []
+        }
+        defer { state.publishers.removeAll() }
+        return Array(state.publishers)
+    }
+}
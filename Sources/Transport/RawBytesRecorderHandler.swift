@@ -0,0 +1,88 @@
+import NIOCore
+import NIOPosix
+
+#if canImport(Darwin)
+    import Darwin  // for O_CREAT, O_TRUNC
+#elseif canImport(Glibc)
+    import Glibc
+#elseif canImport(Musl)
+    import Musl
+#endif
+
+// Records the bytes of a connection exactly as they are on the wire, for offline analysis with
+// Generator/traffic_analyzer.py (see `Configuration.rawBytesRecordingPath`). It sits next to the socket and appends
+// every read and written chunk to the file as a record, the file starts with the 8 byte magic "AMQPREC1":
+//   direction: UInt8 (0 received from the broker, 1 sent to the broker)
+//   time: UInt64 (uptime in nanoseconds)
+//   length: UInt32
+//   bytes
+// All integers are big endian. Writing happens on a thread of its own, in order, and never holds up the traffic;
+// if the file can't be written the recording silently stops.
+final class RawBytesRecorderHandler: ChannelDuplexHandler {
+    typealias InboundIn = ByteBuffer
+    typealias InboundOut = ByteBuffer
+    typealias OutboundIn = ByteBuffer
+    typealias OutboundOut = ByteBuffer
+
+    static let magic = "AMQPREC1"
+    static let inbound: UInt8 = 0
+    static let outbound: UInt8 = 1
+
+    private let threadPool: NIOThreadPool
+    private let fileIO: NonBlockingFileIO
+    private let fileHandle: NIOFileHandle
+    // the last scheduled write, every write waits for the previous one to keep the records in order
+    private var pendingWrite: EventLoopFuture<Void>?
+
+    init(path: String) throws {
+        self.fileHandle = try NIOFileHandle(
+            path: path,
+            mode: .write,
+            flags: .posix(flags: O_CREAT | O_TRUNC, mode: S_IRUSR | S_IWUSR)
+        )
+        self.threadPool = NIOThreadPool(numberOfThreads: 1)
+        self.threadPool.start()
+        self.fileIO = NonBlockingFileIO(threadPool: threadPool)
+    }
+
+    func handlerAdded(context: ChannelHandlerContext) {
+        append(ByteBuffer(string: Self.magic), on: context.eventLoop)
+    }
+
+    func handlerRemoved(context: ChannelHandlerContext) {
+        let (fileHandle, threadPool) = (self.fileHandle, self.threadPool)
+        (pendingWrite ?? context.eventLoop.makeSucceededVoidFuture())
+            .whenComplete { _ in
+                try? fileHandle.close()
+                threadPool.shutdownGracefully { _ in }
+            }
+    }
+
+    func channelRead(context: ChannelHandlerContext, data: NIOAny) {
+        record(Self.inbound, unwrapInboundIn(data), on: context.eventLoop)
+        context.fireChannelRead(data)
+    }
+
+    func write(context: ChannelHandlerContext, data: NIOAny, promise: EventLoopPromise<Void>?) {
+        record(Self.outbound, unwrapOutboundIn(data), on: context.eventLoop)
+        context.write(data, promise: promise)
+    }
+
+    private func record(_ direction: UInt8, _ bytes: ByteBuffer, on eventLoop: any EventLoop) {
+        // direction(1) + time(8) + length(4) + bytes
+        var record = ByteBufferAllocator().buffer(capacity: 13 + bytes.readableBytes)
+        record.writeInteger(direction)
+        record.writeInteger(NIODeadline.now().uptimeNanoseconds)
+        record.writeInteger(UInt32(bytes.readableBytes))
+        record.writeImmutableBuffer(bytes)
+        append(record, on: eventLoop)
+    }
+
+    private func append(_ buffer: ByteBuffer, on eventLoop: any EventLoop) {
+        let (fileIO, fileHandle) = (self.fileIO, self.fileHandle)
+        pendingWrite = (pendingWrite ?? eventLoop.makeSucceededVoidFuture())
+            .flatMap {
+                fileIO.write(fileHandle: fileHandle, buffer: buffer, eventLoop: eventLoop)
+            }
+    }
+}
@@ -9,43 +9,54 @@ import NIOPosix
 #endif
 
 final class Transport: TransportProtocol, Sendable {
-    private let eventLoopGroup: MultiThreadedEventLoopGroup
-    private let asyncNIOChannel: NIOAsyncChannel<any Frame, any Frame>
+    // the connection runs on this loop, picked from the configured group or from a group of its own
+    let eventLoop: any EventLoop
+    // set when no group was configured, the thread of `eventLoop` lives as long as the connection
+    private let ownedEventLoopGroup: MultiThreadedEventLoopGroup?
+    private let asyncNIOChannel: NIOAsyncChannel<InboundFrame, any Frame>
 
-    private let outboundContinuation: AsyncStream<any Frame>.Continuation
-    private let outboundFrames: AsyncStream<any Frame>
-    private let inboundContinuation: AsyncStream<any Frame>.Continuation
+    private let outbound: OutboundQueue
+    private let inboundContinuation: AsyncStream<InboundFrame>.Continuation
     let negotiatedProperties: (Configuration, Spec.Table)
+    let interner: ShortStringInterner?
 
     init(
         host: String = "localhost",
         port: Int = 5672,
+        rawBytesRecordingPath: String? = nil,
+        outboundQueue: OutboundQueueConfiguration = .default,
+        eventLoopGroup: (any EventLoopGroup)? = nil,
         logger: Logger,
-        inboundContinuation: AsyncStream<any Frame>.Continuation,
+        inboundContinuation: AsyncStream<InboundFrame>.Continuation,
         negotiatorFactory: @escaping @Sendable () -> any AMQPNegotiationDelegateProtocol
     ) async throws {
-        // one event loop per connection
-        self.eventLoopGroup = MultiThreadedEventLoopGroup(numberOfThreads: 1)
-
-        // create outbound AsyncStream
-        var outboundContinuation: AsyncStream<any Frame>.Continuation?
-        self.outboundFrames = AsyncStream { continuation in
-            outboundContinuation = continuation
-        }
-        guard let outboundContinuation else {
-            fatalError("Couldn't create outbound AsyncStream")
+        if let eventLoopGroup {
+            self.ownedEventLoopGroup = nil
+            self.eventLoop = eventLoopGroup.next()
+        } else {
+            // one event loop per connection
+            let ownedEventLoopGroup = MultiThreadedEventLoopGroup(numberOfThreads: 1)
+            self.ownedEventLoopGroup = ownedEventLoopGroup
+            self.eventLoop = ownedEventLoopGroup.next()
         }
-        // save continuation for later use
-        self.outboundContinuation = outboundContinuation
+        self.outbound = OutboundQueue(configuration: outboundQueue, eventLoop: eventLoop)
 
         self.inboundContinuation = inboundContinuation
-        let negotiationComplete = eventLoopGroup.any()
-            .makePromise(of: (Configuration, Spec.Table).self)
-        self.asyncNIOChannel = try await ClientBootstrap(group: eventLoopGroup)
+        let interner = ShortStringInterner()
+        self.interner = interner
+        let negotiationComplete = eventLoop.makePromise(of: (Configuration, Spec.Table).self)
+        // pinned to the loop, a shared group would spread the work of one connection over its threads otherwise
+        self.asyncNIOChannel = try await ClientBootstrap(group: eventLoop)
             .connect(host: host, port: port) { channel in
                 return channel.eventLoop.makeCompletedFuture {
+                    // first, so it's next to the socket and sees the bytes as they are on the wire
+                    if let rawBytesRecordingPath {
+                        try channel.pipeline.syncOperations.addHandler(
+                            RawBytesRecorderHandler(path: rawBytesRecordingPath)
+                        )
+                    }
                     try channel.pipeline.syncOperations.addHandler(
-                        ByteToMessageHandler(ByteToFrameCoderHandler())
+                        ByteToMessageHandler(ByteToFrameCoderHandler(interner: interner))
                     )
                     try channel.pipeline.syncOperations.addHandler(
                         MessageToByteHandler(ByteToFrameCoderHandler())
@@ -68,7 +79,7 @@ final class Transport: TransportProtocol, Sendable {
                         ),
                         name: AMQPNegotiationHandler.handlerName
                     )
-                    return try NIOAsyncChannel<any Frame, any Frame>(
+                    return try NIOAsyncChannel<InboundFrame, any Frame>(
                         wrappingChannelSynchronously: channel
                     )
                 }
@@ -89,34 +100,35 @@ extension Transport {
         self.asyncNIOChannel.channel.isActive
     }
 
+    var outboundQueue: OutboundQueue? {
+        outbound
+    }
+
     // sends a frame to the broker through the established connection,
     // the caller is responsible for making sure that the `Transport.isActive`
     func send(_ frame: any Frame) -> EventLoopPromise<any Frame> {
-        let promise = eventLoopGroup.any().makePromise(of: (any Frame).self)
-        outboundContinuation.yield(frame)
+        let promise = eventLoop.makePromise(of: (any Frame).self)
+        outbound.enqueue(CollectionOfOne(frame))
         return promise
     }
 
     // same as send(_ frame: Frame) but for multiple frames
     func send(_ frames: [any Frame]) -> EventLoopPromise<any Frame> {
-        let promise = eventLoopGroup.any().makePromise(of: (any Frame).self)
-        frames.forEach {
-            outboundContinuation.yield($0)
-        }
+        let promise = eventLoop.makePromise(of: (any Frame).self)
+        outbound.enqueue(frames)
         return promise
     }
 
     func sendAsync(_ frame: any Frame) {
-        outboundContinuation.yield(frame)
+        outbound.enqueue(CollectionOfOne(frame))
     }
 
     func sendAsync(_ frames: [any Frame]) {
-        frames.forEach {
-            outboundContinuation.yield($0)
-        }
+        outbound.enqueue(frames)
     }
 
-    /// Receives and sends out frames as they come through the AsyncStream's passed on construction of the object
+    /// Receives frames into the AsyncStream passed on construction of the object and sends out the queued frames,
+    /// whatever was queued while the previous write was in progress is written with one flush (a vectored write).
     ///
     /// - Throws: Any error that occurs during task execution.
     func execute() async {
@@ -137,12 +149,22 @@ extension Transport {
                             }
                         }
                         do {
-                            try await outbound.write(contentsOf: outboundFrames)
+                            // the writer suspends while the NIO channel isn't writable, the queue fills up meanwhile
+                            // and holds up the publishers
+                            try await withTaskCancellationHandler {
+                                while let frames = await self.outbound.next() {
+                                    try await outbound.write(contentsOf: frames)
+                                }
+                            } onCancel: {
+                                self.outbound.finish()
+                            }
                         } catch {
                             // the outbound channel has been closed due to an exception (likely stopped iterating)
                             // swallow the error as there is nobody to notify this about
                             // because this means that owning Channel has been stopped / closed
                         }
+                        // nothing is written anymore, the waiting publishers fail instead of waiting forever
+                        self.outbound.finish()
                     }
             }
         } catch {
@@ -5,13 +5,21 @@ protocol TransportProtocol: Sendable, AnyObject {
     init(
         host: String,
         port: Int,
+        rawBytesRecordingPath: String?,
+        outboundQueue: OutboundQueueConfiguration,
         logger: Logger,
-        inboundContinuation: AsyncStream<any Frame>.Continuation,
+        inboundContinuation: AsyncStream<InboundFrame>.Continuation,
         negotiatorFactory: @escaping @Sendable () -> any AMQPNegotiationDelegateProtocol
     ) async throws
 
     var negotiatedProperties: (Configuration, Spec.Table) { get }
     var isActive: Bool { get }
+    /// the shortstr interning cache of the inbound decoder, if it has one
+    var interner: ShortStringInterner? { get }
+    /// the queue of the frames to be written, if the transport bounds it
+    var outboundQueue: OutboundQueue? { get }
+    /// the event loop the promises returned by `send` belong to
+    var eventLoop: any EventLoop { get }
     func execute() async
 
     func send(_ frame: any Frame) -> EventLoopPromise<any Frame>
@@ -0,0 +1,92 @@
+import NIOConcurrencyHelpers
+import NIOCore
+import NIOEmbedded
+import Testing
+
+@testable import AMQP
+
+@Suite struct AckCoalescing {
+    typealias Sent = NIOLockedValueBox<[any AMQPMethodProtocol & FrameCodable]>
+
+    // the tests are synchronous and make their embedded loop, so it's used from one thread and its time only moves
+    // when the test advances it
+    func makeCoalescer(
+        maxPendingAcks: Int,
+        maxDelay: TimeAmount = .seconds(60),
+        eventLoop: EmbeddedEventLoop = EmbeddedEventLoop(),
+        sent: Sent
+    ) -> AckCoalescer {
+        AckCoalescer(maxPendingAcks: maxPendingAcks, maxDelay: maxDelay, eventLoop: eventLoop) { method in
+            sent.withLockedValue { $0.append(method) }
+        }
+    }
+
+    func expectSent(_ sent: Sent, _ expected: [any AMQPMethodProtocol & FrameCodable]) {
+        let sent = sent.withLockedValue { $0 }
+        #expect(sent.count == expected.count)
+        #expect(zip(sent, expected).allSatisfy { $0.isEqual(to: $1) }, "sent \(sent)")
+    }
+
+    @Test("Contiguous acks are sent as one multiple ack after maxPendingAcks")
+    func contiguousAcks() throws {
+        let sent = Sent([])
+        let coalescer = makeCoalescer(maxPendingAcks: 3, sent: sent)
+        coalescer.ack(deliveryTag: 1, multiple: false)
+        coalescer.ack(deliveryTag: 2, multiple: false)
+        expectSent(sent, [])
+        coalescer.ack(deliveryTag: 3, multiple: false)
+        expectSent(sent, [Spec.Basic.Ack(deliveryTag: 3, multiple: true)])
+    }
+
+    @Test("Acks above a gap are sent one by one, the multiple ack doesn't cover them twice")
+    func outOfOrderAcks() throws {
+        let sent = Sent([])
+        let coalescer = makeCoalescer(maxPendingAcks: 10, sent: sent)
+        coalescer.ack(deliveryTag: 2, multiple: false)
+        coalescer.ack(deliveryTag: 3, multiple: false)
+        coalescer.flush()
+        expectSent(sent, [Spec.Basic.Ack(deliveryTag: 2), Spec.Basic.Ack(deliveryTag: 3)])
+        coalescer.ack(deliveryTag: 1, multiple: false)
+        coalescer.ack(deliveryTag: 4, multiple: false)
+        coalescer.flush()
+        expectSent(
+            sent,
+            [
+                Spec.Basic.Ack(deliveryTag: 2),
+                Spec.Basic.Ack(deliveryTag: 3),
+                Spec.Basic.Ack(deliveryTag: 4, multiple: true),
+            ]
+        )
+    }
+
+    @Test("A nack sends the buffered acks first")
+    func nackFlushes() throws {
+        let sent = Sent([])
+        let coalescer = makeCoalescer(maxPendingAcks: 10, sent: sent)
+        coalescer.ack(deliveryTag: 1, multiple: false)
+        coalescer.ack(deliveryTag: 2, multiple: false)
+        coalescer.nack(deliveryTag: 3, multiple: false, requeue: true)
+        coalescer.ack(deliveryTag: 4, multiple: false)
+        coalescer.flush()
+        expectSent(
+            sent,
+            [
+                Spec.Basic.Ack(deliveryTag: 2, multiple: true),
+                Spec.Basic.Nack(deliveryTag: 3, multiple: false, requeue: true),
+                Spec.Basic.Ack(deliveryTag: 4, multiple: true),
+            ]
+        )
+    }
+
+    @Test("Buffered acks are sent after maxDelay")
+    func delayedFlush() throws {
+        let sent = Sent([])
+        let eventLoop = EmbeddedEventLoop()
+        let coalescer = makeCoalescer(maxPendingAcks: 10, maxDelay: .milliseconds(10), eventLoop: eventLoop, sent: sent)
+        coalescer.ack(deliveryTag: 1, multiple: false)
+        eventLoop.advanceTime(by: .milliseconds(9))
+        expectSent(sent, [])
+        eventLoop.advanceTime(by: .milliseconds(1))
+        expectSent(sent, [Spec.Basic.Ack(deliveryTag: 1, multiple: true)])
+    }
+}
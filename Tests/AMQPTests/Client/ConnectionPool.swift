@@ -0,0 +1,78 @@
+import Testing
+
+@testable import AMQP
+
+@Suite struct ConnectionPooling {
+    func channelOpening(ids: [UInt16]) -> [TransportMock.Action] {
+        ids.flatMap {
+            [
+                TransportMock.Action.outbound(MethodFrame(channelId: $0, payload: Spec.Channel.Open())),
+                TransportMock.Action.inbound(MethodFrame(channelId: $0, payload: Spec.Channel.OpenOk())),
+            ]
+        } + [.keepAlive]
+    }
+
+    @Test("Round-robin spreads the channels over the connections")
+    func roundRobin() async throws {
+        let env = makeTestEnv(with: channelOpening(ids: [1]))
+        let pool = try await ConnectionPool(size: 2, balancing: .roundRobin, with: .default, env: env)
+        let first = try await pool.makeChannel()
+        let second = try await pool.makeChannel()
+        // both are the first channel of their connection
+        #expect(first.id == 1)
+        #expect(second.id == 1)
+    }
+
+    @Test("Least in flight falls back to the connection with the fewest channels when all are idle")
+    func leastInFlight() async throws {
+        let env = makeTestEnv(with: channelOpening(ids: [1]))
+        let pool = try await ConnectionPool(size: 2, balancing: .leastInFlight, with: .default, env: env)
+        let first = try await pool.makeChannel()
+        let second = try await pool.makeChannel()
+        #expect(first.id == 1)
+        #expect(second.id == 1)
+    }
+
+    @Test("Least in flight picks the connection with the least in flight, then the fewest channels")
+    func leastLoaded() {
+        #expect(ConnectionPool.leastLoaded(of: [(3, 1), (1, 4), (2, 0)]) == 1)
+        #expect(ConnectionPool.leastLoaded(of: [(1, 2), (1, 1), (1, 3)]) == 1)
+        // the first of equally loaded connections
+        #expect(ConnectionPool.leastLoaded(of: [(0, 1), (0, 1)]) == 0)
+        // a dropped connection only when all of them dropped
+        #expect(ConnectionPool.leastLoaded(of: [nil, (100, 100)]) == 1)
+        #expect(ConnectionPool.leastLoaded(of: [nil, nil]) == 0)
+    }
+
+    @Test("A connection which dropped is replaced by a new one")
+    func replacesDroppedMember() async throws {
+        // no keepAlive, the connection drops once its channel was opened
+        let env = makeTestEnv(with: [
+            .outbound(MethodFrame(channelId: 1, payload: Spec.Channel.Open())),
+            .inbound(MethodFrame(channelId: 1, payload: Spec.Channel.OpenOk())),
+        ])
+        let pool = try await ConnectionPool(size: 1, balancing: .roundRobin, with: .default, env: env)
+        let first = try await pool.makeChannel()
+        while await pool.openConnections()[0] != nil {
+            try await Task.sleep(for: .milliseconds(1))
+        }
+        // the first channel of the new connection, the dropped one would fail to make a channel
+        let second = try await pool.makeChannel()
+        #expect(first.id == 1)
+        #expect(second.id == 1)
+    }
+
+    @Test("The same routing key always gets a channel of the same connection")
+    func stickyByRoutingKey() async throws {
+        let env = makeTestEnv(with: channelOpening(ids: [1, 2]))
+        let pool = try await ConnectionPool(size: 2, balancing: .stickyByRoutingKey, with: .default, env: env)
+        // "a" and "b" belong to different connections
+        let channels = [
+            try await pool.makeChannel(routingKey: "a"),
+            try await pool.makeChannel(routingKey: "a"),
+            try await pool.makeChannel(routingKey: "b"),
+            try await pool.makeChannel(routingKey: "b"),
+        ]
+        #expect(channels.map(\.id) == [1, 2, 1, 2])
+    }
+}
@@ -1,3 +1,4 @@
+import NIOCore
 import Testing
 
 @testable import AMQP
@@ -311,7 +312,7 @@ import Testing
             ),
             // assuming server delivers a frame larger than agreed 3 bytes
             .inbound(
-                ContentBodyFrame(channelId: expectedChannelId, fragment: [112, 105, 110, 103])
+                ContentBodyFrame(channelId: expectedChannelId, fragment: ByteBuffer(string: "ping"))
             ),
         ]
         let env = makeTestEnv(
@@ -0,0 +1,203 @@
+import NIOCore
+import Testing
+
+@testable import AMQP
+
+@Suite struct FramesRouting {
+    func deliver(on channelId: UInt16, tag: String) -> MethodFrame {
+        MethodFrame(
+            channelId: channelId,
+            payload: Spec.Basic.Deliver(
+                consumerTag: tag,
+                deliveryTag: 1,
+                redelivered: false,
+                exchange: "exchange",
+                routingKey: "key"
+            )
+        )
+    }
+
+    func header(on channelId: UInt16, bodySize: UInt64) -> ContentHeaderFrame {
+        ContentHeaderFrame(channelId: channelId, classId: 60, bodySize: bodySize, properties: .init())
+    }
+
+    @Test("Interleaved deliveries are assembled per channel, an empty body completes with its header")
+    func interleavedDeliveries() async throws {
+        var actions: [TransportMock.Action] = []
+        for channelId: UInt16 in [1, 2] {
+            actions += [
+                .outbound(MethodFrame(channelId: channelId, payload: Spec.Channel.Open())),
+                .inbound(MethodFrame(channelId: channelId, payload: Spec.Channel.OpenOk())),
+            ]
+        }
+        for channelId: UInt16 in [1, 2] {
+            actions += [
+                .outbound(MethodFrame(channelId: channelId, payload: Spec.Basic.Consume(queue: "queue"))),
+                .inbound(
+                    MethodFrame(channelId: channelId, payload: Spec.Basic.ConsumeOk(consumerTag: "c\(channelId)"))
+                ),
+            ]
+        }
+        actions += [
+            .inbound(deliver(on: 1, tag: "c1")),
+            .inbound(deliver(on: 2, tag: "c2")),
+            .inbound(header(on: 2, bodySize: 4)),
+            .inbound(header(on: 1, bodySize: 0)),
+            .inbound(ContentBodyFrame(channelId: 2, fragment: ByteBuffer(string: "ping"))),
+            .keepAlive,
+        ]
+        let connection = try await Connection(with: .default, env: makeTestEnv(with: actions))
+        let first = try await connection.makeChannel()
+        let second = try await connection.makeChannel()
+        let firstMessages = try await first.basicConsume(queue: "queue")
+        let secondMessages = try await second.basicConsume(queue: "queue")
+
+        var iterator = firstMessages.makeAsyncIterator()
+        let empty = try await iterator.next()
+        #expect(empty?.consumerTag == "c1")
+        #expect(empty?.body == [])
+        iterator = secondMessages.makeAsyncIterator()
+        let ping = try await iterator.next()
+        #expect(ping?.consumerTag == "c2")
+        #expect(ping?.body == Array("ping".utf8))
+    }
+
+    func openConsumers() -> [TransportMock.Action] {
+        var actions: [TransportMock.Action] = []
+        for channelId: UInt16 in [1, 2] {
+            actions += [
+                .outbound(MethodFrame(channelId: channelId, payload: Spec.Channel.Open())),
+                .inbound(MethodFrame(channelId: channelId, payload: Spec.Channel.OpenOk())),
+            ]
+        }
+        for channelId: UInt16 in [1, 2] {
+            actions += [
+                .outbound(MethodFrame(channelId: channelId, payload: Spec.Basic.Consume(queue: "queue"))),
+                .inbound(
+                    MethodFrame(channelId: channelId, payload: Spec.Basic.ConsumeOk(consumerTag: "c\(channelId)"))
+                ),
+            ]
+        }
+        return actions
+    }
+
+    @Test("A consumer which reads its streamed body slowly holds up its own channel only")
+    func streamedBodyBackPressure() async throws {
+        var actions = openConsumers()
+        actions += [
+            .inbound(deliver(on: 1, tag: "c1")),
+            .inbound(header(on: 1, bodySize: 12)),
+            .inbound(ContentBodyFrame(channelId: 1, fragment: ByteBuffer(string: "ping"))),
+            .inbound(ContentBodyFrame(channelId: 1, fragment: ByteBuffer(string: "pong"))),
+            // waits in the route of channel 1 until the consumer read the first fragments
+            .inbound(ContentBodyFrame(channelId: 1, fragment: ByteBuffer(string: "pang"))),
+            .inbound(deliver(on: 2, tag: "c2")),
+            .inbound(header(on: 2, bodySize: 4)),
+            .inbound(ContentBodyFrame(channelId: 2, fragment: ByteBuffer(string: "ping"))),
+            .keepAlive,
+        ]
+        let connection = try await Connection(with: .default, env: makeTestEnv(with: actions))
+        let first = try await connection.makeChannel()
+        let second = try await connection.makeChannel()
+        let streamedMessages = try await first.basicConsumeStreamingBodies(queue: "queue", maxBufferedBytes: 4)
+        let messages = try await second.basicConsume(queue: "queue")
+
+        var iterator = messages.makeAsyncIterator()
+        let ping = try await iterator.next()
+        #expect(ping?.body == Array("ping".utf8))
+        var streamedIterator = streamedMessages.makeAsyncIterator()
+        let message = try #require(try await streamedIterator.next())
+        var body: [UInt8] = []
+        for try await fragment in message.body {
+            body += Array(buffer: fragment)
+        }
+        #expect(body == Array("pingpongpang".utf8))
+        #expect(first.isOpen)
+    }
+
+    @Test("A consumer which falls further behind than its channel buffers gets it closed, the others carry on")
+    func consumerOverrun() async throws {
+        var actions = openConsumers()
+        actions += [
+            .inbound(deliver(on: 1, tag: "c1")),
+            .inbound(header(on: 1, bodySize: 20)),
+        ]
+        // two fragments fill the body buffer and the route holds one more, the ones after don't fit
+        for fragment in ["ping", "pong", "pang", "pung", "peng"] {
+            actions.append(.inbound(ContentBodyFrame(channelId: 1, fragment: ByteBuffer(string: fragment))))
+        }
+        let close = Spec.Channel.Close(replyCode: 506, replyText: "the consumer fell behind", classId: 0, methodId: 0)
+        actions += [
+            .outbound(MethodFrame(channelId: 1, payload: close)),
+            .inbound(MethodFrame(channelId: 1, payload: Spec.Channel.CloseOk())),
+            .inbound(deliver(on: 2, tag: "c2")),
+            .inbound(header(on: 2, bodySize: 4)),
+            .inbound(ContentBodyFrame(channelId: 2, fragment: ByteBuffer(string: "ping"))),
+            .keepAlive,
+        ]
+        var configuration = Configuration.default
+        configuration.maxBufferedDeliveries = 1
+        let connection = try await Connection(with: configuration, env: makeTestEnv(with: actions))
+        let first = try await connection.makeChannel()
+        let second = try await connection.makeChannel()
+        let streamedMessages = try await first.basicConsumeStreamingBodies(queue: "queue", maxBufferedBytes: 4)
+        let messages = try await second.basicConsume(queue: "queue")
+
+        var iterator = messages.makeAsyncIterator()
+        let ping = try await iterator.next()
+        #expect(ping?.body == Array("ping".utf8))
+        // the body is only read once the consumer fell behind, the route of channel 1 may have overflowed before its
+        // delivery was handed over
+        while first.isOpen {
+            try await Task.sleep(for: .milliseconds(1))
+        }
+        await #expect(throws: ConnectionError.consumerOverrun) {
+            for try await message in streamedMessages {
+                for try await _ in message.body {}
+            }
+        }
+    }
+
+    @Test("A stalled consumer holds at most maxBufferedDeliveries messages, the other channels keep flowing")
+    func stalledConsumerIsBounded() async throws {
+        var actions = openConsumers()
+        // the consumer of channel 1 doesn't read, the third delivery doesn't fit
+        for _ in 0..<3 {
+            actions += [.inbound(deliver(on: 1, tag: "c1")), .inbound(header(on: 1, bodySize: 0))]
+        }
+        let close = Spec.Channel.Close(replyCode: 506, replyText: "the consumer fell behind", classId: 0, methodId: 0)
+        actions += [
+            .outbound(MethodFrame(channelId: 1, payload: close)),
+            .inbound(MethodFrame(channelId: 1, payload: Spec.Channel.CloseOk())),
+        ]
+        for _ in 0..<2 {
+            actions += [.inbound(deliver(on: 2, tag: "c2")), .inbound(header(on: 2, bodySize: 0))]
+        }
+        actions.append(.keepAlive)
+        var configuration = Configuration.default
+        configuration.maxBufferedDeliveries = 2
+        let connection = try await Connection(with: configuration, env: makeTestEnv(with: actions))
+        let first = try await connection.makeChannel()
+        let second = try await connection.makeChannel()
+        let stalled = try await first.basicConsume(queue: "queue")
+        let messages = try await second.basicConsume(queue: "queue")
+
+        var iterator = messages.makeAsyncIterator()
+        for _ in 0..<2 {
+            let message = try await iterator.next()
+            #expect(message?.consumerTag == "c2")
+        }
+        // at most what fit in the buffer before the overrun is delivered
+        var received = 0
+        do {
+            for try await message in stalled {
+                #expect(message.consumerTag == "c1")
+                received += 1
+            }
+            Issue.record("the stream of a consumer which fell behind should fail")
+        } catch {
+            #expect(error as? ConnectionError == .consumerOverrun)
+        }
+        #expect(received <= 2)
+    }
+}
@@ -0,0 +1,73 @@
+import NIOCore
+import NIOPosix
+import Testing
+
+@testable import AMQP
+
+@Suite struct OutboundQueueing {
+    let eventLoop = MultiThreadedEventLoopGroup.singleton.next()
+
+    // heartbeats are 8 bytes each
+    func makeQueue(maxPendingBytes: Int = 16, maxFlushBytes: Int = 16) -> OutboundQueue {
+        OutboundQueue(
+            configuration: .init(maxPendingBytes: maxPendingBytes, maxFlushBytes: maxFlushBytes),
+            eventLoop: eventLoop
+        )
+    }
+
+    func heartbeats(_ count: Int) -> [any Frame] {
+        Array(repeating: HeartbeatFrame(), count: count)
+    }
+
+    @Test("Publishers wait while the queue is full and go on once the writer took the frames")
+    func backPressure() async throws {
+        let queue = makeQueue()
+        queue.enqueue(heartbeats(2))
+        let reservation = queue.reserve()
+        #expect(queue.statistics.waitingPublishers == 1)
+        #expect(queue.statistics.pendingBytes == 16)
+        let frames = await queue.next()
+        #expect(frames?.count == 2)
+        try await reservation.get()
+        let statistics = queue.statistics
+        #expect(statistics.depth == 0)
+        #expect(statistics.flushes == 1)
+        #expect(statistics.lastFlushBytes == 16)
+        #expect(statistics.maxPendingBytes == 16)
+    }
+
+    @Test("A flush takes at most maxFlushBytes, the rest is written with the next one")
+    func flushSize() async throws {
+        let queue = makeQueue(maxPendingBytes: 64)
+        queue.enqueue(heartbeats(3))
+        #expect(await queue.next()?.count == 2)
+        #expect(await queue.next()?.count == 1)
+        #expect(queue.statistics.flushedBytes == 24)
+    }
+
+    @Test("Connection.Blocked holds the publishers until Connection.Unblocked")
+    func blocked() async throws {
+        let queue = makeQueue()
+        queue.setBlocked(true)
+        let reservation = queue.reserve()
+        #expect(queue.statistics.isBlocked)
+        #expect(queue.statistics.waitingPublishers == 1)
+        queue.setBlocked(false)
+        try await reservation.get()
+    }
+
+    @Test("A closed connection stops the writer and fails the waiting publishers and the later ones")
+    func finish() async throws {
+        let queue = makeQueue()
+        queue.setBlocked(true)
+        let reservation = queue.reserve()
+        queue.finish()
+        #expect(await queue.next() == nil)
+        await #expect(throws: ConnectionError.connectionIsClosed) {
+            try await reservation.get()
+        }
+        await #expect(throws: ConnectionError.connectionIsClosed) {
+            try await queue.reserve().get()
+        }
+    }
+}
@@ -0,0 +1,144 @@
+import NIOCore
+import NIOPosix
+import Testing
+
+@testable import AMQP
+
+@Suite struct PublisherConfirming {
+    // shared by the tests, a group per test would leak its thread
+    let eventLoop = MultiThreadedEventLoopGroup.singleton.next()
+
+    @Test("Acks confirm the messages by delivery tag, multiple ones everything up to the tag")
+    func acks() async throws {
+        let confirms = PublisherConfirms(maxInFlight: 10, eventLoop: eventLoop)
+        let confirmations = try confirms.track(3, isReserved: false) {}
+        #expect(confirms.inFlight == 3)
+        confirms.confirm(deliveryTag: 2, multiple: false, isAck: true)
+        try await confirmations[1].get()
+        #expect(confirms.inFlight == 2)
+        confirms.confirm(deliveryTag: 3, multiple: true, isAck: true)
+        try await confirmations[0].get()
+        try await confirmations[2].get()
+        #expect(confirms.inFlight == 0)
+    }
+
+    @Test("A nack fails the confirmation")
+    func nack() async throws {
+        let confirms = PublisherConfirms(maxInFlight: 10, eventLoop: eventLoop)
+        let confirmations = try confirms.track(2, isReserved: false) {}
+        confirms.confirm(deliveryTag: 2, multiple: true, isAck: false)
+        for confirmation in confirmations {
+            await #expect(throws: PublishError.nacked(deliveryTag: 2)) {
+                try await confirmation.get()
+            }
+        }
+    }
+
+    @Test("Publishers wait for room in the in-flight window")
+    func window() async throws {
+        let confirms = PublisherConfirms(maxInFlight: 2, eventLoop: eventLoop)
+        try await confirms.reserve(2).get()
+        _ = try confirms.track(2, isReserved: true) {}
+        let reservation = confirms.reserve(1)
+        #expect(confirms.inFlight == 2)
+        confirms.confirm(deliveryTag: 1, multiple: false, isAck: true)
+        try await reservation.get()
+        // one unconfirmed, one reserved
+        #expect(confirms.inFlight == 2)
+    }
+
+    @Test("A dropped connection fails the unconfirmed messages and the later ones")
+    func failure() async throws {
+        let confirms = PublisherConfirms(maxInFlight: 10, eventLoop: eventLoop)
+        let confirmations = try confirms.track(1, isReserved: false) {}
+        confirms.fail(with: ConnectionError.connectionIsClosed)
+        await #expect(throws: ConnectionError.connectionIsClosed) {
+            try await confirmations[0].get()
+        }
+        await #expect(throws: ConnectionError.connectionIsClosed) {
+            try await confirms.reserve(1).get()
+        }
+    }
+
+    @Test("Channel in confirm mode completes the confirmation on Basic.Ack")
+    func channelConfirmMode() async throws {
+        let channelId: UInt16 = 1
+        let publish = Spec.Basic.Publish(exchange: "exchange", routingKey: "key")
+        let actions: [TransportMock.Action] = [
+            .outbound(MethodFrame(channelId: channelId, payload: Spec.Channel.Open())),
+            .inbound(MethodFrame(channelId: channelId, payload: Spec.Channel.OpenOk())),
+            .outbound(MethodFrame(channelId: channelId, payload: Spec.Confirm.Select())),
+            .inbound(MethodFrame(channelId: channelId, payload: Spec.Confirm.SelectOk())),
+            .outbound(MethodFrame(channelId: channelId, payload: publish)),
+            .outbound(
+                ContentHeaderFrame(channelId: channelId, classId: publish.amqpClassId, bodySize: 4, properties: .init())
+            ),
+            .outbound(ContentBodyFrame(channelId: channelId, fragment: ByteBuffer(string: "ping"))),
+            .inbound(MethodFrame(channelId: channelId, payload: Spec.Basic.Ack(deliveryTag: 1))),
+            .keepAlive,
+        ]
+        let connection = try await Connection(with: .default, env: makeTestEnv(with: actions))
+        let channel = try await connection.makeChannel()
+        try await channel.confirmSelect()
+        let confirmation = try await channel.basicPublishConfirmed(
+            OutboundMessage(exchange: "exchange", routingKey: "key", body: "ping")
+        )
+        try await confirmation.wait()
+    }
+
+    @Test("A plain publish on a channel in confirm mode waits for room in the in-flight window")
+    func plainPublishIsWindowed() async throws {
+        let channelId: UInt16 = 1
+        let publish = Spec.Basic.Publish(exchange: "exchange", routingKey: "key")
+        let messageFrames: [TransportMock.Action] = [
+            .outbound(MethodFrame(channelId: channelId, payload: publish)),
+            .outbound(
+                ContentHeaderFrame(channelId: channelId, classId: publish.amqpClassId, bodySize: 4, properties: .init())
+            ),
+            .outbound(ContentBodyFrame(channelId: channelId, fragment: ByteBuffer(string: "ping"))),
+        ]
+        var actions: [TransportMock.Action] = [
+            .outbound(MethodFrame(channelId: channelId, payload: Spec.Channel.Open())),
+            .inbound(MethodFrame(channelId: channelId, payload: Spec.Channel.OpenOk())),
+            .outbound(MethodFrame(channelId: channelId, payload: Spec.Confirm.Select())),
+            .inbound(MethodFrame(channelId: channelId, payload: Spec.Confirm.SelectOk())),
+        ]
+        actions += messageFrames
+        // the second message would be sent before Basic.Qos if it didn't wait for the ack of the first one
+        actions += [
+            .outbound(MethodFrame(channelId: channelId, payload: Spec.Basic.Qos(prefetchCount: 1))),
+            .inbound(MethodFrame(channelId: channelId, payload: Spec.Basic.Ack(deliveryTag: 1))),
+            .inbound(MethodFrame(channelId: channelId, payload: Spec.Basic.QosOk())),
+        ]
+        actions += messageFrames
+        actions.append(.keepAlive)
+        let connection = try await Connection(with: .default, env: makeTestEnv(with: actions))
+        let channel = try await connection.makeChannel()
+        try await channel.confirmSelect(maxInFlight: 1)
+        try await channel.basicPublish(exchange: "exchange", routingKey: "key", body: "ping")
+        let second = Task {
+            try await channel.basicPublish(exchange: "exchange", routingKey: "key", body: "ping")
+        }
+        try await Task.sleep(for: .milliseconds(50))
+        try await channel.basicQos(prefetchCount: 1)
+        try await second.value
+    }
+
+    @Test("confirmSelect with another in-flight window than the channel uses throws")
+    func confirmWindowMismatch() async throws {
+        let channelId: UInt16 = 1
+        let actions: [TransportMock.Action] = [
+            .outbound(MethodFrame(channelId: channelId, payload: Spec.Channel.Open())),
+            .inbound(MethodFrame(channelId: channelId, payload: Spec.Channel.OpenOk())),
+            .outbound(MethodFrame(channelId: channelId, payload: Spec.Confirm.Select())),
+            .inbound(MethodFrame(channelId: channelId, payload: Spec.Confirm.SelectOk())),
+            .keepAlive,
+        ]
+        let connection = try await Connection(with: .default, env: makeTestEnv(with: actions))
+        let channel = try await connection.makeChannel()
+        try await channel.confirmSelect(maxInFlight: 8)
+        await #expect(throws: PublishError.confirmWindowMismatch(maxInFlight: 8, requested: 16)) {
+            try await channel.confirmSelect(maxInFlight: 16)
+        }
+    }
+}
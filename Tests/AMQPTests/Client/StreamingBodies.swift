@@ -0,0 +1,153 @@
+import Atomics
+import NIOCore
+import Testing
+
+@testable import AMQP
+
+@Suite struct StreamingBodies {
+    let openChannel: [TransportMock.Action] = [
+        .outbound(MethodFrame(channelId: 1, payload: Spec.Channel.Open())),
+        .inbound(MethodFrame(channelId: 1, payload: Spec.Channel.OpenOk())),
+    ]
+
+    @Test("A streamed message is delivered with its header, the body follows fragment by fragment")
+    func consume() async throws {
+        let deliver = Spec.Basic.Deliver(consumerTag: "tag", deliveryTag: 1, exchange: "exchange", routingKey: "key")
+        let actions =
+            openChannel + [
+                .outbound(MethodFrame(channelId: 1, payload: Spec.Basic.Consume(queue: "queue"))),
+                .inbound(MethodFrame(channelId: 1, payload: Spec.Basic.ConsumeOk(consumerTag: "tag"))),
+                .inbound(MethodFrame(channelId: 1, payload: deliver)),
+                .inbound(ContentHeaderFrame(channelId: 1, classId: 60, bodySize: 8, properties: .init())),
+                .inbound(ContentBodyFrame(channelId: 1, fragment: ByteBuffer(string: "ping"))),
+                .inbound(ContentBodyFrame(channelId: 1, fragment: ByteBuffer(string: "pong"))),
+                .keepAlive,
+            ]
+        let connection = try await Connection(with: .default, env: makeTestEnv(with: actions))
+        let channel = try await connection.makeChannel()
+        let messages = try await channel.basicConsumeStreamingBodies(queue: "queue")
+
+        var iterator = messages.makeAsyncIterator()
+        let message = try #require(try await iterator.next())
+        #expect(message.consumerTag == "tag")
+        #expect(message.bodySize == 8)
+        var fragments: [String] = []
+        for try await fragment in message.body {
+            fragments.append(String(buffer: fragment))
+        }
+        #expect(fragments == ["ping", "pong"])
+    }
+
+    @Test("A body published from a sequence of chunks is sent in frames of the negotiated size")
+    func publish() async throws {
+        let publish = Spec.Basic.Publish(exchange: "exchange", routingKey: "key")
+        let actions =
+            openChannel + [
+                .outbound(MethodFrame(channelId: 1, payload: publish)),
+                .outbound(ContentHeaderFrame(channelId: 1, classId: 60, bodySize: 10, properties: .init())),
+                .outbound(ContentBodyFrame(channelId: 1, fragment: ByteBuffer(string: "abcd"))),
+                .outbound(ContentBodyFrame(channelId: 1, fragment: ByteBuffer(string: "efgh"))),
+                .outbound(ContentBodyFrame(channelId: 1, fragment: ByteBuffer(string: "ij"))),
+            ]
+        // 4 bytes per body frame
+        let env = makeTestEnv(with: actions) {
+            var props = $0
+            props.0.maxFrameSize = 12
+            return props
+        }
+        let connection = try await Connection(with: .default, env: env)
+        let channel = try await connection.makeChannel()
+        let chunks = AsyncStream<[UInt8]> {
+            for chunk in ["ab", "cdefgh", "ij"] {
+                $0.yield(Array(chunk.utf8))
+            }
+            $0.finish()
+        }
+        try await channel.basicPublish(exchange: "exchange", routingKey: "key", bodySize: 10, body: chunks)
+    }
+
+    @Test("Nothing else is published on the channel while a body is streamed")
+    func publishWhileStreaming() async throws {
+        let publish = Spec.Basic.Publish(exchange: "exchange", routingKey: "key")
+        let actions =
+            openChannel + [
+                .outbound(MethodFrame(channelId: 1, payload: publish)),
+                .outbound(ContentHeaderFrame(channelId: 1, classId: 60, bodySize: 4, properties: .init())),
+                .outbound(ContentBodyFrame(channelId: 1, fragment: ByteBuffer(string: "ping"))),
+            ]
+        let connection = try await Connection(with: .default, env: makeTestEnv(with: actions))
+        let channel = try await connection.makeChannel()
+        let reads = ManagedAtomic(0)
+        // the header is out once the body is read
+        let chunks = AsyncStream<ByteBuffer> {
+            guard reads.loadThenWrappingIncrement(ordering: .relaxed) == 0 else {
+                return nil
+            }
+            await #expect(throws: PublishError.channelBusy) {
+                try await channel.basicPublish(exchange: "exchange", routingKey: "key", body: "late")
+            }
+            await #expect(throws: PublishError.channelBusy) {
+                try await channel.basicPublish(
+                    exchange: "exchange",
+                    routingKey: "key",
+                    bodySize: 0,
+                    body: AsyncStream<ByteBuffer> { nil }
+                )
+            }
+            return ByteBuffer(string: "ping")
+        }
+        try await channel.basicPublish(exchange: "exchange", routingKey: "key", bodySize: 4, body: chunks)
+    }
+
+    @Test("The acks sent while a body is streamed follow the body")
+    func ackWhileStreaming() async throws {
+        let publish = Spec.Basic.Publish(exchange: "exchange", routingKey: "key")
+        let actions =
+            openChannel + [
+                .outbound(MethodFrame(channelId: 1, payload: publish)),
+                .outbound(ContentHeaderFrame(channelId: 1, classId: 60, bodySize: 4, properties: .init())),
+                .outbound(ContentBodyFrame(channelId: 1, fragment: ByteBuffer(string: "ping"))),
+                .outbound(MethodFrame(channelId: 1, payload: Spec.Basic.Ack(deliveryTag: 1, multiple: false))),
+            ]
+        let connection = try await Connection(with: .default, env: makeTestEnv(with: actions))
+        let channel = try await connection.makeChannel()
+        let reads = ManagedAtomic(0)
+        let chunks = AsyncStream<ByteBuffer> {
+            guard reads.loadThenWrappingIncrement(ordering: .relaxed) == 0 else {
+                return nil
+            }
+            try? await channel.basicAck(deliveryTag: 1)
+            return ByteBuffer(string: "ping")
+        }
+        try await channel.basicPublish(exchange: "exchange", routingKey: "key", bodySize: 4, body: chunks)
+    }
+
+    @Test("A body which doesn't add up to bodySize throws and closes the connection")
+    func publishShortBody() async throws {
+        let publish = Spec.Basic.Publish(exchange: "exchange", routingKey: "key")
+        let close = Spec.Connection.Close(
+            replyCode: 541,
+            replyText: "the body of a streamed message couldn't be sent",
+            classId: 60,
+            methodId: 40
+        )
+        let actions =
+            openChannel + [
+                .outbound(MethodFrame(channelId: 1, payload: publish)),
+                .outbound(ContentHeaderFrame(channelId: 1, classId: 60, bodySize: 8, properties: .init())),
+                .outbound(ContentBodyFrame(channelId: 1, fragment: ByteBuffer(string: "ping"))),
+                .outbound(MethodFrame(channelId: 0, payload: close)),
+                .inbound(MethodFrame(channelId: 0, payload: Spec.Connection.CloseOk())),
+            ]
+        let connection = try await Connection(with: .default, env: makeTestEnv(with: actions))
+        let channel = try await connection.makeChannel()
+        let chunks = AsyncStream<[UInt8]> {
+            $0.yield(Array("ping".utf8))
+            $0.finish()
+        }
+        await #expect(throws: PublishError.bodySizeMismatch(bodySize: 8, readBytes: 4)) {
+            try await channel.basicPublish(exchange: "exchange", routingKey: "key", bodySize: 8, body: chunks)
+        }
+        #expect(!channel.isOpen)
+    }
+}
@@ -22,10 +22,10 @@ final class TransportMock: TransportProtocol, @unchecked Sendable {
         }
     }
 
-    private let eventLoop: EventLoop = MultiThreadedEventLoopGroup(numberOfThreads: 1).next()
+    let eventLoop: any EventLoop
     private let outboundContinuation: AsyncStream<any Frame>.Continuation
     private let outboundFrames: AsyncStream<any Frame>
-    private let inboundContinuation: AsyncStream<any Frame>.Continuation
+    private let inboundContinuation: AsyncStream<InboundFrame>.Continuation
     // Warning: the following variable is not Sendable
     private(set) var actions: [Action] = .init()
     private(set) var lastUsedIdx: ManagedAtomic<[Action].Index> = .init(0)
@@ -39,10 +39,14 @@ final class TransportMock: TransportProtocol, @unchecked Sendable {
     init(
         host: String,
         port: Int,
+        rawBytesRecordingPath: String?,
+        outboundQueue: OutboundQueueConfiguration,
+        eventLoopGroup: (any EventLoopGroup)?,
         logger: Logger,
-        inboundContinuation: AsyncStream<any AMQP.Frame>.Continuation,
+        inboundContinuation: AsyncStream<InboundFrame>.Continuation,
         negotiatorFactory: @escaping () -> any AMQPNegotiationDelegateProtocol
     ) async throws {
+        self.eventLoop = eventLoopGroup?.next() ?? MultiThreadedEventLoopGroup(numberOfThreads: 1).next()
         self.inboundContinuation = inboundContinuation
         var outboundContinuation: AsyncStream<any Frame>.Continuation?
         self.outboundFrames = AsyncStream { continuation in
@@ -72,7 +76,7 @@ final class TransportMock: TransportProtocol, @unchecked Sendable {
             guard case .inbound(let frame) = actions[idx] else {
                 break
             }
-            self.inboundContinuation.yield(frame)
+            self.inboundContinuation.yield(InboundFrame(frame))
             idx = idx.advanced(by: 1)
         }
         return idx
@@ -87,7 +91,7 @@ final class TransportMock: TransportProtocol, @unchecked Sendable {
         for try await testedFrame in self.outboundFrames {
             switch actions[idx] {
             case .inbound(let frame):
-                self.inboundContinuation.yield(frame)
+                self.inboundContinuation.yield(InboundFrame(frame))
             case .outbound(let expectedFrame):
                 #expect(testedFrame.isEqual(to: expectedFrame))
             case .keepAlive:
@@ -124,6 +128,10 @@ extension TransportMock {
         return isActiveShadow.load(ordering: .sequentiallyConsistent)
     }
 
+    var interner: ShortStringInterner? { nil }
+
+    var outboundQueue: OutboundQueue? { nil }
+
     func send(_ frame: any AMQP.Frame) -> NIOCore.EventLoopPromise<any AMQP.Frame> {
         let promise = eventLoop.makePromise(of: (any Frame).self)
         outboundContinuation.yield(frame)
@@ -148,3 +156,16 @@ extension TransportMock {
         }
     }
 }
+
+extension InboundFrame {
+    // the frames of the expected actions as ByteToFrameCoderHandler would hand them over
+    init(_ frame: any Frame) {
+        switch frame {
+        case let frame as MethodFrame: self = .method(frame)
+        case let frame as ContentHeaderFrame: self = .header(frame)
+        case let frame as ContentBodyFrame: self = .body(frame)
+        case is HeartbeatFrame: self = .heartbeat
+        default: fatalError("\(type(of: frame)) is never received from the broker")
+        }
+    }
+}
@@ -0,0 +1,87 @@
+import NIOConcurrencyHelpers
+import NIOCore
+import Testing
+
+@testable import AMQP
+
+@Suite struct AdaptivePrefetching {
+    final class FakeClock: Sendable {
+        private let time = NIOLockedValueBox(NIODeadline.uptimeNanoseconds(0))
+        var now: NIODeadline { time.withLockedValue { $0 } }
+        func advance(by amount: TimeAmount) {
+            time.withLockedValue { $0 = $0 + amount }
+        }
+    }
+
+    func makeController(_ configuration: AdaptivePrefetch, clock: FakeClock) -> PrefetchController {
+        PrefetchController(configuration: configuration, now: { clock.now })
+    }
+
+    @Test("The prefetch count grows up to the maximum while it limits a fast consumer")
+    func growsForFastConsumer() async throws {
+        let clock = FakeClock()
+        let controller = makeController(.init(maximum: 100, initial: 10), clock: clock)
+        var prefetchCount = 10
+        var tag: Int64 = 0
+        for _ in 0..<60 {
+            // the broker fills the window, the consumer acks it all 1ms later
+            for _ in 0..<prefetchCount {
+                tag += 1
+                prefetchCount = controller.recordDelivery(tag: tag) ?? prefetchCount
+            }
+            clock.advance(by: .milliseconds(1))
+            prefetchCount = controller.recordSettlement(tag: tag, multiple: true) ?? prefetchCount
+            clock.advance(by: .milliseconds(99))
+        }
+        #expect(prefetchCount == 100)
+        let statistics = controller.statistics
+        #expect(statistics.prefetchCount == 100)
+        #expect(statistics.inFlight == 0)
+        #expect(statistics.ackLatency == .milliseconds(1))
+        #expect(statistics.adjustments > 1)
+    }
+
+    @Test("The prefetch count shrinks for a slow consumer")
+    func shrinksForSlowConsumer() async throws {
+        let clock = FakeClock()
+        let controller = makeController(.init(initial: 100), clock: clock)
+        for tag in Int64(1)...100 {
+            #expect(controller.recordDelivery(tag: tag) == nil)
+        }
+        // 10 messages a second, rate * targetLatency is 2
+        var prefetchCount: Int?
+        for tag in Int64(1)...10 {
+            clock.advance(by: .milliseconds(100))
+            prefetchCount = controller.recordSettlement(tag: tag, multiple: false) ?? prefetchCount
+        }
+        #expect(prefetchCount == 2)
+        #expect(controller.statistics.inFlight == 90)
+        #expect(controller.statistics.ackRate == 10)
+    }
+
+    @Test("Acks settle the matching deliveries only")
+    func settlement() async throws {
+        let clock = FakeClock()
+        let controller = makeController(.default, clock: clock)
+        for tag in Int64(1)...10 {
+            _ = controller.recordDelivery(tag: tag)
+        }
+        _ = controller.recordSettlement(tag: 42, multiple: false)
+        #expect(controller.statistics.inFlight == 10)
+        _ = controller.recordSettlement(tag: 5, multiple: false)
+        #expect(controller.statistics.inFlight == 9)
+        _ = controller.recordSettlement(tag: 7, multiple: true)
+        #expect(controller.statistics.inFlight == 3)
+        _ = controller.recordSettlement(tag: 0, multiple: true)
+        #expect(controller.statistics.inFlight == 0)
+    }
+
+    @Test("An idle consumer keeps its prefetch count")
+    func idleConsumerKeepsWindow() async throws {
+        let clock = FakeClock()
+        let controller = makeController(.default, clock: clock)
+        clock.advance(by: .seconds(10))
+        #expect(controller.recordDelivery(tag: 1) == nil)
+        #expect(controller.statistics.prefetchCount == AdaptivePrefetch.default.initial)
+    }
+}
@@ -0,0 +1,37 @@
+#if CodecMetrics
+    import NIOCore
+    import Testing
+
+    @testable import AMQP
+
+    // the counters are process wide, so only growth is checked as other tests run concurrently
+    @Test("Encoding and decoding a method is counted per method")
+    func codecMetricsCountMethods() async throws {
+        func counters() -> CodecMetricsSnapshot.Method? {
+            Connection.codecMetrics().methods.first { $0.name == "basic.qos" }
+        }
+        let before = counters()
+        let method = Spec.Basic.Qos(prefetchCount: 10)
+        let binary = try FrameEncoder().encode(method)
+        _ = try FrameDecoder().decode(Spec.Basic.Qos.self, from: binary)
+        let after = try #require(counters())
+        #expect(after.classId == 60 && after.methodId == 10)
+        #expect(after.encoded.count >= (before?.encoded.count ?? 0) + 1)
+        #expect(after.decoded.count >= (before?.decoded.count ?? 0) + 1)
+        #expect(after.decoded.bytes >= (before?.decoded.bytes ?? 0) + UInt64(method.bytesCount))
+    }
+
+    @Test("Methods written from a frame template are counted as encoded")
+    func codecMetricsCountTemplatedWrites() async throws {
+        func counters() -> CodecMetricsSnapshot.Method? {
+            Connection.codecMetrics().methods.first { $0.name == "basic.qos-ok" }
+        }
+        let before = counters()
+        let method = Spec.Basic.QosOk()
+        var buffer = ByteBuffer()
+        // goes through Spec.Basic.QosOk.writeFrameFromTemplate instead of write(into:)
+        try MethodFrame(channelId: 1, payload: method).writeFrame(into: &buffer)
+        let after = try #require(counters())
+        #expect(after.encoded.count >= (before?.encoded.count ?? 0) + 1)
+    }
+#endif  // CodecMetrics
@@ -0,0 +1,72 @@
+import NIOCore
+import NIOEmbedded
+import Testing
+
+@testable import AMQP
+
+@Suite struct ShortStringInterning {
+    @Test("Repeated Basic.Deliver shortstr fields are served from the interning cache")
+    func deliverFieldsAreInterned() async throws {
+        let method = Spec.Basic.Deliver(consumerTag: "tag", deliveryTag: 1, exchange: "exchange", routingKey: "key")
+        let binary = try FrameEncoder().encode(method)
+        let interner = ShortStringInterner()
+        let decoder = FrameDecoder(interner: interner)
+        #expect(try decoder.decode(Spec.Basic.Deliver.self, from: binary) == method)
+        #expect(interner.statistics == InterningStatistics(hits: 0, misses: 3))
+        #expect(try decoder.decode(Spec.Basic.Deliver.self, from: binary) == method)
+        #expect(interner.statistics == InterningStatistics(hits: 3, misses: 3))
+    }
+
+    @Test("Deliveries decoded into lazy views share the cached storage of their consumer tag")
+    func deliverViewFieldsAreInterned() async throws {
+        let interner = ShortStringInterner()
+        let channel = EmbeddedChannel(handler: ByteToMessageHandler(ByteToFrameCoderHandler(interner: interner)))
+        // longer than a small string, which would be stored inline
+        let consumerTag = "amq.ctag-interned-consumer-tag"
+        for deliveryTag in Int64(1)...2 {
+            let method = Spec.Basic.Deliver(
+                consumerTag: consumerTag, deliveryTag: deliveryTag, exchange: "exchange", routingKey: "key")
+            try channel.writeInbound(try MethodFrame(channelId: 1, payload: method).asData())
+        }
+        let views = try (0..<2).map { _ in
+            let frame = try #require(try channel.readInbound(as: InboundFrame.self))
+            let method: MethodFrame? = if case .method(let method) = frame { method } else { nil }
+            return try #require(method?.payload as? Spec.Basic.DeliverView)
+        }
+        #expect(views.map(\.deliveryTag) == [1, 2])
+        #expect(interner.statistics == InterningStatistics(hits: 3, misses: 3))
+        let storage = views.map { view in
+            view.consumerTag.utf8.withContiguousStorageIfAvailable { UInt(bitPattern: $0.baseAddress) }
+        }
+        #expect(storage[0] != nil)
+        #expect(storage[0] == storage[1])
+        _ = try channel.finish()
+    }
+
+    @Test("The least recently used string is evicted when the cache is full")
+    func leastRecentlyUsedIsEvicted() async throws {
+        let interner = ShortStringInterner(capacity: 2)
+        _ = interner.string(for: ByteBuffer(string: "a"))
+        _ = interner.string(for: ByteBuffer(string: "b"))
+        _ = interner.string(for: ByteBuffer(string: "a"))
+        // evicts "b"
+        _ = interner.string(for: ByteBuffer(string: "c"))
+        #expect(interner.string(for: ByteBuffer(string: "a")) == "a")
+        #expect(interner.statistics == InterningStatistics(hits: 2, misses: 3))
+        #expect(interner.string(for: ByteBuffer(string: "b")) == "b")
+        #expect(interner.statistics == InterningStatistics(hits: 2, misses: 4))
+    }
+
+    @Test("The evicted slots are reused for the new strings")
+    func evictedSlotsAreReused() async throws {
+        let interner = ShortStringInterner(capacity: 2)
+        for string in ["a", "b", "c", "d"] {
+            #expect(interner.string(for: ByteBuffer(string: string)) == string)
+        }
+        _ = interner.string(for: ByteBuffer(string: "c"))
+        _ = interner.string(for: ByteBuffer(string: "d"))
+        #expect(interner.statistics == InterningStatistics(hits: 2, misses: 4))
+        _ = interner.string(for: ByteBuffer(string: "a"))
+        #expect(interner.statistics == InterningStatistics(hits: 2, misses: 5))
+    }
+}
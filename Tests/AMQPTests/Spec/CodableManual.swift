@@ -23,6 +23,48 @@ import Testing
     }
 }
 
+@Suite struct FieldValueCoding {
+    @Test("Table with nested arrays encoding/decoding roundtrip")
+    func nestedArrays() async throws {
+        let table: Spec.Table = [
+            "list": .array([.int32(1), .longstr("two"), .array([.bool(true), .f64(0.5)])]),
+            "empty": .array([]),
+            "nested": .table(["list": .array([.uint8(3)])]),
+        ]
+        let method = Spec.Basic.Consume(arguments: table)
+        let binary = try FrameEncoder().encode(method)
+        #expect(binary.count == method.bytesCount)
+        let decoded = try FrameDecoder().decode(Spec.Basic.Consume.self, from: binary)
+        #expect(decoded == method)
+    }
+
+    @Test("Table with every field value type encoding/decoding roundtrip")
+    func everyFieldValueType() async throws {
+        var table = Spec.Table()
+        for (index, value) in Spec.FieldValue.allCases.enumerated() {
+            table["key\(index)"] = value
+        }
+        let method = Spec.Basic.Consume(arguments: ["nested": .table(table)])
+        let binary = try FrameEncoder().encode(method)
+        #expect(binary.count == method.bytesCount)
+        var written = ByteBuffer()
+        method.write(into: &written)
+        #expect(written == binary)
+        let decoded = try FrameDecoder().decode(Spec.Basic.Consume.self, from: binary)
+        #expect(decoded == method)
+    }
+
+    @Test("Unknown field value type throws instead of trapping")
+    func unknownFieldValueType() async throws {
+        var binary = try FrameEncoder().encode(Spec.Basic.Consume(arguments: ["k": .bool(true)]))
+        // ticket, queue, consumer tag, bits, table size and the key precede the type tag
+        binary.setInteger(UInt8(ascii: "Z"), at: 2 + 1 + 1 + 1 + 4 + 2)
+        #expect(throws: FramingError.self) {
+            try FrameDecoder().decode(Spec.Basic.Consume.self, from: binary)
+        }
+    }
+}
+
 @Suite struct AMQPFrameCoding {
     @Test("ProtocolHeaderFrame default encoding/decoding roundtrip")
     func protocolHeaderFrame() async throws {
@@ -47,6 +89,40 @@ import Testing
         #expect(decodedMethod! == method)
     }
 
+    @Test("MethodFrame direct serialization matches FrameEncoder")
+    func methodFrameAsData() async throws {
+        let method = Spec.Basic.Consume(
+            queue: "queue",
+            consumerTag: "tag",
+            noAck: true,
+            arguments: ["x-priority": .int32(10), "x-name": .longstr("värde")]
+        )
+        let object = MethodFrame(channelId: 3, payload: method)
+        let binary = try object.asData()
+        #expect(binary == (try FrameEncoder().encode(object)))
+        #expect(binary.count == object.bytesCount)
+    }
+
+    @Test("MethodFrame decodes Basic.Deliver into the lazy view when asked to")
+    func methodFrameLazyView() async throws {
+        let method = Spec.Basic.Deliver(
+            consumerTag: "tag",
+            deliveryTag: 7,
+            redelivered: true,
+            exchange: "exchange",
+            routingKey: "key"
+        )
+        let binary = try MethodFrame(channelId: 3, payload: method).asData()
+        let decoded = try FrameDecoder(decodesLazyViews: true).decode(MethodFrame.self, from: binary)
+        let view = try #require(decoded.unwrapPayload(as: Spec.Basic.DeliverView.self))
+        #expect(view.deliveryTag == 7)
+        #expect(view.redelivered)
+        #expect(view.exchange == "exchange")
+        #expect(view.routingKey == "key")
+        #expect(view.materialize() == method)
+        #expect(try decoded.asData() == binary)
+    }
+
     @Test("HeartbeatFrame default encoding/decoding roundtrip")
     func heartbeatFrame() async throws {
         let object = HeartbeatFrame()
@@ -70,12 +146,61 @@ import Testing
         #expect(decoded == object)
     }
 
+    @Test("ContentHeaderFrame with properties direct serialization matches FrameEncoder")
+    func contentHeaderFrameAsData() async throws {
+        let object = ContentHeaderFrame(
+            channelId: 3,
+            classId: Spec.Basic.Publish().amqpClassId,
+            bodySize: 10,
+            properties: .init(
+                contentType: "text/plain",
+                headers: ["x-retries": .int32(2)],
+                deliveryMode: 2,
+                timestamp: Timestamp(millisecondsSince1970: 1_700_000_000_000),
+                clusterId: "cluster"
+            )
+        )
+        let binary = try object.asData()
+        #expect(binary == (try FrameEncoder().encode(object)))
+        #expect(binary.count == object.bytesCount)
+        let decoded = try FrameDecoder().decode(ContentHeaderFrame.self, from: binary)
+        #expect(decoded == object)
+    }
+
     @Test("ContentBodyFrame default encoding/decoding roundtrip")
     func contentBodyFrame() async throws {
-        let object = ContentBodyFrame(channelId: 3, fragment: [0, 1, 2, 3, 4, 5])
+        let object = ContentBodyFrame(channelId: 3, fragment: ByteBuffer(bytes: [0, 1, 2, 3, 4, 5]))
         let binary = try FrameEncoder().encode(object)
         let decoded = try FrameDecoder().decode(ContentBodyFrame.self, from: binary)
         #expect(binary.count == object.bytesCount)
         #expect(decoded == object)
     }
+
+    @Test("ContentBodyFrame direct serialization matches FrameEncoder")
+    func contentBodyFrameAsData() async throws {
+        let object = ContentBodyFrame(channelId: 3, fragment: ByteBuffer(string: "fragment"))
+        let binary = try object.asData()
+        #expect(binary == (try FrameEncoder().encode(object)))
+        #expect(binary.count == object.bytesCount)
+    }
+
+    @Test("FrameBatch serializes its frames back to back into one buffer")
+    func frameBatchAsData() async throws {
+        let publish = Spec.Basic.Publish(exchange: "exchange", routingKey: "key")
+        let frames: [any Frame] = [
+            MethodFrame(channelId: 3, payload: publish),
+            ContentHeaderFrame(channelId: 3, classId: publish.amqpClassId, bodySize: 4, properties: .init()),
+            ContentBodyFrame(channelId: 3, fragment: ByteBuffer(string: "ping")),
+        ]
+        let batch = FrameBatch(frames: frames)
+        var expected = ByteBuffer()
+        for frame in frames {
+            var data = try frame.asData()
+            expected.writeBuffer(&data)
+        }
+        let binary = try batch.asData()
+        #expect(binary == expected)
+        #expect(binary.count == batch.bytesCount)
+        #expect(binary == (try FrameEncoder().encode(batch)))
+    }
 }
@@ -11,6 +11,7 @@
 // SPDX-License-Identifier: Apache-2.0
 //
 
+import NIOCore
 import Testing
 
 @testable import AMQP
@@ -23,6 +24,9 @@ import Testing
         #expect(binary.count == object.bytesCount)
         let decoded = try FrameDecoder().decode(Spec.Basic.Qos.self, from: binary)
         #expect(decoded == object)
+        var written = ByteBuffer()
+        object.write(into: &written)
+        #expect(written == binary)
     }
 
     @Test("Spec.Basic.QosOk default encoding/decoding roundtrip")
@@ -32,6 +36,9 @@ import Testing
         #expect(binary.count == object.bytesCount)
         let decoded = try FrameDecoder().decode(Spec.Basic.QosOk.self, from: binary)
         #expect(decoded == object)
+        var written = ByteBuffer()
+        object.write(into: &written)
+        #expect(written == binary)
     }
 
     @Test("Spec.Basic.Consume default encoding/decoding roundtrip")
@@ -41,6 +48,9 @@ import Testing
         #expect(binary.count == object.bytesCount)
         let decoded = try FrameDecoder().decode(Spec.Basic.Consume.self, from: binary)
         #expect(decoded == object)
+        var written = ByteBuffer()
+        object.write(into: &written)
+        #expect(written == binary)
     }
 
     @Test("Spec.Basic.ConsumeOk default encoding/decoding roundtrip")
@@ -50,6 +60,9 @@ import Testing
         #expect(binary.count == object.bytesCount)
         let decoded = try FrameDecoder().decode(Spec.Basic.ConsumeOk.self, from: binary)
         #expect(decoded == object)
+        var written = ByteBuffer()
+        object.write(into: &written)
+        #expect(written == binary)
     }
 
     @Test("Spec.Basic.Cancel default encoding/decoding roundtrip")
@@ -59,6 +72,9 @@ import Testing
         #expect(binary.count == object.bytesCount)
         let decoded = try FrameDecoder().decode(Spec.Basic.Cancel.self, from: binary)
         #expect(decoded == object)
+        var written = ByteBuffer()
+        object.write(into: &written)
+        #expect(written == binary)
     }
 
     @Test("Spec.Basic.CancelOk default encoding/decoding roundtrip")
@@ -68,6 +84,9 @@ import Testing
         #expect(binary.count == object.bytesCount)
         let decoded = try FrameDecoder().decode(Spec.Basic.CancelOk.self, from: binary)
         #expect(decoded == object)
+        var written = ByteBuffer()
+        object.write(into: &written)
+        #expect(written == binary)
     }
 
     @Test("Spec.Basic.Publish default encoding/decoding roundtrip")
@@ -77,6 +96,9 @@ import Testing
         #expect(binary.count == object.bytesCount)
         let decoded = try FrameDecoder().decode(Spec.Basic.Publish.self, from: binary)
         #expect(decoded == object)
+        var written = ByteBuffer()
+        object.write(into: &written)
+        #expect(written == binary)
     }
 
     @Test("Spec.Basic.Return default encoding/decoding roundtrip")
@@ -86,6 +108,9 @@ import Testing
         #expect(binary.count == object.bytesCount)
         let decoded = try FrameDecoder().decode(Spec.Basic.Return.self, from: binary)
         #expect(decoded == object)
+        var written = ByteBuffer()
+        object.write(into: &written)
+        #expect(written == binary)
     }
 
     @Test("Spec.Basic.Deliver default encoding/decoding roundtrip")
@@ -95,6 +120,9 @@ import Testing
         #expect(binary.count == object.bytesCount)
         let decoded = try FrameDecoder().decode(Spec.Basic.Deliver.self, from: binary)
         #expect(decoded == object)
+        var written = ByteBuffer()
+        object.write(into: &written)
+        #expect(written == binary)
     }
 
     @Test("Spec.Basic.Get default encoding/decoding roundtrip")
@@ -104,6 +132,9 @@ import Testing
         #expect(binary.count == object.bytesCount)
         let decoded = try FrameDecoder().decode(Spec.Basic.Get.self, from: binary)
         #expect(decoded == object)
+        var written = ByteBuffer()
+        object.write(into: &written)
+        #expect(written == binary)
     }
 
     @Test("Spec.Basic.GetOk default encoding/decoding roundtrip")
@@ -113,6 +144,9 @@ import Testing
         #expect(binary.count == object.bytesCount)
         let decoded = try FrameDecoder().decode(Spec.Basic.GetOk.self, from: binary)
         #expect(decoded == object)
+        var written = ByteBuffer()
+        object.write(into: &written)
+        #expect(written == binary)
     }
 
     @Test("Spec.Basic.GetEmpty default encoding/decoding roundtrip")
@@ -122,6 +156,9 @@ import Testing
         #expect(binary.count == object.bytesCount)
         let decoded = try FrameDecoder().decode(Spec.Basic.GetEmpty.self, from: binary)
         #expect(decoded == object)
+        var written = ByteBuffer()
+        object.write(into: &written)
+        #expect(written == binary)
     }
 
     @Test("Spec.Basic.Ack default encoding/decoding roundtrip")
@@ -131,6 +168,9 @@ import Testing
         #expect(binary.count == object.bytesCount)
         let decoded = try FrameDecoder().decode(Spec.Basic.Ack.self, from: binary)
         #expect(decoded == object)
+        var written = ByteBuffer()
+        object.write(into: &written)
+        #expect(written == binary)
     }
 
     @Test("Spec.Basic.Reject default encoding/decoding roundtrip")
@@ -140,6 +180,9 @@ import Testing
         #expect(binary.count == object.bytesCount)
         let decoded = try FrameDecoder().decode(Spec.Basic.Reject.self, from: binary)
         #expect(decoded == object)
+        var written = ByteBuffer()
+        object.write(into: &written)
+        #expect(written == binary)
     }
 
     @Test("Spec.Basic.RecoverAsync default encoding/decoding roundtrip")
@@ -149,6 +192,9 @@ import Testing
         #expect(binary.count == object.bytesCount)
         let decoded = try FrameDecoder().decode(Spec.Basic.RecoverAsync.self, from: binary)
         #expect(decoded == object)
+        var written = ByteBuffer()
+        object.write(into: &written)
+        #expect(written == binary)
     }
 
     @Test("Spec.Basic.Recover default encoding/decoding roundtrip")
@@ -158,6 +204,9 @@ import Testing
         #expect(binary.count == object.bytesCount)
         let decoded = try FrameDecoder().decode(Spec.Basic.Recover.self, from: binary)
         #expect(decoded == object)
+        var written = ByteBuffer()
+        object.write(into: &written)
+        #expect(written == binary)
     }
 
     @Test("Spec.Basic.RecoverOk default encoding/decoding roundtrip")
@@ -167,6 +216,9 @@ import Testing
         #expect(binary.count == object.bytesCount)
         let decoded = try FrameDecoder().decode(Spec.Basic.RecoverOk.self, from: binary)
         #expect(decoded == object)
+        var written = ByteBuffer()
+        object.write(into: &written)
+        #expect(written == binary)
     }
 
     @Test("Spec.Basic.Nack default encoding/decoding roundtrip")
@@ -176,6 +228,9 @@ import Testing
         #expect(binary.count == object.bytesCount)
         let decoded = try FrameDecoder().decode(Spec.Basic.Nack.self, from: binary)
         #expect(decoded == object)
+        var written = ByteBuffer()
+        object.write(into: &written)
+        #expect(written == binary)
     }
 
 }
@@ -188,6 +243,9 @@ import Testing
         #expect(binary.count == object.bytesCount)
         let decoded = try FrameDecoder().decode(Spec.Connection.Start.self, from: binary)
         #expect(decoded == object)
+        var written = ByteBuffer()
+        object.write(into: &written)
+        #expect(written == binary)
     }
 
     @Test("Spec.Connection.StartOk default encoding/decoding roundtrip")
@@ -197,6 +255,9 @@ import Testing
         #expect(binary.count == object.bytesCount)
         let decoded = try FrameDecoder().decode(Spec.Connection.StartOk.self, from: binary)
         #expect(decoded == object)
+        var written = ByteBuffer()
+        object.write(into: &written)
+        #expect(written == binary)
     }
 
     @Test("Spec.Connection.Secure default encoding/decoding roundtrip")
@@ -206,6 +267,9 @@ import Testing
         #expect(binary.count == object.bytesCount)
         let decoded = try FrameDecoder().decode(Spec.Connection.Secure.self, from: binary)
         #expect(decoded == object)
+        var written = ByteBuffer()
+        object.write(into: &written)
+        #expect(written == binary)
     }
 
     @Test("Spec.Connection.SecureOk default encoding/decoding roundtrip")
@@ -215,6 +279,9 @@ import Testing
         #expect(binary.count == object.bytesCount)
         let decoded = try FrameDecoder().decode(Spec.Connection.SecureOk.self, from: binary)
         #expect(decoded == object)
+        var written = ByteBuffer()
+        object.write(into: &written)
+        #expect(written == binary)
     }
 
     @Test("Spec.Connection.Tune default encoding/decoding roundtrip")
@@ -224,6 +291,9 @@ import Testing
         #expect(binary.count == object.bytesCount)
         let decoded = try FrameDecoder().decode(Spec.Connection.Tune.self, from: binary)
         #expect(decoded == object)
+        var written = ByteBuffer()
+        object.write(into: &written)
+        #expect(written == binary)
     }
 
     @Test("Spec.Connection.TuneOk default encoding/decoding roundtrip")
@@ -233,6 +303,9 @@ import Testing
         #expect(binary.count == object.bytesCount)
         let decoded = try FrameDecoder().decode(Spec.Connection.TuneOk.self, from: binary)
         #expect(decoded == object)
+        var written = ByteBuffer()
+        object.write(into: &written)
+        #expect(written == binary)
     }
 
     @Test("Spec.Connection.Open default encoding/decoding roundtrip")
@@ -242,6 +315,9 @@ import Testing
         #expect(binary.count == object.bytesCount)
         let decoded = try FrameDecoder().decode(Spec.Connection.Open.self, from: binary)
         #expect(decoded == object)
+        var written = ByteBuffer()
+        object.write(into: &written)
+        #expect(written == binary)
     }
 
     @Test("Spec.Connection.OpenOk default encoding/decoding roundtrip")
@@ -251,6 +327,9 @@ import Testing
         #expect(binary.count == object.bytesCount)
         let decoded = try FrameDecoder().decode(Spec.Connection.OpenOk.self, from: binary)
         #expect(decoded == object)
+        var written = ByteBuffer()
+        object.write(into: &written)
+        #expect(written == binary)
     }
 
     @Test("Spec.Connection.Close default encoding/decoding roundtrip")
@@ -260,6 +339,9 @@ import Testing
         #expect(binary.count == object.bytesCount)
         let decoded = try FrameDecoder().decode(Spec.Connection.Close.self, from: binary)
         #expect(decoded == object)
+        var written = ByteBuffer()
+        object.write(into: &written)
+        #expect(written == binary)
     }
 
     @Test("Spec.Connection.CloseOk default encoding/decoding roundtrip")
@@ -269,6 +351,9 @@ import Testing
         #expect(binary.count == object.bytesCount)
         let decoded = try FrameDecoder().decode(Spec.Connection.CloseOk.self, from: binary)
         #expect(decoded == object)
+        var written = ByteBuffer()
+        object.write(into: &written)
+        #expect(written == binary)
     }
 
     @Test("Spec.Connection.Blocked default encoding/decoding roundtrip")
@@ -278,6 +363,9 @@ import Testing
         #expect(binary.count == object.bytesCount)
         let decoded = try FrameDecoder().decode(Spec.Connection.Blocked.self, from: binary)
         #expect(decoded == object)
+        var written = ByteBuffer()
+        object.write(into: &written)
+        #expect(written == binary)
     }
 
     @Test("Spec.Connection.Unblocked default encoding/decoding roundtrip")
@@ -287,6 +375,9 @@ import Testing
         #expect(binary.count == object.bytesCount)
         let decoded = try FrameDecoder().decode(Spec.Connection.Unblocked.self, from: binary)
         #expect(decoded == object)
+        var written = ByteBuffer()
+        object.write(into: &written)
+        #expect(written == binary)
     }
 
     @Test("Spec.Connection.UpdateSecret default encoding/decoding roundtrip")
@@ -296,6 +387,9 @@ import Testing
         #expect(binary.count == object.bytesCount)
         let decoded = try FrameDecoder().decode(Spec.Connection.UpdateSecret.self, from: binary)
         #expect(decoded == object)
+        var written = ByteBuffer()
+        object.write(into: &written)
+        #expect(written == binary)
     }
 
     @Test("Spec.Connection.UpdateSecretOk default encoding/decoding roundtrip")
@@ -305,6 +399,9 @@ import Testing
         #expect(binary.count == object.bytesCount)
         let decoded = try FrameDecoder().decode(Spec.Connection.UpdateSecretOk.self, from: binary)
         #expect(decoded == object)
+        var written = ByteBuffer()
+        object.write(into: &written)
+        #expect(written == binary)
     }
 
 }
@@ -317,6 +414,9 @@ import Testing
         #expect(binary.count == object.bytesCount)
         let decoded = try FrameDecoder().decode(Spec.Channel.Open.self, from: binary)
         #expect(decoded == object)
+        var written = ByteBuffer()
+        object.write(into: &written)
+        #expect(written == binary)
     }
 
     @Test("Spec.Channel.OpenOk default encoding/decoding roundtrip")
@@ -326,6 +426,9 @@ import Testing
         #expect(binary.count == object.bytesCount)
         let decoded = try FrameDecoder().decode(Spec.Channel.OpenOk.self, from: binary)
         #expect(decoded == object)
+        var written = ByteBuffer()
+        object.write(into: &written)
+        #expect(written == binary)
     }
 
     @Test("Spec.Channel.Flow default encoding/decoding roundtrip")
@@ -335,6 +438,9 @@ import Testing
         #expect(binary.count == object.bytesCount)
         let decoded = try FrameDecoder().decode(Spec.Channel.Flow.self, from: binary)
         #expect(decoded == object)
+        var written = ByteBuffer()
+        object.write(into: &written)
+        #expect(written == binary)
     }
 
     @Test("Spec.Channel.FlowOk default encoding/decoding roundtrip")
@@ -344,6 +450,9 @@ import Testing
         #expect(binary.count == object.bytesCount)
         let decoded = try FrameDecoder().decode(Spec.Channel.FlowOk.self, from: binary)
         #expect(decoded == object)
+        var written = ByteBuffer()
+        object.write(into: &written)
+        #expect(written == binary)
     }
 
     @Test("Spec.Channel.Close default encoding/decoding roundtrip")
@@ -353,6 +462,9 @@ import Testing
         #expect(binary.count == object.bytesCount)
         let decoded = try FrameDecoder().decode(Spec.Channel.Close.self, from: binary)
         #expect(decoded == object)
+        var written = ByteBuffer()
+        object.write(into: &written)
+        #expect(written == binary)
     }
 
     @Test("Spec.Channel.CloseOk default encoding/decoding roundtrip")
@@ -362,6 +474,9 @@ import Testing
         #expect(binary.count == object.bytesCount)
         let decoded = try FrameDecoder().decode(Spec.Channel.CloseOk.self, from: binary)
         #expect(decoded == object)
+        var written = ByteBuffer()
+        object.write(into: &written)
+        #expect(written == binary)
     }
 
 }
@@ -374,6 +489,9 @@ import Testing
         #expect(binary.count == object.bytesCount)
         let decoded = try FrameDecoder().decode(Spec.Access.Request.self, from: binary)
         #expect(decoded == object)
+        var written = ByteBuffer()
+        object.write(into: &written)
+        #expect(written == binary)
     }
 
     @Test("Spec.Access.RequestOk default encoding/decoding roundtrip")
@@ -383,6 +501,9 @@ import Testing
         #expect(binary.count == object.bytesCount)
         let decoded = try FrameDecoder().decode(Spec.Access.RequestOk.self, from: binary)
         #expect(decoded == object)
+        var written = ByteBuffer()
+        object.write(into: &written)
+        #expect(written == binary)
     }
 
 }
@@ -395,6 +516,9 @@ import Testing
         #expect(binary.count == object.bytesCount)
         let decoded = try FrameDecoder().decode(Spec.Exchange.Declare.self, from: binary)
         #expect(decoded == object)
+        var written = ByteBuffer()
+        object.write(into: &written)
+        #expect(written == binary)
     }
 
     @Test("Spec.Exchange.DeclareOk default encoding/decoding roundtrip")
@@ -404,6 +528,9 @@ import Testing
         #expect(binary.count == object.bytesCount)
         let decoded = try FrameDecoder().decode(Spec.Exchange.DeclareOk.self, from: binary)
         #expect(decoded == object)
+        var written = ByteBuffer()
+        object.write(into: &written)
+        #expect(written == binary)
     }
 
     @Test("Spec.Exchange.Delete default encoding/decoding roundtrip")
@@ -413,6 +540,9 @@ import Testing
         #expect(binary.count == object.bytesCount)
         let decoded = try FrameDecoder().decode(Spec.Exchange.Delete.self, from: binary)
         #expect(decoded == object)
+        var written = ByteBuffer()
+        object.write(into: &written)
+        #expect(written == binary)
     }
 
     @Test("Spec.Exchange.DeleteOk default encoding/decoding roundtrip")
@@ -422,6 +552,9 @@ import Testing
         #expect(binary.count == object.bytesCount)
         let decoded = try FrameDecoder().decode(Spec.Exchange.DeleteOk.self, from: binary)
         #expect(decoded == object)
+        var written = ByteBuffer()
+        object.write(into: &written)
+        #expect(written == binary)
     }
 
     @Test("Spec.Exchange.Bind default encoding/decoding roundtrip")
@@ -431,6 +564,9 @@ import Testing
         #expect(binary.count == object.bytesCount)
         let decoded = try FrameDecoder().decode(Spec.Exchange.Bind.self, from: binary)
         #expect(decoded == object)
+        var written = ByteBuffer()
+        object.write(into: &written)
+        #expect(written == binary)
     }
 
     @Test("Spec.Exchange.BindOk default encoding/decoding roundtrip")
@@ -440,6 +576,9 @@ import Testing
         #expect(binary.count == object.bytesCount)
         let decoded = try FrameDecoder().decode(Spec.Exchange.BindOk.self, from: binary)
         #expect(decoded == object)
+        var written = ByteBuffer()
+        object.write(into: &written)
+        #expect(written == binary)
     }
 
     @Test("Spec.Exchange.Unbind default encoding/decoding roundtrip")
@@ -449,6 +588,9 @@ import Testing
         #expect(binary.count == object.bytesCount)
         let decoded = try FrameDecoder().decode(Spec.Exchange.Unbind.self, from: binary)
         #expect(decoded == object)
+        var written = ByteBuffer()
+        object.write(into: &written)
+        #expect(written == binary)
     }
 
     @Test("Spec.Exchange.UnbindOk default encoding/decoding roundtrip")
@@ -458,6 +600,9 @@ import Testing
         #expect(binary.count == object.bytesCount)
         let decoded = try FrameDecoder().decode(Spec.Exchange.UnbindOk.self, from: binary)
         #expect(decoded == object)
+        var written = ByteBuffer()
+        object.write(into: &written)
+        #expect(written == binary)
     }
 
 }
@@ -470,6 +615,9 @@ import Testing
         #expect(binary.count == object.bytesCount)
         let decoded = try FrameDecoder().decode(Spec.Queue.Declare.self, from: binary)
         #expect(decoded == object)
+        var written = ByteBuffer()
+        object.write(into: &written)
+        #expect(written == binary)
     }
 
     @Test("Spec.Queue.DeclareOk default encoding/decoding roundtrip")
@@ -479,6 +627,9 @@ import Testing
         #expect(binary.count == object.bytesCount)
         let decoded = try FrameDecoder().decode(Spec.Queue.DeclareOk.self, from: binary)
         #expect(decoded == object)
+        var written = ByteBuffer()
+        object.write(into: &written)
+        #expect(written == binary)
     }
 
     @Test("Spec.Queue.Bind default encoding/decoding roundtrip")
@@ -488,6 +639,9 @@ import Testing
         #expect(binary.count == object.bytesCount)
         let decoded = try FrameDecoder().decode(Spec.Queue.Bind.self, from: binary)
         #expect(decoded == object)
+        var written = ByteBuffer()
+        object.write(into: &written)
+        #expect(written == binary)
     }
 
     @Test("Spec.Queue.BindOk default encoding/decoding roundtrip")
@@ -497,6 +651,9 @@ import Testing
         #expect(binary.count == object.bytesCount)
         let decoded = try FrameDecoder().decode(Spec.Queue.BindOk.self, from: binary)
         #expect(decoded == object)
+        var written = ByteBuffer()
+        object.write(into: &written)
+        #expect(written == binary)
     }
 
     @Test("Spec.Queue.Purge default encoding/decoding roundtrip")
@@ -506,6 +663,9 @@ import Testing
         #expect(binary.count == object.bytesCount)
         let decoded = try FrameDecoder().decode(Spec.Queue.Purge.self, from: binary)
         #expect(decoded == object)
+        var written = ByteBuffer()
+        object.write(into: &written)
+        #expect(written == binary)
     }
 
     @Test("Spec.Queue.PurgeOk default encoding/decoding roundtrip")
@@ -515,6 +675,9 @@ import Testing
         #expect(binary.count == object.bytesCount)
         let decoded = try FrameDecoder().decode(Spec.Queue.PurgeOk.self, from: binary)
         #expect(decoded == object)
+        var written = ByteBuffer()
+        object.write(into: &written)
+        #expect(written == binary)
     }
 
     @Test("Spec.Queue.Delete default encoding/decoding roundtrip")
@@ -524,6 +687,9 @@ import Testing
         #expect(binary.count == object.bytesCount)
         let decoded = try FrameDecoder().decode(Spec.Queue.Delete.self, from: binary)
         #expect(decoded == object)
+        var written = ByteBuffer()
+        object.write(into: &written)
+        #expect(written == binary)
     }
 
     @Test("Spec.Queue.DeleteOk default encoding/decoding roundtrip")
@@ -533,6 +699,9 @@ import Testing
         #expect(binary.count == object.bytesCount)
         let decoded = try FrameDecoder().decode(Spec.Queue.DeleteOk.self, from: binary)
         #expect(decoded == object)
+        var written = ByteBuffer()
+        object.write(into: &written)
+        #expect(written == binary)
     }
 
     @Test("Spec.Queue.Unbind default encoding/decoding roundtrip")
@@ -542,6 +711,9 @@ import Testing
         #expect(binary.count == object.bytesCount)
         let decoded = try FrameDecoder().decode(Spec.Queue.Unbind.self, from: binary)
         #expect(decoded == object)
+        var written = ByteBuffer()
+        object.write(into: &written)
+        #expect(written == binary)
     }
 
     @Test("Spec.Queue.UnbindOk default encoding/decoding roundtrip")
@@ -551,6 +723,9 @@ import Testing
         #expect(binary.count == object.bytesCount)
         let decoded = try FrameDecoder().decode(Spec.Queue.UnbindOk.self, from: binary)
         #expect(decoded == object)
+        var written = ByteBuffer()
+        object.write(into: &written)
+        #expect(written == binary)
     }
 
 }
@@ -563,6 +738,9 @@ import Testing
         #expect(binary.count == object.bytesCount)
         let decoded = try FrameDecoder().decode(Spec.Tx.Select.self, from: binary)
         #expect(decoded == object)
+        var written = ByteBuffer()
+        object.write(into: &written)
+        #expect(written == binary)
     }
 
     @Test("Spec.Tx.SelectOk default encoding/decoding roundtrip")
@@ -572,6 +750,9 @@ import Testing
         #expect(binary.count == object.bytesCount)
         let decoded = try FrameDecoder().decode(Spec.Tx.SelectOk.self, from: binary)
         #expect(decoded == object)
+        var written = ByteBuffer()
+        object.write(into: &written)
+        #expect(written == binary)
     }
 
     @Test("Spec.Tx.Commit default encoding/decoding roundtrip")
@@ -581,6 +762,9 @@ import Testing
         #expect(binary.count == object.bytesCount)
         let decoded = try FrameDecoder().decode(Spec.Tx.Commit.self, from: binary)
         #expect(decoded == object)
+        var written = ByteBuffer()
+        object.write(into: &written)
+        #expect(written == binary)
     }
 
     @Test("Spec.Tx.CommitOk default encoding/decoding roundtrip")
@@ -590,6 +774,9 @@ import Testing
         #expect(binary.count == object.bytesCount)
         let decoded = try FrameDecoder().decode(Spec.Tx.CommitOk.self, from: binary)
         #expect(decoded == object)
+        var written = ByteBuffer()
+        object.write(into: &written)
+        #expect(written == binary)
     }
 
     @Test("Spec.Tx.Rollback default encoding/decoding roundtrip")
@@ -599,6 +786,9 @@ import Testing
         #expect(binary.count == object.bytesCount)
         let decoded = try FrameDecoder().decode(Spec.Tx.Rollback.self, from: binary)
         #expect(decoded == object)
+        var written = ByteBuffer()
+        object.write(into: &written)
+        #expect(written == binary)
     }
 
     @Test("Spec.Tx.RollbackOk default encoding/decoding roundtrip")
@@ -608,6 +798,9 @@ import Testing
         #expect(binary.count == object.bytesCount)
         let decoded = try FrameDecoder().decode(Spec.Tx.RollbackOk.self, from: binary)
         #expect(decoded == object)
+        var written = ByteBuffer()
+        object.write(into: &written)
+        #expect(written == binary)
     }
 
 }
@@ -620,6 +813,9 @@ import Testing
         #expect(binary.count == object.bytesCount)
         let decoded = try FrameDecoder().decode(Spec.Confirm.Select.self, from: binary)
         #expect(decoded == object)
+        var written = ByteBuffer()
+        object.write(into: &written)
+        #expect(written == binary)
     }
 
     @Test("Spec.Confirm.SelectOk default encoding/decoding roundtrip")
@@ -629,6 +825,9 @@ import Testing
         #expect(binary.count == object.bytesCount)
         let decoded = try FrameDecoder().decode(Spec.Confirm.SelectOk.self, from: binary)
         #expect(decoded == object)
+        var written = ByteBuffer()
+        object.write(into: &written)
+        #expect(written == binary)
     }
 
 }
@@ -78,6 +78,8 @@ import Testing
         let decoded = try FrameDecoder().decode(Spec.Basic.Return.self, from: input)
         let expected = Spec.Basic.Return(replyCode: 1, exchange: "FooBar", routingKey: "FooBar")
         #expect(decoded == expected)
+        let view = try Spec.Basic.ReturnView(buffer: input)
+        #expect(view.materialize() == expected)
     }
 
     @Test("Spec.Basic.Deliver verify decode bytes")
@@ -91,6 +93,8 @@ import Testing
             routingKey: "FooBar"
         )
         #expect(decoded == expected)
+        let view = try Spec.Basic.DeliverView(buffer: input)
+        #expect(view.materialize() == expected)
     }
 
     @Test("Spec.Basic.Get verify decode bytes")
@@ -123,6 +127,8 @@ import Testing
         let decoded = try FrameDecoder().decode(Spec.Basic.Ack.self, from: input)
         let expected = Spec.Basic.Ack()
         #expect(decoded == expected)
+        let view = try Spec.Basic.AckView(buffer: input)
+        #expect(view.materialize() == expected)
     }
 
     @Test("Spec.Basic.Reject verify decode bytes")
@@ -163,6 +169,8 @@ import Testing
         let decoded = try FrameDecoder().decode(Spec.Basic.Nack.self, from: input)
         let expected = Spec.Basic.Nack()
         #expect(decoded == expected)
+        let view = try Spec.Basic.NackView(buffer: input)
+        #expect(view.materialize() == expected)
     }
 
 }
@@ -16,3 +16,30 @@ import Testing
         #expect(decoded == expected)
     }
 }
+
+@Suite struct MalformedDecode {
+    @Test("Truncated fixed width fields throw instead of trapping")
+    func truncatedFixedWidthFields() async throws {
+        let input = try fixtureData(named: "Basic.Ack").getSlice(at: 0, length: 5)!
+        #expect(throws: FramingError.self) {
+            try FrameDecoder().decode(Spec.Basic.Ack.self, from: input)
+        }
+    }
+
+    @Test("Truncated short string throws instead of trapping")
+    func truncatedShortString() async throws {
+        let input = try fixtureData(named: "Basic.Deliver").getSlice(at: 0, length: 4)!
+        #expect(throws: FramingError.self) {
+            try FrameDecoder().decode(Spec.Basic.Deliver.self, from: input)
+        }
+    }
+
+    @Test("Truncated lazy view throws on construction")
+    func truncatedLazyView() async throws {
+        let fixture = try fixtureData(named: "Basic.Deliver")
+        let input = fixture.getSlice(at: 0, length: fixture.readableBytes - 1)!
+        #expect(throws: FramingError.self) {
+            try Spec.Basic.DeliverView(buffer: input)
+        }
+    }
+}
@@ -0,0 +1,50 @@
+import NIOCore
+import Testing
+
+@testable import AMQP
+
+@Suite struct FrameTemplates {
+    // only methods which the client-minimal profile keeps, the tests are built with either profile
+    @Test(
+        "Frames written from a template match FrameEncoder",
+        arguments: [
+            MethodFrame(channelId: 7, payload: Spec.Basic.Ack(deliveryTag: 42, multiple: true)),
+            MethodFrame(channelId: 7, payload: Spec.Basic.Nack(deliveryTag: .max, multiple: false, requeue: true)),
+            MethodFrame(
+                channelId: 0,
+                payload: Spec.Connection.TuneOk(channelMax: 2047, frameMax: 131_072, heartbeat: 60)
+            ),
+            MethodFrame(channelId: 2, payload: Spec.Basic.Qos(prefetchSize: 0, prefetchCount: 10, global: true)),
+            MethodFrame(channelId: .max, payload: Spec.Channel.CloseOk()),
+            MethodFrame(channelId: 3, payload: Spec.Confirm.Select(nowait: true)),
+            MethodFrame(channelId: 3, payload: Spec.Channel.Flow(active: false)),
+            // methods with variable length arguments have no template and are written by their generated writer
+            MethodFrame(
+                channelId: 3,
+                payload: Spec.Queue.Declare(queue: "queue", arguments: ["x-max-length": .int32(1)])
+            ),
+            MethodFrame(channelId: 4, payload: Spec.Basic.Publish(exchange: "exchange", routingKey: "key")),
+        ]
+    )
+    func methodFrame(frame: MethodFrame) async throws {
+        let expected = try FrameEncoder().encode(frame)
+        #expect(try frame.asData() == expected)
+        #expect(expected.readableBytes == frame.bytesCount)
+    }
+
+    @Test("Only the methods without variable length arguments have a template")
+    func hasTemplate() async throws {
+        var buffer = ByteBuffer()
+        #expect(Spec.Basic.Ack(deliveryTag: 1).writeFrameFromTemplate(channelId: 1, into: &buffer))
+        #expect(Spec.Basic.QosOk().writeFrameFromTemplate(channelId: 1, into: &buffer))
+        let written = buffer.readableBytes
+        #expect(!Spec.Queue.Declare().writeFrameFromTemplate(channelId: 1, into: &buffer))
+        #expect(!Spec.Basic.Publish().writeFrameFromTemplate(channelId: 1, into: &buffer))
+        #expect(buffer.readableBytes == written)
+    }
+
+    @Test("The heartbeat is the pre-encoded template")
+    func heartbeat() async throws {
+        #expect(try HeartbeatFrame().asData() == (try FrameEncoder().encode(HeartbeatFrame())))
+    }
+}
@@ -0,0 +1,84 @@
+import NIOCore
+import Testing
+
+@testable import AMQP
+
+@Suite struct InboundFrameDecoding {
+    let decoder = FrameDecoder(decodesLazyViews: true)
+
+    func encode(_ frames: [any Frame]) throws -> ByteBuffer {
+        try FrameBatch(frames: frames).asData()
+    }
+
+    @Test("A delivery is decoded frame by frame from one buffer")
+    func delivery() async throws {
+        let deliver = Spec.Basic.Deliver(consumerTag: "tag", deliveryTag: 7, exchange: "exchange", routingKey: "key")
+        let header = ContentHeaderFrame(channelId: 3, classId: 60, bodySize: 4, properties: .init(contentType: "text"))
+        let body = ContentBodyFrame(channelId: 3, fragment: ByteBuffer(string: "ping"))
+        var buffer = try encode([MethodFrame(channelId: 3, payload: deliver), header, body, HeartbeatFrame()])
+
+        guard case .method(let method) = try InboundFrame.decode(from: &buffer, decoder: decoder) else {
+            Issue.record("expected a method frame")
+            return
+        }
+        #expect(method.channelId == 3)
+        #expect((method.payload as? Spec.Basic.DeliverView)?.materialize() == deliver)
+        guard case .header(let decodedHeader) = try InboundFrame.decode(from: &buffer, decoder: decoder) else {
+            Issue.record("expected a header frame")
+            return
+        }
+        #expect(decodedHeader == header)
+        guard case .body(let decodedBody) = try InboundFrame.decode(from: &buffer, decoder: decoder) else {
+            Issue.record("expected a body frame")
+            return
+        }
+        #expect(decodedBody == body)
+        guard case .heartbeat = try InboundFrame.decode(from: &buffer, decoder: decoder) else {
+            Issue.record("expected a heartbeat frame")
+            return
+        }
+        #expect(buffer.readableBytes == 0)
+    }
+
+    @Test("A partial frame isn't decoded and leaves the reader index where it was")
+    func partialFrame() async throws {
+        let full = try encode([ContentBodyFrame(channelId: 1, fragment: ByteBuffer(string: "ping"))])
+        var buffer = full.getSlice(at: 0, length: full.readableBytes - 1)!
+        #expect(try InboundFrame.decode(from: &buffer, decoder: decoder) == nil)
+        #expect(buffer.readerIndex == 0)
+    }
+
+    @Test("A frame without the frame-end octet is a fatal error")
+    func missingFrameEnd() async throws {
+        var buffer = try encode([HeartbeatFrame()])
+        buffer.setInteger(UInt8(0), at: buffer.writerIndex - 1)
+        #expect(throws: FramingError.self) {
+            try InboundFrame.decode(from: &buffer, decoder: self.decoder)
+        }
+    }
+
+    @Test(
+        "Frames breaking the framing rules throw the hard error the connection is closed with",
+        arguments: zip(
+            [
+                // heartbeat on a channel
+                [UInt8](arrayLiteral: 8, 0, 1, 0, 0, 0, 0, 0xCE),
+                // body on channel 0
+                [3, 0, 0, 0, 0, 0, 1, 42, 0xCE],
+                // unknown frame type
+                [9, 0, 0, 0, 0, 0, 0, 0xCE],
+                // method frame too short for class and method ids
+                [1, 0, 1, 0, 0, 0, 2, 0, 60, 0xCE],
+                // unknown method
+                [1, 0, 1, 0, 0, 0, 4, 0, 60, 0, 99, 0xCE],
+            ],
+            [Spec.HardError.frameError, .channelError, .frameError, .frameError, .commandInvalid]
+        )
+    )
+    func hardErrors(bytes: [UInt8], expected: Spec.HardError) async throws {
+        var buffer = ByteBuffer(bytes: bytes)
+        #expect(throws: expected) {
+            try InboundFrame.decode(from: &buffer, decoder: self.decoder)
+        }
+    }
+}
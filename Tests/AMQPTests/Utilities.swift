@@ -13,9 +13,12 @@ func makeTestEnv(
         let transportStub = try await TransportMock(
             host: $0,
             port: $1,
-            logger: $2,
-            inboundContinuation: $3,
-            negotiatorFactory: $4
+            rawBytesRecordingPath: $2,
+            outboundQueue: $3,
+            eventLoopGroup: $4,
+            logger: $5,
+            inboundContinuation: $6,
+            negotiatorFactory: $7
         )
         transportStub.expecting(sequenceOf: actions)
         var props = transportStub.negotiatedPropertiesShadow